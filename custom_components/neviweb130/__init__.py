@@ -3,27 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import json
 import logging
 import os
+import random
+import threading
+import time
+from datetime import timedelta
 from typing import Any
 
 import aiohttp
-import requests
 from homeassistant.components.climate.const import PRESET_AWAY, PRESET_HOME, HVACMode
 from homeassistant.components.persistent_notification import DOMAIN as PN_DOMAIN
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import (
     CONF_PASSWORD,
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
     EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
+    RESTART_EXIT_CODE,
     Platform,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryError, ConfigEntryNotReady, IntegrationError
-from homeassistant.helpers import discovery, entity_registry
+from homeassistant.helpers import entity_registry
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.translation import async_get_translations
-from requests.cookies import RequestsCookieJar
+from yarl import URL
 
 from .const import (
     ATTR_ACCESSORY_TYPE,
@@ -63,6 +74,7 @@ from .const import (
     ATTR_DRSETPOINT,
     ATTR_DRSTATUS,
     ATTR_EARLY_START,
+    ATTR_ERROR_CODE_SET1,
     ATTR_FAN_FILTER_REMAIN,
     ATTR_FAN_SPEED,
     ATTR_FAN_SWING_HORIZ,
@@ -154,44 +166,95 @@ from .const import (
     CONF_LOCATION,
     CONF_LOCATION2,
     CONF_LOCATION3,
+    CONF_LOCATIONS,
+    CONF_MAX_CONNECTIONS,
     CONF_NETWORK,
     CONF_NETWORK2,
     CONF_NETWORK3,
     CONF_NOTIFY,
     CONF_PREFIX,
+    CONF_REQUEST_TARGET,
     CONF_SAFE_MODE,
     CONF_STAT_INTERVAL,
+    CONF_WEATHER_INTERVAL,
     DOMAIN,
     MODE_EM_HEAT,
     MODE_MANUAL,
+    SIGNAL_DEVICES_CHANGED,
     STARTUP_MESSAGE,
     VERSION,
 )
+from .coordinator import Neviweb130Coordinator, Neviweb130PollScheduler
 from .helpers import (
+    BREAKER_CLOSED,
+    DEVICE_OFFLINE_CODES,
+    UNSUPPORTED_ATTRS,
+    CircuitBreaker,
+    DeviceHealth,
+    DeviceIndex,
+    async_init_device_cache,
+    async_init_request_counter,
     fetch_release_notes,
     increment_request_counter,
-    init_request_counter,
+    request_limit,
     setup_logger,
     translated_or_default,
 )
 from .schema import CONFIG_SCHEMA as CONFIG_SCHEMA  # noqa: F401
 from .schema import HOMEKIT_MODE as DEFAULT_HOMEKIT_MODE
 from .schema import IGNORE_MIWI as DEFAULT_IGNORE_MIWI
+from .schema import MAX_CONNECTIONS as DEFAULT_MAX_CONNECTIONS
 from .schema import NEVIWEB_MODE_MAP
 from .schema import NOTIFY as DEFAULT_NOTIFY
+from .schema import REQUEST_TARGET as DEFAULT_REQUEST_TARGET
 from .schema import SAFE_MODE as DEFAULT_SAFE_MODE
 from .schema import SCAN_INTERVAL as DEFAULT_SCAN_INTERVAL
 from .schema import STAT_INTERVAL as DEFAULT_STAT_INTERVAL
+from .schema import WEATHER_INTERVAL as DEFAULT_WEATHER_INTERVAL
 
 REQUESTS_TIMEOUT = 30
+# Interval of the comparison of location device lists with the discovered devices
+DEVICE_REFRESH_INTERVAL = timedelta(hours=1)
+# Seconds the setup waits for account logins, slower accounts keep connecting in background
+CONNECT_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+STATUS_CACHE_TTL = 60
+# Seconds during which writes to one device are merged into a single PUT
+WRITE_DEBOUNCE = 0.3
+SESSION_STORE_VERSION = 1
+GATEWAY_OFFLINE = "offline"
+# Seconds after a login during which reconnect() does not log in again
+RELOGIN_GRACE = 60
+# Signature requests in flight during device discovery
+DISCOVERY_CONCURRENCY = 5
+# Signature requests in flight while stored signatures are revalidated in background
+REVALIDATE_CONCURRENCY = 2
+# Retry policy shared by all client requests
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+# Retries allowed per coordinator cycle, as a share of the requests of the cycle
+RETRY_BUDGET_RATIO = 0.1
+RETRY_BUDGET_MIN = 2
+RETRYABLE_HTTP_STATUS = {429, 500, 502, 503, 504}
+# Neviweb error codes of transient conditions, that can succeed on a later try. DVCCOMMTO
+# is left to device health, a device that does not answer rarely does a second later.
+RETRYABLE_ERROR_CODES = {"SVCERR", "DVCBUSY"}
+# Neviweb error codes that open the circuit breaker
+BREAKER_ERROR_CODES = {"MAINTENANCE", "ACCDAYREQMAX"}
 HOST = "https://neviweb.com"
 LOGIN_URL = f"{HOST}/api/login"
+LOGOUT_URL = f"{HOST}/api/logout"
 LOCATIONS_URL = f"{HOST}/api/locations?account$id="
 GATEWAY_DEVICE_URL = f"{HOST}/api/devices?location$id="
 DEVICE_DATA_URL = f"{HOST}/api/device/"
 NEVIWEB_LOCATION = f"{HOST}/api/location/"
 NEVIWEB_WEATHER = f"{HOST}/api/weather?code="
 
+# Platforms loaded for every setup, the others only when devices of their models are discovered
+CORE_PLATFORMS = [Platform.SENSOR, Platform.UPDATE]
+
 HOMEKIT_MODE = DEFAULT_HOMEKIT_MODE
 IGNORE_MIWI = DEFAULT_IGNORE_MIWI
 NOTIFY = DEFAULT_NOTIFY
@@ -234,12 +297,16 @@ def migrate_entity_unique_id(hass: HomeAssistant):
     hass.data[DOMAIN]["data"].migration_done.set()
 
 
-def setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
-    """Set up neviweb130."""
+async def async_setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
+    """Set up neviweb130 from configuration.yaml, imported into a config entry."""
+    if DOMAIN not in hass_config:
+        return True
+
     _LOGGER.warning(STARTUP_MESSAGE)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["translation_cache"] = None
+    hass.data[DOMAIN]["config"] = hass_config[DOMAIN]
 
     async def _load_translations(event):
         """Load translations into cache hass.data"""
@@ -257,20 +324,10 @@ def setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _load_translations)
 
     # Initialise request counter
-    init_request_counter(hass)
-
-    try:
-        data = Neviweb130Data(hass, hass_config[DOMAIN])
-        hass.data[DOMAIN]["data"] = data
-        data.current_version = VERSION
-    except IntegrationError as e:
-        # Temporary workaround for sync setup: Avoid verbose traceback in logs. Once async_setup_entry is used,
-        # we can remove the try-except as HomeAssistant will correctly handle the raised exception
-        _LOGGER.error("Neviweb130 initialization failed: %s", e)
-        return False
+    await async_init_request_counter(hass)
 
-    # Migrate entity unique_ids from int -> str.
-    hass.add_job(migrate_entity_unique_id, hass)
+    # Load stored device signatures and capabilities
+    await async_init_device_cache(hass)
 
     global SCAN_INTERVAL
     SCAN_INTERVAL = hass_config[DOMAIN].get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
@@ -296,6 +353,40 @@ def setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
 
     _LOGGER.debug("Setting safe mode to: %s", hass.data[DOMAIN]["safe_mode"])
 
+    # The YAML configuration stays the source of settings, the entry only runs the setup
+    hass.async_create_task(hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_IMPORT}, data={}))
+
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Log in all Neviweb accounts concurrently and forward the platforms."""
+    config = hass.data.get(DOMAIN, {}).get("config")
+    if config is None:
+        raise ConfigEntryError("No neviweb130 configuration found in configuration.yaml")
+
+    data = Neviweb130Data(hass, config)
+    data.current_version = VERSION
+    await data.async_connect(entry)
+    hass.data[DOMAIN]["data"] = data
+
+    async def _close_sessions(event):
+        """Keep Neviweb sessions for a restart, log out otherwise, then close the pooled sessions."""
+        for client in data.neviweb130_clients:
+            await client.async_shutdown(keep_session=hass.exit_code == RESTART_EXIT_CODE)
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_sessions))
+
+    # Migrate entity unique_ids from int -> str.
+    migrate_entity_unique_id(hass)
+
+    # Fit polling of each account in its daily request budget before entities are created
+    for client in data.neviweb130_clients:
+        client.plan_request_budget(SCAN_INTERVAL, STAT_INTERVAL)
+
+    data.platforms = data.discovered_platforms()
+    _LOGGER.debug("Loading platforms: %s", ", ".join(data.platforms))
+
     async def fetch_latest_version():
         url = "https://api.github.com/repos/claudegel/sinope-130/tags"
 
@@ -322,7 +413,7 @@ def setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
             _LOGGER.warning("Could not fetch latest version from GitHub")
             return
 
-        hass.data[DOMAIN]["data"].available_version = latest
+        data.available_version = latest
 
         result = await fetch_release_notes(latest)
         if result is None:
@@ -331,8 +422,8 @@ def setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
         else:
             title, notes = result
 
-        hass.data[DOMAIN]["data"].release_title = title
-        hass.data[DOMAIN]["data"].release_notes = notes
+        data.release_title = title
+        data.release_notes = notes
         entity = hass.data[DOMAIN].get("update_entity")
         if entity:
             entity._latest_version = latest
@@ -342,15 +433,42 @@ def setup(hass: HomeAssistant, hass_config: dict[str, Any]) -> bool:
             entity._release_summary = entity.release_summary
             entity.async_write_ha_state()
 
-    hass.loop.call_soon_threadsafe(hass.async_create_task, async_init_update())
+    entry.async_create_background_task(hass, async_init_update(), f"{DOMAIN} version check")
+
+    await hass.config_entries.async_forward_entry_setups(entry, data.platforms)
+
+    async def _async_refresh_devices(now) -> None:
+        """Look for devices paired or removed since the last discovery."""
+        for client in data.neviweb130_clients:
+            if client.breaker.state != BREAKER_CLOSED:
+                continue
+            try:
+                await client.async_refresh_devices()
+            except (PyNeviweb130Error, IntegrationError, aiohttp.ClientError, TimeoutError, OSError) as err:
+                _LOGGER.debug("Device refresh of account %s failed: %s", client.username, err)
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_refresh_devices, DEVICE_REFRESH_INTERVAL))
+
+    async def _async_devices_changed(client: Neviweb130Client, added: list, removed: set[str]) -> None:
+        """Fit polling to the new device count and load the platforms of new device types."""
+        client.plan_request_budget(SCAN_INTERVAL, STAT_INTERVAL)
+        platforms = [platform for platform in data.discovered_platforms() if platform not in data.platforms]
+        if platforms:
+            data.platforms = sorted({*data.platforms, *platforms})
+            await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_DEVICES_CHANGED, _async_devices_changed))
+
+    return True
 
-    discovery.load_platform(hass, Platform.CLIMATE, DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, Platform.LIGHT, DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, Platform.SWITCH, DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, Platform.SENSOR, DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, Platform.VALVE, DOMAIN, {}, hass_config)
-    discovery.load_platform(hass, Platform.UPDATE, DOMAIN, {}, hass_config)
 
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload the platforms and close the Neviweb sessions, kept for the next setup."""
+    data: Neviweb130Data = hass.data[DOMAIN]["data"]
+    if not await hass.config_entries.async_unload_platforms(entry, data.platforms):
+        return False
+    hass.data[DOMAIN].pop("data")
+    await data.async_shutdown()
     return True
 
 
@@ -361,6 +479,8 @@ class Neviweb130Data:
         """Init the neviweb130 data object."""
         self.hass = hass
         self.neviweb130_clients: list[Neviweb130Client] = []
+        self._connecting: dict[Neviweb130Client, asyncio.Task] = {}
+        self.platforms: list[Platform] = []
         self.migration_done = asyncio.Event()
 
         # Attributes for versioning and release notes
@@ -373,15 +493,21 @@ class Neviweb130Data:
             _LOGGER.debug("Using multi-account configuration")
             accounts = config.get(CONF_ACCOUNTS, [])
             ignore_miwi = config.get(CONF_IGNORE_MIWI)
+            max_connections = config.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS)
+            weather_interval = config.get(CONF_WEATHER_INTERVAL, DEFAULT_WEATHER_INTERVAL)
+            request_target = config.get(CONF_REQUEST_TARGET, DEFAULT_REQUEST_TARGET)
 
             for idx, account in enumerate(accounts):
                 username = account.get(CONF_USERNAME)
                 password = account.get(CONF_PASSWORD)
                 # Support both 'location' (preferred) and 'network' (alias) for flexibility.
                 # Also support location2/location3 in accounts list so one client session can manage multiple networks.
-                location = account.get(CONF_LOCATION) or account.get(CONF_NETWORK)
-                location2 = account.get(CONF_LOCATION2) or account.get(CONF_NETWORK2)
-                location3 = account.get(CONF_LOCATION3) or account.get(CONF_NETWORK3)
+                # 'locations' lists any number of locations and replaces the three keys when set.
+                locations = account.get(CONF_LOCATIONS) or [
+                    account.get(CONF_LOCATION) or account.get(CONF_NETWORK),
+                    account.get(CONF_LOCATION2) or account.get(CONF_NETWORK2),
+                    account.get(CONF_LOCATION3) or account.get(CONF_NETWORK3),
+                ]
 
                 # Account alias used for entity naming.
                 # In multi-account mode (`accounts:`), all accounts use the same naming rules (no special-casing
@@ -391,11 +517,9 @@ class Neviweb130Data:
                 # No "primary" concept inside accounts-list mode (see legacy single-account mode below).
 
                 _LOGGER.debug(
-                    "Creating client for account %s with location(s) %s/%s/%s and prefix %s",
+                    "Creating client for account %s with location(s) %s and prefix %s",
                     username,
-                    location,
-                    location2,
-                    location3,
+                    "/".join(str(location) for location in locations),
                     prefix,
                 )
 
@@ -403,12 +527,13 @@ class Neviweb130Data:
                     hass,
                     username,
                     password,
-                    location,
-                    location2,
-                    location3,
+                    locations,
                     ignore_miwi,
                     prefix,
                     is_primary=False,
+                    max_connections=max_connections,
+                    weather_interval=weather_interval,
+                    request_target=request_target,
                 )
                 self.neviweb130_clients.append(client)
 
@@ -417,9 +542,7 @@ class Neviweb130Data:
             _LOGGER.debug("Using legacy single-account configuration")
             username = config.get(CONF_USERNAME)
             password = config.get(CONF_PASSWORD)
-            network = config.get(CONF_NETWORK)
-            network2 = config.get(CONF_NETWORK2)
-            network3 = config.get(CONF_NETWORK3)
+            networks = [config.get(CONF_NETWORK), config.get(CONF_NETWORK2), config.get(CONF_NETWORK3)]
             ignore_miwi = config.get(CONF_IGNORE_MIWI)
             # Legacy mode keeps old entity naming by default. Setting a prefix opts into the new naming
             # and may rename existing entities (breaking automations).
@@ -429,12 +552,93 @@ class Neviweb130Data:
                     "A non-empty 'prefix' in legacy single-account configuration "
                     "will rename entities and may break existing automations."
                 )
-            client = Neviweb130Client(hass, username, password, network, network2, network3, ignore_miwi, prefix)
+            max_connections = config.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS)
+            weather_interval = config.get(CONF_WEATHER_INTERVAL, DEFAULT_WEATHER_INTERVAL)
+            request_target = config.get(CONF_REQUEST_TARGET, DEFAULT_REQUEST_TARGET)
+            client = Neviweb130Client(
+                hass,
+                username,
+                password,
+                networks,
+                ignore_miwi,
+                prefix,
+                max_connections=max_connections,
+                weather_interval=weather_interval,
+                request_target=request_target,
+            )
             self.neviweb130_clients.append(client)
 
         else:
             _LOGGER.error("Invalid configuration: must specify either 'accounts' or 'username/password'")
 
+    async def async_connect(self, entry: ConfigEntry) -> None:
+        """Log in all accounts concurrently and keep those connected within CONNECT_TIMEOUT.
+
+        Accounts still connecting after the timeout go on in background, and the
+        entry is reloaded when they are ready, so that a slow account does not
+        hold the setup of the others.
+        """
+        clients = self.neviweb130_clients
+        tasks = {
+            client: entry.async_create_background_task(
+                self.hass, client.async_connect(), f"{DOMAIN} connect {client.username}"
+            )
+            for client in clients
+        }
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=CONNECT_TIMEOUT)
+
+        connected: list[Neviweb130Client] = []
+        failed: dict[Neviweb130Client, BaseException] = {}
+        for client, task in tasks.items():
+            if not task.done():
+                _LOGGER.warning(
+                    "Neviweb account %s is slow to connect, its devices will be added once it is ready",
+                    client.username,
+                )
+                self._connecting[client] = task
+                task.add_done_callback(lambda task: self._connected_late(entry, task))
+            elif task.exception() is None:
+                connected.append(client)
+            else:
+                failed[client] = task.exception()
+                _LOGGER.error("Neviweb account %s failed to connect: %s", client.username, task.exception())
+
+        for err in failed.values():
+            if isinstance(err, (ConfigEntryAuthFailed, ConfigEntryError)):
+                await self.async_shutdown()
+                raise err
+        if not connected:
+            await self.async_shutdown()
+            raise ConfigEntryNotReady("No Neviweb account could be connected")
+        for client in failed:
+            await client.async_close()
+        self.neviweb130_clients = connected
+
+    def discovered_platforms(self) -> list[Platform]:
+        """Return CORE_PLATFORMS and the platforms of the devices discovered on all accounts."""
+        platforms = set(CORE_PLATFORMS)
+        for client in self.neviweb130_clients:
+            platforms.update(Platform(platform) for platform in client.devices.platforms())
+        return sorted(platforms)
+
+    @callback
+    def _connected_late(self, entry: ConfigEntry, task: asyncio.Task) -> None:
+        """Reload the entry to add the devices of an account that connected after the setup."""
+        if task.cancelled() or task.exception() is not None:
+            return
+        _LOGGER.info("Neviweb account connected after setup, reloading neviweb130 to add its devices")
+        self.hass.async_create_task(self.hass.config_entries.async_reload(entry.entry_id))
+
+    async def async_shutdown(self) -> None:
+        """Stop pending logins and close the sessions of all accounts, kept for the next setup."""
+        for task in self._connecting.values():
+            task.cancel()
+        clients = {*self.neviweb130_clients, *self._connecting}
+        self._connecting.clear()
+        for client in clients:
+            await client.async_shutdown(keep_session=True)
+
 
 # According to HA:
 # https://developers.home-assistant.io/docs/en/creating_component_code_review.html
@@ -447,20 +651,25 @@ class PyNeviweb130Error(Exception):
     pass
 
 
+class NeviwebUnavailableError(PyNeviweb130Error):
+    """Request refused locally because the circuit breaker is open."""
+
+
 class Neviweb130Client:
     def __init__(
         self,
         hass,
         username,
         password,
-        network,
-        network2,
-        network3,
+        networks: list[str | None],
         ignore_miwi,
         prefix: str,
         *,
         is_primary: bool = True,
         timeout=REQUESTS_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        weather_interval: int = DEFAULT_WEATHER_INTERVAL,
+        request_target: int = DEFAULT_REQUEST_TARGET,
     ):
         """Initialize the client object."""
         self.hass = hass
@@ -468,26 +677,46 @@ class Neviweb130Client:
         self._is_primary = is_primary
         self._email = username
         self._password = password
-        self._network_name = network
-        self._network_name2 = network2
-        self._network_name3 = network3
+        # Configured location names, in network index order, None to skip an index
+        self._network_names: list[str | None] = list(networks)
         self._code: str | None = None
         self._ignore_miwi = ignore_miwi
-        self._gateway_id = None
-        self._gateway_id2 = None
-        self._gateway_id3 = None
-        self.gateway_data: list[dict[str, Any]] = []
-        self.gateway_data2: list[dict[str, Any]] = []
-        self.gateway_data3: list[dict[str, Any]] = []
+        self._gateway_ids: list[str | None] = []
+        self.devices = DeviceIndex()
         self._account: str | None = None
-        self._cookies: RequestsCookieJar | None = None
+        self._headers: dict[str, str] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._max_connections = max_connections
         self._timeout = timeout
         self._occupancyMode = None
         self.user = None
-
-        self.__post_login_page()
-        self.__get_network()
-        self.__get_gateway_data()
+        self.coordinators: dict[str, Neviweb130Coordinator] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+        self._pending_writes: dict[str, tuple[dict[str, Any], asyncio.Future]] = {}
+        # One PUT in flight per device, so that merged writes reach it in order
+        self._write_locks: dict[str, asyncio.Lock] = {}
+        self._retry_tokens = RETRY_BUDGET_MIN
+        self.breaker = CircuitBreaker(username)
+        self.device_health = DeviceHealth()
+        self._signatures_revalidated = False
+        self._relogin_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._last_login = 0.0
+        self._session_store: Store = Store(
+            hass,
+            SESSION_STORE_VERSION,
+            f"{DOMAIN}_session_{hashlib.sha256(username.encode()).hexdigest()[:12]}",
+            private=True,
+        )
+        self._status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._weather_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._weather_interval = weather_interval
+        self.config_changed_at: dict[str, float] = {}
+        self.poll_scheduler = Neviweb130PollScheduler(hass, username, request_target, DEFAULT_SCAN_INTERVAL)
+        self._location_codes: dict[str, str] = {}
+        self.gateway_status: dict[str, str] = {}
+        self._gateways: dict[str, str] = {}
+        self._device_semaphores: dict[str, asyncio.Semaphore] = {}
 
     def default_group_name(self, platform: str, network_index: int = 1) -> str:
         """Return the base group name used when building entity names.
@@ -501,8 +730,8 @@ class Neviweb130Client:
           to make migration from legacy naming less surprising, e.g.:
           climate.neviweb130_parents_chalet_climate_bathroom
         """
-        if network_index not in (1, 2, 3):
-            raise ValueError("network_index must be 1, 2, or 3")
+        if network_index < 1:
+            raise ValueError("network_index must be 1 or more")
 
         prefix = (self._account_prefix or "").strip()
         if self._is_primary and prefix == "":
@@ -514,11 +743,7 @@ class Neviweb130Client:
         if prefix != "":
             parts.append(prefix)
 
-        location = {
-            1: self._network_name,
-            2: self._network_name2,
-            3: self._network_name3,
-        }.get(network_index)
+        location = self._network_names[network_index - 1] if network_index <= len(self._network_names) else None
         if location:
             parts.append(str(location))
         parts.append(platform)
@@ -533,21 +758,206 @@ class Neviweb130Client:
         device_id = str(device_id)
         if self._is_primary and (self._account_prefix or "").strip() == "":
             return device_id
-        # self._account is set by __post_login_page() during init
+        # self._account is set by _async_post_login_page() during init
         if self._account is None:
             return device_id
         return f"{self._account}_{device_id}"
 
+    @property
+    def username(self) -> str:
+        """Return the Neviweb username of this account."""
+        return self._email
+
+    @property
+    def locations(self) -> list[tuple[int, str]]:
+        """Return (network index, location id) of every selected Neviweb location."""
+        return [
+            (index, str(gateway_id)) for index, gateway_id in enumerate(self._gateway_ids, 1) if gateway_id is not None
+        ]
+
+    def device_location(self, device_id: str) -> str | None:
+        """Return the Neviweb location id of a discovered device."""
+        device = self.devices.get(device_id)
+        return device.location if device is not None else None
+
+    def set_gateway_status(self, location: int | str, gateway_id: str, status: str) -> None:
+        """Record the status of the gateway of a location, read by the gateway sensor."""
+        location = str(location)
+        self._gateways[str(gateway_id)] = location
+        status = str(status).lower()
+        previous = self.gateway_status.get(location)
+        self.gateway_status[location] = status
+        if status != previous and (status == GATEWAY_OFFLINE or previous == GATEWAY_OFFLINE):
+            devices = sum(1 for device in self.devices.location(location) if device.zigbee)
+            if status == GATEWAY_OFFLINE:
+                _LOGGER.warning(
+                    "Gateway %s of location %s is offline, polling of its %s Zigbee devices is paused",
+                    gateway_id,
+                    location,
+                    devices,
+                )
+            else:
+                _LOGGER.warning("Gateway %s of location %s is back %s, resuming polling", gateway_id, location, status)
+
+    def behind_offline_gateway(self, device_id: str) -> bool:
+        """Return True if a Zigbee device can not be reached because the gateway of its location is offline."""
+        device = self.devices.get(device_id)
+        if device is None or not device.zigbee or device.id in self._gateways:
+            return False
+        return self.gateway_status.get(device.location) == GATEWAY_OFFLINE
+
+    def _device_semaphore(self, device_id: str) -> asyncio.Semaphore:
+        """Return the limiter of device requests: one per gateway for Zigbee devices, one for Wi-Fi devices."""
+        key, limit = request_limit(self.devices.get(device_id))
+        semaphore = self._device_semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._device_semaphores[key] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def get_coordinator(self, location: int | str) -> Neviweb130Coordinator:
+        """Return the update coordinator of a location, creating it on first use."""
+        location = str(location)
+        if location not in self.coordinators:
+            coordinator = Neviweb130Coordinator(self.hass, self, location, self.poll_scheduler.interval)
+            self.poll_scheduler.attach(coordinator)
+            self.coordinators[location] = coordinator
+        return self.coordinators[location]
+
+    def plan_request_budget(self, scan_interval: timedelta, stat_interval: int) -> int:
+        """Project the daily request total of this account and pick the poll interval that fits the target."""
+        devices = len(self.devices)
+        self.poll_scheduler.base_interval = scan_interval
+        self.poll_scheduler.interval = scan_interval
+        projected = self.poll_scheduler.plan(devices, len(self.locations), stat_interval)
+        # Coordinators created before a device change keep polling at the new pace too
+        for coordinator in self.coordinators.values():
+            coordinator.set_poll_interval(self.poll_scheduler.interval)
+        if self.poll_scheduler.interval != scan_interval:
+            _LOGGER.warning(
+                "Neviweb account %s: %s devices polled every %s would exceed the daily request target of %s, "
+                "poll interval raised to %s sec (projected %s requests per day)",
+                self._email,
+                devices,
+                scan_interval,
+                self.poll_scheduler.target,
+                int(self.poll_scheduler.interval.total_seconds()),
+                projected,
+            )
+        else:
+            _LOGGER.info(
+                "Neviweb account %s: projected %s requests per day for a target of %s",
+                self._email,
+                projected,
+                self.poll_scheduler.target,
+            )
+        return projected
+
+    async def async_connect(self) -> None:
+        """Login, select networks and discover devices."""
+        if not await self._async_restore_session():
+            await self._async_post_login_page()
+        await self._async_get_network()
+        await self._async_get_gateway_data()
+
+    async def async_update(self) -> None:
+        await self.async_refresh_devices()
+
     def update(self):
-        self.__get_gateway_data()
+        self._run(self.async_update())
 
     def test_connect(self):
-        self.__post_login_page()
+        self._run(self._async_post_login_page())
 
     def reconnect(self):
-        self.__post_login_page()
-        self.__get_network()
-        self.__get_gateway_data()
+        self._run(self.async_reconnect())
+
+    async def async_relogin(self) -> None:
+        """Log in again to renew the session, once for all concurrent callers."""
+        if self._relogin_task is None:
+            self._relogin_task = self.hass.async_create_task(self._async_post_login_page())
+            self._relogin_task.add_done_callback(lambda _: setattr(self, "_relogin_task", None))
+        await asyncio.shield(self._relogin_task)
+
+    async def async_reconnect(self) -> None:
+        """Renew the session and rediscover devices only if a location device list changed.
+
+        Callers hitting an expired session in the same cycle share one reconnection.
+        """
+        if self._reconnect_task is None:
+            self._reconnect_task = self.hass.async_create_task(self._async_reconnect())
+            self._reconnect_task.add_done_callback(lambda _: setattr(self, "_reconnect_task", None))
+        await asyncio.shield(self._reconnect_task)
+
+    async def _async_reconnect(self) -> None:
+        if self.breaker.state != BREAKER_CLOSED:
+            # Neviweb is unavailable, the breaker probe decides when to resume
+            return
+        if time.monotonic() - self._last_login > RELOGIN_GRACE:
+            await self.async_relogin()
+        await self.async_refresh_devices()
+
+    async def async_refresh_devices(self) -> bool:
+        """Compare the device list of each location with the index and discover only the added devices.
+
+        Known devices keep their data, only devices without a stored signature are
+        requested. Devices whose signature could not be read are requested again
+        at each refresh until it is read. Listeners of SIGNAL_DEVICES_CHANGED add and retire entities.
+        Return True if devices were added or removed.
+        """
+        locations = self.locations
+        results = await asyncio.gather(
+            *(
+                self._async_get_location_devices(location, "gateway_data_failed", "Cannot get gateway data.")
+                for _, location in locations
+            )
+        )
+        lists: list[tuple[int, str, list[dict[str, Any]]]] = []
+        new: list[tuple[int, list[dict[str, Any]]]] = []
+        removed: set[str] = set()
+        for (index, location), devices in zip(locations, results):
+            indexed = {device.id: device for device in self.devices.location(location)}
+            if not devices and indexed:
+                # An empty list is more likely a Neviweb glitch than a location emptied at once
+                _LOGGER.debug("Neviweb returned no device for location %s, keeping its devices", location)
+                lists.append((index, location, [device.info for device in indexed.values()]))
+                continue
+            ids = {str(info["id"]) for info in devices}
+            removed.update(set(indexed) - ids)
+            # Devices without a signature were not set up, their signature is requested again
+            known = {device_id: device for device_id, device in indexed.items() if device.model is not None}
+            added = [info for info in devices if str(info["id"]) not in known]
+            if added:
+                new.append((index, added))
+            # Known devices keep the data their entities read
+            infos = [known[str(info["id"])].info if str(info["id"]) in known else info for info in devices]
+            lists.append((index, location, infos))
+        if not new and not removed:
+            return False
+
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                self._async_get_signatures(added, "«network»" if index == 1 else f"«network{index}»", semaphore)
+                for index, added in new
+            )
+        )
+        self.devices = DeviceIndex.build(lists)
+        added_devices = [
+            device
+            for _, added in new
+            for info in added
+            if (device := self.devices.get(info["id"])) is not None and device.model is not None
+        ]
+        if not added_devices and not removed:
+            return False
+        _LOGGER.warning(
+            "Neviweb devices changed for account %s: %s added, %s removed",
+            self._email,
+            len(added_devices),
+            len(removed),
+        )
+        async_dispatcher_send(self.hass, SIGNAL_DEVICES_CHANGED, self, added_devices, removed)
+        return True
 
     def notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
         """Notify user via HA web frontend."""
@@ -562,9 +972,247 @@ class Neviweb130Client:
         )
         return True
 
-    def __post_login_page(self) -> None:
+    async def async_notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
+        """Notify user via HA web frontend."""
+        await self.hass.services.async_call(
+            PN_DOMAIN,
+            "create",
+            service_data={
+                "title": title,
+                "message": msg,
+            },
+            blocking=False,
+        )
+        return True
+
+    def _run(self, coro):
+        """Run a client coroutine on the HA event loop and wait for its result.
+
+        Shim for the sync methods kept for code that is still sync, it must be
+        called from an executor thread. Entities and services await the async_*
+        methods directly.
+        """
+        if threading.get_ident() == self.hass.loop_thread_id:
+            coro.close()
+            raise RuntimeError("Neviweb130Client sync method called from the event loop, await its async_* method")
+        return asyncio.run_coroutine_threadsafe(coro, self.hass.loop).result()
+
+    async def _async_get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled aiohttp session of this account, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    async def _async_save_session(self) -> None:
+        """Store session id and cookies so that next start can reuse them."""
+        session = await self._async_get_session()
+        await self._session_store.async_save(
+            {
+                "session": self._headers.get("Session-Id"),
+                "account": self._account,
+                "user": self.user,
+                "cookies": {cookie.key: cookie.value for cookie in session.cookie_jar},
+            }
+        )
+
+    async def _async_restore_session(self) -> bool:
+        """Reuse the session stored at last run if Neviweb still accepts it."""
+        stored = await self._session_store.async_load()
+        if not stored or not stored.get("session") or not stored.get("account"):
+            return False
+        session = await self._async_get_session()
+        session.cookie_jar.update_cookies(stored.get("cookies", {}), URL(HOST))
+        self._headers = {"Session-Id": stored["session"]}
+        try:
+            status, networks = await self._async_send("GET", LOCATIONS_URL + stored["account"])
+        except (aiohttp.ClientError, TimeoutError, OSError):
+            status, networks = 0, None
+        if status != 200 or not isinstance(networks, list):
+            _LOGGER.debug("Stored Neviweb session rejected, logging in: %s", networks)
+            self._headers = {}
+            session.cookie_jar.clear()
+            return False
+
+        self._account = stored["account"]
+        self.user = stored.get("user")
+        self._last_login = time.monotonic()
+        _LOGGER.debug("Reusing stored Neviweb session for: %s", self._account)
+        return True
+
+    async def async_shutdown(self, keep_session: bool) -> None:
+        """Store the session to reuse it, or log out and forget it, then close the pooled session."""
+        if self._headers.get("Session-Id"):
+            if keep_session:
+                await self._async_save_session()
+            else:
+                try:
+                    await self._async_send("GET", LOGOUT_URL)
+                except (PyNeviweb130Error, aiohttp.ClientError, TimeoutError, OSError) as err:
+                    _LOGGER.debug("Neviweb logout failed: %s", err)
+                await self._session_store.async_remove()
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the pooled session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def refill_retry_budget(self, requests: int) -> None:
+        """Allow retries for a new polling cycle of the given number of requests."""
+        self._retry_tokens = max(self._retry_tokens, RETRY_BUDGET_MIN, int(requests * RETRY_BUDGET_RATIO))
+
+    @staticmethod
+    def _is_session_expired(body: Any) -> bool:
+        """Return True if Neviweb answered that the session expired."""
+        return (
+            isinstance(body, dict) and isinstance(body.get("error"), dict) and body["error"].get("code") == "USRSESSEXP"
+        )
+
+    @staticmethod
+    def _is_retryable(status: int, body: Any) -> bool:
+        """Return True if a response reports a transient failure."""
+        if status in RETRYABLE_HTTP_STATUS:
+            return True
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            return body["error"].get("code") in RETRYABLE_ERROR_CODES
+        return False
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        json_data: dict[str, Any] | None = None,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> tuple[int, Any]:
+        """Send a request with retries, return http status and decoded json body.
+
+        Timeouts, connection errors and transient server answers are retried with
+        exponential backoff and jitter, up to RETRY_ATTEMPTS tries, while the retry
+        budget of the current cycle is not spent. Other answers are returned as is.
+        limiter is held during each try only, not while waiting for the next one.
+        """
+        attempt = 0
+        relogged = False
+        while True:
+            try:
+                session_id = self._headers.get("Session-Id")
+                async with limiter or contextlib.nullcontext():
+                    status, body = await self._async_send(method, url, json_data)
+                if self._is_session_expired(body) and url != LOGIN_URL and not relogged:
+                    # Renew the session, unless another caller already did, and send again
+                    relogged = True
+                    if self._headers.get("Session-Id") == session_id:
+                        await self.async_relogin()
+                    continue
+                if not self._is_retryable(status, body):
+                    return status, body
+                error: BaseException | None = None
+            except (TimeoutError, aiohttp.ClientConnectionError) as err:
+                error = err
+
+            attempt += 1
+            if attempt >= RETRY_ATTEMPTS or self._retry_tokens <= 0:
+                if error is not None:
+                    raise error
+                return status, body
+            self._retry_tokens -= 1
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+            _LOGGER.debug(
+                "Retrying %s %s in %.1f sec (try %s/%s): %s",
+                method,
+                url,
+                delay,
+                attempt + 1,
+                RETRY_ATTEMPTS,
+                error if error is not None else body,
+            )
+            await asyncio.sleep(delay)
+
+    async def _async_send(self, method: str, url: str, json_data: dict[str, Any] | None = None) -> tuple[int, Any]:
+        """Send one request on the pooled session, return http status and decoded json body.
+
+        Refused without reaching Neviweb while the circuit breaker is open.
+        """
+        if not self.breaker.allow_request():
+            raise NeviwebUnavailableError(f"Neviweb requests suspended: {self.breaker.reason}")
+        increment_request_counter(self.hass, url, self._email)
+        session = await self._async_get_session()
+        try:
+            async with session.request(
+                method,
+                url,
+                json=json_data,
+                headers=self._headers,
+                allow_redirects=False,
+            ) as resp:
+                status, body = resp.status, await resp.json(content_type=None)
+        except (aiohttp.ClientError, TimeoutError, OSError, ValueError) as err:
+            self.breaker.record_failure(type(err).__name__)
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release_probe()
+            raise
+
+        code = body["error"].get("code") if isinstance(body, dict) and isinstance(body.get("error"), dict) else None
+        if code in BREAKER_ERROR_CODES:
+            self.breaker.record_error_code(code)
+        elif status >= 500:
+            self.breaker.record_failure(f"HTTP {status}")
+        else:
+            self.breaker.record_success()
+        return status, body
+
+    async def async_probe(self) -> None:
+        """Send the probe request of a half open circuit breaker, its answer closes or reopens it."""
+        try:
+            await self._async_request("GET", LOCATIONS_URL + str(self._account))
+        except (PyNeviweb130Error, aiohttp.ClientError, TimeoutError, OSError, ValueError) as err:
+            _LOGGER.debug("Neviweb probe failed for %s: %s", self._email, err)
+
+    async def _async_cached_fetch(self, kind: str, key: str, cache: dict[str, tuple[float, Any]], ttl: float, fetch):
+        """Return cache[key] if younger than ttl, else run fetch(key) once for all concurrent callers.
+
+        fetch is responsible for storing valid answers in cache.
+        """
+        cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        task = self._inflight.get((kind, key))
+        if task is None:
+            task = self.hass.async_create_task(fetch(key))
+            self._inflight[(kind, key)] = task
+            task.add_done_callback(lambda _: self._inflight.pop((kind, key), None))
+        return await asyncio.shield(task)
+
+    def _log_session_expired(self, data: Any) -> None:
+        """Log USRSESSEXP error received from Neviweb."""
+        if isinstance(data, dict) and "error" in data and data["error"]["code"] == "USRSESSEXP":
+            _LOGGER.error(
+                translated_or_default(
+                    self.hass,
+                    "usr_session",
+                    (
+                        "Warning: Got USRSESSEXP error, Neviweb session expired.\n"
+                        "Set your scan_interval parameter to less than 10 minutes to avoid this...\n"
+                        "Reconnecting..."
+                    ),
+                )
+            )
+
+    async def _async_post_login_page(self) -> None:
         """Login to Neviweb."""
-        increment_request_counter(self.hass)
         data = {
             "username": self._email,
             "password": self._password,
@@ -572,14 +1220,8 @@ class Neviweb130Client:
             "stayConnected": 1,
         }
         try:
-            raw_res = requests.post(
-                LOGIN_URL,
-                json=data,
-                cookies=self._cookies,
-                allow_redirects=False,
-                timeout=self._timeout,
-            )
-        except OSError:
+            status, res = await self._async_request("POST", LOGIN_URL, data)
+        except (aiohttp.ClientError, TimeoutError, OSError):
             raise PyNeviweb130Error(
                 translated_or_default(
                     self.hass,
@@ -587,25 +1229,18 @@ class Neviweb130Client:
                     "Cannot submit login form... Check your network or firewall.",
                 )
             )
-        if raw_res.status_code != 200:
-            _LOGGER.debug("Login status: %s", raw_res.json())
-            data = raw_res.json()
+        if status != 200:
+            _LOGGER.debug("Login status: %s", res)
             raise PyNeviweb130Error(
                 translated_or_default(
                     self.hass,
                     "login_failed",
-                    f"Cannot log in to Neviweb. {data['error']['code']}.",
-                    code=data["error"]["code"],
+                    f"Cannot log in to Neviweb. {res['error']['code']}.",
+                    code=res["error"]["code"],
                 )
             )
 
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-
-        data = raw_res.json()
+        data = res
         _LOGGER.debug("Login response: %s", data)
         if "error" in data:
             if data["error"]["code"] == "ACCSESSEXC":
@@ -646,13 +1281,13 @@ class Neviweb130Client:
 
         self.user = data["user"]
         self._headers = {"Session-Id": data["session"]}
+        self._last_login = time.monotonic()
         self._account = str(data["account"]["id"])
         _LOGGER.debug("Successfully logged in to: %s", self._account)
+        await self._async_save_session()
 
-    def __get_network(self) -> None:
+    async def _async_get_network(self) -> None:
         """Get gateway id associated to the desired network."""
-        increment_request_counter(self.hass)
-        # Http requests
         if self._account is None:
             raise ConfigEntryAuthFailed(
                 translated_or_default(
@@ -663,124 +1298,50 @@ class Neviweb130Client:
             )
 
         try:
-            raw_res = requests.get(
-                LOCATIONS_URL + self._account,
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-            networks = raw_res.json()
+            _, networks = await self._async_request("GET", LOCATIONS_URL + self._account)
             _LOGGER.warning("Number of networks found on Neviweb: %s", len(networks))
             _LOGGER.warning("networks: %s", networks)
-            if (
-                self._network_name is None and self._network_name2 is None and self._network_name3 is None
-            ):  # Use 1st network found, second or third if found
-                self._gateway_id = networks[0]["id"]
-                self._network_name = networks[0]["name"]
-                self._occupancyMode = networks[0]["mode"]
-                self._code = networks[0]["postalCode"]
-                _LOGGER.warning("Selecting %s as first network", self._network_name)
-                if len(networks) > 1:
-                    self._gateway_id2 = networks[1]["id"]
-                    self._network_name2 = networks[1]["name"]
-                    self._occupancyMode = networks[1]["mode"]
-                    self._code = networks[1]["postalCode"]
-                    _LOGGER.warning("Selecting %s as second network", self._network_name2)
-                    if len(networks) > 2:
-                        self._gateway_id3 = networks[2]["id"]
-                        self._network_name3 = networks[2]["name"]
-                        self._occupancyMode = networks[2]["mode"]
-                        self._code = networks[2]["postalCode"]
-                        _LOGGER.warning("Selecting %s as third network", self._network_name3)
+            if not any(self._network_names):  # Use all networks found
+                self._network_names = [network["name"] for network in networks]
+                self._gateway_ids = [network["id"] for network in networks]
+                for index, network in enumerate(networks, 1):
+                    self._occupancyMode = network["mode"]
+                    self._code = network["postalCode"]
+                    _LOGGER.warning("Selecting %s as network %s", network["name"], index)
             else:
-                for network in networks:
-                    if network["name"] == self._network_name:
-                        self._gateway_id = network["id"]
-                        self._occupancyMode = network["mode"]
-                        self._code = network["postalCode"]
-                        _LOGGER.warning(
-                            "Selecting %s network among: %s",
-                            self._network_name,
-                            networks,
-                        )
-                        continue
-                    elif (network["name"] == self._network_name.capitalize()) or (
-                        network["name"] == self._network_name[0].lower() + self._network_name[1:]
-                    ):
-                        self._gateway_id = network["id"]
-                        self._occupancyMode = network["mode"]
-                        self._code = network["postalCode"]
-                        _LOGGER.warning(
-                            "Please check first letter of your network name. "
-                            "Is it a capital letter or not? "
-                            f"Selecting {self._network_name} network among: {networks}"
-                        )
+                self._gateway_ids = [None] * len(self._network_names)
+                for index, name in enumerate(self._network_names, 1):
+                    if not name:
                         continue
+                    suffix = "" if index == 1 else index
+                    network = next((network for network in networks if network["name"] == name), None)
+                    if network is not None:
+                        _LOGGER.warning("Selecting %s network among: %s", name, networks)
                     else:
-                        _LOGGER.warning(
-                            f"Your network name {self._network_name} do not correspond to "
-                            f"discovered network {network['name']}, skipping this one... "
-                            f"Please check your config if nothing get discovered"
+                        network = next(
+                            (
+                                network
+                                for network in networks
+                                if network["name"] in (name.capitalize(), name[0].lower() + name[1:])
+                            ),
+                            None,
                         )
-
-                    if self._network_name2 is not None and self._network_name2 != "":
-                        if network["name"] == self._network_name2:
-                            self._gateway_id2 = network["id"]
-                            self._occupancyMode = network["mode"]
-                            self._code = network["postalCode"]
-                            _LOGGER.debug(
-                                "Selecting %s network among: %s",
-                                self._network_name2,
-                                networks,
-                            )
-                            continue
-                        elif (network["name"] == self._network_name2.capitalize()) or (
-                            network["name"] == self._network_name2[0].lower() + self._network_name2[1:]
-                        ):
-                            self._gateway_id = network["id"]
-                            self._occupancyMode = network["mode"]
-                            self._code = network["postalCode"]
-                            _LOGGER.warning(
-                                "Please check first letter of your network2 name. "
-                                "Is it a capital letter or not? "
-                                f"Selecting {self._network_name2} network among: {networks}"
-                            )
-                            continue
-                        else:
-                            _LOGGER.warning(
-                                f"Your network2 name {self._network_name2} do not correspond to "
-                                f"discovered network {network['name']}, skipping this one..."
-                            )
-
-                    if self._network_name3 is not None and self._network_name3 != "":
-                        if network["name"] == self._network_name3:
-                            self._gateway_id3 = network["id"]
-                            self._occupancyMode = network["mode"]
-                            self._code = network["postalCode"]
+                        if network is None:
                             _LOGGER.warning(
-                                "Selecting %s network among: %s",
-                                self._network_name3,
-                                networks,
+                                f"Your network{suffix} name {name} do not correspond to any discovered network "
+                                f"among {[network['name'] for network in networks]}, skipping it... "
+                                f"Please check your config if nothing get discovered"
                             )
                             continue
-                        elif (network["name"] == self._network_name3.capitalize()) or (
-                            network["name"] == self._network_name3[0].lower() + self._network_name3[1:]
-                        ):
-                            self._gateway_id = network["id"]
-                            self._occupancyMode = network["mode"]
-                            self._code = network["postalCode"]
-                            _LOGGER.warning(
-                                "Please check first letter of your network3 name. "
-                                "Is it a capital letter or not? "
-                                f"Selecting {self._network_name3} network among: {networks}"
-                            )
-                            continue
-                        else:
-                            _LOGGER.warning(
-                                f"Your network3 name {self._network_name3} do not correspond to "
-                                f"discovered network {network['name']}, skipping this one..."
-                            )
-        except OSError:
+                        _LOGGER.warning(
+                            f"Please check first letter of your network{suffix} name. "
+                            "Is it a capital letter or not? "
+                            f"Selecting {name} network among: {networks}"
+                        )
+                    self._gateway_ids[index - 1] = network["id"]
+                    self._occupancyMode = network["mode"]
+                    self._code = network["postalCode"]
+        except (aiohttp.ClientError, TimeoutError, OSError):
             raise PyNeviweb130Error(
                 translated_or_default(
                     self.hass,
@@ -789,22 +1350,23 @@ class Neviweb130Client:
                 )
             )
 
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
+        # Keep postal code of every location for weather requests
+        self._location_codes = {str(network["id"]): network["postalCode"] for network in networks}
 
-        # Prepare data
-        self.gateway_data = raw_res.json()
+    async def _async_get_location_devices(self, gateway_id, error_key: str, error_default: str) -> list[dict[str, Any]]:
+        """Get the device list of one Neviweb location."""
+        try:
+            _, devices = await self._async_request("GET", GATEWAY_DEVICE_URL + str(gateway_id))
+        except (aiohttp.ClientError, TimeoutError, OSError):
+            raise PyNeviweb130Error(translated_or_default(self.hass, error_key, error_default))
+        return devices
 
-    def __get_gateway_data(self) -> None:
+    async def _async_get_gateway_data(self) -> None:
         """Get gateway data."""
-        increment_request_counter(self.hass)
         # Check if gateway_id was set
-        if self._gateway_id is None and self._gateway_id2 is None and self._gateway_id3 is None:
+        if not self.locations:
             _LOGGER.warning("No gateway defined, check your config for networks names...")
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "no_gateway_defined",
@@ -821,233 +1383,173 @@ class Neviweb130Client:
                     ),
                 )
             )
-        # Http requests
-        try:
-            raw_res = requests.get(
-                GATEWAY_DEVICE_URL + str(self._gateway_id),
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-            _LOGGER.debug("Received gateway data: %s", raw_res.json())
-        except OSError:
-            raise PyNeviweb130Error(
-                translated_or_default(
-                    self.hass,
-                    "gateway_data_failed",
-                    "Cannot get gateway data.",
+        # Http requests, all locations at once
+        networks = self.locations
+        results = await asyncio.gather(
+            *(
+                self._async_get_location_devices(
+                    gateway_id,
+                    "gateway_data_failed" if index == 1 else f"gateway_data{index}_failed",
+                    "Cannot get gateway data." if index == 1 else f"Cannot get gateway {index} data.",
                 )
+                for index, gateway_id in networks
             )
+        )
+        for (index, _), devices in zip(networks, results):
+            _LOGGER.debug("Gateway_data%s: %s", "" if index == 1 else index, devices)
+
+        # Device signatures, fetched concurrently with a bounded number of requests in flight
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                self._async_get_signatures(devices, "«network»" if index == 1 else f"«network{index}»", semaphore)
+                for (index, _), devices in zip(networks, results)
+            )
+        )
+        self.devices = DeviceIndex.build(
+            [(index, location, devices) for (index, location), devices in zip(networks, results)]
+        )
 
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-
-        # Prepare data
-        self.gateway_data = raw_res.json()
-        _LOGGER.debug("Gateway_data: %s", self.gateway_data)
+    async def _async_get_signatures(
+        self, devices: list[dict[str, Any]], param: str, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Add the signature of each device of one location to its device data.
 
-        if self._gateway_id2 is not None:
-            try:
-                raw_res2 = requests.get(
-                    GATEWAY_DEVICE_URL + str(self._gateway_id2),
-                    headers=self._headers,
-                    cookies=self._cookies,
-                    timeout=self._timeout,
-                )
-                _LOGGER.debug("Received gateway data 2: %s", raw_res2.json())
-            except OSError:
-                raise PyNeviweb130Error(
-                    translated_or_default(
-                        self.hass,
-                        "gateway_data2_failed",
-                        "Cannot get gateway 2 data.",
-                    )
-                )
+        Stored signatures are used right away and revalidated in background, only
+        devices never seen before are requested before setup goes on.
+        """
+        cache = self.hass.data[DOMAIN]["device_cache"]
+        missing: list[dict[str, Any]] = []
+        for device in devices:
+            signature = cache.signature(str(device["id"]))
+            if signature is not None:
+                device[ATTR_SIGNATURE] = signature
+            else:
+                missing.append(device)
 
-            # Prepare data
-            self.gateway_data2 = raw_res2.json()
-            _LOGGER.debug("Gateway_data2: %s", self.gateway_data2)
+        await asyncio.gather(*(self._async_get_signature(device, semaphore) for device in missing))
+        if len(missing) < len(devices) and not self._signatures_revalidated:
+            self.hass.async_create_background_task(
+                self._async_revalidate_signatures([device for device in devices if device not in missing]),
+                f"{DOMAIN} revalidate signatures {param}",
+            )
 
-        if self._gateway_id3 is not None:
-            try:
-                raw_res3 = requests.get(
-                    GATEWAY_DEVICE_URL + str(self._gateway_id3),
-                    headers=self._headers,
-                    cookies=self._cookies,
-                    timeout=self._timeout,
-                )
-                _LOGGER.debug("Received gateway data 3: %s", raw_res3.json())
-            except OSError:
-                raise PyNeviweb130Error(
-                    translated_or_default(
-                        self.hass,
-                        "gateway_data3_failed",
-                        "Cannot get gateway 3 data.",
-                    )
+        if not self._ignore_miwi and any(
+            (device.get(ATTR_SIGNATURE) or {}).get("protocol") == "miwi" for device in devices
+        ):
+            _LOGGER.debug(
+                translated_or_default(
+                    self.hass,
+                    "ignore_miwi",
+                    (
+                        f"The Neviweb location selected for parameter {param} contains unsupported\n"
+                        "MiWi devices. If this location contains only MiWi devices, use the sinope neviweb\n"
+                        "integration instead. If mixed devices exist, set ignore_miwi:\n"
+                        "True in your neviweb130 configuration."
+                    ),
+                    param=param,
                 )
+            )
 
-            # Prepare data
-            self.gateway_data3 = raw_res3.json()
-            _LOGGER.debug("Gateway_data3: %s", self.gateway_data3)
-
-        for device in self.gateway_data:
-            data = self.get_device_attributes(str(device["id"]), [ATTR_SIGNATURE])
-            if ATTR_SIGNATURE in data:
-                device[ATTR_SIGNATURE] = data[ATTR_SIGNATURE]
-            _LOGGER.debug("Received signature data: %s", data)
-            if data[ATTR_SIGNATURE]["protocol"] == "miwi":
-                if not self._ignore_miwi:
-                    _LOGGER.debug(
-                        translated_or_default(
-                            self.hass,
-                            "ignore_miwi",
-                            (
-                                f"The Neviweb location selected for parameter {'«network»'} contains unsupported\n"
-                                "MiWi devices. If this location contains only MiWi devices, use the sinope neviweb\n"
-                                "integration instead. If mixed devices exist, set ignore_miwi:\n"
-                                "True in your neviweb130 configuration."
-                            ),
-                            param="«network»",
-                        )
-                    )
-        if self._gateway_id2 is not None:
-            for device in self.gateway_data2:
-                data2 = self.get_device_attributes(str(device["id"]), [ATTR_SIGNATURE])
-                if ATTR_SIGNATURE in data2:
-                    device[ATTR_SIGNATURE] = data2[ATTR_SIGNATURE]
-                _LOGGER.debug("Received signature data: %s", data2)
-                if data2[ATTR_SIGNATURE]["protocol"] == "miwi":
-                    if not self._ignore_miwi:
-                        _LOGGER.debug(
-                            translated_or_default(
-                                self.hass,
-                                "ignore_miwi",
-                                (
-                                    f"The Neviweb location selected for parameter {'«network2»'} "
-                                    "contains unsupported\n"
-                                    "MiWi devices. If this location contains only MiWi devices, "
-                                    "use the sinope neviweb\n"
-                                    "integration instead. If mixed devices exist, set ignore_miwi:\n"
-                                    "True in your neviweb130 configuration."
-                                ),
-                                param="«network2»",
-                            )
-                        )
-        if self._gateway_id3 is not None:
-            for device in self.gateway_data3:
-                data3 = self.get_device_attributes(str(device["id"]), [ATTR_SIGNATURE])
-                if ATTR_SIGNATURE in data3:
-                    device[ATTR_SIGNATURE] = data3[ATTR_SIGNATURE]
-                _LOGGER.debug("Received signature data: %s", data3)
-                if data3[ATTR_SIGNATURE]["protocol"] == "miwi":
-                    if not self._ignore_miwi:
-                        _LOGGER.debug(
-                            translated_or_default(
-                                self.hass,
-                                "ignore_miwi",
-                                (
-                                    f"The Neviweb location selected for parameter {'«network3»'} "
-                                    "contains unsupported\n"
-                                    "MiWi devices. If this location contains only MiWi devices, "
-                                    "use the sinope neviweb\n"
-                                    "integration instead. If mixed devices exist, set ignore_miwi:\n"
-                                    "True in your neviweb130 configuration."
-                                ),
-                                param="«network3»",
-                            )
-                        )
+    async def _async_get_signature(self, device: dict[str, Any], semaphore: asyncio.Semaphore) -> bool:
+        """Request the signature of one device, store it, return True if it changed."""
+        async with semaphore:
+            data = await self.async_get_device_attributes(str(device["id"]), [ATTR_SIGNATURE])
+        _LOGGER.debug("Received signature data: %s", data)
+        if ATTR_SIGNATURE not in data:
+            return False
+        changed = device.get(ATTR_SIGNATURE) != data[ATTR_SIGNATURE]
+        device[ATTR_SIGNATURE] = data[ATTR_SIGNATURE]
+        self.hass.data[DOMAIN]["device_cache"].set_signature(str(device["id"]), data[ATTR_SIGNATURE])
+        return changed
+
+    async def _async_revalidate_signatures(self, devices: list[dict[str, Any]]) -> None:
+        """Refresh stored signatures, a changed one is used at next restart."""
+        self._signatures_revalidated = True
+        semaphore = asyncio.Semaphore(REVALIDATE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._async_get_signature(device, semaphore) for device in devices), return_exceptions=True
+        )
+        for device, changed in zip(devices, results):
+            if changed is True:
+                _LOGGER.info(
+                    "Signature of device %s (%s) changed, probably after a firmware update. "
+                    "Restart Home Assistant to apply it",
+                    device["id"],
+                    device.get("name"),
+                )
 
-    def get_device_attributes(self, device_id: str, attributes: list[str]) -> dict[str, Any]:
+    async def async_get_device_attributes(self, device_id: str, attributes: list[str]) -> dict[str, Any]:
         """Get device attributes."""
-        increment_request_counter(self.hass)
         # Http requests
         try:
-            raw_res = requests.get(
+            _, data = await self._async_request(
+                "GET",
                 DEVICE_DATA_URL + device_id + "/attribute?attributes=" + ",".join(attributes),
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
+                limiter=self._device_semaphore(device_id),
             )
-        #            _LOGGER.debug("Received devices data: %s", raw_res.json())
-        except requests.exceptions.ReadTimeout:
+        except TimeoutError:
+            self.device_health.record_failure(device_id, "ReadTimeout")
             return {"errorCode": "ReadTimeout"}
         except Exception as e:
             raise PyNeviweb130Error(f"Cannot get device attributes {e}")
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        if "error" in data:
-            if data["error"]["code"] == "USRSESSEXP":
-                _LOGGER.error(
-                    translated_or_default(
-                        self.hass,
-                        "usr_session",
-                        (
-                            "Warning: Got USRSESSEXP error, Neviweb session expired.\n"
-                            "Set your scan_interval parameter to less than 10 minutes to avoid this...\n"
-                            "Reconnecting..."
-                        ),
-                    )
-                )
+        self._log_session_expired(data)
+        code = data["error"].get("code") if isinstance(data, dict) and isinstance(data.get("error"), dict) else None
+        if code == "DVCATTRNSPTD" and ATTR_ERROR_CODE_SET1 in attributes and len(attributes) > 1:
+            # The device refuses errorCodeSet1 in its main read, it is read separately from now on
+            _LOGGER.info("Device %s does not support %s in its attribute read", device_id, ATTR_ERROR_CODE_SET1)
+            UNSUPPORTED_ATTRS.setdefault(device_id, set()).add(ATTR_ERROR_CODE_SET1)
+            return await self.async_get_device_attributes(
+                device_id, [attr for attr in attributes if attr != ATTR_ERROR_CODE_SET1]
+            )
+        if code in DEVICE_OFFLINE_CODES:
+            self.device_health.record_failure(device_id, code)
+        elif code is None:
+            self.device_health.record_success(device_id)
         return data
 
-    def get_device_status(self, device_id: str):
+    def get_device_attributes(self, device_id: str, attributes: list[str]) -> dict[str, Any]:
+        """Get device attributes."""
+        return self._run(self.async_get_device_attributes(device_id, attributes))
+
+    async def async_get_device_status(self, device_id: str):
         """Get device status for the GT130."""
-        increment_request_counter(self.hass)
         # Http requests
         try:
-            raw_res = requests.get(
-                DEVICE_DATA_URL + device_id + "/status",
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-            _LOGGER.debug("Received devices status: %s", raw_res.json())
-        except requests.exceptions.ReadTimeout:
+            _, data = await self._async_request("GET", DEVICE_DATA_URL + device_id + "/status")
+            _LOGGER.debug("Received devices status: %s", data)
+        except TimeoutError:
             return {"errorCode": "ReadTimeout"}
         except Exception as e:
             raise PyNeviweb130Error("Cannot get device status", e)
-        # Prepare data
-        data = raw_res.json()
-        if "error" in data:
-            if data["error"]["code"] == "USRSESSEXP":
-                _LOGGER.error(
-                    translated_or_default(
-                        self.hass,
-                        "usr_session",
-                        (
-                            "Warning: Got USRSESSEXP error, Neviweb session expired.\n"
-                            "Set your scan_interval parameter to less than 10 minutes to avoid this...\n"
-                            "Reconnecting..."
-                        ),
-                    )
-                )
+        self._log_session_expired(data)
         return data
 
-    def get_neviweb_status(self, location):
-        """Get neviweb occupancyMode status."""
-        increment_request_counter(self.hass)
+    def get_device_status(self, device_id: str):
+        """Get device status for the GT130."""
+        return self._run(self.async_get_device_status(device_id))
+
+    async def async_get_neviweb_status(self, location):
+        """Get neviweb occupancyMode status.
+
+        Status is cached per location for STATUS_CACHE_TTL seconds and concurrent
+        callers share the same request.
+        """
+        location = str(location)
+        return await self._async_cached_fetch(
+            "status", location, self._status_cache, STATUS_CACHE_TTL, self._async_fetch_neviweb_status
+        )
+
+    async def _async_fetch_neviweb_status(self, location: str):
+        """Request neviweb occupancyMode status and cache valid answers."""
         # Http requests
         try:
-            raw_res = requests.get(
-                NEVIWEB_LOCATION + str(location) + "/notifications",
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-            _LOGGER.debug("Received neviweb status: %s", raw_res.json())
-        except requests.exceptions.ReadTimeout:
+            _, data = await self._async_request("GET", NEVIWEB_LOCATION + location + "/notifications")
+            _LOGGER.debug("Received neviweb status: %s", data)
+        except TimeoutError:
             return {"errorCode": "ReadTimeout"}
         except Exception as e:
             raise PyNeviweb130Error("Cannot get neviweb status", e)
-        data = raw_res.json()
         if "error" in data:
             if data["error"]["code"] == "USRSESSEXP":
                 _LOGGER.error(
@@ -1061,21 +1563,26 @@ class Neviweb130Client:
                         param=location,
                     )
                 )
+        elif "errorCode" not in data:
+            self._status_cache[location] = (time.monotonic(), data)
         return data
 
-    def get_device_alert(self, device_id: str):
+    def cached_neviweb_status(self, location: int | str) -> dict[str, Any] | None:
+        """Return last known occupancy status of a location without any request."""
+        cached = self._status_cache.get(str(location))
+        return cached[1] if cached is not None else None
+
+    def get_neviweb_status(self, location):
+        """Get neviweb occupancyMode status."""
+        return self._run(self.async_get_neviweb_status(location))
+
+    async def async_get_device_alert(self, device_id: str):
         """Get device alert for Sedna valve."""
-        increment_request_counter(self.hass)
         # Http requests
         try:
-            raw_res = requests.get(
-                DEVICE_DATA_URL + device_id + "/alert",
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-            _LOGGER.debug("Received devices alert (%s): %s", device_id, raw_res.json())
-        except requests.exceptions.ReadTimeout:
+            _, data = await self._async_request("GET", DEVICE_DATA_URL + device_id + "/alert")
+            _LOGGER.debug("Received devices alert (%s): %s", device_id, data)
+        except TimeoutError:
             return {"errorCode": "ReadTimeout"}
         except Exception as e:
             raise PyNeviweb130Error(
@@ -1086,236 +1593,151 @@ class Neviweb130Client:
                     id=device_id,
                 )
             ) from e
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        if "error" in data:
-            if data["error"]["code"] == "USRSESSEXP":
-                _LOGGER.error(
-                    translated_or_default(
-                        self.hass,
-                        "usr_session",
-                        (
-                            "Warning: Got USRSESSEXP error, Neviweb session expired.\n"
-                            "Set your scan_interval parameter to less than 10 minutes to avoid this...\n"
-                            "Reconnecting..."
-                        ),
-                    )
-                )
+        self._log_session_expired(data)
         return data
 
-    def get_device_monthly_stats(self, device_id: str, HC: bool):
-        """Get device power consumption (in Wh) for the last 24 months."""
-        increment_request_counter(self.hass)
+    def get_device_alert(self, device_id: str):
+        """Get device alert for Sedna valve."""
+        return self._run(self.async_get_device_alert(device_id))
+
+    async def _async_get_device_stats(self, device_id: str, HC: bool, period: str):
+        """Get device power consumption history for period monthly, daily or hourly."""
         # Http requests
         if HC:
-            data = DEVICE_DATA_URL + device_id + "/energy/monthly"
+            url = DEVICE_DATA_URL + device_id + "/energy/" + period
         else:
-            data = DEVICE_DATA_URL + device_id + "/consumption/monthly"
-        _LOGGER.debug("monthly data = %s", data)
+            url = DEVICE_DATA_URL + device_id + "/consumption/" + period
+        _LOGGER.debug("%s data = %s", period, url)
         try:
-            raw_res = requests.get(
-                data,
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-        except OSError:
+            _, data = await self._async_request("GET", url)
+        except (aiohttp.ClientError, TimeoutError, OSError):
             raise PyNeviweb130Error(
                 translated_or_default(
                     self.hass,
                     "energy_stat",
-                    f"Cannot get {'monthly'} stats for device {device_id}.",
-                    param="monthly",
+                    f"Cannot get {period} stats for device {device_id}.",
+                    param=period,
                     id=device_id,
                 )
             )
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        # _LOGGER.debug("Monthly_stats data: %s", data)
         if HC:
             return data
         else:
             if "history" in data:
                 return data["history"]
-        _LOGGER.debug("Monthly stat error: %s", data)
+        _LOGGER.debug("%s stat error: %s", period.capitalize(), data)
         return None
 
+    async def async_get_device_monthly_stats(self, device_id: str, HC: bool):
+        """Get device power consumption (in Wh) for the last 24 months."""
+        return await self._async_get_device_stats(device_id, HC, "monthly")
+
+    def get_device_monthly_stats(self, device_id: str, HC: bool):
+        """Get device power consumption (in Wh) for the last 24 months."""
+        return self._run(self.async_get_device_monthly_stats(device_id, HC))
+
+    async def async_get_device_daily_stats(self, device_id: str, HC: bool):
+        """Get device power consumption (in Wh) for the last 30 days."""
+        return await self._async_get_device_stats(device_id, HC, "daily")
+
     def get_device_daily_stats(self, device_id: str, HC: bool):
         """Get device power consumption (in Wh) for the last 30 days."""
-        increment_request_counter(self.hass)
-        # Http requests
-        if HC:
-            data = DEVICE_DATA_URL + device_id + "/energy/daily"
-        else:
-            data = DEVICE_DATA_URL + device_id + "/consumption/daily"
-        _LOGGER.debug("daily data = %s", data)
-        try:
-            raw_res = requests.get(
-                data,
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-        except OSError:
-            raise PyNeviweb130Error(
-                translated_or_default(
-                    self.hass,
-                    "energy_stat",
-                    f"Cannot get {'daily'} stats for device {device_id}.",
-                    param="daily",
-                    id=device_id,
-                )
-            )
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        # _LOGGER.debug("Daily_stats data: %s", data)
-        if HC:
-            return data
-        else:
-            if "history" in data:
-                return data["history"]
-        _LOGGER.debug("Daily stat error: %s", data)
-        return None
+        return self._run(self.async_get_device_daily_stats(device_id, HC))
+
+    async def async_get_device_hourly_stats(self, device_id: str, HC: bool):
+        """Get device power consumption (in Wh) for the last 24 hours."""
+        return await self._async_get_device_stats(device_id, HC, "hourly")
 
     def get_device_hourly_stats(self, device_id: str, HC: bool):
         """Get device power consumption (in Wh) for the last 24 hours."""
-        increment_request_counter(self.hass)
-        # Http requests
-        if HC:
-            data = DEVICE_DATA_URL + device_id + "/energy/hourly"
-        else:
-            data = DEVICE_DATA_URL + device_id + "/consumption/hourly"
-        _LOGGER.debug("hourly data = %s", data)
-        try:
-            raw_res = requests.get(
-                data,
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-        except OSError:
-            raise PyNeviweb130Error(
-                translated_or_default(
-                    self.hass,
-                    "energy_stat",
-                    f"Cannot get {'hourly'} stats for device {device_id}.",
-                    param="hourly",
-                    id=device_id,
-                )
-            )
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
-        # _LOGGER.debug("Hourly_stats data: %s", data)
-        if HC:
-            return data
-        else:
-            if "history" in data:
-                return data["history"]
-        _LOGGER.debug("Hourly stat error: %s", data)
-        return None
+        return self._run(self.async_get_device_hourly_stats(device_id, HC))
 
-    def get_weather(self):
-        """Get Neviweb weather for my location."""
-        increment_request_counter(self.hass)
-        if self._code is None:
+    async def async_get_weather(self, location: int | str | None = None):
+        """Get Neviweb weather for my location.
+
+        Weather is cached per postal code and refreshed every weather_interval seconds.
+        """
+        code = self._location_codes.get(str(location), self._code) if location is not None else self._code
+        if code is None:
             raise ValueError("self._code is None")
+        return await self._async_cached_fetch(
+            "weather", code, self._weather_cache, self._weather_interval, self._async_fetch_weather
+        )
+
+    async def _async_fetch_weather(self, code: str):
+        """Request Neviweb weather for a postal code and cache valid answers."""
         try:
-            raw_res = requests.get(
-                NEVIWEB_WEATHER + self._code,
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
-        except OSError:
+            _, data = await self._async_request("GET", NEVIWEB_WEATHER + code)
+        except NeviwebUnavailableError:
+            cached = self._weather_cache.get(code)
+            if cached is None:
+                raise
+            # Requests are suspended, last weather read is kept past weather_interval
+            return cached[1]
+        except (aiohttp.ClientError, TimeoutError, OSError):
             raise PyNeviweb130Error(
                 translated_or_default(
                     self.hass,
                     "weather_data",
-                    f"Cannot get Neviweb weather and icon for code {self._code}.",
-                    code=self._code,
+                    f"Cannot get Neviweb weather and icon for code {code}.",
+                    code=code,
                 )
             )
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
         # _LOGGER.debug("weather data: %s", data)
+        if isinstance(data, dict) and "error" not in data:
+            self._weather_cache[code] = (time.monotonic(), data)
         return data
 
-    def get_device_sensor_error(self, device_id: str):
+    def get_weather(self, location: int | str | None = None):
+        """Get Neviweb weather for my location."""
+        return self._run(self.async_get_weather(location))
+
+    async def async_get_device_sensor_error(self, device_id: str):
         """Get device error code status."""
-        increment_request_counter(self.hass)
         # Http requests
         try:
-            raw_res = requests.get(
+            _, data = await self._async_request(
+                "GET",
                 DEVICE_DATA_URL + device_id + "/attribute?attributes=errorCodeSet1",
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
+                limiter=self._device_semaphore(device_id),
             )
-        except OSError:
+        except (aiohttp.ClientError, TimeoutError, OSError):
             raise PyNeviweb130Error("Cannot get device error code status...")
-        # Update cookies
-        if self._cookies is None:
-            self._cookies = raw_res.cookies
-        else:
-            self._cookies.update(raw_res.cookies)
-        # Prepare data
-        data = raw_res.json()
         if "errorCodeSet1" in data:
             return data["errorCodeSet1"]
         _LOGGER.debug("Error code status data: %s", data)
         return None
 
-    def set_brightness(self, device_id: str, brightness):
+    def get_device_sensor_error(self, device_id: str):
+        """Get device error code status."""
+        return self._run(self.async_get_device_sensor_error(device_id))
+
+    async def async_set_brightness(self, device_id: str, brightness):
         """Set device brightness."""
         data = {ATTR_INTENSITY: brightness}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_onoff(self, device_id: str, onoff):
+    async def async_set_onoff(self, device_id: str, onoff):
         """Set device onOff state."""
         data = {ATTR_ONOFF: onoff}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_light_onoff(self, device_id: str, onoff, brightness):
+    async def async_set_light_onoff(self, device_id: str, onoff, brightness):
         """Set light device onOff state."""
         data = {ATTR_ONOFF: onoff, ATTR_INTENSITY: brightness}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_valve_onoff(self, device_id: str, onoff):
+    async def async_set_valve_onoff(self, device_id: str, onoff):
         """Set sedna valve onOff state."""
         data = {ATTR_MOTOR_TARGET: onoff}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_mode(self, device_id: str, mode):
+    async def async_set_mode(self, device_id: str, mode):
         """Set device operation mode."""
         data = {ATTR_POWER_MODE: mode}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_setpoint_mode(self, device_id: str, mode, wifi, HC):
+    async def async_set_setpoint_mode(self, device_id: str, mode, wifi, HC):
         """Set thermostat operation mode."""
         """Work differently for Wi-Fi and Zigbee devices and TH6250xx devices."""
         if wifi:
@@ -1329,9 +1751,9 @@ class Neviweb130Client:
         else:
             data = {ATTR_SYSTEM_MODE: mode}
         _LOGGER.debug("Setpoint mode data: %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_occupancy_mode(self, device_id: str, mode, wifi):
+    async def async_set_occupancy_mode(self, device_id: str, mode, wifi):
         """Set thermostat preset mode."""
         """Work differently for Wi-Fi and Zigbee devices."""
         if wifi:
@@ -1341,30 +1763,30 @@ class Neviweb130Client:
                 return
         else:
             data = {ATTR_SYSTEM_MODE: mode}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_temperature(self, device_id: str, temperature):
+    async def async_set_temperature(self, device_id: str, temperature):
         """Set device heating temperature target."""
         data = {ATTR_ROOM_SETPOINT: temperature}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_temperature(self, device_id: str, temperature):
+    async def async_set_cool_temperature(self, device_id: str, temperature):
         """Set device cooling temperature target."""
         data = {ATTR_COOL_SETPOINT: temperature}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_room_setpoint_away(self, device_id: str, temperature):
+    async def async_set_room_setpoint_away(self, device_id: str, temperature):
         """Set device away heating temperature target for all Wi-Fi thermostats."""
         data = {ATTR_ROOM_SETPOINT_AWAY: temperature}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_setpoint_away(self, device_id: str, temperature, HC):
+    async def async_set_cool_setpoint_away(self, device_id: str, temperature, HC):
         """Set device away cooling temperature target for TH6500WF and TH6250WF."""
         if HC:
             data = {ATTR_COOL_SETPOINT_AWAY: temperature}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1378,12 +1800,12 @@ class Neviweb130Client:
                 )
             )
 
-    def set_humidity(self, device_id: str, humidity):
+    async def async_set_humidity(self, device_id: str, humidity):
         """Set device humidity target."""
         data = {ATTR_HUMIDITY_SETPOINT: humidity}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_accessory_type(self, device_id: str, accessory_type):
+    async def async_set_accessory_type(self, device_id: str, accessory_type):
         """Set accessory (humidifier, dehumidifier, air exchanger) type for TH6500WF and TH6250WF."""
         data = {
             ATTR_ACCESSORY_TYPE: {
@@ -1394,15 +1816,15 @@ class Neviweb130Client:
                 "airExchangerStandalone": accessory_type == "airExchanger",
             }
         }
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_schedule_mode(self, device_id: str, mode, HC):
+    async def async_set_schedule_mode(self, device_id: str, mode, HC):
         """Set schedule mode for TH6500WF and TH6250WF."""
         if HC:
             data = {ATTR_SETPOINT_MODE: mode}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1416,13 +1838,13 @@ class Neviweb130Client:
                 )
             )
 
-    def set_heatcool_delta(self, device_id: str, level, HC):
+    async def async_set_heatcool_delta(self, device_id: str, level, HC):
         """Set schedule mode for TH6500WF and TH6250WF."""
         if HC:
             data = {ATTR_HEATCOOL_SETPOINT_MIN_DELTA: level}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1436,14 +1858,14 @@ class Neviweb130Client:
                 )
             )
 
-    def set_fan_filter_reminder(self, device_id: str, month, HC):
+    async def async_set_fan_filter_reminder(self, device_id: str, month, HC):
         """Set schedule mode for TH6500WF and TH6250WF."""
         if HC:
             month_val = month * 720
             data = {ATTR_FAN_FILTER_REMAIN: month_val}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1457,13 +1879,13 @@ class Neviweb130Client:
                 )
             )
 
-    def set_temperature_offset(self, device_id: str, temp, HC):
+    async def async_set_temperature_offset(self, device_id: str, temp, HC):
         """Set schedule mode for TH6500WF and TH6250WF."""
         if HC:
             data = {ATTR_TEMP_OFFSET_HEAT: temp}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1477,13 +1899,13 @@ class Neviweb130Client:
                 )
             )
 
-    def set_humidity_offset(self, device_id: str, offset, HC):
+    async def async_set_humidity_offset(self, device_id: str, offset, HC):
         """Set humidity setpoint offset for TH6500WF and TH6250WF."""
         if HC:
             data = {ATTR_HUMIDITY_SETPOINT_OFFSET: offset}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1497,13 +1919,13 @@ class Neviweb130Client:
                 )
             )
 
-    def set_humidity_mode(self, device_id: str, mode, HC):
+    async def async_set_humidity_mode(self, device_id: str, mode, HC):
         """Set humidity setpoint mode for TH6500WF and TH6250WF."""
         if HC:
             data = {ATTR_HUMIDITY_SETPOINT_MODE: mode}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1517,7 +1939,7 @@ class Neviweb130Client:
                 )
             )
 
-    def set_air_ex_min_time_on(self, device_id: str, time, HC):
+    async def async_set_air_ex_min_time_on(self, device_id: str, time, HC):
         """Set minimum time the air exchanger is on per hour."""
         if HC:
             time_val = None
@@ -1531,9 +1953,9 @@ class Neviweb130Client:
                 case "Continuous":
                     time_val = 60
             data = {ATTR_AIR_EX_MIN_TIME_ON: time_val}
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -1547,12 +1969,12 @@ class Neviweb130Client:
                 )
             )
 
-    def set_heat_installation_type(self, device_id: str, type_val: str):
+    async def async_set_heat_installation_type(self, device_id: str, type_val: str):
         """Set heater installation type (add-on or conventional)."""
         data = {ATTR_HEAT_INSTALLATION_TYPE: type_val}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_backlight(self, device_id: str, level, is_wifi: bool):
+    async def async_set_backlight(self, device_id: str, level, is_wifi: bool):
         """Set backlight intensity when idle, on or auto.
         Work differently for Wi-Fi and Zigbee devices."""
         if is_wifi:
@@ -1560,104 +1982,104 @@ class Neviweb130Client:
         else:
             data = {ATTR_BACKLIGHT: level}
         _LOGGER.debug("backlight.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_second_display(self, device_id: str, display):
+    async def async_set_second_display(self, device_id: str, display):
         """Set device second display for outside temperature or setpoint temperature."""
         data = {ATTR_DISPLAY2: display}
         _LOGGER.debug("display.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_keypad_lock(self, device_id: str, lock, wifi):
+    async def async_set_keypad_lock(self, device_id: str, lock, wifi):
         """Set device keyboard locked/unlocked."""
         if wifi:
             data = {ATTR_WIFI_KEYPAD: lock}
         else:
             data = {ATTR_KEYPAD: lock}
         _LOGGER.debug("lock.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_phase(self, device_id: str, phase):
+    async def async_set_phase(self, device_id: str, phase):
         """Set device phase control mode."""
         data = {ATTR_PHASE_CONTROL: phase}
         _LOGGER.debug("phase.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_double_up(self, device_id: str, double):
+    async def async_set_double_up(self, device_id: str, double):
         """Set device key double up action."""
         data = {ATTR_KEY_DOUBLE_UP: double}
         _LOGGER.debug("double_up.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_timer(self, device_id: str, time):
+    async def async_set_timer(self, device_id: str, time):
         """Set device auto off for timer on switch and multi controller."""
         data = {ATTR_TIMER: time}
         _LOGGER.debug("timer.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_timer2(self, device_id: str, time):
+    async def async_set_timer2(self, device_id: str, time):
         """Set device auto off for timer2 on multi controller."""
         data = {ATTR_TIMER2: time}
         _LOGGER.debug("timer2.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_time_format(self, device_id: str, time):
+    async def async_set_time_format(self, device_id: str, time):
         """Set device time format 12h or 24h."""
         data = {ATTR_TIME_FORMAT: time}
         _LOGGER.debug("time.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_temperature_format(self, device_id: str, deg):
+    async def async_set_temperature_format(self, device_id: str, deg):
         """Set device temperature format: celsius or fahrenheit."""
         data = {ATTR_TEMP: deg}
         _LOGGER.debug("temperature.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_floor_air_limit(self, device_id: str, status, temp):
+    async def async_set_floor_air_limit(self, device_id: str, status, temp):
         """Set device maximum air temperature limit."""
         if temp == 0:
             temp = None
         data = {ATTR_FLOOR_AIR_LIMIT: {"status": status, "value": temp}}
         _LOGGER.debug("floorairlimit.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_early_start(self, device_id: str, start):
+    async def async_set_early_start(self, device_id: str, start):
         """Set early start on/off for Wi-Fi thermostats."""
         data = {ATTR_EARLY_START: start}
         _LOGGER.debug("early_start.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_air_floor_mode(self, device_id: str, mode):
+    async def async_set_air_floor_mode(self, device_id: str, mode):
         """Switch temperature control between floor and ambient sensor."""
         data = {ATTR_FLOOR_MODE: mode}
         _LOGGER.debug("floor_mode.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_setpoint_min(self, device_id: str, temp):
+    async def async_set_setpoint_min(self, device_id: str, temp):
         """Set device setpoint minimum temperature."""
         data = {ATTR_ROOM_SETPOINT_MIN: temp}
         _LOGGER.debug("setpointMin.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_setpoint_max(self, device_id: str, temp):
+    async def async_set_setpoint_max(self, device_id: str, temp):
         """Set device setpoint maximum temperature."""
         data = {ATTR_ROOM_SETPOINT_MAX: temp}
         _LOGGER.debug("setpointMax.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_setpoint_min(self, device_id: str, temp):
+    async def async_set_cool_setpoint_min(self, device_id: str, temp):
         """Set device cooling setpoint minimum temperature."""
         data = {ATTR_COOL_SETPOINT_MIN: temp}
         _LOGGER.debug("CoolsetpointMin.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_setpoint_max(self, device_id: str, temp):
+    async def async_set_cool_setpoint_max(self, device_id: str, temp):
         """Set device cooling setpoint maximum temperature."""
         data = {ATTR_COOL_SETPOINT_MAX: temp}
         _LOGGER.debug("CoolsetpointMax.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_cycle_output(self, device_id: str, val: int, wifi: bool):
+    async def async_set_aux_cycle_output(self, device_id: str, val: int, wifi: bool):
         """Set low voltage thermostat aux cycle status and length."""
         data: dict[str, Any]
         if wifi:
@@ -1666,9 +2088,9 @@ class Neviweb130Client:
         else:
             data = {ATTR_CYCLE_OUTPUT2: {"status": "on" if val > 0 else "off", "value": val}}
             _LOGGER.debug("auxCycleOutput.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cycle_output(self, device_id: str, val: int, is_hc: bool):
+    async def async_set_cycle_output(self, device_id: str, val: int, is_hc: bool):
         """Set low voltage thermostat main cycle length."""
         if is_hc:
             data = {ATTR_COOL_CYCLE_LENGTH: val}
@@ -1676,42 +2098,42 @@ class Neviweb130Client:
         else:
             data = {ATTR_CYCLE_LENGTH: val}
             _LOGGER.debug("cycleOutput.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_tank_size(self, device_id: str, val):
+    async def async_set_tank_size(self, device_id: str, val):
         """Set water heater tank size for RM3500ZB."""
         data = {ATTR_TANK_SIZE: val}
         _LOGGER.debug("TankSize.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_remaining_time(self, device_id: str, time):
+    async def async_set_remaining_time(self, device_id: str, time):
         """Activate or deactivate calypso for time period."""
         data = {ATTR_COLD_LOAD_PICKUP_REMAIN_TIME: time}
         _LOGGER.debug("RemainingTime.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_sensor_type(self, device_id: str, val):
+    async def async_set_sensor_type(self, device_id: str, val):
         """Set floor sensor type 10k, 12k."""
         data = {
             ATTR_FLOOR_SENSOR: val,
             ATTR_FLOOR_OUTPUT2: {"status": "off", "value": 0},
         }
         _LOGGER.debug("sensor.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_low_temp_protection(self, device_id: str, val):
+    async def async_set_low_temp_protection(self, device_id: str, val):
         """Set water heater temperature protection for RM3500ZB."""
         data = {ATTR_WATER_TEMP_MIN: val}
         _LOGGER.debug("Low temp protection.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_controlled_device(self, device_id: str, val):
+    async def async_set_controlled_device(self, device_id: str, val):
         """Set device name controlled by RM3250ZB and RM3250WF."""
         data = {ATTR_CONTROLLED_DEVICE: val}
         _LOGGER.debug("ControlledDevice.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_em_heat(self, device_id: str, heat, low, sec):
+    async def async_set_em_heat(self, device_id: str, heat, low, sec):
         """Set floor, low voltage, Wi-Fi floor and low voltage Wi-Fi thermostats auxiliary heat slave/off or on/off."""
         if low == "voltage":
             data = {ATTR_CYCLE_OUTPUT2: {"status": heat, "value": sec}}
@@ -1720,9 +2142,9 @@ class Neviweb130Client:
         else:
             data = {ATTR_FLOOR_AUX: heat}
         _LOGGER.debug("em_heat.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_floor_limit(self, device_id: str, level, low, wifi):
+    async def async_set_floor_limit(self, device_id: str, level, low, wifi):
         """Set floor setpoint limit low and high for Zigbee and Wi-Fi thermostats. (0 = off)."""
         data: dict[str, dict[str, str | int | None]]
         if level == 0:
@@ -1760,9 +2182,9 @@ class Neviweb130Client:
                         ATTR_FLOOR_OUTPUT2: {"status": "off", "value": 0},
                     }
         _LOGGER.debug("Floor limit = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_pump_protection(self, device_id: str, status, wifi):
+    async def async_set_pump_protection(self, device_id: str, status, wifi):
         """Set low voltage thermostat pump protection status.
         Work differently for Wi-Fi and zigbee devices."""
         if wifi:
@@ -1779,9 +2201,9 @@ class Neviweb130Client:
                     ATTR_PUMP_PROTEC_PERIOD: {"status": "off"},
                 }
         _LOGGER.debug("pump.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_flow_meter_model(self, device_id: str, model):
+    async def async_set_flow_meter_model(self, device_id: str, model):
         """Set flow meter model connected to the Sedna valve 2e gen."""
         if model == "FS4221":
             data = {
@@ -1811,15 +2233,15 @@ class Neviweb130Client:
                 ATTR_FLOW_ENABLED: False,
             }
         _LOGGER.debug("Flowmeter model.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_flow_meter_delay(self, device_id: str, delay):
+    async def async_set_flow_meter_delay(self, device_id: str, delay):
         """Set flow meter delay before alarm is activated on Sedna valve 2e gen."""
         data = {ATTR_FLOW_ALARM1_PERIOD: delay}
         _LOGGER.debug("Flowmeter delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_flow_meter_options(self, device_id: str, alarm, action, length, threshold):
+    async def async_set_flow_meter_options(self, device_id: str, alarm, action, length, threshold):
         """Set flow meter options when leak alarm is activated on Sedna valve 2e gen."""
         data = {
             ATTR_FLOW_ALARM1_OPTION: {
@@ -1830,15 +2252,15 @@ class Neviweb130Client:
             ATTR_FLOW_THRESHOLD: threshold,
         }
         _LOGGER.debug("Flowmeter options.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_flow_alarm_timer(self, device_id: str, timer):
+    async def async_set_flow_alarm_timer(self, device_id: str, timer):
         """Set flowmeter alarm action disabled timer, for valves with flowmeter."""
         data = {ATTR_FLOW_ALARM_TIMER: timer}
         _LOGGER.debug("Flowmeter alarm disable timer.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_led_indicator(self, device_id: str, state, red, green, blue):
+    async def async_set_led_indicator(self, device_id: str, state, red, green, blue):
         """Set device led indicator intensity and color for on and off state."""
         if state == 1:
             data = {
@@ -1858,66 +2280,66 @@ class Neviweb130Client:
                 }
             }
             _LOGGER.debug("led off color.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_led_on_intensity(self, device_id: str, intensity):
+    async def async_set_led_on_intensity(self, device_id: str, intensity):
         """Set device led indicator intensity for on state."""
         data = {ATTR_LED_ON_INTENSITY: intensity}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
         _LOGGER.debug("led on intensity.data on = %s", data)
 
-    def set_led_off_intensity(self, device_id: str, intensity):
+    async def async_set_led_off_intensity(self, device_id: str, intensity):
         """Set device led indicator intensity for off state."""
         data = {ATTR_LED_OFF_INTENSITY: intensity}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
         _LOGGER.debug("led off intensity.data on = %s", data)
 
-    def set_light_min_intensity(self, device_id: str, intensity):
+    async def async_set_light_min_intensity(self, device_id: str, intensity):
         """Set dimmer light minimum intensity from 1 to 3000."""
         data = {ATTR_INTENSITY_MIN: intensity}
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
         _LOGGER.debug("led min intensity.data on = %s", data)
 
-    def set_wattage(self, device_id: str, watt):
+    async def async_set_wattage(self, device_id: str, watt):
         """Set light and dimmer watt load."""
         data = {ATTR_LIGHT_WATTAGE: {"status": "on", "value": watt}}
         _LOGGER.debug("wattage.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_auxiliary_load(self, device_id: str, status, load):
+    async def async_set_auxiliary_load(self, device_id: str, status, load):
         """Set auxiliary output load in watt."""
         data = {ATTR_FLOOR_OUTPUT2: {"status": status, "value": load}}
         _LOGGER.debug("auxiliary_load.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_valve_alert(self, device_id: str, batt):
+    async def async_set_valve_alert(self, device_id: str, batt):
         """Set Sedna valve battery alert on/off."""
         data = {ATTR_BATT_ALERT: batt}
         _LOGGER.debug("valve.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_valve_temp_alert(self, device_id: str, temp):
+    async def async_set_valve_temp_alert(self, device_id: str, temp):
         """Set Sedna valve temperature alert on/off."""
         data = {ATTR_TEMP_ALERT: temp}
         _LOGGER.debug("valve.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_switch_temp_alert(self, device_id: str, temp):
+    async def async_set_switch_temp_alert(self, device_id: str, temp):
         """Set low temperature alert for MC3100ZB. 0 = off, 5 = on."""
         if temp == 0:
             temp = None
 
         data = {ATTR_TEMP_ALERT: temp}
         _LOGGER.debug("switch_temp_alert.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_battery_type(self, device_id: str, batt):
+    async def async_set_battery_type(self, device_id: str, batt):
         """Set water leak sensor battery type, lithium or alkaline."""
         data = {ATTR_BATTERY_TYPE: batt}
         _LOGGER.debug("battery_type.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_sensor_alert(self, device_id: str, leak, batt, temp, close):
+    async def async_set_sensor_alert(self, device_id: str, leak, batt, temp, close):
         """Set leak detector alert, battery, temperature, leak, Sedna valve closing."""
         data = {
             ATTR_LEAK_ALERT: leak,
@@ -1926,9 +2348,9 @@ class Neviweb130Client:
             ATTR_CONF_CLOSURE: close,
         }
         _LOGGER.debug("leak.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_load_dr_options(self, device_id: str, onoff, optout, dr):
+    async def async_set_load_dr_options(self, device_id: str, onoff, optout, dr):
         """Set load controller Eco Sinope attributes."""
         data = {
             ATTR_DRSTATUS: {
@@ -1938,9 +2360,9 @@ class Neviweb130Client:
             }
         }
         _LOGGER.debug("Load.DR.options = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_hvac_dr_options(
+    async def async_set_hvac_dr_options(
         self, device_id: str, *, dr=None, optout=None, setpoint=None, aux_conf=None, fan_speed_conf=None
     ):
         """Set load controller Eco Sinope attributes."""
@@ -1954,12 +2376,12 @@ class Neviweb130Client:
                 }
             }
             _LOGGER.debug("hvac.DR.options = %s", data)
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
 
         if aux_conf is not None:
             data = {ATTR_DR_AUX_CONF: "activated" if aux_conf == "on" else "deactivated"}
             _LOGGER.debug("hvac.DR.options = %s", data)
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
 
         if fan_speed_conf is not None:
             data = {
@@ -1967,78 +2389,78 @@ class Neviweb130Client:
                 ATTR_DR_FAN_SPEED_CONF: "auto" if fan_speed_conf == "on" else "on"
             }
             _LOGGER.debug("hvac.DR.options = %s", data)
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
 
-    def set_hvac_dr_setpoint(self, device_id: str, status, val):
+    async def async_set_hvac_dr_setpoint(self, device_id: str, status, val):
         """Set load controller Eco Sinope attributes."""
         data = {ATTR_DRSETPOINT: {"status": status, "value": val}}
         _LOGGER.debug("hvac.DR.setpoint = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_control_onoff(self, device_id: str, number, status):
+    async def async_set_control_onoff(self, device_id: str, number, status):
         """Set valve controller onOff or OnOff2 status, on or off."""
         if number == 1:
             data = {ATTR_ONOFF: status}
         else:
             data = {ATTR_ONOFF2: status}
         _LOGGER.debug("control.valve.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_tank_type(self, device_id: str, tank):
+    async def async_set_tank_type(self, device_id: str, tank):
         """Set tank type for LM4110-ZB sensor."""
         data = {ATTR_TANK_TYPE: tank}
         _LOGGER.debug("tank_type.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_gauge_type(self, device_id: str, gauge):
+    async def async_set_gauge_type(self, device_id: str, gauge):
         """Set gauge type for LM4110-ZB sensor on propane tank."""
         data = {ATTR_GAUGE_TYPE: gauge}
         _LOGGER.debug("gauge_type.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_heating_source(self, device_id: str, equip: str):
+    async def async_set_aux_heating_source(self, device_id: str, equip: str):
         """Set auxiliary heating source for TH6500WF and TH6250WF."""
         data = {ATTR_AUX_HEAT_SOURCE_TYPE: equip}
         _LOGGER.debug("aux_heating_source.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_low_fuel_alert(self, device_id: str, alert):
+    async def async_set_low_fuel_alert(self, device_id: str, alert):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_FUEL_PERCENT_ALERT: alert}
         _LOGGER.debug("low_fuel_alert.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_refuel_alert(self, device_id: str, alert):
+    async def async_set_refuel_alert(self, device_id: str, alert):
         """Set refuel alert for LM4110-ZB sensor."""
         data = {ATTR_REFUEL: alert}
         _LOGGER.debug("Refuel_alert.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_tank_height(self, device_id: str, height):
+    async def async_set_tank_height(self, device_id: str, height):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_TANK_HEIGHT: height}
         _LOGGER.debug("tank_height.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_fuel_alert(self, device_id: str, fuel):
+    async def async_set_fuel_alert(self, device_id: str, fuel):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_FUEL_ALERT: fuel}
         _LOGGER.debug("tank_height.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_battery_alert(self, device_id: str, batt):
+    async def async_set_battery_alert(self, device_id: str, batt):
         """Set low fuel alert limit for LM4110-ZB sensor."""
         data = {ATTR_BATT_ALERT: batt}
         _LOGGER.debug("battery_alert.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_power_supply(self, device_id: str, supply):
+    async def async_set_power_supply(self, device_id: str, supply):
         """Set power supply for Sedna valve."""
         data = {ATTR_POWER_SUPPLY: supply}
         _LOGGER.debug("power_supply.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_on_off_input_delay(self, device_id: str, delay, onoff, input_number):
+    async def async_set_on_off_input_delay(self, device_id: str, delay, onoff, input_number):
         """Set input 1 or 2 on/off delay in seconds."""
         data = None
         match onoff:
@@ -2047,9 +2469,9 @@ class Neviweb130Client:
             case _:
                 data = {ATTR_INPUT_1_OFF_DELAY: delay} if input_number == 1 else {ATTR_INPUT_2_OFF_DELAY: delay}
         _LOGGER.debug("input_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_input_output_names(self, device_id: str, in1, in2, out1, out2):
+    async def async_set_input_output_names(self, device_id: str, in1, in2, out1, out2):
         """Set names for input 1 and 2, output 1 and 2 for MC3100ZB device."""
         data = {}
         if len(in1) > 0:
@@ -2069,79 +2491,79 @@ class Neviweb130Client:
         else:
             data.update({ATTR_OUTPUT_NAME_2: ""})
         _LOGGER.debug("in/out names.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_pump_limit(self, device_id: str, temp):
+    async def async_set_heat_pump_limit(self, device_id: str, temp):
         """Set minimum temperature for heat pump operation."""
         data = {ATTR_BALANCE_PT: temp}
         _LOGGER.debug("Heat pump limit value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_lockout(self, device_id: str, temp, G2):
+    async def async_set_heat_lockout(self, device_id: str, temp, G2):
         """Set maximum outside temperature limit to allow heating device operation."""
         if G2:
             data = {ATTR_HEAT_LOCKOUT_TEMP: temp}
         else:
             data = {ATTR_HEAT_LOCK_TEMP: temp}
         _LOGGER.debug("Heat lockout limit value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_lockout(self, device_id: str, temp):
+    async def async_set_cool_lockout(self, device_id: str, temp):
         """Set minimum outside temperature limit to allow cooling device operation."""
         data = {ATTR_COOL_LOCK_TEMP: temp}
         _LOGGER.debug("Cool lockout limit value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_hp_display(self, device_id: str, display):
+    async def async_set_hp_display(self, device_id: str, display):
         """Set display on/off for heat pump."""
         data = {ATTR_DISPLAY_CONF: display}
         _LOGGER.debug("Display config value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_hp_sound(self, device_id: str, sound):
+    async def async_set_hp_sound(self, device_id: str, sound):
         """Set display on/off for heat pump."""
         data = {ATTR_SOUND_CONF: sound}
         _LOGGER.debug("Sound config value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_swing_horizontal(self, device_id: str, swing):
+    async def async_set_swing_horizontal(self, device_id: str, swing):
         """Set horizontal fan swing action for heat pump."""
         data = {ATTR_FAN_SWING_HORIZ: swing}
         _LOGGER.debug("Fan horizontal swing value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_swing_vertical(self, device_id: str, swing):
+    async def async_set_swing_vertical(self, device_id: str, swing):
         """Set vertical fan swing action for heat pump."""
         data = {ATTR_FAN_SWING_VERT: swing}
         _LOGGER.debug("Fan vertical swing value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_fan_mode(self, device_id: str, speed):
+    async def async_set_fan_mode(self, device_id: str, speed):
         """Set fan speed (mode) for heat pump."""
         data = {ATTR_FAN_SPEED: speed}
         _LOGGER.debug("Fan speed value.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_hc_display(self, device_id: str, display):
+    async def async_set_hc_display(self, device_id: str, display):
         """Set device second display for outside temperature or setpoint temperature for TH1134ZB-HC."""
         data = {ATTR_DISPLAY2: display}
         _LOGGER.debug("Hc display.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_language(self, device_id: str, lang):
+    async def async_set_language(self, device_id: str, lang):
         """Set display language for TH1134ZB-HC."""
         data = {ATTR_LANGUAGE: lang}
         _LOGGER.debug("Hc language.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_dissipation_time(self, device_id: str, time: int, HC):
+    async def async_set_heat_dissipation_time(self, device_id: str, time: int, HC):
         """Set heating purge time for TH6500WF and TH6250WF thermostats."""
         if HC:
             data = {ATTR_HEAT_PURGE_TIME: time}
             _LOGGER.debug("HC heat_dissipation_time.data = %s", data)
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -2155,14 +2577,14 @@ class Neviweb130Client:
                 )
             )
 
-    def set_cool_dissipation_time(self, device_id: str, time: int, HC):
+    async def async_set_cool_dissipation_time(self, device_id: str, time: int, HC):
         """Set cooling purge time for TH6500WF and TH6250WF thermostats."""
         if HC:
             data = {ATTR_COOL_PURGE_TIME: time}
             _LOGGER.debug("HC cool_dissipation_time.data = %s", data)
-            self.set_device_attributes(device_id, data)
+            await self.async_set_device_attributes(device_id, data)
         else:
-            self.notify_ha(
+            await self.async_notify_ha(
                 translated_or_default(
                     self.hass,
                     "heat_cool_warning",
@@ -2176,168 +2598,178 @@ class Neviweb130Client:
                 )
             )
 
-    def set_reversing_valve_polarity(self, device_id: str, polarity: str):
+    async def async_set_reversing_valve_polarity(self, device_id: str, polarity: str):
         """Set minimum time the heater is on before letting be off again (run-on time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_REVERSING_VALVE_POLARITY: polarity}
         _LOGGER.debug("HC set_reversing_valve_polarity.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_min_time_on(self, device_id: str, time: int):
+    async def async_set_heat_min_time_on(self, device_id: str, time: int):
         """Set minimum time the heater is on before letting be off again (run-on time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_HEAT_MIN_TIME_ON: time}
         _LOGGER.debug("HC heat_min_time_on.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_min_time_off(self, device_id: str, time: int):
+    async def async_set_heat_min_time_off(self, device_id: str, time: int):
         """Set minimum time the heater is off before letting it be on again (cooldown time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_HEAT_MIN_TIME_OFF: time}
         _LOGGER.debug("HC heat_min_time_off.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_min_time_on(self, device_id: str, time: int):
+    async def async_set_cool_min_time_on(self, device_id: str, time: int):
         """Set minimum time the cooler is on before letting be off again (run-on time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_COOL_MIN_TIME_ON: time}
         _LOGGER.debug("HC cool_min_time_on.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_min_time_off(self, device_id: str, time: int):
+    async def async_set_cool_min_time_off(self, device_id: str, time: int):
         """Set minimum time the cooler is off before letting it be on again (cooldown time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_COOL_MIN_TIME_OFF: time}
         _LOGGER.debug("HC cool_min_time_off.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_heat_min_time_on(self, device_id: str, time: int):
+    async def async_set_aux_heat_min_time_on(self, device_id: str, time: int):
         """Set minimum time the auxiliary heater is on before letting be off again (run-on time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_AUX_HEAT_MIN_TIME_ON: time}
         _LOGGER.debug("HC aux_heat_min_time_on.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_heat_min_time_off(self, device_id: str, time: int):
+    async def async_set_aux_heat_min_time_off(self, device_id: str, time: int):
         """Set minimum time the auxiliary heater is off before letting it be on again (cooldown time).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_AUX_HEAT_MIN_TIME_OFF: time}
         _LOGGER.debug("HC aux_heat_min_time_off.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_interstage_delay(self, device_id: str, time: int):
+    async def async_set_heat_interstage_delay(self, device_id: str, time: int):
         """Set total time before reaching last heat stage (interstage delay).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_HEAT_INTERSTAGE_DELAY: time}
         _LOGGER.debug("HC set_heat_interstage_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_interstage_delay(self, device_id: str, time: int):
+    async def async_set_aux_interstage_delay(self, device_id: str, time: int):
         """Set total time before reaching last auxiliary heat stage (interstage delay).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_AUX_INTERSTAGE_DELAY: time}
         _LOGGER.debug("HC set_aux_interstage_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_interstage_delay(self, device_id: str, time: int):
+    async def async_set_cool_interstage_delay(self, device_id: str, time: int):
         """Set total time before reaching last cool stage (interstage delay).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_COOL_INTERSTAGE_DELAY: time}
         _LOGGER.debug("HC set_cool_interstage_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_heat_interstage_min_delay(self, device_id: str, time: int):
+    async def async_set_heat_interstage_min_delay(self, device_id: str, time: int):
         """Set minimum time before reaching next heat stage (min interstage delay).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_HEAT_INTERSTAGE_MIN_DELAY: time}
         _LOGGER.debug("HC set_heat_min_interstage_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_interstage_min_delay(self, device_id: str, time: int):
+    async def async_set_aux_interstage_min_delay(self, device_id: str, time: int):
         """Set minimum time before reaching next auxiliary stage (min interstage delay).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_AUX_INTERSTAGE_MIN_DELAY: time}
         _LOGGER.debug("HC set_aux_min_interstage_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_cool_interstage_min_delay(self, device_id: str, time: int):
+    async def async_set_cool_interstage_min_delay(self, device_id: str, time: int):
         """Set minimum time before reaching next cool stage (min interstage delay).
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_COOL_INTERSTAGE_MIN_DELAY: time}
         _LOGGER.debug("HC set_cool_min_interstage_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_aux_heat_start_delay(self, device_id: str, time: int):
+    async def async_set_aux_heat_start_delay(self, device_id: str, time: int):
         """Set minimum time using the heat pump before using the auxiliary heaters.
         for TH6500WF and TH6250WF thermostats."""
         data = {ATTR_AUX_HEAT_START_DELAY: time}
         _LOGGER.debug("HC set_aux_heat_start_delay.data = %s", data)
-        self.set_device_attributes(device_id, data)
+        await self.async_set_device_attributes(device_id, data)
 
-    def set_device_attributes(self, device_id: str, data: dict[str, Any]):
-        """Set devices attributes."""
-        increment_request_counter(self.hass)
-        result = 1
-        while result < 4:
-            try:
-                resp = requests.put(
-                    DEVICE_DATA_URL + device_id + "/attribute",
-                    json=data,
-                    headers=self._headers,
-                    cookies=self._cookies,
-                    timeout=self._timeout,
-                )
-                _LOGGER.debug(
-                    "Requests = %s%s%s %s",
-                    DEVICE_DATA_URL,
-                    device_id,
-                    "/attribute",
-                    data,
-                )
-                _LOGGER.debug("Data = %s", data)
-                _LOGGER.debug("Requests response = %s", resp.status_code)
-                _LOGGER.debug("Json Data received= %s", resp.json())
-                _LOGGER.debug("Content = %s", resp.content)
-                _LOGGER.debug("Text = %s", resp.text)
+    async def async_set_device_attributes(self, device_id: str, data: dict[str, Any]):
+        """Set devices attributes.
 
-                if "error" not in resp.json():
-                    break
+        Writes to the same device within WRITE_DEBOUNCE seconds are merged, latest
+        value winning per attribute, and sent in one PUT. Writes made while the
+        previous PUT to the device is in flight are merged until it is done, then
+        sent. Every caller returns, or raises, when its PUT is done.
+        """
+        # Slow tier of this device must be read again on next update
+        self.config_changed_at[device_id] = time.monotonic()
+        pending = self._pending_writes.get(device_id)
+        if pending is None:
+            pending = ({}, self.hass.loop.create_future())
+            self._pending_writes[device_id] = pending
+            self.hass.async_create_task(self._async_flush_writes(device_id))
+        pending[0].update(data)
+        await asyncio.shield(pending[1])
+
+    async def _async_flush_writes(self, device_id: str) -> None:
+        """Send the attributes queued for a device once the debounce window is over and its last PUT is done."""
+        await asyncio.sleep(WRITE_DEBOUNCE)
+        lock = self._write_locks.setdefault(device_id, asyncio.Lock())
+        async with lock:
+            data, future = self._pending_writes.pop(device_id)
+            try:
+                await self._async_put_device_attributes(device_id, data)
+            except Exception as err:  # noqa: BLE001
+                future.set_exception(err)
+            else:
+                future.set_result(None)
 
-                result += 1
-                _LOGGER.debug(
-                    "Service error received: %s, resending requests %s",
-                    resp.json(),
-                    result,
-                )
-            except OSError:
-                raise PyNeviweb130Error(
-                    translated_or_default(
-                        self.hass,
-                        "set_attribute",
-                        f"Cannot set device {device_id} attributes: {data}.",
-                        id=device_id,
-                        data=data,
-                    )
+    async def _async_put_device_attributes(self, device_id: str, data: dict[str, Any]) -> None:
+        """Send one PUT of device attributes, transient errors are retried by _async_request."""
+        try:
+            status, resp = await self._async_request(
+                "PUT", DEVICE_DATA_URL + device_id + "/attribute", data, limiter=self._device_semaphore(device_id)
+            )
+        except (aiohttp.ClientError, TimeoutError, OSError):
+            raise PyNeviweb130Error(
+                translated_or_default(
+                    self.hass,
+                    "set_attribute",
+                    f"Cannot set device {device_id} attributes: {data}.",
+                    id=device_id,
+                    data=data,
                 )
+            )
+        _LOGGER.debug(
+            "Requests = %s%s%s %s",
+            DEVICE_DATA_URL,
+            device_id,
+            "/attribute",
+            data,
+        )
+        _LOGGER.debug("Requests response = %s", status)
+        _LOGGER.debug("Json Data received= %s", resp)
+        if isinstance(resp, dict) and "error" in resp:
+            _LOGGER.debug("Service error received: %s", resp)
 
-    def post_neviweb_status(self, location: int | str, mode: str):
+    def set_device_attributes(self, device_id: str, data: dict[str, Any]):
+        """Set devices attributes."""
+        self._run(self.async_set_device_attributes(device_id, data))
+
+    async def async_post_neviweb_status(self, location: int | str, mode: str):
         """Send post requests to Neviweb for global occupancy mode"""
-        increment_request_counter(self.hass)
         location = str(location)
         data = {ATTR_MODE: mode}
         try:
-            resp = requests.post(
-                NEVIWEB_LOCATION + location + "/mode",
-                json=data,
-                headers=self._headers,
-                cookies=self._cookies,
-                timeout=self._timeout,
-            )
+            status, resp = await self._async_request("POST", NEVIWEB_LOCATION + location + "/mode", data)
 
             _LOGGER.debug("Data = %s", data)
-            _LOGGER.debug("Requests response = %s", resp.status_code)
-            _LOGGER.debug("Json Data received= %s", resp.json())
-        except OSError:
+            _LOGGER.debug("Requests response = %s", status)
+            _LOGGER.debug("Json Data received= %s", resp)
+        except (aiohttp.ClientError, TimeoutError, OSError):
             raise PyNeviweb130Error(
                 translated_or_default(
                     self.hass,
@@ -2347,5 +2779,16 @@ class Neviweb130Client:
                     data=data,
                 )
             )
-        if "error" in resp.json():
-            _LOGGER.debug("Service error received: %s", resp.json())
+        if "error" in resp:
+            _LOGGER.debug("Service error received: %s", resp)
+            return
+
+        # Update cached status right away so other entities see the new mode
+        cached = self._status_cache.get(location)
+        status = dict(cached[1]) if cached is not None else {}
+        status[ATTR_OCCUPANCY] = mode
+        self._status_cache[location] = (time.monotonic(), status)
+
+    def post_neviweb_status(self, location: int | str, mode: str):
+        """Send post requests to Neviweb for global occupancy mode"""
+        self._run(self.async_post_neviweb_status(location, mode))
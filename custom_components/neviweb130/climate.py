@@ -58,6 +58,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import date, datetime, timezone
+from functools import partial
 from threading import Lock
 from typing import Any, Mapping, override
 
@@ -79,7 +80,6 @@ from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import ServiceCall
 from homeassistant.exceptions import ServiceValidationError
-from homeassistant.helpers.event import call_later
 
 from . import HOMEKIT_MODE, NOTIFY
 from . import SCAN_INTERVAL as scan_interval
@@ -129,6 +129,7 @@ from .const import (
     ATTR_DRSTATUS,
     ATTR_DUAL_STATUS,
     ATTR_EARLY_START,
+    ATTR_ERROR_CODE_SET1,
     ATTR_FAN_CAP,
     ATTR_FAN_FILTER_REMAIN,
     ATTR_FAN_SPEED,
@@ -209,6 +210,20 @@ from .const import (
     ATTR_WIFI,
     ATTR_WIFI_KEYPAD,
     ATTR_WIFI_WATTAGE,
+    DEVICE_MODEL_COLOR_WIFI,
+    DEVICE_MODEL_DOUBLE,
+    DEVICE_MODEL_FLOOR,
+    DEVICE_MODEL_HC,
+    DEVICE_MODEL_HEAT,
+    DEVICE_MODEL_HEAT_COOL,
+    DEVICE_MODEL_HEAT_G2,
+    DEVICE_MODEL_HEAT_PUMP,
+    DEVICE_MODEL_LOW,
+    DEVICE_MODEL_LOW_WIFI,
+    DEVICE_MODEL_WIFI,
+    DEVICE_MODEL_WIFI_FLOOR,
+    DEVICE_MODEL_WIFI_HEAT_PUMP,
+    DEVICE_MODEL_WIFI_LITE,
     DOMAIN,
     MODE_AUTO_BYPASS,
     MODE_EM_HEAT,
@@ -265,7 +280,21 @@ from .const import (
     SERVICE_SET_TIME_FORMAT,
     VERSION,
 )
-from .helpers import file_exists, safe_get_device_attributes, safe_number, translated_or_default
+from .coordinator import (
+    READ_DAILY_STATS,
+    READ_ERROR_CODE,
+    READ_HOURLY_STATS,
+    READ_MONTHLY_STATS,
+    DeviceRead,
+    Neviweb130CoordinatorEntity,
+    async_track_platform_devices,
+)
+from .helpers import (
+    UNSUPPORTED_ATTRS,
+    file_exists,
+    safe_number,
+    translated_or_default,
+)
 from .schema import (
     AUX_HEATING,
     CYCLE_LENGTH_VALUES,
@@ -507,43 +536,11 @@ PRESET_h_c_MODES = [
     PRESET_AWAY,
 ]
 
-DEVICE_MODEL_LOW = [7372]
-DEVICE_MODEL_LOW_WIFI = [739]
-DEVICE_MODEL_FLOOR = [737]
-DEVICE_MODEL_WIFI_FLOOR = [738]
-DEVICE_MODEL_WIFI = [1510, 742]
-DEVICE_MODEL_WIFI_LITE = [336, 343, 348]
-DEVICE_MODEL_COLOR_WIFI = [350]
-DEVICE_MODEL_HEAT = [1123, 1124]
-DEVICE_MODEL_DOUBLE = [7373]
-DEVICE_MODEL_HEAT_G2 = [300]
-DEVICE_MODEL_HC = [1512]
-DEVICE_MODEL_HEAT_PUMP = [6810, 6811, 6812]
-DEVICE_MODEL_WIFI_HEAT_PUMP = [6813, 6814]
-DEVICE_MODEL_HEAT_COOL = [6727, 6730, 6731]
-IMPLEMENTED_DEVICE_MODEL = (
-    DEVICE_MODEL_HEAT
-    + DEVICE_MODEL_FLOOR
-    + DEVICE_MODEL_LOW
-    + DEVICE_MODEL_WIFI_FLOOR
-    + DEVICE_MODEL_WIFI
-    + DEVICE_MODEL_LOW_WIFI
-    + DEVICE_MODEL_HEAT_G2
-    + DEVICE_MODEL_HC
-    + DEVICE_MODEL_DOUBLE
-    + DEVICE_MODEL_HEAT_PUMP
-    + DEVICE_MODEL_HEAT_COOL
-    + DEVICE_MODEL_WIFI_LITE
-    + DEVICE_MODEL_COLOR_WIFI
-    + DEVICE_MODEL_WIFI_HEAT_PUMP
-)
-
 
-async def async_setup_platform(
+async def async_setup_entry(
     hass,
-    config,
+    entry,
     async_add_entities,
-    discovery_info=None,
 ) -> None:
     """Set up the neviweb130 thermostats."""
     data = hass.data[DOMAIN]["data"]
@@ -551,309 +548,113 @@ async def async_setup_platform(
     # Wait for async migration to be done
     await data.migration_done.wait()
 
-    entities: list[Neviweb130Thermostat] = []
-
-    # Loop through all clients (supports multi-account)
-    for client in data.neviweb130_clients:
-        default_name = client.default_group_name("climate")
-        default_name_2 = client.default_group_name("climate", 2)
-        default_name_3 = client.default_group_name("climate", 3)
-
-        # Process gateway_data for this client
-        for device_info in client.gateway_data:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name, device_info["name"])
-                device_sku = device_info["sku"]
-                location_id = device_info["location$id"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
+    def create_entities(client, devices) -> list[Neviweb130Thermostat]:
+        """Return the entities of discovered devices of an account."""
+        created: list[Neviweb130Thermostat] = []
+        for device in devices:
+            device_info = device.info
+            device_name = "{} {}".format(client.default_group_name("climate", device.network), device_info["name"])
+            device_sku = device_info["sku"]
+            location_id = device_info["location$id"]
+            device_firmware = "{}.{}.{}".format(
+                device_info["signature"]["softVersion"]["major"],
+                device_info["signature"]["softVersion"]["middle"],
+                device_info["signature"]["softVersion"]["minor"],
+            )
+            if device_info["signature"]["model"] in DEVICE_MODEL_HEAT:
+                created.append(
+                    Neviweb130Thermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
                 )
-                if device_info["signature"]["model"] in DEVICE_MODEL_HEAT:
-                    entities.append(
-                        Neviweb130Thermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_G2:
-                    entities.append(
-                        Neviweb130G2Thermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_FLOOR:
-                    entities.append(
-                        Neviweb130FloorThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_LOW:
-                    entities.append(
-                        Neviweb130LowThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_DOUBLE:
-                    entities.append(
-                        Neviweb130DoubleThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI:
-                    entities.append(
-                        Neviweb130WifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_LITE:
-                    entities.append(
-                        Neviweb130WifiLiteThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_COLOR_WIFI:
-                    entities.append(
-                        Neviweb130ColorWifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_LOW_WIFI:
-                    entities.append(
-                        Neviweb130LowWifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_FLOOR:
-                    entities.append(
-                        Neviweb130WifiFloorThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HC:
-                    entities.append(
-                        Neviweb130HcThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_PUMP:
-                    entities.append(
-                        Neviweb130HPThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_HEAT_PUMP:
-                    entities.append(
-                        Neviweb130WifiHPThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                else:
-                    entities.append(  # DEVICE_MODEL_HEAT_COOL
-                        Neviweb130HeatCoolThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-        for device_info in client.gateway_data2:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_2, device_info["name"])
-                device_sku = device_info["sku"]
-                location_id = device_info["location$id"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
+            elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_G2:
+                created.append(
+                    Neviweb130G2Thermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
                 )
-                if device_info["signature"]["model"] in DEVICE_MODEL_HEAT:
-                    entities.append(
-                        Neviweb130Thermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
+            elif device_info["signature"]["model"] in DEVICE_MODEL_FLOOR:
+                created.append(
+                    Neviweb130FloorThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_G2:
-                    entities.append(
-                        Neviweb130G2Thermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_FLOOR:
-                    entities.append(
-                        Neviweb130FloorThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_LOW:
-                    entities.append(
-                        Neviweb130LowThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_DOUBLE:
-                    entities.append(
-                        Neviweb130DoubleThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI:
-                    entities.append(
-                        Neviweb130WifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_LITE:
-                    entities.append(
-                        Neviweb130WifiLiteThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_COLOR_WIFI:
-                    entities.append(
-                        Neviweb130ColorWifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_LOW_WIFI:
-                    entities.append(
-                        Neviweb130LowWifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_FLOOR:
-                    entities.append(
-                        Neviweb130WifiFloorThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HC:
-                    entities.append(
-                        Neviweb130HcThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_PUMP:
-                    entities.append(
-                        Neviweb130HPThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_HEAT_PUMP:
-                    entities.append(
-                        Neviweb130WifiHPThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                else:
-                    entities.append(  # DEVICE_MODEL_HEAT_COOL
-                        Neviweb130HeatCoolThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-        for device_info in client.gateway_data3:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_3, device_info["name"])
-                device_sku = device_info["sku"]
-                location_id = device_info["location$id"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
                 )
-                if device_info["signature"]["model"] in DEVICE_MODEL_HEAT:
-                    entities.append(
-                        Neviweb130Thermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_G2:
-                    entities.append(
-                        Neviweb130G2Thermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_FLOOR:
-                    entities.append(
-                        Neviweb130FloorThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_LOW:
-                    entities.append(
-                        Neviweb130LowThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_DOUBLE:
-                    entities.append(
-                        Neviweb130DoubleThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI:
-                    entities.append(
-                        Neviweb130WifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_LITE:
-                    entities.append(
-                        Neviweb130WifiLiteThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_COLOR_WIFI:
-                    entities.append(
-                        Neviweb130ColorWifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_LOW:
+                created.append(
+                    Neviweb130LowThermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_DOUBLE:
+                created.append(
+                    Neviweb130DoubleThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_LOW_WIFI:
-                    entities.append(
-                        Neviweb130LowWifiThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI:
+                created.append(
+                    Neviweb130WifiThermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_LITE:
+                created.append(
+                    Neviweb130WifiLiteThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_FLOOR:
-                    entities.append(
-                        Neviweb130WifiFloorThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_COLOR_WIFI:
+                created.append(
+                    Neviweb130ColorWifiThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HC:
-                    entities.append(
-                        Neviweb130HcThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_LOW_WIFI:
+                created.append(
+                    Neviweb130LowWifiThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_PUMP:
-                    entities.append(
-                        Neviweb130HPThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_FLOOR:
+                created.append(
+                    Neviweb130WifiFloorThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_HEAT_PUMP:
-                    entities.append(
-                        Neviweb130WifiHPThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_HC:
+                created.append(
+                    Neviweb130HcThermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_HEAT_PUMP:
+                created.append(
+                    Neviweb130HPThermostat(device_info, device_name, device_sku, device_firmware, location_id, client)
+                )
+            elif device_info["signature"]["model"] in DEVICE_MODEL_WIFI_HEAT_PUMP:
+                created.append(
+                    Neviweb130WifiHPThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
-                else:
-                    entities.append(  # DEVICE_MODEL_HEAT_COOL
-                        Neviweb130HeatCoolThermostat(
-                            device_info, device_name, device_sku, device_firmware, location_id, client
-                        )
+                )
+            else:
+                created.append(  # DEVICE_MODEL_HEAT_COOL
+                    Neviweb130HeatCoolThermostat(
+                        device_info, device_name, device_sku, device_firmware, location_id, client
                     )
+                )
+        return created
+
+    entities: list[Neviweb130Thermostat] = []
 
-    async_add_entities(entities, True)
+    # Loop through all clients (supports multi-account)
+    for client in data.neviweb130_clients:
+        entities.extend(create_entities(client, client.devices.platform("climate")))
+
+    async_add_entities(entities)
 
     entity_map: dict[str, Neviweb130Thermostat] | None = None
     _entity_map_lock = Lock()
 
+    def _entities_changed() -> None:
+        """Rebuild the entity lookup of services on next use."""
+        nonlocal entity_map
+        entity_map = None
+
+    async_track_platform_devices(
+        hass, entry, "climate", entities, create_entities, async_add_entities, _entities_changed
+    )
+
     def get_thermostat(service: ServiceCall) -> Neviweb130Thermostat:
         entity_id = service.data.get(ATTR_ENTITY_ID)
         if entity_id is None:
@@ -895,37 +696,37 @@ async def async_setup_platform(
             )
         return thermostat
 
-    def set_second_display_service(service: ServiceCall) -> None:
+    async def set_second_display_service(service: ServiceCall) -> None:
         """Set to outside or setpoint temperature display for Wi-Fi thermostats."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "display": service.data[ATTR_DISPLAY2],
         }
-        thermostat.set_second_display(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_second_display(value)
+        thermostat.async_refresh_after_write()
 
-    def set_backlight_service(service: ServiceCall) -> None:
+    async def set_backlight_service(service: ServiceCall) -> None:
         """Set backlight always on or auto."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "level": service.data[ATTR_BACKLIGHT],
         }
-        thermostat.set_backlight(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_backlight(value)
+        thermostat.async_refresh_after_write()
 
-    def set_climate_keypad_lock_service(service: ServiceCall) -> None:
+    async def set_climate_keypad_lock_service(service: ServiceCall) -> None:
         """Lock/unlock keypad device."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "lock": service.data[ATTR_KEYPAD],
         }
-        thermostat.set_keypad_lock(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_keypad_lock(value)
+        thermostat.async_refresh_after_write()
 
-    def set_time_format_service(service: ServiceCall) -> None:
+    async def set_time_format_service(service: ServiceCall) -> None:
         """Set time format 12h or 24h."""
         thermostat = get_thermostat(service)
         if isinstance(thermostat, Neviweb130WifiLiteThermostat):
@@ -966,70 +767,70 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             ATTR_TIME: service.data[ATTR_TIME_FORMAT],
         }
-        thermostat.set_time_format(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_time_format(value)
+        thermostat.async_refresh_after_write()
 
-    def set_temperature_format_service(service: ServiceCall) -> None:
+    async def set_temperature_format_service(service: ServiceCall) -> None:
         """Set temperature format, celsius or fahrenheit."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_TEMP],
         }
-        thermostat.set_temperature_format(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_temperature_format(value)
+        thermostat.async_refresh_after_write()
 
-    def set_setpoint_max_service(service: ServiceCall) -> None:
+    async def set_setpoint_max_service(service: ServiceCall) -> None:
         """Set maximum setpoint for device."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_ROOM_SETPOINT_MAX],
         }
-        thermostat.set_setpoint_max(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_setpoint_max(value)
+        thermostat.async_refresh_after_write()
 
-    def set_setpoint_min_service(service: ServiceCall) -> None:
+    async def set_setpoint_min_service(service: ServiceCall) -> None:
         """Set minimum setpoint for device."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_ROOM_SETPOINT_MIN],
         }
-        thermostat.set_setpoint_min(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_setpoint_min(value)
+        thermostat.async_refresh_after_write()
 
-    def set_floor_air_limit_service(service: ServiceCall) -> None:
+    async def set_floor_air_limit_service(service: ServiceCall) -> None:
         """Set minimum setpoint for device."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_FLOOR_AIR_LIMIT],
         }
-        thermostat.set_floor_air_limit(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_floor_air_limit(value)
+        thermostat.async_refresh_after_write()
 
-    def set_early_start_service(service: ServiceCall) -> None:
+    async def set_early_start_service(service: ServiceCall) -> None:
         """Set early heating on/off for Wi-Fi thermostat."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "start": service.data[ATTR_EARLY_START],
         }
-        thermostat.set_early_start(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_early_start(value)
+        thermostat.async_refresh_after_write()
 
-    def set_air_floor_mode_service(service: ServiceCall) -> None:
+    async def set_air_floor_mode_service(service: ServiceCall) -> None:
         """Switch between ambient or floor temperature sensor."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "mode": service.data[ATTR_FLOOR_MODE],
         }
-        thermostat.set_air_floor_mode(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_air_floor_mode(value)
+        thermostat.async_refresh_after_write()
 
-    def set_hvac_dr_options_service(service: ServiceCall) -> None:
+    async def set_hvac_dr_options_service(service: ServiceCall) -> None:
         """Set options for hvac dr in Eco Sinope."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1045,10 +846,10 @@ async def async_setup_platform(
                 ATTR_AUX_OPTIM: service.data.get(ATTR_AUX_OPTIM),
                 ATTR_FAN_SPEED_OPTIM: service.data.get(ATTR_FAN_SPEED_OPTIM),
             }
-        thermostat.set_hvac_dr_options(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_hvac_dr_options(value)
+        thermostat.async_refresh_after_write()
 
-    def set_hvac_dr_setpoint_service(service: ServiceCall) -> None:
+    async def set_hvac_dr_setpoint_service(service: ServiceCall) -> None:
         """Set options for hvac dr setpoint in Eco Sinope."""
         thermostat = get_thermostat(service)
         value = {
@@ -1056,10 +857,10 @@ async def async_setup_platform(
             "status": service.data[ATTR_STATUS],
             "val": service.data[ATTR_VALUE],
         }
-        thermostat.set_hvac_dr_setpoint(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_hvac_dr_setpoint(value)
+        thermostat.async_refresh_after_write()
 
-    def set_auxiliary_load_service(service: ServiceCall) -> None:
+    async def set_auxiliary_load_service(service: ServiceCall) -> None:
         """Set options for auxiliary heating."""
         thermostat = get_thermostat(service)
         value = {
@@ -1067,10 +868,10 @@ async def async_setup_platform(
             "status": service.data[ATTR_STATUS],
             "val": service.data[ATTR_VALUE],
         }
-        thermostat.set_auxiliary_load(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_auxiliary_load(value)
+        thermostat.async_refresh_after_write()
 
-    def set_aux_cycle_output_service(service: ServiceCall) -> None:
+    async def set_aux_cycle_output_service(service: ServiceCall) -> None:
         """Set options for auxiliary cycle length for low voltage thermostats."""
         thermostat = get_thermostat(service)
         val = service.data.get(ATTR_VALUE)
@@ -1087,60 +888,60 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "val": val,
         }
-        thermostat.set_aux_cycle_output(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_aux_cycle_output(value)
+        thermostat.async_refresh_after_write()
 
-    def set_cycle_output_service(service: ServiceCall) -> None:
+    async def set_cycle_output_service(service: ServiceCall) -> None:
         """Set options for main cycle length for low voltage thermostats."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "val": service.data[ATTR_VALUE],
         }
-        thermostat.set_cycle_output(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cycle_output(value)
+        thermostat.async_refresh_after_write()
 
-    def set_pump_protection_service(service: ServiceCall) -> None:
+    async def set_pump_protection_service(service: ServiceCall) -> None:
         """Set status of pump protection for low voltage thermostats."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "status": service.data[ATTR_STATUS],
         }
-        thermostat.set_pump_protection(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_pump_protection(value)
+        thermostat.async_refresh_after_write()
 
-    def set_cool_setpoint_max_service(service: ServiceCall) -> None:
+    async def set_cool_setpoint_max_service(service: ServiceCall) -> None:
         """Set maximum cooling setpoint for device."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_COOL_SETPOINT_MAX],
         }
-        thermostat.set_cool_setpoint_max(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cool_setpoint_max(value)
+        thermostat.async_refresh_after_write()
 
-    def set_cool_setpoint_min_service(service: ServiceCall) -> None:
+    async def set_cool_setpoint_min_service(service: ServiceCall) -> None:
         """Set minimum cooling setpoint for device."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_COOL_SETPOINT_MIN],
         }
-        thermostat.set_cool_setpoint_min(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cool_setpoint_min(value)
+        thermostat.async_refresh_after_write()
 
-    def set_room_setpoint_away_service(service: ServiceCall) -> None:
+    async def set_room_setpoint_away_service(service: ServiceCall) -> None:
         """Set away heating setpoint."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_ROOM_SETPOINT_AWAY],
         }
-        thermostat.set_room_setpoint_away(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_room_setpoint_away(value)
+        thermostat.async_refresh_after_write()
 
-    def set_cool_setpoint_away_service(service: ServiceCall) -> None:
+    async def set_cool_setpoint_away_service(service: ServiceCall) -> None:
         """Set away cooling setpoint."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1157,10 +958,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_COOL_SETPOINT_AWAY],
         }
-        thermostat.set_cool_setpoint_away(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cool_setpoint_away(value)
+        thermostat.async_refresh_after_write()
 
-    def set_floor_limit_high_service(service: ServiceCall) -> None:
+    async def set_floor_limit_high_service(service: ServiceCall) -> None:
         """Set maximum floor heating limit for floor device."""
         thermostat = get_thermostat(service)
         value = {
@@ -1168,10 +969,10 @@ async def async_setup_platform(
             "level": service.data[ATTR_FLOOR_MAX],
             "limit": "high",
         }
-        thermostat.set_floor_limit(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_floor_limit(value)
+        thermostat.async_refresh_after_write()
 
-    def set_floor_limit_low_service(service: ServiceCall) -> None:
+    async def set_floor_limit_low_service(service: ServiceCall) -> None:
         """Set minimum floor heating limit for floor device."""
         thermostat = get_thermostat(service)
         value = {
@@ -1179,10 +980,10 @@ async def async_setup_platform(
             "level": service.data[ATTR_FLOOR_MIN],
             "limit": "low",
         }
-        thermostat.set_floor_limit(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_floor_limit(value)
+        thermostat.async_refresh_after_write()
 
-    def set_activation_service(service: ServiceCall) -> None:
+    async def set_activation_service(service: ServiceCall) -> None:
         """Activate or deactivate Neviweb polling for missing device."""
         thermostat = get_thermostat(service)
         value = {
@@ -1190,38 +991,38 @@ async def async_setup_platform(
             "active": service.data[ATTR_ACTIVE],
         }
         thermostat.set_activation(value)
-        thermostat.schedule_update_ha_state(True)
+        thermostat.async_refresh_after_write()
 
-    def set_sensor_type_service(service: ServiceCall) -> None:
+    async def set_sensor_type_service(service: ServiceCall) -> None:
         """Set floor sensor type."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "type": service.data[ATTR_FLOOR_SENSOR],
         }
-        thermostat.set_sensor_type(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_sensor_type(value)
+        thermostat.async_refresh_after_write()
 
-    def set_em_heat_service(service: ServiceCall) -> None:
+    async def set_em_heat_service(service: ServiceCall) -> None:
         """Set emergency heat on/off for thermostats."""
         thermostat = get_thermostat(service)
         if service.data[ATTR_VALUE] == "on":
-            thermostat.turn_em_heat_on()
+            await thermostat.async_turn_em_heat_on()
         else:
-            thermostat.turn_em_heat_off()
-        thermostat.schedule_update_ha_state(True)
+            await thermostat.async_turn_em_heat_off()
+        thermostat.async_refresh_after_write()
 
-    def set_heat_pump_operation_limit_service(service: ServiceCall) -> None:
+    async def set_heat_pump_operation_limit_service(service: ServiceCall) -> None:
         """Set minimum temperature for heat pump device operation."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_BALANCE_PT],
         }
-        thermostat.set_heat_pump_operation_limit(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_heat_pump_operation_limit(value)
+        thermostat.async_refresh_after_write()
 
-    def set_heat_installation_type_service(service: ServiceCall) -> None:
+    async def set_heat_installation_type_service(service: ServiceCall) -> None:
         """Set minimum temperature for heat pump device operation."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1238,10 +1039,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             ATTR_TYPE: service.data[ATTR_TYPE],
         }
-        thermostat.set_heat_installation_type(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_heat_installation_type(value)
+        thermostat.async_refresh_after_write()
 
-    def set_heat_lockout_temperature_service(service: ServiceCall) -> None:
+    async def set_heat_lockout_temperature_service(service: ServiceCall) -> None:
         """Set maximum outside temperature limit to allow heating device operation."""
         # Work differently for G2 thermostats
         thermostat = get_thermostat(service)
@@ -1250,60 +1051,60 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "temp": temp,
         }
-        thermostat.set_heat_lockout_temperature(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_heat_lockout_temperature(value)
+        thermostat.async_refresh_after_write()
 
-    def set_cool_lockout_temperature_service(service: ServiceCall) -> None:
+    async def set_cool_lockout_temperature_service(service: ServiceCall) -> None:
         """Set minimum outside temperature limit to allow cooling device operation."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_COOL_LOCK_TEMP],
         }
-        thermostat.set_cool_lockout_temperature(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cool_lockout_temperature(value)
+        thermostat.async_refresh_after_write()
 
-    def set_display_config_service(service: ServiceCall) -> None:
+    async def set_display_config_service(service: ServiceCall) -> None:
         """Set display on/off for heat pump."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "display": service.data[ATTR_DISPLAY_CONF],
         }
-        thermostat.set_display_config(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_display_config(value)
+        thermostat.async_refresh_after_write()
 
-    def set_sound_config_service(service: ServiceCall) -> None:
+    async def set_sound_config_service(service: ServiceCall) -> None:
         """Set sound on/off for heat pump."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "sound": service.data[ATTR_SOUND_CONF],
         }
-        thermostat.set_sound_config(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_sound_config(value)
+        thermostat.async_refresh_after_write()
 
-    def set_hc_second_display_service(service: ServiceCall) -> None:
+    async def set_hc_second_display_service(service: ServiceCall) -> None:
         """Set second display for TH1134ZB-HC thermostat."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "display": service.data[ATTR_DISPLAY2],
         }
-        thermostat.set_hc_second_display(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_hc_second_display(value)
+        thermostat.async_refresh_after_write()
 
-    def set_language_service(service: ServiceCall) -> None:
+    async def set_language_service(service: ServiceCall) -> None:
         """Set display language for TH1134ZB-HC thermostat."""
         thermostat = get_thermostat(service)
         value = {
             "id": thermostat.unique_id,
             "lang": service.data[ATTR_LANGUAGE],
         }
-        thermostat.set_language(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_language(value)
+        thermostat.async_refresh_after_write()
 
-    def set_reversing_valve_polarity(service: ServiceCall) -> None:
+    async def set_reversing_valve_polarity(service: ServiceCall) -> None:
         """Set minimum time the device is on before letting be off again (run-on time)
         for TH6500WF and TH6250WF thermostats."""
         thermostat = get_thermostat(service)
@@ -1317,10 +1118,10 @@ async def async_setup_platform(
                     domain=DOMAIN,
                 )
             )
-        thermostat.set_reversing_valve_polarity(service.data)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_reversing_valve_polarity(service.data)
+        thermostat.async_refresh_after_write()
 
-    def set_min_time_on_service(service: ServiceCall) -> None:
+    async def set_min_time_on_service(service: ServiceCall) -> None:
         """Set minimum time the device is on before letting be off again (run-on time)
         for TH6500WF and TH6250WF thermostats."""
         thermostat = get_thermostat(service)
@@ -1334,10 +1135,10 @@ async def async_setup_platform(
                     domain=DOMAIN,
                 )
             )
-        thermostat.set_min_time_on(service.data)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_min_time_on(service.data)
+        thermostat.async_refresh_after_write()
 
-    def set_min_time_off_service(service: ServiceCall) -> None:
+    async def set_min_time_off_service(service: ServiceCall) -> None:
         """Set minimum time the device is off before letting it be on again (cooldown time)
         for TH6500WF and TH6250WF thermostats."""
         thermostat = get_thermostat(service)
@@ -1351,10 +1152,10 @@ async def async_setup_platform(
                     domain=DOMAIN,
                 )
             )
-        thermostat.set_min_time_off(service.data)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_min_time_off(service.data)
+        thermostat.async_refresh_after_write()
 
-    def set_heat_interstage_delay(service: ServiceCall) -> None:
+    async def set_heat_interstage_delay(service: ServiceCall) -> None:
         """Set minimum time the device is heating before letting it increment the heater stage
         for TH6500WF and TH6250WF thermostats."""
         thermostat = get_thermostat(service)
@@ -1368,10 +1169,10 @@ async def async_setup_platform(
                     domain=DOMAIN,
                 )
             )
-        thermostat.set_heat_interstage_delay(service.data)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_heat_interstage_delay(service.data)
+        thermostat.async_refresh_after_write()
 
-    def set_cool_interstage_delay(service: ServiceCall) -> None:
+    async def set_cool_interstage_delay(service: ServiceCall) -> None:
         """Set minimum time the device is cooling before letting it increment the cooler stage
         for TH6500WF and TH6250WF thermostats."""
         thermostat = get_thermostat(service)
@@ -1385,10 +1186,10 @@ async def async_setup_platform(
                     domain=DOMAIN,
                 )
             )
-        thermostat.set_cool_interstage_delay(service.data)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cool_interstage_delay(service.data)
+        thermostat.async_refresh_after_write()
 
-    def set_aux_heat_start_delay(service: ServiceCall) -> None:
+    async def set_aux_heat_start_delay(service: ServiceCall) -> None:
         """Set minimum time the device is cooling before letting it increment the cooler stage
         for TH6500WF and TH6250WF thermostats."""
         thermostat = get_thermostat(service)
@@ -1402,10 +1203,10 @@ async def async_setup_platform(
                     domain=DOMAIN,
                 )
             )
-        thermostat.set_aux_heat_start_delay(service.data)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_aux_heat_start_delay(service.data)
+        thermostat.async_refresh_after_write()
 
-    def set_accessory_type_service(service: ServiceCall) -> None:
+    async def set_accessory_type_service(service: ServiceCall) -> None:
         """Set TH6500WF accessory (humidifier, dehumidifier, air exchanger) type."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1422,10 +1223,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "type": service.data[ATTR_ACCESSORY_TYPE],
         }
-        thermostat.set_accessory_type(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_accessory_type(value)
+        thermostat.async_refresh_after_write()
 
-    def set_schedule_mode_service(service: ServiceCall) -> None:
+    async def set_schedule_mode_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF schedule mode, manual or auto."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1442,10 +1243,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "mode": service.data[ATTR_SETPOINT_MODE],
         }
-        thermostat.set_schedule_mode(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_schedule_mode(value)
+        thermostat.async_refresh_after_write()
 
-    def set_heatcool_setpoint_delta_service(service: ServiceCall) -> None:
+    async def set_heatcool_setpoint_delta_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF delta temperature between heating and cooling setpoint."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1462,10 +1263,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "level": service.data[ATTR_HEATCOOL_SETPOINT_MIN_DELTA],
         }
-        thermostat.set_heatcool_setpoint_delta(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_heatcool_setpoint_delta(value)
+        thermostat.async_refresh_after_write()
 
-    def set_fan_filter_reminder_service(service: ServiceCall) -> None:
+    async def set_fan_filter_reminder_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF fan filter reminder period from 1 to 12 month."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1482,10 +1283,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "month": service.data[ATTR_FAN_FILTER_REMAIN],
         }
-        thermostat.set_fan_filter_reminder(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_fan_filter_reminder(value)
+        thermostat.async_refresh_after_write()
 
-    def set_temperature_offset_service(service: ServiceCall) -> None:
+    async def set_temperature_offset_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF temperature sensor offset from -2 to 2°C with a 0.5°C increment."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1502,10 +1303,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "temp": service.data[ATTR_TEMP_OFFSET_HEAT],
         }
-        thermostat.set_temperature_offset(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_temperature_offset(value)
+        thermostat.async_refresh_after_write()
 
-    def set_aux_heating_source_service(service: ServiceCall) -> None:
+    async def set_aux_heating_source_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF auxiliary heating device."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1522,10 +1323,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             ATTR_AUX_HEAT_SOURCE_TYPE: service.data[ATTR_AUX_HEAT_SOURCE_TYPE],
         }
-        thermostat.set_aux_heating_source(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_aux_heating_source(value)
+        thermostat.async_refresh_after_write()
 
-    def set_fan_speed_service(service: ServiceCall) -> None:
+    async def set_fan_speed_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF fan speed, On or Auto."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1542,10 +1343,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "speed": service.data[ATTR_FAN_SPEED],
         }
-        thermostat.set_fan_speed(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_fan_speed(value)
+        thermostat.async_refresh_after_write()
 
-    def set_humidity_mode_service(service: ServiceCall) -> None:
+    async def set_humidity_mode_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF fan speed, On or Auto."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1562,10 +1363,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             "mode": service.data[ATTR_HUMIDITY_SETPOINT_MODE],
         }
-        thermostat.set_humidity_mode(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_humidity_mode(value)
+        thermostat.async_refresh_after_write()
 
-    def set_heat_dissipation_time_service(service: ServiceCall) -> None:
+    async def set_heat_dissipation_time_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF fan speed, On or Auto."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1582,10 +1383,10 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             ATTR_TIME: service.data[ATTR_TIME] * 60,
         }
-        thermostat.set_heat_dissipation_time(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_heat_dissipation_time(value)
+        thermostat.async_refresh_after_write()
 
-    def set_cool_dissipation_time_service(service: ServiceCall) -> None:
+    async def set_cool_dissipation_time_service(service: ServiceCall) -> None:
         """Set TH6500WF, TH6250WF fan speed, On or Auto."""
         thermostat = get_thermostat(service)
         if not isinstance(thermostat, Neviweb130HeatCoolThermostat):
@@ -1602,17 +1403,17 @@ async def async_setup_platform(
             "id": thermostat.unique_id,
             ATTR_TIME: service.data[ATTR_TIME] * 60,
         }
-        thermostat.set_cool_dissipation_time(value)
-        thermostat.schedule_update_ha_state(True)
+        await thermostat.async_set_cool_dissipation_time(value)
+        thermostat.async_refresh_after_write()
 
-    def set_climate_neviweb_status_service(service):
+    async def set_climate_neviweb_status_service(service):
         """Set Neviweb global status per location, home or away."""
         entity_id = service.data[ATTR_ENTITY_ID]
         for thermostat in entities:
             if thermostat.entity_id == entity_id:
                 value = {"id": thermostat.unique_id, "mode": service.data[ATTR_MODE]}
-                thermostat.set_climate_neviweb_status(value)
-                thermostat.schedule_update_ha_state(True)
+                await thermostat.async_set_climate_neviweb_status(value)
+                thermostat.async_refresh_after_write()
                 break
 
     hass.services.async_register(
@@ -2044,12 +1845,14 @@ def resolve_fan_speed(speed: str, model: int) -> int:
     return value
 
 
-class Neviweb130Thermostat(ClimateEntity):
+class Neviweb130Thermostat(Neviweb130CoordinatorEntity, ClimateEntity):
     """Implementation of Neviweb TH1123ZB, TH1124ZB thermostat."""
 
     _enable_turn_on_off_backwards_compatibility = False
     _attr_precision = 0.1
     _attr_target_temperature_step = 0.5
+    uses_location_status = True
+    uses_weather = True
 
     def __init__(self, device_info, name, sku, firmware, location, client):
         """Initialize."""
@@ -2118,6 +1921,7 @@ class Neviweb130Thermostat(ClimateEntity):
         self._em_heat = "off"
         self._energy_stat_time = time.time() - 1500
         self._error_code = 0
+        self._error_code_in_read = False
         self._fan_speed = None
         self._fan_swing_cap = None
         self._fan_swing_cap_horiz = None
@@ -2166,45 +1970,48 @@ class Neviweb130Thermostat(ClimateEntity):
         self._wattage = 0
         self._weather_icon = 0
 
-    def update(self) -> None:
+    @property
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return True
+
+    def cycle_reads(self) -> dict[str, DeviceRead]:
+        """Return the energy statistic reads due in this cycle, and the error code read when not in the main read."""
+        reads = self.stats_reads(STAT_INTERVAL, self._is_HC)
+        if not self._error_code_in_read:
+            reads[READ_ERROR_CODE] = partial(self._client.async_get_device_sensor_error, self._id)
+        return reads
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        HEAT_ATTRIBUTES = [
+            ATTR_WATTAGE,
+            ATTR_KEYPAD,
+            ATTR_BACKLIGHT,
+            ATTR_SYSTEM_MODE,
+            ATTR_CYCLE_LENGTH,
+            ATTR_DISPLAY2,
+            ATTR_RSSI,
+        ]
+        if self._firmware == "0.6.4" or self._firmware == "0.6.0":
+            FIRMWARE_SPECIAL = []
+        else:
+            FIRMWARE_SPECIAL = [ATTR_ROOM_TEMP_DISPLAY]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + HEAT_ATTRIBUTES + FIRMWARE_SPECIAL)
+
+    async def async_update(self) -> None:
         if self._active:
-            HEAT_ATTRIBUTES = [
-                ATTR_WATTAGE,
-                ATTR_KEYPAD,
-                ATTR_BACKLIGHT,
-                ATTR_SYSTEM_MODE,
-                ATTR_CYCLE_LENGTH,
-                ATTR_DISPLAY2,
-                ATTR_RSSI,
-            ]
-            if self._firmware == "0.6.4" or self._firmware == "0.6.0":
-                FIRMWARE_SPECIAL = []
-            else:
-                FIRMWARE_SPECIAL = [ATTR_ROOM_TEMP_DISPLAY]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + HEAT_ATTRIBUTES + FIRMWARE_SPECIAL
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "4.2.3, updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug(
@@ -2269,7 +2076,7 @@ class Neviweb130Thermostat(ClimateEntity):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -2285,6 +2092,11 @@ class Neviweb130Thermostat(ClimateEntity):
                         )
                     )
 
+    @property
+    def burst_polling(self) -> bool:
+        """Return True during a demand response event on this thermostat."""
+        return self._drstatus_active == "on"
+
     @property
     @override
     def unique_id(self) -> str:
@@ -2674,7 +2486,7 @@ class Neviweb130Thermostat(ClimateEntity):
         return self._is_HC or self._is_WHP
 
     @override
-    def set_fan_mode(self, speed: str) -> None:
+    async def async_set_fan_mode(self, speed: str) -> None:
         """Set new fan mode."""
         if speed is None:
             return
@@ -2694,61 +2506,66 @@ class Neviweb130Thermostat(ClimateEntity):
                     )
                 )
 
-        self._client.set_fan_mode(self._id, speed_val)
+        await self._client.async_set_fan_mode(self._id, speed_val)
         self._fan_speed = speed
+        self.async_refresh_after_write()
 
     @override
-    def set_swing_mode(self, swing: str) -> None:
+    async def async_set_swing_mode(self, swing: str) -> None:
         """Set new vertical swing mode."""
         if swing is None:
             return
         else:
-            self._client.set_swing_vertical(self._id, swing)
+            await self._client.async_set_swing_vertical(self._id, swing)
             self._fan_swing_vert = swing
+        self.async_refresh_after_write()
 
     @override
-    def set_swing_horizontal_mode(self, swing: str) -> None:
+    async def async_set_swing_horizontal_mode(self, swing: str) -> None:
         """Set new horizontal swing mode."""
         if swing is None:
             return
         else:
-            self._client.set_swing_horizontal(self._id, swing)
+            await self._client.async_set_swing_horizontal(self._id, swing)
             self._fan_swing_horiz = swing
+        self.async_refresh_after_write()
 
     @override
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the thermostat to HVACMode.HEAT."""
-        self._client.set_setpoint_mode(self._id, HVACMode.HEAT, self._is_wifi, self._is_HC)
+        await self._client.async_set_setpoint_mode(self._id, HVACMode.HEAT, self._is_wifi, self._is_HC)
         self._operation_mode = HVACMode.HEAT
+        self.async_refresh_after_write()
 
     @override
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn the thermostat to HVACMode.OFF."""
-        self._client.set_setpoint_mode(self._id, HVACMode.OFF, self._is_wifi, self._is_HC)
+        await self._client.async_set_setpoint_mode(self._id, HVACMode.OFF, self._is_wifi, self._is_HC)
         self._operation_mode = HVACMode.OFF
+        self.async_refresh_after_write()
 
     @override
-    def set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
         temperature = min(temperature, self._max_temp)
         temperature = max(temperature, self._min_temp)
-        self._client.set_temperature(self._id, temperature)
+        await self._client.async_set_temperature(self._id, temperature)
         self._target_temp = temperature
-        self._delayed_refresh()
+        self.async_refresh_after_write()
 
-    def set_second_display(self, value):
+    async def async_set_second_display(self, value):
         """Set thermostat second display between outside and setpoint temperature."""
         if value["display"] == "outsideTemperature":
             display_name = "Outside"
         else:
             display_name = "Setpoint"
-        self._client.set_second_display(value["id"], value["display"])
+        await self._client.async_set_second_display(value["id"], value["display"])
         self._display2 = display_name
 
-    def set_backlight(self, value):
+    async def async_set_backlight(self, value):
         """Set thermostat backlight «auto» = off when idle / on when active or «on» = always on.
         Work differently for Zigbee and Wi-Fi devices."""
         is_wifi = self._is_wifi or self._is_low_wifi or self._is_wifi_lite or self._is_wifi_floor
@@ -2767,10 +2584,10 @@ class Neviweb130Thermostat(ClimateEntity):
             else:
                 level_command = "onActive"
             level_name = "Auto"
-        self._client.set_backlight(value["id"], level_command, is_wifi)
+        await self._client.async_set_backlight(value["id"], level_command, is_wifi)
         self._backlight = level_name
 
-    def set_keypad_lock(self, value):
+    async def async_set_keypad_lock(self, value):
         """Lock or unlock device's keypad, Zigbee: locked, unlocked, partiallyLocked."""
         """ Wi-Fi: lock, unlock, partialLock."""
         lock = value["lock"]
@@ -2803,84 +2620,84 @@ class Neviweb130Thermostat(ClimateEntity):
                         )
                     )
 
-        self._client.set_keypad_lock(value["id"], lock, self._is_wifi)
+        await self._client.async_set_keypad_lock(value["id"], lock, self._is_wifi)
         self._keypad = lock
 
-    def set_time_format(self, value):
+    async def async_set_time_format(self, value):
         """Set time format 12h or 24h."""
         if value[ATTR_TIME] == 12:
             time_command = "12h"
         else:
             time_command = "24h"
-        self._client.set_time_format(value["id"], time_command)
+        await self._client.async_set_time_format(value["id"], time_command)
         self._time_format = time_command
 
-    def set_temperature_format(self, value):
+    async def async_set_temperature_format(self, value):
         """Set temperature format, celsius or fahrenheit."""
-        self._client.set_temperature_format(value["id"], value["temp"])
+        await self._client.async_set_temperature_format(value["id"], value["temp"])
         self._temperature_format = value["temp"]
 
-    def set_air_floor_mode(self, value):
+    async def async_set_air_floor_mode(self, value):
         """Switch temperature control between floor and ambient sensor."""
-        self._client.set_air_floor_mode(value["id"], value["mode"])
+        await self._client.async_set_air_floor_mode(value["id"], value["mode"])
         self._floor_mode = value["mode"]
 
-    def set_setpoint_max(self, value):
+    async def async_set_setpoint_max(self, value):
         """Set maximum setpoint temperature."""
-        self._client.set_setpoint_max(value["id"], value["temp"])
+        await self._client.async_set_setpoint_max(value["id"], value["temp"])
         self._max_temp = value["temp"]
 
-    def set_setpoint_min(self, value):
+    async def async_set_setpoint_min(self, value):
         """Set minimum setpoint temperature."""
-        self._client.set_setpoint_min(value["id"], value["temp"])
+        await self._client.async_set_setpoint_min(value["id"], value["temp"])
         self._min_temp = value["temp"]
 
-    def set_room_setpoint_away(self, value):
+    async def async_set_room_setpoint_away(self, value):
         """Set device away heating setpoint."""
-        self._client.set_room_setpoint_away(value["id"], value["temp"])
+        await self._client.async_set_room_setpoint_away(value["id"], value["temp"])
         self._target_temp_away = value["temp"]
 
-    def set_cool_setpoint_max(self, value):
+    async def async_set_cool_setpoint_max(self, value):
         """Set maximum cooling setpoint temperature."""
-        self._client.set_cool_setpoint_max(value["id"], value["temp"])
+        await self._client.async_set_cool_setpoint_max(value["id"], value["temp"])
         self._cool_max = value["temp"]
 
-    def set_cool_setpoint_min(self, value):
+    async def async_set_cool_setpoint_min(self, value):
         """Set minimum cooling setpoint temperature."""
-        self._client.set_cool_setpoint_min(value["id"], value["temp"])
+        await self._client.async_set_cool_setpoint_min(value["id"], value["temp"])
         self._cool_min = value["temp"]
 
-    def set_floor_air_limit(self, value):
+    async def async_set_floor_air_limit(self, value):
         """Set maximum temperature air limit for floor thermostat."""
         if value["temp"] == 0:
             status = "off"
         else:
             status = "on"
-        self._client.set_floor_air_limit(value["id"], status, value["temp"])
+        await self._client.async_set_floor_air_limit(value["id"], status, value["temp"])
         self._floor_air_limit = value["temp"]
 
-    def set_early_start(self, value):
+    async def async_set_early_start(self, value):
         """Set early heating on/off for Wi-Fi thermostat."""
-        self._client.set_early_start(value["id"], value["start"])
+        await self._client.async_set_early_start(value["id"], value["start"])
         self._early_start = value["start"]
 
-    def set_hvac_dr_options(self, value):
+    async def async_set_hvac_dr_options(self, value):
         """Set thermostat DR options for Eco Sinope."""
-        self._client.set_hvac_dr_options(
+        await self._client.async_set_hvac_dr_options(
             value["id"], dractive=value["dractive"], optout=value["optout"], setpoint=value["setpoint"]
         )
         self._drstatus_active = value["dractive"]
         self._drstatus_optout = value["optout"]
         self._drstatus_setpoint = value["setpoint"]
 
-    def set_hvac_dr_setpoint(self, value):
+    async def async_set_hvac_dr_setpoint(self, value):
         """Set thermostat DR setpoint values for Eco Sinope."""
-        self._client.set_hvac_dr_setpoint(value["id"], value["status"], value["val"])
+        await self._client.async_set_hvac_dr_setpoint(value["id"], value["status"], value["val"])
         self._drsetpoint_status = value["status"]
         self._drsetpoint_value = value["val"]
 
     @override
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new hvac mode."""
 
         # Simple modes, we call directly set_point_mode
@@ -2895,42 +2712,43 @@ class Neviweb130Thermostat(ClimateEntity):
         ]
 
         if hvac_mode in simple_modes:
-            self._client.set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
+            await self._client.async_set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
 
         elif hvac_mode == HVACMode.AUTO:
-            self._client.set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
+            await self._client.async_set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
 
         elif hvac_mode == HVACMode.HEAT_COOL:
-            self._client.set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
+            await self._client.async_set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
 
         elif hvac_mode == MODE_AUTO_BYPASS:
             if self._operation_mode == HVACMode.AUTO:
-                self._client.set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
+                await self._client.async_set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC_like)
 
         else:
             _LOGGER.error("Unable to set hvac mode: %s", hvac_mode)
 
         self._operation_mode = hvac_mode
-        self._delayed_refresh()
+        self.async_refresh_after_write()
 
     @override
-    def set_preset_mode(self, preset_mode: str) -> None:
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Activate a preset."""
         if preset_mode == self.preset_mode:
             return
         if preset_mode == PRESET_AWAY:
-            self._client.set_occupancy_mode(self._id, PRESET_AWAY, self._is_wifi)
+            await self._client.async_set_occupancy_mode(self._id, PRESET_AWAY, self._is_wifi)
         elif preset_mode == PRESET_HOME:
-            self._client.set_occupancy_mode(self._id, PRESET_HOME, self._is_wifi)
+            await self._client.async_set_occupancy_mode(self._id, PRESET_HOME, self._is_wifi)
         elif preset_mode == PRESET_NONE:
-            self._client.set_occupancy_mode(self._id, PRESET_NONE, self._is_wifi)
+            await self._client.async_set_occupancy_mode(self._id, PRESET_NONE, self._is_wifi)
             # Re-apply current hvac_mode without any preset
-            self.set_hvac_mode(self.hvac_mode)
+            await self.async_set_hvac_mode(self.hvac_mode)
         else:
             _LOGGER.error("Unable to set preset mode: %s", preset_mode)
         self._occupancy = preset_mode
+        self.async_refresh_after_write()
 
-    def turn_em_heat_on(self):
+    async def async_turn_em_heat_on(self):
         """Turn emergency heater on."""
         if self._is_low_voltage:
             value = "on"
@@ -2946,9 +2764,9 @@ class Neviweb130Thermostat(ClimateEntity):
             sec = 0
             low = "floor"
             self._em_heat = "slave"
-        self._client.set_em_heat(self._id, value, low, sec)
+        await self._client.async_set_em_heat(self._id, value, low, sec)
 
-    def turn_em_heat_off(self):
+    async def async_turn_em_heat_off(self):
         """Turn emergency heater off."""
         if self._is_low_voltage:
             low = "voltage"
@@ -2962,15 +2780,15 @@ class Neviweb130Thermostat(ClimateEntity):
             low = "floor"
             self._em_heat = "off"
             sec = 0
-        self._client.set_em_heat(self._id, "off", low, sec)
+        await self._client.async_set_em_heat(self._id, "off", low, sec)
 
-    def set_auxiliary_load(self, value):
+    async def async_set_auxiliary_load(self, value):
         """Set thermostat auxiliary output status and load."""
-        self._client.set_auxiliary_load(value["id"], value["status"], value["val"])
+        await self._client.async_set_auxiliary_load(value["id"], value["status"], value["val"])
         self._load2_status = value["status"]
         self._load2 = value["val"]
 
-    def set_aux_cycle_output(self, value):
+    async def async_set_aux_cycle_output(self, value):
         """Set low voltage thermostats auxiliary cycle status and length."""
         length: int = CYCLE_LENGTH_VALUES[value["val"]]
         is_wifi = self._is_low_wifi or (self._is_wifi and self._is_HC)
@@ -2983,7 +2801,7 @@ class Neviweb130Thermostat(ClimateEntity):
                     entity=self.entity_id,
                 )
             )
-        self._client.set_aux_cycle_output(value["id"], length, is_wifi)
+        await self._client.async_set_aux_cycle_output(value["id"], length, is_wifi)
         if is_wifi:
             self._aux_cycle_length = length
         elif length > 0:
@@ -2993,7 +2811,7 @@ class Neviweb130Thermostat(ClimateEntity):
             # Leaving self._cycle_length_output2_value to the old value on purpose
             self._cycle_length_output2_status = "off"
 
-    def set_cycle_output(self, value):
+    async def async_set_cycle_output(self, value):
         """Set low voltage thermostats main cycle output length."""
         length: int = CYCLE_LENGTH_VALUES[value["val"]]
         if length == 0:
@@ -3005,22 +2823,22 @@ class Neviweb130Thermostat(ClimateEntity):
                     entity=self.entity_id,
                 )
             )
-        self._client.set_cycle_output(value["id"], length, self._is_HC)
+        await self._client.async_set_cycle_output(value["id"], length, self._is_HC)
         self._cycle_length = length
 
-    def set_pump_protection(self, value):
+    async def async_set_pump_protection(self, value):
         """Set pump protection value."""
-        self._client.set_pump_protection(value["id"], value["status"], self._is_low_wifi)
+        await self._client.async_set_pump_protection(value["id"], value["status"], self._is_low_wifi)
         self._pump_protec_status = value["status"]
         self._pump_protec_duration = 60
         self._pump_protec_period = 1
 
-    def set_sensor_type(self, value):
+    async def async_set_sensor_type(self, value):
         """Set sensor type."""
-        self._client.set_sensor_type(value["id"], value["type"])
+        await self._client.async_set_sensor_type(value["id"], value["type"])
         self._floor_sensor_type = value["type"]
 
-    def set_floor_limit(self, value):
+    async def async_set_floor_limit(self, value):
         """Set maximum/minimum floor setpoint temperature."""
         temp = value["level"]
         limit = value["limit"]
@@ -3030,7 +2848,7 @@ class Neviweb130Thermostat(ClimateEntity):
         else:
             if 0 < temp < 7:
                 temp = 7
-        self._client.set_floor_limit(value["id"], temp, limit, self._is_wifi_floor)
+        await self._client.async_set_floor_limit(value["id"], temp, limit, self._is_wifi_floor)
         if limit == "low":
             self._floor_min = temp if temp != 0 else None
             self._floor_min_status = "on"
@@ -3042,47 +2860,49 @@ class Neviweb130Thermostat(ClimateEntity):
         """Activate or deactivate neviweb polling for a missing device."""
         self._active = value["active"]
 
-    def set_heat_pump_operation_limit(self, value):
+    async def async_set_heat_pump_operation_limit(self, value):
         """Set minimum temperature for heat pump operation."""
         temp = value["temp"]
         if temp < self._balance_pt_low:
             temp = self._balance_pt_low
-        self._client.set_heat_pump_limit(value["id"], temp)
+        await self._client.async_set_heat_pump_limit(value["id"], temp)
         self._balance_pt = temp
 
-    def set_heat_lockout_temperature(self, value):
+    async def async_set_heat_lockout_temperature(self, value):
         """Set maximum outside temperature limit to allow heating device operation."""
-        self._client.set_heat_lockout(value["id"], value["temp"], self._is_gen2)
+        await self._client.async_set_heat_lockout(value["id"], value["temp"], self._is_gen2)
         self._heat_lockout_temp = value["temp"]
 
-    def set_cool_lockout_temperature(self, value):
+    async def async_set_cool_lockout_temperature(self, value):
         """Set minimum outside temperature limit to allow cooling device operation."""
-        self._client.set_cool_lockout(value["id"], value["temp"])
+        await self._client.async_set_cool_lockout(value["id"], value["temp"])
         self._cool_lockout_temp = value["temp"]
 
-    def set_display_config(self, value):
+    async def async_set_display_config(self, value):
         """Set display on/off for heat pump."""
-        self._client.set_hp_display(value["id"], value["display"])
+        await self._client.async_set_hp_display(value["id"], value["display"])
         self._display_conf = value["display"]
 
-    def set_sound_config(self, value):
+    async def async_set_sound_config(self, value):
         """Set sound on/off for heat pump."""
-        self._client.set_hp_sound(value["id"], value["sound"])
+        await self._client.async_set_hp_sound(value["id"], value["sound"])
         self._sound_conf = value["sound"]
 
-    def set_hc_second_display(self, value):
+    async def async_set_hc_second_display(self, value):
         """Set second display value for TH1134ZB-HC."""
-        self._client.set_hc_display(value["id"], value["display"])
+        await self._client.async_set_hc_display(value["id"], value["display"])
         self._display2 = value["display"]
 
-    def set_language(self, value):
+    async def async_set_language(self, value):
         """Set display language value for TH1134ZB-HC."""
-        self._client.set_language(value["id"], value["lang"])
+        await self._client.async_set_language(value["id"], value["lang"])
         self._language = value["lang"]
 
     def get_weather(self):
-        """Get weather temperature for my location."""
-        weather = self._client.get_weather()
+        """Get weather temperature for my location, read by the coordinator."""
+        weather = self.location_weather()
+        if weather is None:
+            return
 
         # Check that weather is a valid dict
         if not isinstance(weather, dict):
@@ -3106,26 +2926,19 @@ class Neviweb130Thermostat(ClimateEntity):
         self._temperature = temperature
         self._weather_icon = icon
 
-    def set_climate_neviweb_status(self, value):
+    async def async_set_climate_neviweb_status(self, value):
         """Set Neviweb global occupancy mode, away or home"""
-        self._client.post_neviweb_status(self._location, value["mode"])
+        await self._client.async_post_neviweb_status(self._location, value["mode"])
         self._occupancy_mode = value["mode"]
 
-    def _delayed_refresh(self, delay: float = 2.0) -> None:
-        """Push immediate state and schedule a delayed refresh."""
-        self.schedule_update_ha_state()
-
-        # Set a delayed refresh to wait from Neviweb to finish his setting
-        call_later(self.hass, delay, lambda _: self.update())
-
     def do_stat(self, start):
         """Get device energy statistic."""
-        if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
+        if self.has_cycle_value(READ_HOURLY_STATS):
             today = date.today()
             current_month = today.month
             current_day = today.day
             if not self._is_HC:
-                device_monthly_stats = self._client.get_device_monthly_stats(self._id, False)
+                device_monthly_stats = self.cycle_value(READ_MONTHLY_STATS)
                 _LOGGER.debug("%s device_monthly_stats = %s", self._name, device_monthly_stats)
                 if device_monthly_stats is not None and len(device_monthly_stats) > 1:
                     n = len(device_monthly_stats)
@@ -3151,7 +2964,7 @@ class Neviweb130Thermostat(ClimateEntity):
                             name=self._name,
                         )
                     )
-                device_daily_stats = self._client.get_device_daily_stats(self._id, False)
+                device_daily_stats = self.cycle_value(READ_DAILY_STATS)
                 _LOGGER.debug("%s device_daily_stats = %s", self._name, device_daily_stats)
                 if device_daily_stats is not None and len(device_daily_stats) > 1:
                     n = len(device_daily_stats)
@@ -3181,7 +2994,7 @@ class Neviweb130Thermostat(ClimateEntity):
                             name=self._name,
                         )
                     )
-                device_hourly_stats = self._client.get_device_hourly_stats(self._id, False)
+                device_hourly_stats = self.cycle_value(READ_HOURLY_STATS)
                 _LOGGER.debug(
                     "%s device hourly stat (SKU: %s): %s, size = %s",
                     self._name,
@@ -3231,7 +3044,7 @@ class Neviweb130Thermostat(ClimateEntity):
                         self._mark = self._marker
                 self._energy_stat_time = time.time()
             else:
-                device_hourly_stats = self._client.get_device_hourly_stats(self._id, True)
+                device_hourly_stats = self.cycle_value(READ_HOURLY_STATS)
                 _LOGGER.debug(
                     "%s device hourly stats (SKU: %s): %s, size = %s",
                     self._name,
@@ -3282,9 +3095,28 @@ class Neviweb130Thermostat(ClimateEntity):
         if self._energy_stat_time == 0:
             self._energy_stat_time = start
 
-    def get_sensor_error_code(self):
+    def plan_update_attributes(self, attributes: list[str]) -> list[str]:
+        """Return the attributes to read in one request for this update.
+
+        errorCodeSet1 is added to the main read so the error bitmask arrives in the
+        same round trip, unless this device refused it there. The client records
+        devices answering DVCATTRNSPTD to it in UNSUPPORTED_ATTRS, those read it in
+        a separate request.
+        """
+        self._error_code_in_read = ATTR_ERROR_CODE_SET1 not in UNSUPPORTED_ATTRS.get(self._id, set())
+        if self._error_code_in_read and ATTR_ERROR_CODE_SET1 not in attributes:
+            return attributes + [ATTR_ERROR_CODE_SET1]
+        return attributes
+
+    def get_sensor_error_code(self, device_data: dict[str, Any] | None = None):
         """Get device sensor error code."""
-        device_error_code = self._client.get_device_sensor_error(self._id)
+        if device_data is not None and device_data.get(ATTR_ERROR_CODE_SET1) is not None:
+            device_error_code = device_data[ATTR_ERROR_CODE_SET1]
+        elif self._error_code_in_read or not self.has_cycle_value(READ_ERROR_CODE):
+            # Error code read failed or was not done in this cycle, keep last state
+            return
+        else:
+            device_error_code = self.cycle_value(READ_ERROR_CODE)
         raw_code = device_error_code.get("raw", 0) if device_error_code else 0
 
         # Message list
@@ -3357,7 +3189,7 @@ class Neviweb130Thermostat(ClimateEntity):
                         ),
                     )
                 )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCDAYREQMAX":
             _LOGGER.warning("Maximum daily request reached... Reduce polling frequency")
         elif error_data == "TimeoutError":
@@ -3371,7 +3203,7 @@ class Neviweb130Thermostat(ClimateEntity):
                     "Warning: Neviweb access temporary blocked for maintenance... Retry later.",
                 )
             )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximum session number reached... Close other connections and try again")
             self.notify_ha(
@@ -3384,7 +3216,7 @@ class Neviweb130Thermostat(ClimateEntity):
                     ),
                 )
             )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "DVCATTRNSPTD":
             _LOGGER.warning(
                 "Device attribute not supported for %s (id: %s): %s... (SKU: %s)",
@@ -3528,14 +3360,15 @@ class Neviweb130Thermostat(ClimateEntity):
 
     def notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
-            PN_DOMAIN,
-            "create",
-            service_data={
-                "title": title,
-                "message": msg,
-            },
-            blocking=False,
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                PN_DOMAIN,
+                "create",
+                service_data={
+                    "title": title,
+                    "message": msg,
+                },
+            )
         )
         return True
 
@@ -3548,43 +3381,35 @@ class Neviweb130G2Thermostat(Neviweb130Thermostat):
         self._cold_load_pickup = None
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        GEN2_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_WATTAGE,
+            ATTR_DISPLAY2,
+            ATTR_KEYPAD,
+            ATTR_BACKLIGHT,
+            ATTR_SYSTEM_MODE,
+            ATTR_CYCLE_LENGTH,
+            ATTR_COLD_LOAD_PICKUP,
+            ATTR_HEAT_LOCKOUT_TEMP,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + GEN2_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            GEN2_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_WATTAGE,
-                ATTR_DISPLAY2,
-                ATTR_KEYPAD,
-                ATTR_BACKLIGHT,
-                ATTR_SYSTEM_MODE,
-                ATTR_CYCLE_LENGTH,
-                ATTR_COLD_LOAD_PICKUP,
-                ATTR_HEAT_LOCKOUT_TEMP,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + GEN2_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -3641,7 +3466,7 @@ class Neviweb130G2Thermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -3723,51 +3548,43 @@ class Neviweb130FloorThermostat(Neviweb130Thermostat):
         self._load2 = 0
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        FLOOR_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_WATTAGE,
+            ATTR_GFCI_STATUS,
+            ATTR_GFCI_ALERT,
+            ATTR_FLOOR_MODE,
+            ATTR_FLOOR_AUX,
+            ATTR_FLOOR_OUTPUT2,
+            ATTR_FLOOR_AIR_LIMIT,
+            ATTR_FLOOR_SENSOR,
+            ATTR_FLOOR_MAX,
+            ATTR_FLOOR_MIN,
+            ATTR_KEYPAD,
+            ATTR_BACKLIGHT,
+            ATTR_SYSTEM_MODE,
+            ATTR_CYCLE_LENGTH,
+            ATTR_DISPLAY2,
+            ATTR_RSSI,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + FLOOR_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            FLOOR_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_WATTAGE,
-                ATTR_GFCI_STATUS,
-                ATTR_GFCI_ALERT,
-                ATTR_FLOOR_MODE,
-                ATTR_FLOOR_AUX,
-                ATTR_FLOOR_OUTPUT2,
-                ATTR_FLOOR_AIR_LIMIT,
-                ATTR_FLOOR_SENSOR,
-                ATTR_FLOOR_MAX,
-                ATTR_FLOOR_MIN,
-                ATTR_KEYPAD,
-                ATTR_BACKLIGHT,
-                ATTR_SYSTEM_MODE,
-                ATTR_CYCLE_LENGTH,
-                ATTR_DISPLAY2,
-                ATTR_RSSI,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + FLOOR_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -3840,7 +3657,7 @@ class Neviweb130FloorThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -3934,51 +3751,43 @@ class Neviweb130LowThermostat(Neviweb130Thermostat):
         self._pump_protec_period_status = "off"
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOW_VOLTAGE_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_KEYPAD,
+            ATTR_BACKLIGHT,
+            ATTR_SYSTEM_MODE,
+            ATTR_CYCLE_LENGTH,
+            ATTR_DISPLAY2,
+            ATTR_RSSI,
+            ATTR_PUMP_PROTEC_DURATION,
+            ATTR_PUMP_PROTEC_PERIOD,
+            ATTR_FLOOR_AIR_LIMIT,
+            ATTR_FLOOR_MODE,
+            ATTR_FLOOR_SENSOR,
+            ATTR_FLOOR_MAX,
+            ATTR_FLOOR_MIN,
+            ATTR_CYCLE_OUTPUT2,
+            ATTR_FLOOR_OUTPUT1,
+            ATTR_FLOOR_OUTPUT2,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + LOW_VOLTAGE_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            LOW_VOLTAGE_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_KEYPAD,
-                ATTR_BACKLIGHT,
-                ATTR_SYSTEM_MODE,
-                ATTR_CYCLE_LENGTH,
-                ATTR_DISPLAY2,
-                ATTR_RSSI,
-                ATTR_PUMP_PROTEC_DURATION,
-                ATTR_PUMP_PROTEC_PERIOD,
-                ATTR_FLOOR_AIR_LIMIT,
-                ATTR_FLOOR_MODE,
-                ATTR_FLOOR_SENSOR,
-                ATTR_FLOOR_MAX,
-                ATTR_FLOOR_MIN,
-                ATTR_CYCLE_OUTPUT2,
-                ATTR_FLOOR_OUTPUT1,
-                ATTR_FLOOR_OUTPUT2,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOW_VOLTAGE_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -4059,7 +3868,7 @@ class Neviweb130LowThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -4148,42 +3957,34 @@ class Neviweb130DoubleThermostat(Neviweb130Thermostat):
     """Implementation of Neviweb TH1500ZB thermostat."""
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        DOUBLE_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_KEYPAD,
+            ATTR_BACKLIGHT,
+            ATTR_SYSTEM_MODE,
+            ATTR_CYCLE_LENGTH,
+            ATTR_DISPLAY2,
+            ATTR_RSSI,
+            ATTR_WATTAGE,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + DOUBLE_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            DOUBLE_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_KEYPAD,
-                ATTR_BACKLIGHT,
-                ATTR_SYSTEM_MODE,
-                ATTR_CYCLE_LENGTH,
-                ATTR_DISPLAY2,
-                ATTR_RSSI,
-                ATTR_WATTAGE,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + DOUBLE_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -4239,7 +4040,7 @@ class Neviweb130DoubleThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -4321,46 +4122,38 @@ class Neviweb130WifiThermostat(Neviweb130Thermostat):
         self._temp_display_status = None
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        WIFI_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_CYCLE_LENGTH,
+            ATTR_FLOOR_OUTPUT1,
+            ATTR_WIFI_WATTAGE,
+            ATTR_WIFI,
+            ATTR_WIFI_KEYPAD,
+            ATTR_DISPLAY2,
+            ATTR_SETPOINT_MODE,
+            ATTR_OCCUPANCY,
+            ATTR_BACKLIGHT_AUTO_DIM,
+            ATTR_EARLY_START,
+            ATTR_ROOM_SETPOINT_AWAY,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + WIFI_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            WIFI_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_CYCLE_LENGTH,
-                ATTR_FLOOR_OUTPUT1,
-                ATTR_WIFI_WATTAGE,
-                ATTR_WIFI,
-                ATTR_WIFI_KEYPAD,
-                ATTR_DISPLAY2,
-                ATTR_SETPOINT_MODE,
-                ATTR_OCCUPANCY,
-                ATTR_BACKLIGHT_AUTO_DIM,
-                ATTR_EARLY_START,
-                ATTR_ROOM_SETPOINT_AWAY,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + WIFI_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -4425,7 +4218,7 @@ class Neviweb130WifiThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -4519,48 +4312,46 @@ class Neviweb130WifiLiteThermostat(Neviweb130Thermostat):
         self._interlock_partner = None
         self._interlock_hc_mode = None
 
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._sku not in ("TH1133WF", "TH1133CR", "TH1134WF", "TH1134CR")
+
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LITE_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_CYCLE_LENGTH,
+            ATTR_OUTPUT1,
+            ATTR_WIFI,
+            ATTR_WIFI_KEYPAD,
+            ATTR_SETPOINT_MODE,
+            ATTR_OCCUPANCY,
+            ATTR_BACKLIGHT_AUTO_DIM,
+            ATTR_EARLY_START,
+            ATTR_ROOM_SETPOINT_AWAY,
+            ATTR_INTERLOCK_PARTNER,
+            ATTR_INTERLOCK_ID,
+            ATTR_INTERLOCK_HC_MODE,
+        ]
+        return self.plan_update_attributes(UPDATE_LITE_ATTRIBUTES + LITE_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            LITE_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_CYCLE_LENGTH,
-                ATTR_OUTPUT1,
-                ATTR_WIFI,
-                ATTR_WIFI_KEYPAD,
-                ATTR_SETPOINT_MODE,
-                ATTR_OCCUPANCY,
-                ATTR_BACKLIGHT_AUTO_DIM,
-                ATTR_EARLY_START,
-                ATTR_ROOM_SETPOINT_AWAY,
-                ATTR_INTERLOCK_PARTNER,
-                ATTR_INTERLOCK_ID,
-                ATTR_INTERLOCK_HC_MODE,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_LITE_ATTRIBUTES + LITE_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -4627,14 +4418,9 @@ class Neviweb130WifiLiteThermostat(Neviweb130Thermostat):
             status = neviweb_status.get(ATTR_OCCUPANCY)
             if isinstance(status, str):
                 self._occupancy_mode = status
-            if (
-                self._sku != "TH1133WF"
-                and self._sku != "TH1133CR"
-                and self._sku != "TH1134WF"
-                and self._sku != "TH1134CR"
-            ):
+            if self.reads_stats:
                 self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -4726,44 +4512,36 @@ class Neviweb130ColorWifiThermostat(Neviweb130Thermostat):
         self._temp_display_status = None
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LITE_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_OUTPUT1,
+            ATTR_WIFI,
+            ATTR_WIFI_KEYPAD,
+            ATTR_SETPOINT_MODE,
+            ATTR_OCCUPANCY,
+            ATTR_BACKLIGHT_AUTO_DIM,
+            ATTR_EARLY_START,
+            ATTR_ROOM_SETPOINT_AWAY,
+            ATTR_LANGUAGE,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + LITE_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            LITE_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_OUTPUT1,
-                ATTR_WIFI,
-                ATTR_WIFI_KEYPAD,
-                ATTR_SETPOINT_MODE,
-                ATTR_OCCUPANCY,
-                ATTR_BACKLIGHT_AUTO_DIM,
-                ATTR_EARLY_START,
-                ATTR_ROOM_SETPOINT_AWAY,
-                ATTR_LANGUAGE,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LITE_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -4827,7 +4605,7 @@ class Neviweb130ColorWifiThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -4919,56 +4697,48 @@ class Neviweb130LowWifiThermostat(Neviweb130Thermostat):
         self._temp_display_status = None
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOW_WIFI_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_FLOOR_OUTPUT2,
+            ATTR_FLOOR_AUX,
+            ATTR_ROOM_SETPOINT_AWAY,
+            ATTR_EARLY_START,
+            ATTR_BACKLIGHT_AUTO_DIM,
+            ATTR_OCCUPANCY,
+            ATTR_SETPOINT_MODE,
+            ATTR_DISPLAY2,
+            ATTR_WIFI_KEYPAD,
+            ATTR_WIFI,
+            ATTR_WIFI_WATTAGE,
+            ATTR_FLOOR_OUTPUT1,
+            ATTR_PUMP_PROTEC,
+            ATTR_PUMP_PROTEC_DURATION,
+            ATTR_FLOOR_AIR_LIMIT,
+            ATTR_FLOOR_MODE,
+            ATTR_FLOOR_SENSOR,
+            ATTR_AUX_CYCLE_LENGTH,
+            ATTR_CYCLE_LENGTH,
+            ATTR_FLOOR_MAX,
+            ATTR_FLOOR_MIN,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + LOW_WIFI_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            LOW_WIFI_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_FLOOR_OUTPUT2,
-                ATTR_FLOOR_AUX,
-                ATTR_ROOM_SETPOINT_AWAY,
-                ATTR_EARLY_START,
-                ATTR_BACKLIGHT_AUTO_DIM,
-                ATTR_OCCUPANCY,
-                ATTR_SETPOINT_MODE,
-                ATTR_DISPLAY2,
-                ATTR_WIFI_KEYPAD,
-                ATTR_WIFI,
-                ATTR_WIFI_WATTAGE,
-                ATTR_FLOOR_OUTPUT1,
-                ATTR_PUMP_PROTEC,
-                ATTR_PUMP_PROTEC_DURATION,
-                ATTR_FLOOR_AIR_LIMIT,
-                ATTR_FLOOR_MODE,
-                ATTR_FLOOR_SENSOR,
-                ATTR_AUX_CYCLE_LENGTH,
-                ATTR_CYCLE_LENGTH,
-                ATTR_FLOOR_MAX,
-                ATTR_FLOOR_MIN,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOW_WIFI_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -5048,7 +4818,7 @@ class Neviweb130LowWifiThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -5157,57 +4927,55 @@ class Neviweb130WifiFloorThermostat(Neviweb130Thermostat):
         self._room_temp_error = None
         self._target_temp_away = None
 
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._sku != "FLP55" and self._sku != "PS120_240WF"
+
+    @override
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        WIFI_FLOOR_ATTRIBUTES = [
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_GFCI_ALERT,
+            ATTR_FLOOR_MAX,
+            ATTR_FLOOR_MIN,
+            ATTR_GFCI_STATUS,
+            ATTR_FLOOR_MODE,
+            ATTR_FLOOR_AUX,
+            ATTR_FLOOR_OUTPUT2,
+            ATTR_FLOOR_AIR_LIMIT,
+            ATTR_FLOOR_SENSOR,
+            ATTR_FLOOR_OUTPUT1,
+            ATTR_WIFI_WATTAGE,
+            ATTR_WIFI,
+            ATTR_WIFI_KEYPAD,
+            ATTR_DISPLAY2,
+            ATTR_SETPOINT_MODE,
+            ATTR_OCCUPANCY,
+            ATTR_BACKLIGHT_AUTO_DIM,
+            ATTR_EARLY_START,
+            ATTR_ROOM_SETPOINT_AWAY,
+            ATTR_ROOM_SETPOINT_MIN,
+            ATTR_ROOM_SETPOINT_MAX,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + WIFI_FLOOR_ATTRIBUTES)
+
     @override
-    def update(self) -> None:
+    async def async_update(self) -> None:
         if self._active:
-            WIFI_FLOOR_ATTRIBUTES = [
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_GFCI_ALERT,
-                ATTR_FLOOR_MAX,
-                ATTR_FLOOR_MIN,
-                ATTR_GFCI_STATUS,
-                ATTR_FLOOR_MODE,
-                ATTR_FLOOR_AUX,
-                ATTR_FLOOR_OUTPUT2,
-                ATTR_FLOOR_AIR_LIMIT,
-                ATTR_FLOOR_SENSOR,
-                ATTR_FLOOR_OUTPUT1,
-                ATTR_WIFI_WATTAGE,
-                ATTR_WIFI,
-                ATTR_WIFI_KEYPAD,
-                ATTR_DISPLAY2,
-                ATTR_SETPOINT_MODE,
-                ATTR_OCCUPANCY,
-                ATTR_BACKLIGHT_AUTO_DIM,
-                ATTR_EARLY_START,
-                ATTR_ROOM_SETPOINT_AWAY,
-                ATTR_ROOM_SETPOINT_MIN,
-                ATTR_ROOM_SETPOINT_MAX,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + WIFI_FLOOR_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -5279,9 +5047,9 @@ class Neviweb130WifiFloorThermostat(Neviweb130Thermostat):
             status = neviweb_status.get(ATTR_OCCUPANCY)
             if isinstance(status, str):
                 self._occupancy_mode = status
-            if self._sku != "FLP55" and self._sku != "PS120_240WF":
+            if self.reads_stats:
                 self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -5381,63 +5149,55 @@ class Neviweb130HcThermostat(Neviweb130Thermostat):
         self._sound_cap = None
 
     @override
-    def update(self) -> None:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        HC_ATTRIBUTES = [
+            ATTR_DISPLAY2,
+            ATTR_RSSI,
+            ATTR_COOL_SETPOINT,
+            ATTR_COOL_SETPOINT_MIN,
+            ATTR_COOL_SETPOINT_MAX,
+            ATTR_SYSTEM_MODE,
+            ATTR_CYCLE_LENGTH,
+            ATTR_WATTAGE,
+            ATTR_BACKLIGHT,
+            ATTR_KEYPAD,
+            ATTR_HC_DEV,
+            ATTR_LANGUAGE,
+            ATTR_MODEL,
+            ATTR_FAN_SPEED,
+            ATTR_FAN_SWING_VERT,
+            ATTR_FAN_SWING_HORIZ,
+            ATTR_FAN_CAP,
+            ATTR_FAN_SWING_CAP,
+            ATTR_FAN_SWING_CAP_HORIZ,
+            ATTR_FAN_SWING_CAP_VERT,
+            ATTR_BALANCE_PT,
+            ATTR_HEAT_LOCK_TEMP,
+            ATTR_COOL_LOCK_TEMP,
+            ATTR_AVAIL_MODE,
+            ATTR_DISPLAY_CONF,
+            ATTR_DISPLAY_CAP,
+            ATTR_SOUND_CONF,
+            ATTR_SOUND_CAP,
+            ATTR_ROOM_TEMP_DISPLAY,
+        ]
+        return self.plan_update_attributes(UPDATE_ATTRIBUTES + HC_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
         if self._active:
-            HC_ATTRIBUTES = [
-                ATTR_DISPLAY2,
-                ATTR_RSSI,
-                ATTR_COOL_SETPOINT,
-                ATTR_COOL_SETPOINT_MIN,
-                ATTR_COOL_SETPOINT_MAX,
-                ATTR_SYSTEM_MODE,
-                ATTR_CYCLE_LENGTH,
-                ATTR_WATTAGE,
-                ATTR_BACKLIGHT,
-                ATTR_KEYPAD,
-                ATTR_HC_DEV,
-                ATTR_LANGUAGE,
-                ATTR_MODEL,
-                ATTR_FAN_SPEED,
-                ATTR_FAN_SWING_VERT,
-                ATTR_FAN_SWING_HORIZ,
-                ATTR_FAN_CAP,
-                ATTR_FAN_SWING_CAP,
-                ATTR_FAN_SWING_CAP_HORIZ,
-                ATTR_FAN_SWING_CAP_VERT,
-                ATTR_BALANCE_PT,
-                ATTR_HEAT_LOCK_TEMP,
-                ATTR_COOL_LOCK_TEMP,
-                ATTR_AVAIL_MODE,
-                ATTR_DISPLAY_CONF,
-                ATTR_DISPLAY_CAP,
-                ATTR_SOUND_CONF,
-                ATTR_SOUND_CAP,
-                ATTR_ROOM_TEMP_DISPLAY,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + HC_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -5513,7 +5273,7 @@ class Neviweb130HcThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -5615,62 +5375,60 @@ class Neviweb130HPThermostat(Neviweb130Thermostat):
         self._model = None
         self._sound_cap = None
 
+    @property
     @override
-    def update(self) -> None:
-        if self._active:
-            HP_ATTRIBUTES = [
-                ATTR_RSSI,
-                ATTR_COOL_SETPOINT,
-                ATTR_SYSTEM_MODE,
-                ATTR_KEYPAD,
-                ATTR_MODEL,
-                ATTR_FAN_SPEED,
-                ATTR_FAN_SWING_VERT,
-                ATTR_FAN_CAP,
-                ATTR_AVAIL_MODE,
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return False
+
+    @override
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        HP_ATTRIBUTES = [
+            ATTR_RSSI,
+            ATTR_COOL_SETPOINT,
+            ATTR_SYSTEM_MODE,
+            ATTR_KEYPAD,
+            ATTR_MODEL,
+            ATTR_FAN_SPEED,
+            ATTR_FAN_SWING_VERT,
+            ATTR_FAN_CAP,
+            ATTR_AVAIL_MODE,
+        ]
+        if self._firmware != "0.1.7":
+            NEW_HP_ATTRIBUTES = [
+                ATTR_DRSTATUS,
+                ATTR_DRSETPOINT,
+                ATTR_FAN_SWING_HORIZ,
+                ATTR_FAN_SWING_CAP,
+                ATTR_FAN_SWING_CAP_HORIZ,
+                ATTR_FAN_SWING_CAP_VERT,
+                ATTR_BALANCE_PT,
+                ATTR_HEAT_LOCK_TEMP,
+                ATTR_COOL_LOCK_TEMP,
+                ATTR_DISPLAY_CONF,
+                ATTR_DISPLAY_CAP,
+                ATTR_SOUND_CONF,
+                ATTR_SOUND_CAP,
             ]
-            if self._firmware != "0.1.7":
-                NEW_HP_ATTRIBUTES = [
-                    ATTR_DRSTATUS,
-                    ATTR_DRSETPOINT,
-                    ATTR_FAN_SWING_HORIZ,
-                    ATTR_FAN_SWING_CAP,
-                    ATTR_FAN_SWING_CAP_HORIZ,
-                    ATTR_FAN_SWING_CAP_VERT,
-                    ATTR_BALANCE_PT,
-                    ATTR_HEAT_LOCK_TEMP,
-                    ATTR_COOL_LOCK_TEMP,
-                    ATTR_DISPLAY_CONF,
-                    ATTR_DISPLAY_CAP,
-                    ATTR_SOUND_CONF,
-                    ATTR_SOUND_CAP,
-                ]
-            else:
-                NEW_HP_ATTRIBUTES = []
+        else:
+            NEW_HP_ATTRIBUTES = []
+        return self.plan_update_attributes(UPDATE_HP_ATTRIBUTES + HP_ATTRIBUTES + NEW_HP_ATTRIBUTES)
+
+    @override
+    async def async_update(self) -> None:
+        if self._active:
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_HP_ATTRIBUTES + HP_ATTRIBUTES + NEW_HP_ATTRIBUTES
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             _LOGGER.debug(
                 "Updated attributes for %s: %s",
                 self._name,
-                attributes,
+                self.planned_attributes,
             )
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -5746,7 +5504,7 @@ class Neviweb130HPThermostat(Neviweb130Thermostat):
             status = neviweb_status.get(ATTR_OCCUPANCY)
             if isinstance(status, str):
                 self._occupancy_mode = status
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -5863,29 +5621,31 @@ class Neviweb130HPThermostat(Neviweb130Thermostat):
         return self._target_cool
 
     @override
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the thermostat to HVACMode.HEAT."""
         self._operation_mode = HVACMode.HEAT
-        self._client.set_setpoint_mode(self._id, self._operation_mode, self._is_wifi, self._is_HP)
+        await self._client.async_set_setpoint_mode(self._id, self._operation_mode, self._is_wifi, self._is_HP)
+        self.async_refresh_after_write()
 
     @override
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn the thermostat to HVACMode.OFF."""
         self._operation_mode = HVACMode.OFF
-        self._client.set_setpoint_mode(self._id, self._operation_mode, self._is_wifi, self._is_HP)
+        await self._client.async_set_setpoint_mode(self._id, self._operation_mode, self._is_wifi, self._is_HP)
+        self.async_refresh_after_write()
 
     @override
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new hvac mode."""
         mode_to_send: str | HVACMode = hvac_mode
         if hvac_mode == HVACMode.FAN_ONLY:
             mode_to_send = "fanOnly"
-        self._client.set_setpoint_mode(self._id, mode_to_send, self._is_wifi, self._is_HP)
+        await self._client.async_set_setpoint_mode(self._id, mode_to_send, self._is_wifi, self._is_HP)
 
-        self._delayed_refresh()
+        self.async_refresh_after_write()
 
     @override
-    def set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature, routing to coolSetpoint or roomSetpoint based on mode."""
         temperature_low = None
         temperature_high = None
@@ -5904,7 +5664,7 @@ class Neviweb130HPThermostat(Neviweb130Thermostat):
             temperature_low = min(temperature_low, self._max_temp)
 
             if self._target_temp != temperature_low:
-                self._client.set_temperature(self._id, temperature_low)
+                await self._client.async_set_temperature(self._id, temperature_low)
                 self._target_temp = temperature_low
 
         if temperature_high is not None:
@@ -5912,10 +5672,10 @@ class Neviweb130HPThermostat(Neviweb130Thermostat):
             temperature_high = max(temperature_high, self._cool_min)
 
             if self._target_cool != temperature_high:
-                self._client.set_cool_temperature(self._id, temperature_high)
+                await self._client.async_set_cool_temperature(self._id, temperature_high)
                 self._target_cool = temperature_high
 
-        self._delayed_refresh()
+        self.async_refresh_after_write()
 
     @property
     @override
@@ -6000,60 +5760,57 @@ class Neviweb130WifiHPThermostat(Neviweb130Thermostat):
         self._room_temp_error = None
         self._sound_cap = None
 
+    @property
     @override
-    def update(self) -> None:
-        if self._active:
-            WHP_ATTRIBUTES = [
-                ATTR_BALANCE_PT,
-                ATTR_COOL_LOCK_TEMP,
-                ATTR_COOL_SETPOINT,
-                ATTR_COOL_SETPOINT_AWAY,
-                ATTR_DISPLAY_CAP,
-                ATTR_DISPLAY_CONF,
-                ATTR_DRSETPOINT,
-                ATTR_DRSTATUS,
-                ATTR_FAN_CAP,
-                ATTR_FAN_SPEED,
-                ATTR_FAN_SWING_CAP,
-                ATTR_FAN_SWING_CAP_HORIZ,
-                ATTR_FAN_SWING_CAP_VERT,
-                ATTR_FAN_SWING_HORIZ,
-                ATTR_FAN_SWING_VERT,
-                ATTR_HEAT_COOL,
-                ATTR_HEAT_LOCK_TEMP,
-                ATTR_INTERLOCK_ID,
-                ATTR_MODEL,
-                ATTR_OCCUPANCY,
-                ATTR_ROOM_SETPOINT_AWAY,
-                ATTR_ROOM_TEMP_DISPLAY,
-                ATTR_SETPOINT_MODE,
-                ATTR_SOUND_CAP,
-                ATTR_SOUND_CONF,
-                ATTR_SYSTEM_MODE_AVAIL,
-                ATTR_WIFI,
-                ATTR_WIFI_KEYPAD,
-            ]
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return False
+
+    @override
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        WHP_ATTRIBUTES = [
+            ATTR_BALANCE_PT,
+            ATTR_COOL_LOCK_TEMP,
+            ATTR_COOL_SETPOINT,
+            ATTR_COOL_SETPOINT_AWAY,
+            ATTR_DISPLAY_CAP,
+            ATTR_DISPLAY_CONF,
+            ATTR_DRSETPOINT,
+            ATTR_DRSTATUS,
+            ATTR_FAN_CAP,
+            ATTR_FAN_SPEED,
+            ATTR_FAN_SWING_CAP,
+            ATTR_FAN_SWING_CAP_HORIZ,
+            ATTR_FAN_SWING_CAP_VERT,
+            ATTR_FAN_SWING_HORIZ,
+            ATTR_FAN_SWING_VERT,
+            ATTR_HEAT_COOL,
+            ATTR_HEAT_LOCK_TEMP,
+            ATTR_INTERLOCK_ID,
+            ATTR_MODEL,
+            ATTR_OCCUPANCY,
+            ATTR_ROOM_SETPOINT_AWAY,
+            ATTR_ROOM_TEMP_DISPLAY,
+            ATTR_SETPOINT_MODE,
+            ATTR_SOUND_CAP,
+            ATTR_SOUND_CONF,
+            ATTR_SYSTEM_MODE_AVAIL,
+            ATTR_WIFI,
+            ATTR_WIFI_KEYPAD,
+        ]
+        return self.plan_update_attributes(UPDATE_HP_ATTRIBUTES + WHP_ATTRIBUTES)
 
+    @override
+    async def async_update(self) -> None:
+        if self._active:
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_HP_ATTRIBUTES + WHP_ATTRIBUTES
-            _LOGGER.debug("Updated attributes for %s: %s", self._name, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug("Updated attributes for %s: %s", self._name, self.planned_attributes)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -6187,7 +5944,7 @@ class Neviweb130WifiHPThermostat(Neviweb130Thermostat):
             status = neviweb_status.get(ATTR_OCCUPANCY)
             if isinstance(status, str):
                 self._occupancy_mode = status
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -6338,30 +6095,32 @@ class Neviweb130WifiHPThermostat(Neviweb130Thermostat):
         return self._target_cool
 
     @override
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the thermostat to HVACMode.HEAT."""
         self._heat_cool = HVACMode.HEAT
-        self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_WHP)
+        await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_WHP)
+        self.async_refresh_after_write()
 
     @override
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn the thermostat to HVACMode.OFF."""
         self._heat_cool = HVACMode.OFF
-        self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_WHP)
+        await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_WHP)
+        self.async_refresh_after_write()
 
     @override
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new hvac mode."""
-        self._client.set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_WHP)
+        await self._client.async_set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_WHP)
 
         self._heat_cool = hvac_mode if hvac_mode != HVACMode.HEAT_COOL else HVACMode.AUTO
 
         # Reset the preset to the occupancy
-        self.set_preset_mode(self._occupancy)
-        self._delayed_refresh()
+        await self.async_set_preset_mode(self._occupancy)
+        self.async_refresh_after_write()
 
     @override
-    def set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature_low = None
         temperature_high = None
@@ -6385,7 +6144,7 @@ class Neviweb130WifiHPThermostat(Neviweb130Thermostat):
                 temperature_low = min(temperature_low, self._max_temp)
 
             if self._target_temp != temperature_low:
-                self._client.set_temperature(self._id, temperature_low)
+                await self._client.async_set_temperature(self._id, temperature_low)
                 self._target_temp = temperature_low
 
         if temperature_high is not None:
@@ -6398,9 +6157,9 @@ class Neviweb130WifiHPThermostat(Neviweb130Thermostat):
                 temperature_high = max(temperature_high, self._cool_min)
 
             if self._target_cool != temperature_high:
-                self._client.set_cool_temperature(self._id, temperature_high)
+                await self._client.async_set_cool_temperature(self._id, temperature_high)
                 self._target_cool = temperature_high
-        self._delayed_refresh()
+        self.async_refresh_after_write()
 
     @property
     @override
@@ -6539,106 +6298,99 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
             setattr(self, f"_{mode}_hourly_last_timestamp_local", None)
 
     @override
-    def update(self) -> None:
-        if self._active:
-            HC_ATTRIBUTES = [
-                ATTR_AUX_CYCLE_LENGTH,
-                ATTR_AUX_HEAT_MIN_TIME_ON,
-                ATTR_AUX_HEAT_SOURCE_TYPE,
-                ATTR_AUX_HEAT_START_DELAY,
-                ATTR_BACK_LIGHT,
-                ATTR_BACKLIGHT_AUTO_DIM,
-                ATTR_BALANCE_PT,
-                ATTR_CYCLE_LENGTH,
-                ATTR_COOL_CYCLE_LENGTH,
-                ATTR_COOL_LOCK_TEMP,
-                ATTR_COOL_MIN_TIME_OFF,
-                ATTR_COOL_MIN_TIME_ON,
-                ATTR_COOL_SETPOINT_AWAY,
-                ATTR_DUAL_STATUS,
-                ATTR_EARLY_START,
-                ATTR_FAN_FILTER_REMAIN,
-                ATTR_FAN_SPEED,
-                ATTR_HEAT_COOL,
-                ATTR_HEATCOOL_SETPOINT_MIN_DELTA,
-                ATTR_HEAT_INSTALLATION_TYPE,
-                ATTR_HEAT_LOCK_TEMP,
-                ATTR_HEAT_SOURCE_TYPE,
-                ATTR_HUMIDIFIER_TYPE,
-                ATTR_HUMIDITY_DISPLAY,
-                ATTR_HUMIDITY_SETPOINT,
-                ATTR_LANGUAGE,
-                ATTR_OCCUPANCY,
-                ATTR_OUTPUT_CONNECT_STATE,
-                ATTR_REVERSING_VALVE_POLARITY,
-                ATTR_ROOM_SETPOINT_AWAY,
-                ATTR_SETPOINT_MODE,
-                ATTR_TEMP_OFFSET_HEAT,
-                ATTR_WIFI_KEYPAD,
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        HC_ATTRIBUTES = [
+            ATTR_AUX_CYCLE_LENGTH,
+            ATTR_AUX_HEAT_MIN_TIME_ON,
+            ATTR_AUX_HEAT_SOURCE_TYPE,
+            ATTR_AUX_HEAT_START_DELAY,
+            ATTR_BACK_LIGHT,
+            ATTR_BACKLIGHT_AUTO_DIM,
+            ATTR_BALANCE_PT,
+            ATTR_CYCLE_LENGTH,
+            ATTR_COOL_CYCLE_LENGTH,
+            ATTR_COOL_LOCK_TEMP,
+            ATTR_COOL_MIN_TIME_OFF,
+            ATTR_COOL_MIN_TIME_ON,
+            ATTR_COOL_SETPOINT_AWAY,
+            ATTR_DUAL_STATUS,
+            ATTR_EARLY_START,
+            ATTR_FAN_FILTER_REMAIN,
+            ATTR_FAN_SPEED,
+            ATTR_HEAT_COOL,
+            ATTR_HEATCOOL_SETPOINT_MIN_DELTA,
+            ATTR_HEAT_INSTALLATION_TYPE,
+            ATTR_HEAT_LOCK_TEMP,
+            ATTR_HEAT_SOURCE_TYPE,
+            ATTR_HUMIDIFIER_TYPE,
+            ATTR_HUMIDITY_DISPLAY,
+            ATTR_HUMIDITY_SETPOINT,
+            ATTR_LANGUAGE,
+            ATTR_OCCUPANCY,
+            ATTR_OUTPUT_CONNECT_STATE,
+            ATTR_REVERSING_VALVE_POLARITY,
+            ATTR_ROOM_SETPOINT_AWAY,
+            ATTR_SETPOINT_MODE,
+            ATTR_TEMP_OFFSET_HEAT,
+            ATTR_WIFI_KEYPAD,
+        ]
+        HC_SPECIAL_FIRMWARE = [
+            ATTR_ACCESSORY_TYPE,
+            ATTR_AIR_EX_MIN_TIME_ON,
+            ATTR_AUX_HEAT_MIN_TIME_OFF,
+            ATTR_COOL_PURGE_TIME,
+            ATTR_DRACCESORYCONF,
+            ATTR_DRAUXCONF,
+            ATTR_DRFANCONF,
+            ATTR_HC_LOCK_STATUS,
+            ATTR_HEAT_MIN_TIME_ON,
+            ATTR_HEAT_MIN_TIME_OFF,
+            ATTR_HEAT_PURGE_TIME,
+            ATTR_HUMIDITY_SETPOINT_OFFSET,
+            ATTR_HUMIDITY_SETPOINT_MODE,
+        ]
+        if self._device_model == 6727:
+            HC_EXTRA = [
+                ATTR_COOL_INTERSTAGE_MIN_DELAY,
+                ATTR_HEAT_INTERSTAGE_MIN_DELAY,
+                ATTR_HVAC_INPUT_1_FUNCTION,
+                ATTR_SCHEDULED_PEAK_DELAY,
+                #  ATTR_SCHEDULED_PEAK_STATUS,
             ]
-            """Get specific attributes"""
-            HC_SPECIAL_FIRMWARE = [
-                ATTR_ACCESSORY_TYPE,
-                ATTR_AIR_EX_MIN_TIME_ON,
-                ATTR_AUX_HEAT_MIN_TIME_OFF,
-                ATTR_COOL_PURGE_TIME,
-                ATTR_DRACCESORYCONF,
-                ATTR_DRAUXCONF,
-                ATTR_DRFANCONF,
-                ATTR_HC_LOCK_STATUS,
-                ATTR_HEAT_MIN_TIME_ON,
-                ATTR_HEAT_MIN_TIME_OFF,
-                ATTR_HEAT_PURGE_TIME,
-                ATTR_HUMIDITY_SETPOINT_OFFSET,
-                ATTR_HUMIDITY_SETPOINT_MODE,
+        else:
+            HC_EXTRA = []
+        if self._device_model == 6727 or self._device_model == 6731:
+            HC_CONFIG = [
+                ATTR_AIR_ACTIVATION_TEMP,
+                ATTR_AIR_CONFIG,
+                ATTR_AIR_MAX_POWER_TEMP,
+                ATTR_DRAIR_CURT_CONF,
+                ATTR_HEAT_OUTPUT_POLARITY,
             ]
-            if self._device_model == 6727:
-                HC_EXTRA = [
-                    ATTR_COOL_INTERSTAGE_MIN_DELAY,
-                    ATTR_HEAT_INTERSTAGE_MIN_DELAY,
-                    ATTR_HVAC_INPUT_1_FUNCTION,
-                    ATTR_SCHEDULED_PEAK_DELAY,
-                    #  ATTR_SCHEDULED_PEAK_STATUS,
-                ]
-            else:
-                HC_EXTRA = []
-            if self._device_model == 6727 or self._device_model == 6731:
-                HC_CONFIG = [
-                    ATTR_AIR_ACTIVATION_TEMP,
-                    ATTR_AIR_CONFIG,
-                    ATTR_AIR_MAX_POWER_TEMP,
-                    ATTR_DRAIR_CURT_CONF,
-                    ATTR_HEAT_OUTPUT_POLARITY,
-                ]
-            else:
-                HC_CONFIG = []
-            if self._firmware == "4.3.6":
-                HC_43 = [ATTR_INTERLOCK_ID, ATTR_INTERLOCK_HC_MODE, ATTR_INTERLOCK_PARTNER]
-            else:
-                HC_43 = []
+        else:
+            HC_CONFIG = []
+        if self._firmware == "4.3.6":
+            HC_43 = [ATTR_INTERLOCK_ID, ATTR_INTERLOCK_HC_MODE, ATTR_INTERLOCK_PARTNER]
+        else:
+            HC_43 = []
+        return self.plan_update_attributes(
+            UPDATE_HEAT_COOL_ATTRIBUTES + HC_ATTRIBUTES + HC_SPECIAL_FIRMWARE + HC_EXTRA + HC_CONFIG + HC_43
+        )
 
+    @override
+    async def async_update(self) -> None:
+        if self._active:
+            """Get specific attributes"""
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = (
-                UPDATE_HEAT_COOL_ATTRIBUTES + HC_ATTRIBUTES + HC_SPECIAL_FIRMWARE + HC_EXTRA + HC_CONFIG + HC_43
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug(
+                "Updated attributes for %s (firmware %s): %s", self._name, self._firmware, self.planned_attributes
             )
-            _LOGGER.debug("Updated attributes for %s (firmware %s): %s", self._name, self._firmware, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -6796,7 +6548,7 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
             if isinstance(status, str):
                 self._occupancy_mode = status
             self.do_stat(start)
-            self.get_sensor_error_code()
+            self.get_sensor_error_code(device_data)
             self.get_weather()
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -7000,27 +6752,29 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
             return 70.0
 
     @override
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn the thermostat to HVACMode.HEAT_COOL."""
         self._heat_cool = HVACMode.AUTO
-        self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+        await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+        self.async_refresh_after_write()
 
     @override
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn the thermostat to HVACMode.OFF."""
         self._heat_cool = HVACMode.OFF
-        self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+        await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+        self.async_refresh_after_write()
 
     @override
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new hvac mode."""
-        self._client.set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC)
+        await self._client.async_set_setpoint_mode(self._id, hvac_mode, self._is_wifi, self._is_HC)
 
         self._heat_cool = hvac_mode if hvac_mode != HVACMode.HEAT_COOL else HVACMode.AUTO
 
         # Reset the preset to the occupancy
-        self.set_preset_mode(self._occupancy)
-        self._delayed_refresh()
+        await self.async_set_preset_mode(self._occupancy)
+        self.async_refresh_after_write()
 
     def _em_heat_allowed(self) -> bool:
         """Check if device configuration allow turning on emergency heat. 'addOn' or 'conventional'."""
@@ -7029,7 +6783,7 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
         return self._temperature < self._balance_pt
 
     @override
-    def set_preset_mode(self, preset_mode: str) -> None:
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Activate a preset, including BOOST which maps to emergency heat."""
 
         # --- BOOST = Emergency Heat ---
@@ -7048,18 +6802,19 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 return
             # Mode Conventional → always allowed
             self._heat_cool = MODE_EM_HEAT
-            self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+            await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
             return
 
         # --- Others presets (Home, Away) ---
         self._occupancy = preset_mode
-        self._client.set_occupancy_mode(self._id, self._occupancy, self._is_wifi)
+        await self._client.async_set_occupancy_mode(self._id, self._occupancy, self._is_wifi)
 
         if self._heat_cool == MODE_EM_HEAT:
-            self.set_hvac_mode(HVACMode.HEAT)
+            await self.async_set_hvac_mode(HVACMode.HEAT)
+        self.async_refresh_after_write()
 
     @override
-    def turn_em_heat_on(self):
+    async def async_turn_em_heat_on(self):
         """Set emergency heat 'on' depending on installation type and outdoor temperature."""
         self._preset_before = self.preset_mode
         # --- Mode Conventional : always allowed ---
@@ -7077,20 +6832,20 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
             return
 
         self._heat_cool = MODE_EM_HEAT
-        self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
-        self.set_hvac_mode(HVACMode.HEAT)
+        await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+        await self.async_set_hvac_mode(HVACMode.HEAT)
 
     @override
-    def turn_em_heat_off(self):
+    async def async_turn_em_heat_off(self):
         """Set emergency heat off."""
         self._heat_cool = HVACMode.HEAT
-        self._client.set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
+        await self._client.async_set_setpoint_mode(self._id, self._heat_cool, self._is_wifi, self._is_HC)
         if self._preset_before in PRESET_HC_MODES:
             self._occupancy = self._preset_before
-            self._client.set_occupancy_mode(self._id, self._occupancy, self._is_wifi)
+            await self._client.async_set_occupancy_mode(self._id, self._occupancy, self._is_wifi)
 
     @override
-    def set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature_low = None
         temperature_high = None
@@ -7112,7 +6867,7 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 temperature_low = min(temperature_low, self._max_temp)
 
             if self._target_temp != temperature_low:
-                self._client.set_temperature(self._id, temperature_low)
+                await self._client.async_set_temperature(self._id, temperature_low)
                 self._target_temp = temperature_low
 
         if temperature_high is not None:
@@ -7123,11 +6878,11 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 temperature_high = max(temperature_high, self._cool_min)
 
             if self._target_cool != temperature_high:
-                self._client.set_cool_temperature(self._id, temperature_high)
+                await self._client.async_set_cool_temperature(self._id, temperature_high)
                 self._target_cool = temperature_high
-        self._delayed_refresh()
+        self.async_refresh_after_write()
 
-    def set_min_time_on(self, value):
+    async def async_set_min_time_on(self, value):
         """Set minimum time the device is on before letting be off again (run-on time)"""
         heat_min_time_on = value.get(ATTR_HEAT_MIN_TIME_ON)
         cool_min_time_on = value.get(ATTR_COOL_MIN_TIME_ON)
@@ -7135,47 +6890,47 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
         air_ex_min_time_on = value.get(ATTR_AIR_EX_MIN_TIME_ON)
 
         if heat_min_time_on is not None:
-            self._client.set_heat_min_time_on(self.unique_id, heat_min_time_on)
+            await self._client.async_set_heat_min_time_on(self.unique_id, heat_min_time_on)
             self._heat_min_time_on = heat_min_time_on
         if cool_min_time_on is not None:
-            self._client.set_cool_min_time_on(self.unique_id, cool_min_time_on)
+            await self._client.async_set_cool_min_time_on(self.unique_id, cool_min_time_on)
             self._cool_min_time_on = cool_min_time_on
         if aux_heat_min_time_on is not None:
-            self._client.set_aux_heat_min_time_on(self.unique_id, aux_heat_min_time_on)
+            await self._client.async_set_aux_heat_min_time_on(self.unique_id, aux_heat_min_time_on)
             self._aux_heat_min_time_on = aux_heat_min_time_on
         if air_ex_min_time_on is not None:
-            self._client.set_air_ex_min_time_on(self.unique_id, air_ex_min_time_on)
+            await self._client.async_set_air_ex_min_time_on(self.unique_id, air_ex_min_time_on)
             self._air_ex_min_time_on = air_ex_min_time_on
 
-    def set_heat_installation_type(self, value):
+    async def async_set_heat_installation_type(self, value):
         """Set minimum time the device is on before letting be off again (run-on time)"""
         type_val = value[ATTR_TYPE]
-        self._client.set_heat_installation_type(self.unique_id, type_val)
+        await self._client.async_set_heat_installation_type(self.unique_id, type_val)
         self._heat_installation_type = type_val
 
-    def set_reversing_valve_polarity(self, value):
+    async def async_set_reversing_valve_polarity(self, value):
         """Set minimum time the device is on before letting be off again (run-on time)"""
         polarity = value[ATTR_POLARITY]
-        self._client.set_reversing_valve_polarity(self.unique_id, polarity)
+        await self._client.async_set_reversing_valve_polarity(self.unique_id, polarity)
         self._reversing_valve_polarity = polarity
 
-    def set_min_time_off(self, value):
+    async def async_set_min_time_off(self, value):
         """Set minimum time the device is off before letting it be on again (cooldown time)"""
         heat_min_time_off = value.get(ATTR_HEAT_MIN_TIME_OFF)
         cool_min_time_off = value.get(ATTR_COOL_MIN_TIME_OFF)
         aux_heat_min_time_off = value.get(ATTR_AUX_HEAT_MIN_TIME_OFF)
 
         if heat_min_time_off is not None:
-            self._client.set_heat_min_time_off(self.unique_id, heat_min_time_off)
+            await self._client.async_set_heat_min_time_off(self.unique_id, heat_min_time_off)
             self._heat_min_time_off = heat_min_time_off
         if cool_min_time_off is not None:
-            self._client.set_cool_min_time_off(self.unique_id, cool_min_time_off)
+            await self._client.async_set_cool_min_time_off(self.unique_id, cool_min_time_off)
             self._cool_min_time_off = cool_min_time_off
         if aux_heat_min_time_off is not None:
-            self._client.set_aux_heat_min_time_off(self.unique_id, aux_heat_min_time_off)
+            await self._client.async_set_aux_heat_min_time_off(self.unique_id, aux_heat_min_time_off)
             self._aux_heat_min_time_off = aux_heat_min_time_off
 
-    def set_heat_interstage_delay(self, value):
+    async def async_set_heat_interstage_delay(self, value):
         try:
             time_val = int(value[ATTR_TIME])
         except KeyError:
@@ -7212,13 +6967,13 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
             )
 
         if has_multiple_hp_heat_stages:
-            self._client.set_heat_interstage_min_delay(self.unique_id, time_val * 60)
-            self._client.set_heat_interstage_delay(self.unique_id, time_val * 60 * 2)
+            await self._client.async_set_heat_interstage_min_delay(self.unique_id, time_val * 60)
+            await self._client.async_set_heat_interstage_delay(self.unique_id, time_val * 60 * 2)
         if has_multiple_aux_stages:
-            self._client.set_aux_interstage_min_delay(self.unique_id, time_val * 60)
-            self._client.set_aux_interstage_delay(self.unique_id, time_val * 60 * 2)
+            await self._client.async_set_aux_interstage_min_delay(self.unique_id, time_val * 60)
+            await self._client.async_set_aux_interstage_delay(self.unique_id, time_val * 60 * 2)
 
-    def set_cool_interstage_delay(self, value):
+    async def async_set_cool_interstage_delay(self, value):
         try:
             time_val = int(value[ATTR_TIME])
         except KeyError:
@@ -7253,10 +7008,10 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 )
             )
 
-        self._client.set_cool_interstage_min_delay(self.unique_id, time_val * 60)
-        self._client.set_cool_interstage_delay(self.unique_id, time_val * 60 * 2)
+        await self._client.async_set_cool_interstage_min_delay(self.unique_id, time_val * 60)
+        await self._client.async_set_cool_interstage_delay(self.unique_id, time_val * 60 * 2)
 
-    def set_aux_heat_start_delay(self, value):
+    async def async_set_aux_heat_start_delay(self, value):
         try:
             time_val = float(value[ATTR_TIME])
         except KeyError:
@@ -7293,9 +7048,9 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 )
             )
 
-        self._client.set_aux_heat_start_delay(self.unique_id, time_val)
+        await self._client.async_set_aux_heat_start_delay(self.unique_id, time_val)
 
-    def set_aux_heating_source(self, value):
+    async def async_set_aux_heating_source(self, value):
         """Set auxiliary heating device."""
         equip = AUX_HEATING.get(value[ATTR_AUX_HEAT_SOURCE_TYPE])
         if equip is None:
@@ -7309,16 +7064,16 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 )
             )
 
-        self._client.set_aux_heating_source(value["id"], equip)
+        await self._client.async_set_aux_heating_source(value["id"], equip)
         self._aux_heat_source_type = equip
 
-    def set_fan_speed(self, value):
+    async def async_set_fan_speed(self, value):
         """Set fan speed On or Auto."""
-        self._client.set_fan_mode(value["id"], value["speed"])
+        await self._client.async_set_fan_mode(value["id"], value["speed"])
         self._fan_speed = value["speed"]
 
     @override
-    def set_humidity(self, humidity: int | None = None, **kwargs: Any) -> None:
+    async def async_set_humidity(self, humidity: int | None = None, **kwargs: Any) -> None:
         """Set new target humidity %."""
         if humidity is None:
             humidity = kwargs.get("humidity")
@@ -7326,65 +7081,66 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
             return
 
         if self._humidity_setpoint_mode == "defog":
-            self._client.set_humidity_offset(self._id, humidity, self._is_HC)
+            await self._client.async_set_humidity_offset(self._id, humidity, self._is_HC)
             self._humidity_setpoint_offset = humidity
         else:
-            self._client.set_humidity(self._id, humidity)
+            await self._client.async_set_humidity(self._id, humidity)
             self._humidity_setpoint = humidity
+        self.async_refresh_after_write()
 
-    def set_accessory_type(self, value):
+    async def async_set_accessory_type(self, value):
         """Set accessory (humidifier, dehumidifier, air exchanger, heat accumulator) type for TH6500WF."""
-        self._client.set_accessory_type(value["id"], value["type"])
+        await self._client.async_set_accessory_type(value["id"], value["type"])
         self._accessory_type = value["type"]
 
-    def set_schedule_mode(self, value):
+    async def async_set_schedule_mode(self, value):
         """Set schedule mode, manual or auto."""
-        self._client.set_schedule_mode(value["id"], value["mode"], self._is_HC)
+        await self._client.async_set_schedule_mode(value["id"], value["mode"], self._is_HC)
         self._operation_mode = value["mode"]
 
-    def set_heatcool_setpoint_delta(self, value):
+    async def async_set_heatcool_setpoint_delta(self, value):
         """Set delta temperature between heating and cooling setpoint from 1 to 5°C."""
-        self._client.set_heatcool_delta(value["id"], value["level"], self._is_HC)
+        await self._client.async_set_heatcool_delta(value["id"], value["level"], self._is_HC)
         self._heatcool_setpoint_delta = value["level"]
 
-    def set_cool_setpoint_away(self, value):
+    async def async_set_cool_setpoint_away(self, value):
         """Set device away cooling setpoint."""
-        self._client.set_cool_setpoint_away(value["id"], value["temp"], self._is_HC)
+        await self._client.async_set_cool_setpoint_away(value["id"], value["temp"], self._is_HC)
         self._cool_target_temp_away = value["temp"]
 
-    def set_cool_dissipation_time(self, value):
+    async def async_set_cool_dissipation_time(self, value):
         """Set device cool dissipation time."""
-        self._client.set_cool_dissipation_time(value["id"], value[ATTR_TIME], self._is_HC)
+        await self._client.async_set_cool_dissipation_time(value["id"], value[ATTR_TIME], self._is_HC)
         self._heat_purge_time = value[ATTR_TIME]
 
-    def set_heat_dissipation_time(self, value):
+    async def async_set_heat_dissipation_time(self, value):
         """Set device heat dissipation time."""
-        self._client.set_heat_dissipation_time(value["id"], value[ATTR_TIME], self._is_HC)
+        await self._client.async_set_heat_dissipation_time(value["id"], value[ATTR_TIME], self._is_HC)
         self._cool_purge_time = value[ATTR_TIME]
 
-    def set_fan_filter_reminder(self, value):
+    async def async_set_fan_filter_reminder(self, value):
         """Set fan filter reminder period from 1 to 12 month."""
-        self._client.set_fan_filter_reminder(value["id"], value["month"], self._is_HC)
+        await self._client.async_set_fan_filter_reminder(value["id"], value["month"], self._is_HC)
         self._fan_filter_remain = value["month"]
 
-    def set_temperature_offset(self, value):
+    async def async_set_temperature_offset(self, value):
         """Set thermostat sensor offset from -2 to 2°C with a 0.5°C increment."""
-        self._client.set_temperature_offset(value["id"], value["temp"], self._is_HC)
+        await self._client.async_set_temperature_offset(value["id"], value["temp"], self._is_HC)
         self._temp_offset_heat = value["temp"]
 
     @override
-    def set_heat_pump_operation_limit(self, value):
+    async def async_set_heat_pump_operation_limit(self, value):
         """Set minimum temperature for heat pump operation."""
         temp = value["temp"]
-        self._client.set_heat_pump_limit(value["id"], temp)
+        await self._client.async_set_heat_pump_limit(value["id"], temp)
         self._balance_pt = temp
 
-    def set_humidity_mode(self, value):
+    async def async_set_humidity_mode(self, value):
         """Set thermostat humidity setpoint mode, defog or manual"""
-        self._client.set_humidity_mode(value["id"], value["mode"], self._is_HC)
+        await self._client.async_set_humidity_mode(value["id"], value["mode"], self._is_HC)
         self._humidity_setpoint_mode = value["mode"]
 
-    def set_hvac_dr_options(self, value):
+    async def async_set_hvac_dr_options(self, value):
         """Set thermostat DR options for Eco Sinope."""
         aux_conf = value.get(ATTR_AUX_OPTIM)
         fan_speed_config = value.get(ATTR_FAN_SPEED_OPTIM)
@@ -7399,7 +7155,7 @@ class Neviweb130HeatCoolThermostat(Neviweb130Thermostat):
                 )
             )
 
-        self._client.set_hvac_dr_options(value["id"], aux_conf=aux_conf, fan_speed_conf=fan_speed_config)
+        await self._client.async_set_hvac_dr_options(value["id"], aux_conf=aux_conf, fan_speed_conf=fan_speed_config)
         if aux_conf is not None:
             self._dr_aux_config = "activated" if aux_conf == "on" else "deactivated"
         if fan_speed_config is not None:
@@ -0,0 +1,25 @@
+"""Config flow for neviweb130, importing the configuration.yaml setup."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+
+from .const import DOMAIN
+
+
+class Neviweb130ConfigFlow(ConfigFlow, domain=DOMAIN):
+    """Create the config entry that runs the setup of the neviweb130 YAML configuration."""
+
+    VERSION = 1
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create the entry on the first start with a neviweb130 configuration."""
+        await self.async_set_unique_id(DOMAIN)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title="Neviweb130", data={})
+
+    async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Accounts are configured in configuration.yaml."""
+        return self.async_abort(reason="yaml_only")
@@ -41,6 +41,8 @@ CONF_IGNORE_MIWI = "ignore_miwi"
 CONF_LOCATION = "location"
 CONF_LOCATION2 = "location2"
 CONF_LOCATION3 = "location3"
+CONF_LOCATIONS = "locations"
+CONF_MAX_CONNECTIONS = "max_connections"
 CONF_NETWORK = "network"
 CONF_NETWORK2 = "network2"
 CONF_NETWORK3 = "network3"
@@ -48,6 +50,8 @@ CONF_NOTIFY = "notify"
 CONF_PREFIX = "prefix"
 CONF_SAFE_MODE = "safe_mode"
 CONF_STAT_INTERVAL = "stat_interval"
+CONF_WEATHER_INTERVAL = "weather_interval"
+CONF_REQUEST_TARGET = "request_target"
 
 ATTR_ACCESSORY_TYPE = "accessoryType"
 ATTR_ACTIVE = "active"
@@ -386,3 +390,135 @@ SERVICE_SET_TIME_FORMAT = "set_time_format"
 SERVICE_SET_VALVE_ALERT = "set_valve_alert"
 SERVICE_SET_VALVE_TEMP_ALERT = "set_valve_temp_alert"
 SERVICE_SET_WATTAGE = "set_wattage"
+
+# Device models handled by each platform, known before the platforms are loaded
+
+DEVICE_MODEL_LOW = [7372]
+DEVICE_MODEL_LOW_WIFI = [739]
+DEVICE_MODEL_FLOOR = [737]
+DEVICE_MODEL_WIFI_FLOOR = [738]
+DEVICE_MODEL_WIFI = [1510, 742]
+DEVICE_MODEL_WIFI_LITE = [336, 343, 348]
+DEVICE_MODEL_COLOR_WIFI = [350]
+DEVICE_MODEL_HEAT = [1123, 1124]
+DEVICE_MODEL_DOUBLE = [7373]
+DEVICE_MODEL_HEAT_G2 = [300]
+DEVICE_MODEL_HC = [1512]
+DEVICE_MODEL_HEAT_PUMP = [6810, 6811, 6812]
+DEVICE_MODEL_WIFI_HEAT_PUMP = [6813, 6814]
+DEVICE_MODEL_HEAT_COOL = [6727, 6730, 6731]
+CLIMATE_DEVICE_MODEL = (
+    DEVICE_MODEL_HEAT
+    + DEVICE_MODEL_FLOOR
+    + DEVICE_MODEL_LOW
+    + DEVICE_MODEL_WIFI_FLOOR
+    + DEVICE_MODEL_WIFI
+    + DEVICE_MODEL_LOW_WIFI
+    + DEVICE_MODEL_HEAT_G2
+    + DEVICE_MODEL_HC
+    + DEVICE_MODEL_DOUBLE
+    + DEVICE_MODEL_HEAT_PUMP
+    + DEVICE_MODEL_HEAT_COOL
+    + DEVICE_MODEL_WIFI_LITE
+    + DEVICE_MODEL_COLOR_WIFI
+    + DEVICE_MODEL_WIFI_HEAT_PUMP
+)
+
+DEVICE_MODEL_DIMMER = [2131]
+DEVICE_MODEL_SED_DIMMER = [21312]
+DEVICE_MODEL_NEW_DIMMER = [2132]
+DEVICE_MODEL_SED_NEW_DIMMER = [21322]
+DEVICE_MODEL_LIGHT = [2121]
+DEVICE_MODEL_SED_LIGHT = [21212]
+LIGHT_DEVICE_MODEL = (
+    DEVICE_MODEL_LIGHT
+    + DEVICE_MODEL_SED_LIGHT
+    + DEVICE_MODEL_DIMMER
+    + DEVICE_MODEL_SED_DIMMER
+    + DEVICE_MODEL_NEW_DIMMER
+    + DEVICE_MODEL_SED_NEW_DIMMER
+)
+
+IMPLEMENTED_GATEWAY = [130, 3156]
+IMPLEMENTED_TANK_MONITOR = [5056]
+IMPLEMENTED_LTE_TANK_MONITOR = [5055]
+IMPLEMENTED_SENSOR_MODEL = [5051, 5053]
+IMPLEMENTED_NEW_SENSOR_MODEL = [4210]
+IMPLEMENTED_NEW_CONNECTED_SENSOR = [42102]
+IMPLEMENTED_CONNECTED_SENSOR = [5050, 5052]
+SENSOR_DEVICE_MODEL = (
+    IMPLEMENTED_SENSOR_MODEL
+    + IMPLEMENTED_TANK_MONITOR
+    + IMPLEMENTED_LTE_TANK_MONITOR
+    + IMPLEMENTED_CONNECTED_SENSOR
+    + IMPLEMENTED_GATEWAY
+    + IMPLEMENTED_NEW_SENSOR_MODEL
+    + IMPLEMENTED_NEW_CONNECTED_SENSOR
+)
+
+IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL = [2152, 339]
+IMPLEMENTED_WATER_HEATER_LOAD_MODEL = [2151]
+IMPLEMENTED_ZB_DEVICE_CONTROL = [2180]
+IMPLEMENTED_SED_DEVICE_CONTROL = [2181]
+IMPLEMENTED_WALL_DEVICES = [2600, 2610]
+IMPLEMENTED_SED_WALL_DEVICES = [26002, 26102]
+IMPLEMENTED_LOAD_DEVICES = [2506]
+IMPLEMENTED_SED_LOAD_DEVICES = [25062]
+IMPLEMENTED_WIFI_LOAD_DEVICES = [346]
+SWITCH_DEVICE_MODEL = (
+    IMPLEMENTED_LOAD_DEVICES
+    + IMPLEMENTED_SED_LOAD_DEVICES
+    + IMPLEMENTED_WALL_DEVICES
+    + IMPLEMENTED_SED_WALL_DEVICES
+    + IMPLEMENTED_ZB_DEVICE_CONTROL
+    + IMPLEMENTED_SED_DEVICE_CONTROL
+    + IMPLEMENTED_WATER_HEATER_LOAD_MODEL
+    + IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL
+    + IMPLEMENTED_WIFI_LOAD_DEVICES
+)
+
+IMPLEMENTED_WIFI_MESH_VALVE_MODEL = [3155]
+IMPLEMENTED_ZB_MESH_VALVE_MODEL = [3153, 31532]
+IMPLEMENTED_WIFI_VALVE_MODEL = [3150]
+IMPLEMENTED_ZB_VALVE_MODEL = [3151]
+VALVE_DEVICE_MODEL = (
+    IMPLEMENTED_WIFI_VALVE_MODEL
+    + IMPLEMENTED_ZB_VALVE_MODEL
+    + IMPLEMENTED_WIFI_MESH_VALVE_MODEL
+    + IMPLEMENTED_ZB_MESH_VALVE_MODEL
+)
+
+# Zigbee devices, reached through the GT130 gateway of their location. Wi-Fi devices
+# and devices connected to a Sedna valve answer Neviweb directly.
+ZIGBEE_DEVICE_MODEL = (
+    DEVICE_MODEL_HEAT
+    + DEVICE_MODEL_FLOOR
+    + DEVICE_MODEL_LOW
+    + DEVICE_MODEL_HEAT_G2
+    + DEVICE_MODEL_HC
+    + DEVICE_MODEL_DOUBLE
+    + DEVICE_MODEL_HEAT_PUMP
+    + DEVICE_MODEL_LIGHT
+    + DEVICE_MODEL_DIMMER
+    + DEVICE_MODEL_NEW_DIMMER
+    + IMPLEMENTED_SENSOR_MODEL
+    + IMPLEMENTED_NEW_SENSOR_MODEL
+    + IMPLEMENTED_TANK_MONITOR
+    + IMPLEMENTED_WATER_HEATER_LOAD_MODEL
+    + IMPLEMENTED_ZB_DEVICE_CONTROL
+    + IMPLEMENTED_WALL_DEVICES
+    + IMPLEMENTED_LOAD_DEVICES
+    + IMPLEMENTED_ZB_VALVE_MODEL
+    + IMPLEMENTED_ZB_MESH_VALVE_MODEL
+)
+
+# Dispatcher signal sent with (client, added devices, removed device ids) when a device list changes
+SIGNAL_DEVICES_CHANGED = f"{DOMAIN}_devices_changed"
+
+PLATFORM_DEVICE_MODEL: dict[str, list[int]] = {
+    "climate": CLIMATE_DEVICE_MODEL,
+    "light": LIGHT_DEVICE_MODEL,
+    "sensor": SENSOR_DEVICE_MODEL,
+    "switch": SWITCH_DEVICE_MODEL,
+    "valve": VALVE_DEVICE_MODEL,
+}
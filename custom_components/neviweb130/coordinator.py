@@ -0,0 +1,866 @@
+"""Per-location data update coordinator for neviweb130."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import random
+import time
+import zlib
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_AUX_CYCLE_LENGTH,
+    ATTR_AVAIL_MODE,
+    ATTR_BACK_LIGHT,
+    ATTR_BACKLIGHT,
+    ATTR_BACKLIGHT_AUTO_DIM,
+    ATTR_BATTERY_TYPE,
+    ATTR_CONTROLLED_DEVICE,
+    ATTR_COOL_CYCLE_LENGTH,
+    ATTR_COOL_LOCK_TEMP,
+    ATTR_COOL_SETPOINT_MAX,
+    ATTR_COOL_SETPOINT_MIN,
+    ATTR_CYCLE_LENGTH,
+    ATTR_CYCLE_OUTPUT2,
+    ATTR_DISPLAY2,
+    ATTR_DISPLAY_CAP,
+    ATTR_EARLY_START,
+    ATTR_FAN_CAP,
+    ATTR_FAN_SWING_CAP,
+    ATTR_FAN_SWING_CAP_HORIZ,
+    ATTR_FAN_SWING_CAP_VERT,
+    ATTR_FLOOR_AIR_LIMIT,
+    ATTR_FLOOR_MAX,
+    ATTR_FLOOR_MIN,
+    ATTR_FLOOR_SENSOR,
+    ATTR_GAUGE_TYPE,
+    ATTR_HEAT_INSTALLATION_TYPE,
+    ATTR_HEAT_LOCK_TEMP,
+    ATTR_HUMIDIFIER_TYPE,
+    ATTR_INPUT_1_OFF_DELAY,
+    ATTR_INPUT_1_ON_DELAY,
+    ATTR_INPUT_2_OFF_DELAY,
+    ATTR_INPUT_2_ON_DELAY,
+    ATTR_INTENSITY_MIN,
+    ATTR_KEY_DOUBLE_UP,
+    ATTR_KEYPAD,
+    ATTR_LANGUAGE,
+    ATTR_LED_OFF_COLOR,
+    ATTR_LED_OFF_INTENSITY,
+    ATTR_LED_ON_COLOR,
+    ATTR_LED_ON_INTENSITY,
+    ATTR_NAME_1,
+    ATTR_NAME_2,
+    ATTR_OUTPUT_NAME_1,
+    ATTR_OUTPUT_NAME_2,
+    ATTR_PHASE_CONTROL,
+    ATTR_ROOM_SETPOINT_MAX,
+    ATTR_ROOM_SETPOINT_MIN,
+    ATTR_SOUND_CAP,
+    ATTR_SOUND_CONF,
+    ATTR_TANK_HEIGHT,
+    ATTR_TANK_SIZE,
+    ATTR_TANK_TYPE,
+    ATTR_TEMP,
+    ATTR_TEMP_OFFSET_HEAT,
+    ATTR_TIME_FORMAT,
+    ATTR_WATTAGE,
+    ATTR_WATTAGE_OVERRIDE,
+    ATTR_WIFI_KEYPAD,
+    ATTR_WIFI_WATTAGE,
+    DOMAIN,
+    SIGNAL_DEVICES_CHANGED,
+)
+from .helpers import BREAKER_CLOSED, BREAKER_HALF_OPEN, async_safe_get_device_attributes
+
+if TYPE_CHECKING:
+    from . import Neviweb130Client
+    from .helpers import NeviwebDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# Longest poll interval the scheduler may stretch to, in seconds
+MAX_POLL_INTERVAL = 3600
+# Stat requests done per device every stat_interval (monthly, daily and hourly)
+STAT_REQUESTS = 3
+# Relative change of interval below which coordinators are left untouched
+INTERVAL_TOLERANCE = 0.1
+# Target seconds between two coordinator ticks, devices are spread over the ticks of a poll interval
+STAGGER_TICK = 60
+# Seconds of burst polling counted in its cost when a demand response event starts
+BURST_HORIZON = 4 * 3600
+# Random delay of each device read within its tick, as a share of the tick, 0 to disable
+STAGGER_JITTER = 0.5
+# Seconds between two reads of the slow (configuration) attribute tier
+SLOW_TIER_INTERVAL = 3600
+# Seconds after startup before capabilities restored from storage are read again
+CAPABILITY_REVALIDATE_DELAY = 600
+
+# Reads done with the attributes of a device in its cycle, see cycle_reads()
+READ_MONTHLY_STATS = "monthly_stats"
+READ_DAILY_STATS = "daily_stats"
+READ_HOURLY_STATS = "hourly_stats"
+READ_ERROR_CODE = "error_code"
+READ_ALERT = "alert"
+READ_STATUS = "status"
+# Location reads, done by the device itself only when it has no coordinator
+READ_LOCATION_STATUS = "location_status"
+READ_WEATHER = "weather"
+
+DeviceRead = Callable[[], Awaitable[Any]]
+
+# Configuration attributes that only change when set from HA, the Neviweb app or the
+# device keypad. They are read every SLOW_TIER_INTERVAL instead of every cycle.
+SLOW_TIER_ATTRIBUTES = frozenset(
+    {
+        ATTR_AUX_CYCLE_LENGTH,
+        ATTR_AVAIL_MODE,
+        ATTR_BACK_LIGHT,
+        ATTR_BACKLIGHT,
+        ATTR_BACKLIGHT_AUTO_DIM,
+        ATTR_BATTERY_TYPE,
+        ATTR_CONTROLLED_DEVICE,
+        ATTR_COOL_CYCLE_LENGTH,
+        ATTR_COOL_LOCK_TEMP,
+        ATTR_COOL_SETPOINT_MAX,
+        ATTR_COOL_SETPOINT_MIN,
+        ATTR_CYCLE_LENGTH,
+        ATTR_CYCLE_OUTPUT2,
+        ATTR_DISPLAY2,
+        ATTR_DISPLAY_CAP,
+        ATTR_EARLY_START,
+        ATTR_FAN_CAP,
+        ATTR_FAN_SWING_CAP,
+        ATTR_FAN_SWING_CAP_HORIZ,
+        ATTR_FAN_SWING_CAP_VERT,
+        ATTR_FLOOR_AIR_LIMIT,
+        ATTR_FLOOR_MAX,
+        ATTR_FLOOR_MIN,
+        ATTR_FLOOR_SENSOR,
+        ATTR_GAUGE_TYPE,
+        ATTR_HEAT_INSTALLATION_TYPE,
+        ATTR_HEAT_LOCK_TEMP,
+        ATTR_HUMIDIFIER_TYPE,
+        ATTR_INPUT_1_OFF_DELAY,
+        ATTR_INPUT_1_ON_DELAY,
+        ATTR_INPUT_2_OFF_DELAY,
+        ATTR_INPUT_2_ON_DELAY,
+        ATTR_INTENSITY_MIN,
+        ATTR_KEY_DOUBLE_UP,
+        ATTR_KEYPAD,
+        ATTR_LANGUAGE,
+        ATTR_LED_OFF_COLOR,
+        ATTR_LED_OFF_INTENSITY,
+        ATTR_LED_ON_COLOR,
+        ATTR_LED_ON_INTENSITY,
+        ATTR_NAME_1,
+        ATTR_NAME_2,
+        ATTR_OUTPUT_NAME_1,
+        ATTR_OUTPUT_NAME_2,
+        ATTR_PHASE_CONTROL,
+        ATTR_ROOM_SETPOINT_MAX,
+        ATTR_ROOM_SETPOINT_MIN,
+        ATTR_SOUND_CAP,
+        ATTR_SOUND_CONF,
+        ATTR_TANK_HEIGHT,
+        ATTR_TANK_SIZE,
+        ATTR_TANK_TYPE,
+        ATTR_TEMP,
+        ATTR_TEMP_OFFSET_HEAT,
+        ATTR_TIME_FORMAT,
+        ATTR_WATTAGE,
+        ATTR_WATTAGE_OVERRIDE,
+        ATTR_WIFI_KEYPAD,
+        ATTR_WIFI_WATTAGE,
+    }
+)
+
+# Device capabilities, kept across restarts in the device cache
+CAPABILITY_ATTRIBUTES = frozenset(
+    {
+        ATTR_AVAIL_MODE,
+        ATTR_DISPLAY_CAP,
+        ATTR_FAN_CAP,
+        ATTR_FAN_SWING_CAP,
+        ATTR_FAN_SWING_CAP_HORIZ,
+        ATTR_FAN_SWING_CAP_VERT,
+        ATTR_SOUND_CAP,
+    }
+)
+
+
+async def async_read_device(
+    client: Neviweb130Client, device_id: str, attributes: list[str], reads: dict[str, DeviceRead]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Read attributes of a device together with its other reads, never raise.
+
+    A failed attribute read is returned as an errorCode, failed other reads are
+    left out of the returned values.
+    """
+    calls = [read() for read in reads.values()]
+    if attributes:
+        calls.append(client.async_get_device_attributes(device_id, attributes))
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    data: dict[str, Any] = {}
+    if attributes:
+        data = results.pop()
+        if isinstance(data, BaseException):
+            _LOGGER.debug("Bulk update failed for device %s: %s", device_id, data)
+            data = {"errorCode": str(data)}
+    values: dict[str, Any] = {}
+    for name, result in zip(reads, results):
+        if isinstance(result, BaseException):
+            _LOGGER.debug("Reading %s of device %s failed: %s", name, device_id, result)
+        else:
+            values[name] = result
+    return data, values
+
+
+class Neviweb130Coordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Fetch the data of every device of one Neviweb location once per poll interval.
+
+    Each subscribed entity plans the attributes it reads when it registers, and
+    tells the coordinator which other reads are due for it (stats, error code,
+    alert, status) through cycle_reads(). The poll interval is split in ticks of
+    about STAGGER_TICK seconds and each device gets a stable slot among them, so
+    the requests of a location are spread evenly over the interval instead of
+    sent in one burst. On each tick the coordinator requests the devices of the
+    current slot, the occupancy status once per interval and the weather of the
+    location, and pushes the result to their entities.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: Neviweb130Client,
+        location: str,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} location {location}",
+            update_interval=update_interval,
+        )
+        self.client = client
+        self.location = str(location)
+        self._entities: dict[str, Neviweb130CoordinatorEntity] = {}
+        self._pending: dict[str, tuple[str, list[str], dict[str, Any], dict[str, Any]]] = {}
+        self._status: dict[str, Any] | None = None
+        # Outdoor weather of the location, read for the entities that show it
+        self.weather: dict[str, Any] | None = None
+        self._weather_users = 0
+        self._slots = 1
+        self._tick = 0
+        self._due: set[str] = set()
+        # Devices written to since last tick, read on the next one whatever their slot
+        self._requested: set[str] = set()
+        self._burst = False
+        # Devices whose burst polling fits the budget, and whether the budget ended it for this event
+        self._burst_size = 0
+        self._burst_denied = False
+        self.poll_interval = update_interval
+        self.set_poll_interval(update_interval)
+
+    def set_poll_interval(self, interval: timedelta) -> None:
+        """Set the time in which every device is polled once."""
+        self.poll_interval = interval
+        self._slots = max(1, int(interval.total_seconds() // STAGGER_TICK))
+        self.update_interval = interval / self._slots
+
+    def device_slot(self, device_id: str) -> int:
+        """Return the stable slot of a device within the poll interval."""
+        return zlib.crc32(str(device_id).encode()) % self._slots
+
+    def is_due(self, device_id: str) -> bool:
+        """Return True if the device was due in the last tick."""
+        return device_id in self._due
+
+    @callback
+    def request_device(self, device_id: str) -> None:
+        """Read a device on the next tick, out of its slot."""
+        self._requested.add(device_id)
+
+    def _burst_devices(self) -> set[str]:
+        """Return the devices in a demand response event, polled on each tick while the request budget allows it.
+
+        The cost of polling them on each tick for BURST_HORIZON is checked against
+        the projected daily total when the event starts, and again for devices
+        joining it. Once the budget ends the burst, it stays ended until the event
+        is over, so that polling does not switch back and forth.
+        """
+        devices = {device_id for device_id, entity in self._entities.items() if entity.burst_polling}
+        active = bool(devices)
+        if active != self._burst:
+            self._burst = active
+            self._burst_size = 0
+            self._burst_denied = False
+            _LOGGER.info(
+                "Demand response event %s in location %s, %s",
+                "started" if active else "ended",
+                self.location,
+                "polling its devices every tick" if active else "back to normal polling",
+            )
+        if not active or self._burst_denied:
+            return set()
+        added = max(len(devices) - self._burst_size, 0)
+        if not self.client.poll_scheduler.burst_allowed(self._burst_cost(added)):
+            self._burst_denied = True
+            _LOGGER.info(
+                "Demand response event in location %s: daily request target reached, back to normal polling",
+                self.location,
+            )
+            return set()
+        self._burst_size = max(self._burst_size, len(devices))
+        return devices
+
+    def _burst_cost(self, devices: int) -> int:
+        """Return the requests added by polling devices on each tick instead of once per interval for BURST_HORIZON."""
+        tick = self.update_interval.total_seconds() if self.update_interval else STAGGER_TICK
+        per_second = 1 / tick - 1 / self.poll_interval.total_seconds()
+        return int(devices * BURST_HORIZON * max(per_second, 0))
+
+    @callback
+    def async_register_entity(self, entity: Neviweb130CoordinatorEntity):
+        """Register an entity for bulk fetch, return a callable to unregister it."""
+        self._entities[entity.device_id] = entity
+
+        @callback
+        def _unregister() -> None:
+            self._entities.pop(entity.device_id, None)
+            self._pending.pop(entity.device_id, None)
+
+        return _unregister
+
+    @callback
+    def async_add_weather_user(self):
+        """Read the weather of the location on each tick, return a callable to stop."""
+        self._weather_users += 1
+
+        @callback
+        def _remove() -> None:
+            self._weather_users -= 1
+
+        return _remove
+
+    async def _async_fetch_device(
+        self, device_id: str, attributes: list[str], reads: dict[str, DeviceRead]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Fetch attributes and other reads of one device, never raise."""
+        if STAGGER_JITTER:
+            await asyncio.sleep(random.uniform(0, self.update_interval.total_seconds() * STAGGER_JITTER))
+        return await async_read_device(self.client, device_id, attributes, reads)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the devices due, the location status and the weather."""
+        breaker = self.client.breaker
+        if breaker.state == BREAKER_HALF_OPEN:
+            await self.client.async_probe()
+        if breaker.state != BREAKER_CLOSED:
+            # Entities keep their last state until Neviweb answers again
+            raise UpdateFailed(f"Neviweb requests suspended for location {self.location}: {breaker.reason}")
+        start = time.time()
+        slot = self._tick % self._slots
+        self._tick += 1
+        burst = self._burst_devices()
+        requested, self._requested = self._requested, set()
+        self._due = {
+            device_id
+            for device_id in self._entities
+            if self.device_slot(device_id) == slot or device_id in burst or device_id in requested
+        }
+        # The device in safe mode reads its attributes one by one itself
+        safe_mode = self.hass.data[DOMAIN]["safe_mode"]
+        planned: dict[str, tuple[list[str], list[str], dict[str, DeviceRead]]] = {}
+        for device_id, entity in self._entities.items():
+            if (
+                device_id not in self._due
+                or device_id == safe_mode
+                or entity.update_paused
+                or not self.client.device_health.should_poll(device_id)
+                or self.client.behind_offline_gateway(device_id)
+            ):
+                continue
+            attributes = list(entity.planned_attributes or [])
+            reads = entity.cycle_reads()
+            if attributes or reads:
+                planned[device_id] = (attributes, entity.request_attributes(attributes), reads)
+        uses_status = any(entity.uses_location_status for entity in self._entities.values())
+        with_status = uses_status and (slot == 0 or self._status is None)
+        with_weather = self._weather_users > 0
+        self.client.refill_retry_budget(len(planned) + 1)
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_device(device_id, requested, reads)
+                for device_id, (_, requested, reads) in planned.items()
+            ),
+            *([self.client.async_get_neviweb_status(self.location)] if with_status else []),
+            *([self.client.async_get_weather(self.location)] if with_weather else []),
+            return_exceptions=True,
+        )
+        if with_weather:
+            weather = results.pop()
+            if isinstance(weather, BaseException):
+                # Last weather read is kept
+                _LOGGER.debug("Weather update failed for location %s: %s", self.location, weather)
+            else:
+                self.weather = weather
+        status = results[-1] if with_status else self._status
+        devices: dict[str, dict[str, Any]] = {}
+        for (device_id, (attributes, requested, _)), result in zip(planned.items(), results):
+            data, values = ({"errorCode": str(result)}, {}) if isinstance(result, BaseException) else result
+            devices[device_id] = data
+            self._pending[device_id] = (",".join(attributes), requested, data, values)
+
+        if isinstance(status, BaseException):
+            if planned and all("errorCode" in data for data in devices.values()):
+                raise UpdateFailed(f"Neviweb location {self.location} update failed: {status}")
+            status = None
+        self._status = status
+
+        _LOGGER.debug(
+            "Location %s refreshed %s devices of slot %s/%s in %s sec",
+            self.location,
+            len(devices),
+            slot + 1,
+            self._slots,
+            round(time.time() - start, 3),
+        )
+        self.client.poll_scheduler.async_cycle_done()
+        return {"devices": devices, "status": status}
+
+    def take_device_data(
+        self, device_id: str, attributes: list[str]
+    ) -> tuple[list[str], dict[str, Any], dict[str, Any]] | None:
+        """Return attributes requested, data and other reads fetched for a device during last cycle.
+
+        Data is returned only once and only if the entity still asks for the same attributes.
+        """
+        pending = self._pending.pop(device_id, None)
+        if pending is None or pending[0] != ",".join(attributes):
+            return None
+        return pending[1], pending[2], pending[3]
+
+    def location_status(self) -> dict[str, Any] | None:
+        """Return occupancy status of last cycle, or newer if it was changed since."""
+        cached = self.client.cached_neviweb_status(self.location)
+        return cached if cached is not None else self._status
+
+
+class Neviweb130PollScheduler:
+    """Keep the polling of one Neviweb account under its daily request target.
+
+    Neviweb blocks an account for the rest of the day once it reaches its daily
+    quota (ACCDAYREQMAX). After each coordinator cycle the scheduler measures the
+    request rate of the account since the previous adjustment and compares it
+    with the rate left by the remaining budget until midnight. The poll interval
+    of every coordinator of the account is stretched or shrunk accordingly, never
+    below the configured scan_interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, account: str, target: int, base_interval: timedelta) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._account = account
+        self.target = target
+        self.base_interval = base_interval
+        self.interval = base_interval
+        self.projected_daily_total: int | None = None
+        self._coordinators: list[Neviweb130Coordinator] = []
+        self._sample: tuple[float, int] | None = None
+
+    def used_today(self) -> int:
+        """Return the number of requests sent today by this account."""
+        data = self._hass.data[DOMAIN]["request_data"]
+        if data["date"] != datetime.date.today().isoformat():
+            return 0
+        return data["accounts"].get(self._account, 0)
+
+    def plan(self, devices: int, locations: int, stat_interval: int) -> int:
+        """Estimate the daily total of the configured polling and pick the first interval.
+
+        Returns the projected number of requests for a full day at the chosen interval.
+        """
+        base = self.base_interval.total_seconds()
+        per_cycle = devices + locations
+        stats = devices * STAT_REQUESTS * 86400 / stat_interval
+        projected = int(per_cycle * 86400 / base + stats)
+        if projected > self.target and per_cycle:
+            needed = per_cycle * 86400 / max(self.target - stats, 1)
+            self.interval = timedelta(seconds=min(max(base, needed), MAX_POLL_INTERVAL))
+            projected = int(per_cycle * 86400 / self.interval.total_seconds() + stats)
+        self.projected_daily_total = projected
+        return projected
+
+    def burst_allowed(self, extra: int = 0) -> bool:
+        """Return True if the account can afford extra requests on top of its projected daily total."""
+        used = self.used_today()
+        if used >= self.target:
+            return False
+        return max(self.projected_daily_total or 0, used) + extra < self.target
+
+    def attach(self, coordinator: Neviweb130Coordinator) -> None:
+        """Track a coordinator whose interval is managed by this scheduler."""
+        coordinator.set_poll_interval(self.interval)
+        self._coordinators.append(coordinator)
+
+    @callback
+    def async_cycle_done(self) -> None:
+        """Adjust poll interval from the request rate measured since last adjustment."""
+        now = time.monotonic()
+        used = self.used_today()
+        sample = self._sample
+        if sample is None or used < sample[1]:
+            # First cycle or new day, start measuring from here
+            self._sample = (now, used)
+            return
+        elapsed = now - sample[0]
+        if elapsed < self.base_interval.total_seconds() / 2:
+            return
+        self._sample = (now, used)
+
+        rate = (used - sample[1]) / elapsed
+        local_now = dt_util.now()
+        midnight = dt_util.start_of_local_day(local_now) + timedelta(days=1)
+        seconds_left = max((midnight - local_now).total_seconds(), 1)
+        self.projected_daily_total = int(used + rate * seconds_left)
+
+        remaining = self.target - used
+        current = self.interval.total_seconds()
+        if remaining <= 0:
+            new = MAX_POLL_INTERVAL
+        elif rate <= 0:
+            new = current
+        else:
+            # Request rate scales with the inverse of the poll interval
+            new = current * rate / (remaining / seconds_left)
+        new = min(max(new, self.base_interval.total_seconds()), MAX_POLL_INTERVAL)
+        if abs(new - current) <= current * INTERVAL_TOLERANCE:
+            return
+
+        _LOGGER.info(
+            "Neviweb account %s: %s requests today, projected %s for a target of %s, poll interval set to %s sec",
+            self._account,
+            used,
+            self.projected_daily_total,
+            self.target,
+            int(new),
+        )
+        self.interval = timedelta(seconds=new)
+        for coordinator in self._coordinators:
+            coordinator.set_poll_interval(self.interval)
+
+
+class Neviweb130CoordinatorEntity(Entity):
+    """Mixin for neviweb130 device entities refreshed by their location coordinator.
+
+    Each entity plans the attributes it reads with update_attributes() when it
+    registers, and again after each update, and returns its other reads due
+    (stats, error code, ...) from cycle_reads(). The coordinator runs them all in
+    the device slot, the async_update() of each entity only parses what was
+    pushed: async_fetch_device_attributes() returns the attributes, cycle_value(),
+    location_status() and location_weather() the other reads. Only entities
+    without a coordinator, or the device in safe mode, do the same reads by a
+    direct request, the others are never read out of a coordinator tick: the
+    first read of a device waits for its slot. Attributes of SLOW_TIER_ATTRIBUTES
+    are only requested when due and otherwise filled from their last read.
+    Capabilities stored at last run are used for the first updates, and the
+    last attributes read are parsed when the entity is added, so that it shows
+    its last known state without waiting for a request.
+    """
+
+    _attr_should_poll = False
+    _client: Neviweb130Client
+    _id: str
+    _location: str
+    _sku: str
+    _device_model: Any
+    _firmware: str
+    _active = True
+    _energy_stat_time: float = 0.0
+    _coordinator: Neviweb130Coordinator | None = None
+    # Read the location occupancy status, and the outdoor weather, with the devices
+    uses_location_status = False
+    uses_weather = False
+    planned_attributes: list[str] | None = None
+    _cycle_values: dict[str, Any] | None = None
+    _slow_values: dict[str, Any] | None = None
+    _slow_fetched_at: float = 0.0
+    _restore_data: dict[str, Any] | None = None
+    _polled = False
+
+    @property
+    def device_id(self) -> str:
+        """Return Neviweb device id."""
+        return self._id
+
+    @property
+    def update_paused(self) -> bool:
+        """Return True while updates of the device are snoozed, it is then not read."""
+        return not self._active
+
+    @property
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return False
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        return []
+
+    def cycle_reads(self) -> dict[str, DeviceRead]:
+        """Return the reads other than attributes due in this cycle, by READ_* name."""
+        return {}
+
+    def stats_reads(self, stat_interval: int, HC: bool = False) -> dict[str, DeviceRead]:
+        """Return the energy statistic reads once stat_interval has passed since the last ones."""
+        if not self.reads_stats or self._energy_stat_time == 0 or time.time() - self._energy_stat_time <= stat_interval:
+            return {}
+        if HC:
+            return {READ_HOURLY_STATS: partial(self._client.async_get_device_hourly_stats, self._id, True)}
+        return {
+            READ_MONTHLY_STATS: partial(self._client.async_get_device_monthly_stats, self._id, False),
+            READ_DAILY_STATS: partial(self._client.async_get_device_daily_stats, self._id, False),
+            READ_HOURLY_STATS: partial(self._client.async_get_device_hourly_stats, self._id, False),
+        }
+
+    def cycle_value(self, read: str) -> Any:
+        """Return the value of a read done in the current cycle, or None."""
+        return (self._cycle_values or {}).get(read)
+
+    def has_cycle_value(self, read: str) -> bool:
+        """Return True if the read was done in the current cycle."""
+        return read in (self._cycle_values or {})
+
+    def location_status(self) -> dict[str, Any]:
+        """Return location occupancy status of the current cycle, empty if not read."""
+        if self._coordinator is not None:
+            status = self._coordinator.location_status()
+        else:
+            status = self.cycle_value(READ_LOCATION_STATUS)
+        return status if isinstance(status, dict) else {}
+
+    def location_weather(self) -> dict[str, Any] | None:
+        """Return the outdoor weather of the location, None if not read."""
+        if self._coordinator is not None:
+            return self._coordinator.weather
+        return self.cycle_value(READ_WEATHER)
+
+    def _direct_reads(self) -> dict[str, DeviceRead]:
+        """Return the reads of a direct request, with the location ones when there is no coordinator."""
+        reads = self.cycle_reads()
+        if self._coordinator is None:
+            if self.uses_location_status:
+                reads[READ_LOCATION_STATUS] = partial(self._client.async_get_neviweb_status, self._location)
+            if self.uses_weather:
+                reads[READ_WEATHER] = partial(self._client.async_get_weather, self._location)
+        return reads
+
+    @property
+    def burst_polling(self) -> bool:
+        """Return True while the device takes part in a demand response event, it is then polled on every tick."""
+        return False
+
+    async def async_added_to_hass(self) -> None:
+        """Plan the first reads and subscribe to the location coordinator."""
+        await super().async_added_to_hass()
+        self._restore_capabilities()
+        self.planned_attributes = self.update_attributes()
+        location = self._client.device_location(self._id)
+        if location is None:
+            _LOGGER.warning("No Neviweb location found for device %s, using direct polling", self._id)
+            self._attr_should_poll = True
+            return
+        self._coordinator = self._client.get_coordinator(location)
+        self.async_on_remove(self._coordinator.async_register_entity(self))
+        if self.uses_weather:
+            self.async_on_remove(self._coordinator.async_add_weather_user())
+        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
+
+        # Show the last known state now, the first poll comes in the device slot
+        snapshot = self.hass.data[DOMAIN]["device_cache"].snapshot(self._id)
+        if snapshot and snapshot["attributes"] == self.planned_attributes:
+            self.hass.async_create_task(self._async_restore_state(snapshot, time.monotonic()))
+
+    async def _async_restore_state(self, snapshot: dict[str, Any], added_at: float) -> None:
+        """Parse the last attributes read at last run, once, unless the device was written to since."""
+        changed_at = self._client.config_changed_at.get(self._id)
+        if changed_at is not None and changed_at >= added_at:
+            return
+        # Only this update sees the snapshot, forced and later updates read Neviweb
+        self._restore_data = snapshot
+        try:
+            await self.async_update()
+        finally:
+            self._restore_data = None
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Parse data pushed by the coordinator."""
+        if self._coordinator is None or not self._coordinator.last_update_success:
+            return
+        if not self._coordinator.is_due(self._id):
+            return
+        if not self.available:
+            # Only availability changes, nothing to parse
+            self._coordinator.take_device_data(self._id, self.planned_attributes or [])
+            self.async_write_ha_state()
+            return
+        self.async_schedule_update_ha_state(True)
+
+    @callback
+    def async_refresh_after_write(self) -> None:
+        """Show the values just written, and read the device again on the next tick."""
+        self.async_write_ha_state()
+        if self._coordinator is not None:
+            self._coordinator.request_device(self._id)
+        else:
+            self.async_schedule_update_ha_state(True)
+
+    @property
+    def available(self) -> bool:
+        """Return False while the device is in quarantine or behind an offline gateway."""
+        return not (
+            self._client.device_health.is_quarantined(self._id) or self._client.behind_offline_gateway(self._id)
+        )
+
+    def _restore_capabilities(self) -> None:
+        """Seed the slow tier with capabilities stored at last run, read them again a bit later."""
+        capabilities = self.hass.data[DOMAIN]["device_cache"].capabilities(self._id)
+        if capabilities:
+            self._slow_values = dict(capabilities)
+            self._slow_fetched_at = time.monotonic() - SLOW_TIER_INTERVAL + CAPABILITY_REVALIDATE_DELAY
+
+    def request_attributes(self, attributes: list[str]) -> list[str]:
+        """Return the attributes to request now.
+
+        The slow tier is left out of the request unless it is due: never read,
+        older than SLOW_TIER_INTERVAL, or invalidated by a set_* call since.
+        """
+        if self._slow_values is None:
+            return list(attributes)
+        changed_at = self._client.config_changed_at.get(self._id)
+        due = time.monotonic() - self._slow_fetched_at > SLOW_TIER_INTERVAL or (
+            changed_at is not None and changed_at >= self._slow_fetched_at
+        )
+        if due:
+            return list(attributes)
+        return [attr for attr in attributes if attr not in SLOW_TIER_ATTRIBUTES or attr not in self._slow_values]
+
+    def _merge_slow_tier(self, attributes: list[str], requested: list[str], data: dict[str, Any]) -> dict[str, Any]:
+        """Keep slow tier values read in data, and fill the ones not requested from the last read."""
+        if not isinstance(data, dict) or "error" in data or "errorCode" in data:
+            return data
+        slow_read = {attr: data[attr] for attr in requested if attr in SLOW_TIER_ATTRIBUTES and attr in data}
+        if len(requested) == len(attributes):
+            self._slow_values = slow_read
+            self._slow_fetched_at = time.monotonic()
+            capabilities = {attr: value for attr, value in slow_read.items() if attr in CAPABILITY_ATTRIBUTES}
+            if capabilities:
+                self.hass.data[DOMAIN]["device_cache"].set_capabilities(self._id, capabilities)
+        elif self._slow_values is not None:
+            self._slow_values.update(slow_read)
+            for attr in attributes:
+                if attr not in data and attr in self._slow_values:
+                    data[attr] = self._slow_values[attr]
+        return data
+
+    async def async_fetch_device_attributes(self) -> dict[str, Any] | None:
+        """Return the planned attributes from the current cycle, or request them with the other reads.
+
+        With a coordinator nothing is requested here. None is returned when it
+        fetched nothing for the device, which is then read on the next tick, or
+        in its slot if it was never read. The attributes of the next update are
+        planned again from the values just read.
+        """
+        attributes = list(self.planned_attributes or [])
+        restore, self._restore_data = self._restore_data, None
+        if restore is not None and restore["attributes"] == attributes:
+            # Restoring last known state, no other read before the first poll
+            self._cycle_values = {}
+            return dict(restore["data"])
+        if self.hass.data[DOMAIN]["safe_mode"] == self._id:
+            requested = attributes
+            data = await async_safe_get_device_attributes(
+                self.hass,
+                self._client,
+                self._id,
+                attributes,
+                _LOGGER,
+                device_sku=self._sku,
+                device_model=self._device_model,
+                firmware=self._firmware,
+            )
+            _, self._cycle_values = await async_read_device(self._client, self._id, [], self._direct_reads())
+        elif self._coordinator is not None:
+            taken = self._coordinator.take_device_data(self._id, attributes)
+            if taken is None:
+                if self._polled:
+                    self._coordinator.request_device(self._id)
+                return None
+            requested, data, self._cycle_values = taken
+        else:
+            requested = self.request_attributes(attributes)
+            data, self._cycle_values = await async_read_device(self._client, self._id, requested, self._direct_reads())
+        self._polled = True
+        data = self._merge_slow_tier(attributes, requested, data)
+        if attributes and isinstance(data, dict) and "error" not in data and "errorCode" not in data:
+            self.hass.data[DOMAIN]["device_cache"].set_snapshot(self._id, attributes, data)
+        self.planned_attributes = self.update_attributes()
+        return data
+
+
+def async_track_platform_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    platform: str,
+    entities: list,
+    create_entities: Callable[[Neviweb130Client, list[NeviwebDevice]], list],
+    async_add_entities: AddEntitiesCallback,
+    entities_changed: Callable[[], None],
+) -> None:
+    """Add entities for devices of a platform discovered after setup, and retire those of removed devices.
+
+    entities is the entity list of the platform, updated in place, and
+    entities_changed is called after each change so that the platform can
+    rebuild its service lookups. Registry entries of retired entities are kept.
+    """
+
+    @callback
+    def _devices_changed(client: Neviweb130Client, added: list[NeviwebDevice], removed: set[str]) -> None:
+        retired = [
+            entity
+            for entity in entities
+            if isinstance(entity, Neviweb130CoordinatorEntity)
+            and entity._client is client
+            and entity.device_id in removed
+        ]
+        new = create_entities(client, [device for device in added if device.platform == platform])
+        if not retired and not new:
+            return
+        for entity in retired:
+            _LOGGER.warning("Device %s was removed from Neviweb, retiring %s", entity.device_id, entity.entity_id)
+            entities.remove(entity)
+            hass.async_create_task(entity.async_remove())
+        if new:
+            _LOGGER.warning("Adding %s new Neviweb %s entities", len(new), platform)
+            entities.extend(new)
+            async_add_entities(new)
+        entities_changed()
+
+    entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_DEVICES_CHANGED, _devices_changed))
@@ -5,18 +5,27 @@ import datetime
 import logging
 import os
 import shutil
+import threading
+import time
 from logging.handlers import RotatingFileHandler
+from urllib.parse import urlsplit
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import ATTR_SIGNATURE, DOMAIN, PLATFORM_DEVICE_MODEL, ZIGBEE_DEVICE_MODEL
 
 _LOGGER = logging.getLogger(__name__)
 
 REQUEST_STORE_VERSION = 1
 REQUEST_STORE_KEY = f"{DOMAIN}_request_count"
+REQUEST_SAVE_DELAY = 60
+DEVICE_CACHE_STORE_VERSION = 1
+DEVICE_CACHE_STORE_KEY = f"{DOMAIN}_device_cache"
+DEVICE_CACHE_SAVE_DELAY = 60
 
 # ─────────────────────────────────────────────
 # SECTION LOGGER SETUP
@@ -211,48 +220,461 @@ def build_update_summary(installed: str, latest: str, notes: str) -> str:
 # ─────────────────────────────────────────────
 
 
-def init_request_counter(hass):
+class RequestCounter:
+    """Daily count of Neviweb requests, kept in memory and saved to .storage in batches.
+
+    increment() only takes a short lock and may be called from the event loop or from
+    executor threads. The store is written at most once per REQUEST_SAVE_DELAY and
+    flushed when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: Store, data: dict | None) -> None:
+        """Initialize the counter from stored data."""
+        self._hass = hass
+        self._store = store
+        self._lock = threading.Lock()
+        self._save_scheduled = False
+        self.data = data or {"date": datetime.date.today().isoformat(), "count": 0}
+        self.data.setdefault("endpoints", {})
+        self.data.setdefault("accounts", {})
+
+    @staticmethod
+    def endpoint_name(url: str) -> str:
+        """Return the api path of url with ids and query removed, used as breakdown key."""
+        path = urlsplit(url).path
+        return "/".join("{id}" if part.isdigit() else part for part in path.split("/"))
+
+    def increment(self, endpoint: str | None = None, account: str | None = None) -> int:
+        """Increase counter by one, return the daily total."""
+        today = datetime.date.today().isoformat()
+        with self._lock:
+            data = self.data
+            # Reset if day change
+            if data["date"] != today:
+                data["date"] = today
+                data["count"] = 0
+                data["endpoints"] = {}
+                data["accounts"] = {}
+            data["count"] += 1
+            if endpoint is not None:
+                data["endpoints"][endpoint] = data["endpoints"].get(endpoint, 0) + 1
+            if account is not None:
+                data["accounts"][account] = data["accounts"].get(account, 0) + 1
+            count = data["count"]
+            schedule = not self._save_scheduled
+            self._save_scheduled = True
+
+        if schedule:
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+        return count
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Coalesce saves of all increments done in the next REQUEST_SAVE_DELAY seconds."""
+        self._store.async_delay_save(self._data_to_save, REQUEST_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return a snapshot of the counter for the store."""
+        with self._lock:
+            self._save_scheduled = False
+            return {
+                **self.data,
+                "endpoints": dict(self.data["endpoints"]),
+                "accounts": dict(self.data["accounts"]),
+            }
+
+    async def async_flush(self) -> None:
+        """Write the counter to the store now."""
+        await self._store.async_save(self._data_to_save())
+
+
+async def async_init_request_counter(hass):
     """Initialise the persistent store for request counter data."""
     store: Store = Store(hass, REQUEST_STORE_VERSION, REQUEST_STORE_KEY)
 
     # Load data
-    future = asyncio.run_coroutine_threadsafe(store.async_load(), hass.loop)
-    data = future.result()
+    counter = RequestCounter(hass, store, await store.async_load())
 
-    if not data:
-        data = {
-            "date": datetime.date.today().isoformat(),
-            "count": 0,
-        }
-        future = asyncio.run_coroutine_threadsafe(store.async_save(data), hass.loop)
-        future.result()
+    hass.data[DOMAIN]["request_counter"] = counter
+    hass.data[DOMAIN]["request_data"] = counter.data
 
-    hass.data[DOMAIN]["request_store"] = store
-    hass.data[DOMAIN]["request_data"] = data
+    async def _flush_request_counter(event):
+        """Save pending request count when HA stops."""
+        await counter.async_flush()
 
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _flush_request_counter)
 
-def increment_request_counter(hass):
-    """Increase counter by one."""
+
+def increment_request_counter(hass, url: str | None = None, account: str | None = None):
+    """Increase counter by one, safe from the event loop and from executor threads."""
+    counter: RequestCounter = hass.data[DOMAIN]["request_counter"]
+    endpoint = RequestCounter.endpoint_name(url) if url is not None else None
+    return counter.increment(endpoint, account)
+
+
+def get_daily_request_count(hass):
+    """Return the daily request count."""
+    return hass.data[DOMAIN]["request_data"]["count"]
+
+
+def get_daily_request_breakdown(hass) -> dict[str, dict[str, int]]:
+    """Return today's request count per endpoint and per account."""
     data = hass.data[DOMAIN]["request_data"]
-    today = datetime.date.today().isoformat()
+    return {
+        "endpoints": dict(data["endpoints"]),
+        "accounts": dict(data["accounts"]),
+    }
 
-    # Reset if day change
-    if data["date"] != today:
-        data["date"] = today
-        data["count"] = 0
 
-    data["count"] += 1
+# ─────────────────────────────────────────────
+# SECTION DEVICE CACHE
+# ─────────────────────────────────────────────
 
-    # Persistent saving
-    future = asyncio.run_coroutine_threadsafe(hass.data[DOMAIN]["request_store"].async_save(data), hass.loop)
-    future.result()
 
-    return data["count"]
+class DeviceCache:
+    """Signature, capabilities and last read attributes of each Neviweb device, kept across restarts.
 
+    Signature and capabilities only change with a firmware update, so they are
+    used at startup without a request and revalidated in the background. The last
+    read attributes give entities their last known state before the first poll.
+    Changes are saved to .storage with a delay so that they are written in batches.
+    """
 
-def get_daily_request_count(hass):
-    """Return the daily request count."""
-    return hass.data[DOMAIN]["request_data"]["count"]
+    def __init__(self, hass: HomeAssistant, store: Store, data: dict | None) -> None:
+        """Initialize the cache from stored data."""
+        self._hass = hass
+        self._store = store
+        self._lock = threading.Lock()
+        self._data: dict[str, dict] = data or {}
+
+    def signature(self, device_id: str) -> dict | None:
+        """Return the stored signature of a device."""
+        return self._data.get(str(device_id), {}).get("signature")
+
+    def capabilities(self, device_id: str) -> dict | None:
+        """Return the stored capability attributes of a device."""
+        return self._data.get(str(device_id), {}).get("capabilities")
+
+    def snapshot(self, device_id: str) -> dict | None:
+        """Return the last attributes read for a device, with the list they were read for."""
+        return self._data.get(str(device_id), {}).get("snapshot")
+
+    def set_signature(self, device_id: str, signature: dict) -> None:
+        """Store the signature of a device."""
+        self._set(str(device_id), "signature", signature)
+
+    def set_capabilities(self, device_id: str, capabilities: dict) -> None:
+        """Store the capability attributes of a device."""
+        self._set(str(device_id), "capabilities", capabilities)
+
+    def set_snapshot(self, device_id: str, attributes: list[str], data: dict) -> None:
+        """Store the last attributes read for a device, restored at next startup."""
+        self._set(str(device_id), "snapshot", {"attributes": list(attributes), "data": dict(data)})
+
+    def _set(self, device_id: str, key: str, value: dict) -> None:
+        with self._lock:
+            entry = self._data.setdefault(device_id, {})
+            if entry.get(key) == value:
+                return
+            entry[key] = value
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, DEVICE_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        with self._lock:
+            return {device_id: dict(entry) for device_id, entry in self._data.items()}
+
+    async def async_flush(self) -> None:
+        """Write the cache to the store now."""
+        await self._store.async_save(self._data_to_save())
+
+
+async def async_init_device_cache(hass):
+    """Load the persistent device signature and capability cache."""
+    store: Store = Store(hass, DEVICE_CACHE_STORE_VERSION, DEVICE_CACHE_STORE_KEY)
+    cache = DeviceCache(hass, store, await store.async_load())
+    hass.data[DOMAIN]["device_cache"] = cache
+
+    async def _flush_device_cache(event):
+        """Save pending cache changes when HA stops."""
+        await cache.async_flush()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _flush_device_cache)
+
+
+# ─────────────────────────────────────────────
+# SECTION CIRCUIT BREAKER
+# ─────────────────────────────────────────────
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Consecutive transport failures that open the breaker
+BREAKER_FAILURE_THRESHOLD = 5
+# Open time after an outage, doubled on each failed probe up to BREAKER_MAX_OPEN_TIME
+BREAKER_OPEN_TIME = 60
+BREAKER_MAX_OPEN_TIME = 1800
+# Open time during a Neviweb maintenance
+BREAKER_MAINTENANCE_TIME = 900
+
+
+class CircuitBreaker:
+    """Stop sending requests to Neviweb while it cannot answer them.
+
+    The breaker opens on MAINTENANCE, on ACCDAYREQMAX (until the quota resets at
+    local midnight) or after repeated transport failures. While open, every
+    request is refused without reaching Neviweb. Once the open time is over the
+    breaker is half open: a single probe request is let through and its result
+    closes the breaker or opens it again for a longer time.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize a closed breaker."""
+        self._name = name
+        self._lock = threading.Lock()
+        self._open_until = 0.0
+        self._open_time = BREAKER_OPEN_TIME
+        self._failures = 0
+        self._probing = False
+        self.reason: str | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self.reason is None:
+            return BREAKER_CLOSED
+        if time.monotonic() < self._open_until:
+            return BREAKER_OPEN
+        return BREAKER_HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now, taking the probe slot when half open."""
+        with self._lock:
+            state = self.state
+            if state == BREAKER_CLOSED:
+                return True
+            if state == BREAKER_HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def release_probe(self) -> None:
+        """Free the probe slot of a request that ended without an answer, e.g. cancelled."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker after an answer from Neviweb."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self.reason is not None:
+                _LOGGER.warning("Neviweb is reachable again for %s, resuming requests", self._name)
+                self.reason = None
+                self._open_time = BREAKER_OPEN_TIME
+
+    def record_failure(self, reason: str) -> None:
+        """Count a transport failure, open the breaker when there are too many or a probe failed."""
+        with self._lock:
+            self._failures += 1
+            if self.reason is not None:
+                # Failed probe, stay open longer
+                self._open_time = min(self._open_time * 2, BREAKER_MAX_OPEN_TIME)
+                self._open(reason, self._open_time)
+            elif self._failures >= BREAKER_FAILURE_THRESHOLD:
+                self._open(reason, self._open_time)
+
+    def record_error_code(self, code: str) -> None:
+        """Open the breaker on Neviweb answers that no retry can fix before a while."""
+        with self._lock:
+            if code == "MAINTENANCE":
+                self._open(code, BREAKER_MAINTENANCE_TIME)
+            elif code == "ACCDAYREQMAX":
+                now = dt_util.now()
+                midnight = dt_util.start_of_local_day(now) + datetime.timedelta(days=1)
+                self._open(code, (midnight - now).total_seconds() + 60)
+
+    def _open(self, reason: str, duration: float) -> None:
+        self._probing = False
+        self._open_until = time.monotonic() + duration
+        if self.reason != reason:
+            _LOGGER.warning(
+                "Neviweb requests suspended for %s during %s sec: %s",
+                self._name,
+                int(duration),
+                reason,
+            )
+        self.reason = reason
+
+
+# ─────────────────────────────────────────────
+# SECTION DEVICE HEALTH
+# ─────────────────────────────────────────────
+
+# Consecutive failed reads that put a device in quarantine
+QUARANTINE_FAILURES = 3
+# Seconds before the first probe of a quarantined device, doubled after each failed probe
+QUARANTINE_PROBE_TIME = 300
+QUARANTINE_MAX_PROBE_TIME = 3600
+# Neviweb error codes telling that a device does not answer
+DEVICE_OFFLINE_CODES = {"DVCCOMMTO", "DVCUNVLB"}
+
+
+class DeviceHealth:
+    """Consecutive read failures of each device and quarantine of the unreachable ones.
+
+    A quarantined device is not polled, except for one probe read when its probe
+    time is over. A failed probe doubles the wait before the next one, a successful
+    read restores the device at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with every device healthy."""
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._quarantine: dict[str, tuple[float, float]] = {}
+
+    def is_quarantined(self, device_id: str) -> bool:
+        """Return True if the device is in quarantine."""
+        return device_id in self._quarantine
+
+    def should_poll(self, device_id: str) -> bool:
+        """Return True if the device is healthy or its probe is due."""
+        quarantine = self._quarantine.get(device_id)
+        return quarantine is None or time.monotonic() >= quarantine[0]
+
+    def record_success(self, device_id: str) -> None:
+        """Reset failures of a device, restore it if it was in quarantine."""
+        with self._lock:
+            self._failures.pop(device_id, None)
+            if self._quarantine.pop(device_id, None) is not None:
+                _LOGGER.warning("Device %s answers again, restored from quarantine", device_id)
+
+    def record_failure(self, device_id: str, reason: str) -> None:
+        """Count a failed read, quarantine the device or push back its next probe."""
+        with self._lock:
+            failures = self._failures.get(device_id, 0) + 1
+            self._failures[device_id] = failures
+            quarantine = self._quarantine.get(device_id)
+            if quarantine is not None:
+                probe_time = min(quarantine[1] * 2, QUARANTINE_MAX_PROBE_TIME)
+            elif failures >= QUARANTINE_FAILURES:
+                probe_time = QUARANTINE_PROBE_TIME
+                _LOGGER.warning(
+                    "Device %s did not answer %s times (%s), quarantined until it answers again",
+                    device_id,
+                    failures,
+                    reason,
+                )
+            else:
+                return
+            self._quarantine[device_id] = (time.monotonic() + probe_time, probe_time)
+            _LOGGER.debug("Next probe of quarantined device %s in %s sec", device_id, probe_time)
+
+
+# ─────────────────────────────────────────────
+# SECTION DEVICE INDEX
+# ─────────────────────────────────────────────
+
+
+# Device reads and writes in flight through one Zigbee gateway, and for all Wi-Fi devices
+ZIGBEE_CONCURRENCY = 2
+WIFI_CONCURRENCY = 8
+
+
+class NeviwebDevice:
+    """A discovered Neviweb device, with the location and platform it belongs to."""
+
+    __slots__ = ("id", "info", "location", "model", "network", "platform", "zigbee")
+
+    def __init__(self, info: dict, location: str, network: int) -> None:
+        """Initialize from the device info returned by Neviweb, completed with its signature."""
+        signature = info.get(ATTR_SIGNATURE) or {}
+        self.id = str(info["id"])
+        self.info = info
+        self.location = location
+        self.network = network
+        self.model: int | None = signature.get("model")
+        self.platform = next(
+            (platform for platform, models in PLATFORM_DEVICE_MODEL.items() if self.model in models), None
+        )
+        # The signature protocol ("sinopcom") does not tell Zigbee from Wi-Fi devices, the model does
+        self.zigbee = self.model in ZIGBEE_DEVICE_MODEL
+
+
+def request_limit(device: NeviwebDevice | None) -> tuple[str, int]:
+    """Return the key and size of the limiter of requests to a device.
+
+    Zigbee devices of a location share the radio of its gateway, which times out
+    when it gets too many reads at once. Wi-Fi devices answer the cloud directly
+    and share one larger limiter, as do devices not discovered yet.
+    """
+    if device is not None and device.zigbee:
+        return f"gateway {device.location}", ZIGBEE_CONCURRENCY
+    return "wifi", WIFI_CONCURRENCY
+
+
+class DeviceIndex:
+    """Devices of one account keyed by id, and grouped by location, model and platform.
+
+    Built once per discovery from the device lists of all selected locations, so
+    that lookups do not scan the lists again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._devices: dict[str, NeviwebDevice] = {}
+        self._by_location: dict[str, list[NeviwebDevice]] = {}
+        self._by_model: dict[int, list[NeviwebDevice]] = {}
+        self._by_platform: dict[str, list[NeviwebDevice]] = {}
+
+    @classmethod
+    def build(cls, locations: list[tuple[int, str, list[dict]]]) -> "DeviceIndex":
+        """Return the index of the devices of (network index, location id, devices) lists."""
+        index = cls()
+        for network, location, devices in locations:
+            index._by_location.setdefault(location, [])
+            for info in devices:
+                device = NeviwebDevice(info, location, network)
+                index._devices[device.id] = device
+                index._by_location[location].append(device)
+                if device.model is not None:
+                    index._by_model.setdefault(device.model, []).append(device)
+                if device.platform is not None:
+                    index._by_platform.setdefault(device.platform, []).append(device)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self._devices)
+
+    def __iter__(self):
+        """Iterate over all devices."""
+        return iter(self._devices.values())
+
+    def get(self, device_id: str) -> NeviwebDevice | None:
+        """Return a device by id."""
+        return self._devices.get(str(device_id))
+
+    def location(self, location: str) -> list[NeviwebDevice]:
+        """Return the devices of a location."""
+        return self._by_location.get(str(location), [])
+
+    def model(self, models: list[int]) -> list[NeviwebDevice]:
+        """Return the devices of the given models."""
+        return [device for model in models for device in self._by_model.get(model, [])]
+
+    def platform(self, platform: str) -> list[NeviwebDevice]:
+        """Return the devices handled by a platform."""
+        return self._by_platform.get(platform, [])
+
+    def platforms(self) -> set[str]:
+        """Return the platforms with at least one device."""
+        return set(self._by_platform)
 
 
 # ─────────────────────────────────────────────
@@ -339,7 +761,7 @@ def translated_or_default(hass, key, default, **placeholders):
 UNSUPPORTED_ATTRS: dict[str, set[str]] = {}
 
 
-def safe_get_device_attributes(
+async def async_safe_get_device_attributes(
     hass,
     client,
     device_id,
@@ -354,7 +776,7 @@ def safe_get_device_attributes(
     filtered_attrs = [attr for attr in attributes if attr not in UNSUPPORTED_ATTRS.get(device_id, set())]
 
     try:
-        result = client.get_device_attributes(device_id, filtered_attrs)
+        result = await client.async_get_device_attributes(device_id, filtered_attrs)
 
         logger.debug("client result = %s", result)
         # If Neviweb silently ignore → result == {} or incomplete
@@ -383,7 +805,7 @@ def safe_get_device_attributes(
             fw_info,
         )
 
-        notify_ha(
+        await async_notify_ha(
             hass,
             (
                 f"Some attributes requested for device {device_id} are not supported.\n"
@@ -399,7 +821,7 @@ def safe_get_device_attributes(
         for attr in attributes:
             logger.debug("Testing attribute %s for %s", attr, model_info)
             try:
-                result = client.get_device_attributes(device_id, [attr])
+                result = await client.async_get_device_attributes(device_id, [attr])
                 logger.debug("Result for '%s': %s", attr, result)
 
                 # 1. If Neviweb return value
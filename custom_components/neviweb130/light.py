@@ -57,6 +57,12 @@ from .const import (
     ATTR_TIME,
     ATTR_TIMER,
     ATTR_WATTAGE_INSTANT,
+    DEVICE_MODEL_DIMMER,
+    DEVICE_MODEL_LIGHT,
+    DEVICE_MODEL_NEW_DIMMER,
+    DEVICE_MODEL_SED_DIMMER,
+    DEVICE_MODEL_SED_LIGHT,
+    DEVICE_MODEL_SED_NEW_DIMMER,
     DOMAIN,
     MODE_OFF,
     SERVICE_SET_ACTIVATION,
@@ -71,7 +77,15 @@ from .const import (
     SERVICE_SET_WATTAGE,
     VERSION,
 )
-from .helpers import safe_get_device_attributes, safe_number, translated_or_default
+from .coordinator import (
+    READ_DAILY_STATS,
+    READ_HOURLY_STATS,
+    READ_MONTHLY_STATS,
+    DeviceRead,
+    Neviweb130CoordinatorEntity,
+    async_track_platform_devices,
+)
+from .helpers import safe_number, translated_or_default
 from .schema import (
     SET_ACTIVATION_SCHEMA,
     SET_KEY_DOUBLE_UP_SCHEMA,
@@ -103,27 +117,11 @@ UPDATE_ATTRIBUTES = [
     ATTR_RSSI,
 ]
 
-DEVICE_MODEL_DIMMER = [2131]
-DEVICE_MODEL_SED_DIMMER = [21312]
-DEVICE_MODEL_NEW_DIMMER = [2132]
-DEVICE_MODEL_SED_NEW_DIMMER = [21322]
-DEVICE_MODEL_LIGHT = [2121]
-DEVICE_MODEL_SED_LIGHT = [21212]
-IMPLEMENTED_DEVICE_MODEL = (
-    DEVICE_MODEL_LIGHT
-    + DEVICE_MODEL_SED_LIGHT
-    + DEVICE_MODEL_DIMMER
-    + DEVICE_MODEL_SED_DIMMER
-    + DEVICE_MODEL_NEW_DIMMER
-    + DEVICE_MODEL_SED_NEW_DIMMER
-)
-
 
-async def async_setup_platform(
+async def async_setup_entry(
     hass,
-    config,
+    entry,
     async_add_entities,
-    discovery_info=None,
 ) -> None:
     """Set up the neviweb light."""
     data = hass.data[DOMAIN]["data"]
@@ -131,105 +129,53 @@ async def async_setup_platform(
     # Wait for async migration to be done
     await data.migration_done.wait()
 
+    def create_entities(client, devices) -> list[Neviweb130Light]:
+        """Return the entities of discovered devices of an account."""
+        created: list[Neviweb130Light] = []
+        for device in devices:
+            device_info = device.info
+            device_name = "{} {}".format(client.default_group_name("light", device.network), device_info["name"])
+            device_sku = device_info["sku"]
+            device_firmware = "{}.{}.{}".format(
+                device_info["signature"]["softVersion"]["major"],
+                device_info["signature"]["softVersion"]["middle"],
+                device_info["signature"]["softVersion"]["minor"],
+            )
+            if (
+                device_info["signature"]["model"] in DEVICE_MODEL_LIGHT
+                or device_info["signature"]["model"] in DEVICE_MODEL_SED_LIGHT
+            ):
+                created.append(Neviweb130Light(device_info, device_name, device_sku, device_firmware, client))
+            elif (
+                device_info["signature"]["model"] in DEVICE_MODEL_DIMMER
+                or device_info["signature"]["model"] in DEVICE_MODEL_SED_DIMMER
+            ):
+                created.append(Neviweb130Dimmer(device_info, device_name, device_sku, device_firmware, client))
+            elif (
+                device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER
+                or device_info["signature"]["model"] in DEVICE_MODEL_SED_NEW_DIMMER
+            ):
+                created.append(Neviweb130NewDimmer(device_info, device_name, device_sku, device_firmware, client))
+        return created
+
     entities: list[Neviweb130Light] = []
 
     # Loop through all clients (supports multi-account)
     for client in data.neviweb130_clients:
-        default_name = client.default_group_name("light")
-        default_name_2 = client.default_group_name("light", 2)
-        default_name_3 = client.default_group_name("light", 3)
+        entities.extend(create_entities(client, client.devices.platform("light")))
 
-        # Process gateway_data for this client
-        for device_info in client.gateway_data:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if (
-                    device_info["signature"]["model"] in DEVICE_MODEL_LIGHT
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_LIGHT
-                ):
-                    entities.append(Neviweb130Light(device_info, device_name, device_sku, device_firmware, client))
-                elif (
-                    device_info["signature"]["model"] in DEVICE_MODEL_DIMMER
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_DIMMER
-                ):
-                    entities.append(Neviweb130Dimmer(device_info, device_name, device_sku, device_firmware, client))
-                elif (
-                    device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_NEW_DIMMER
-                ):
-                    entities.append(Neviweb130NewDimmer(device_info, device_name, device_sku, device_firmware, client))
-        for device_info in client.gateway_data2:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_2, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if (
-                    device_info["signature"]["model"] in DEVICE_MODEL_LIGHT
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_LIGHT
-                ):
-                    entities.append(Neviweb130Light(device_info, device_name, device_sku, device_firmware, client))
-                elif (
-                    device_info["signature"]["model"] in DEVICE_MODEL_DIMMER
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_DIMMER
-                ):
-                    entities.append(Neviweb130Dimmer(device_info, device_name, device_sku, device_firmware, client))
-                elif (
-                    device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_NEW_DIMMER
-                ):
-                    entities.append(Neviweb130NewDimmer(device_info, device_name, device_sku, device_firmware, client))
-        for device_info in client.gateway_data3:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_3, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if (
-                    device_info["signature"]["model"] in DEVICE_MODEL_LIGHT
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_LIGHT
-                ):
-                    entities.append(Neviweb130Light(device_info, device_name, device_sku, device_firmware, client))
-                elif (
-                    device_info["signature"]["model"] in DEVICE_MODEL_DIMMER
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_DIMMER
-                ):
-                    entities.append(Neviweb130Dimmer(device_info, device_name, device_sku, device_firmware, client))
-                elif (
-                    device_info["signature"]["model"] in DEVICE_MODEL_NEW_DIMMER
-                    or device_info["signature"]["model"] in DEVICE_MODEL_SED_NEW_DIMMER
-                ):
-                    entities.append(Neviweb130NewDimmer(device_info, device_name, device_sku, device_firmware, client))
-
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
     entity_map: dict[str, Neviweb130Light] | None = None
     _entity_map_lock = Lock()
 
+    def _entities_changed() -> None:
+        """Rebuild the entity lookup of services on next use."""
+        nonlocal entity_map
+        entity_map = None
+
+    async_track_platform_devices(hass, entry, "light", entities, create_entities, async_add_entities, _entities_changed)
+
     def get_light(service: ServiceCall) -> Neviweb130Light:
         entity_id = service.data.get(ATTR_ENTITY_ID)
         if entity_id is None:
@@ -271,21 +217,21 @@ async def async_setup_platform(
             )
         return light
 
-    def set_light_keypad_lock_service(service: ServiceCall) -> None:
+    async def set_light_keypad_lock_service(service: ServiceCall) -> None:
         """Lock/unlock keypad device."""
         light = get_light(service)
         value = {"id": light.unique_id, "lock": service.data[ATTR_KEYPAD]}
-        light.set_keypad_lock(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_keypad_lock(value)
+        light.async_refresh_after_write()
 
-    def set_light_timer_service(service: ServiceCall) -> None:
+    async def set_light_timer_service(service: ServiceCall) -> None:
         """Set timer for light device."""
         light = get_light(service)
         value = {"id": light.unique_id, ATTR_TIME: service.data[ATTR_TIMER]}
-        light.set_timer(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_timer(value)
+        light.async_refresh_after_write()
 
-    def set_led_indicator_service(service: ServiceCall) -> None:
+    async def set_led_indicator_service(service: ServiceCall) -> None:
         """Set led color and intensity for light indicator."""
         light = get_light(service)
         value = {
@@ -295,75 +241,75 @@ async def async_setup_platform(
             "green": service.data[ATTR_GREEN],
             "blue": service.data[ATTR_BLUE],
         }
-        light.set_led_indicator(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_led_indicator(value)
+        light.async_refresh_after_write()
 
-    def set_led_on_intensity_service(service: ServiceCall) -> None:
+    async def set_led_on_intensity_service(service: ServiceCall) -> None:
         """Set led on intensity for light indicator."""
         light = get_light(service)
         value = {
             "id": light.unique_id,
             "led_on": service.data[ATTR_LED_ON_INTENSITY],
         }
-        light.set_led_on_intensity(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_led_on_intensity(value)
+        light.async_refresh_after_write()
 
-    def set_led_off_intensity_service(service: ServiceCall) -> None:
+    async def set_led_off_intensity_service(service: ServiceCall) -> None:
         """Set led off intensity for light indicator."""
         light = get_light(service)
         value = {
             "id": light.unique_id,
             "led_off": service.data[ATTR_LED_OFF_INTENSITY],
         }
-        light.set_led_off_intensity(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_led_off_intensity(value)
+        light.async_refresh_after_write()
 
-    def set_light_min_intensity_service(service: ServiceCall) -> None:
+    async def set_light_min_intensity_service(service: ServiceCall) -> None:
         """Set dimmer light minimum intensity."""
         light = get_light(service)
         value = {
             "id": light.unique_id,
             "intensity": service.data[ATTR_INTENSITY_MIN],
         }
-        light.set_light_min_intensity(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_light_min_intensity(value)
+        light.async_refresh_after_write()
 
-    def set_wattage_service(service: ServiceCall) -> None:
+    async def set_wattage_service(service: ServiceCall) -> None:
         """Set watt load for light device."""
         light = get_light(service)
         value = {
             "id": light.unique_id,
             "watt": service.data[ATTR_LIGHT_WATTAGE],
         }
-        light.set_wattage(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_wattage(value)
+        light.async_refresh_after_write()
 
-    def set_phase_control_service(service: ServiceCall) -> None:
+    async def set_phase_control_service(service: ServiceCall) -> None:
         """Change phase control mode for dimmer device."""
         light = get_light(service)
         value = {
             "id": light.unique_id,
             "phase": service.data[ATTR_PHASE_CONTROL],
         }
-        light.set_phase_control(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_phase_control(value)
+        light.async_refresh_after_write()
 
-    def set_activation_service(service: ServiceCall) -> None:
+    async def set_activation_service(service: ServiceCall) -> None:
         """Activate or deactivate Neviweb polling for missing device."""
         light = get_light(service)
         value = {"id": light.unique_id, "active": service.data[ATTR_ACTIVE]}
         light.set_activation(value)
-        light.schedule_update_ha_state(True)
+        light.async_refresh_after_write()
 
-    def set_key_double_up_service(service: ServiceCall) -> None:
+    async def set_key_double_up_service(service: ServiceCall) -> None:
         """Change key double up action for dimmer device."""
         light = get_light(service)
         value = {
             "id": light.unique_id,
             "double": service.data[ATTR_KEY_DOUBLE_UP],
         }
-        light.set_key_double_up(value)
-        light.schedule_update_ha_state(True)
+        await light.async_set_key_double_up(value)
+        light.async_refresh_after_write()
 
     hass.services.async_register(
         DOMAIN,
@@ -464,7 +410,7 @@ def lock_to_ha(lock):
     return None
 
 
-class Neviweb130Light(LightEntity):
+class Neviweb130Light(Neviweb130CoordinatorEntity, LightEntity):
     """Implementation of a neviweb light, SW2500ZB, SW2500ZB-G2."""
 
     def __init__(self, device_info, name, sku, firmware, client):
@@ -519,42 +465,29 @@ class Neviweb130Light(LightEntity):
         self._wattage = 0
         self._wattage_status = None
 
-    def update(self):
+    @property
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._is_light
+
+    def cycle_reads(self) -> dict[str, DeviceRead]:
+        """Return the energy statistic reads due in this cycle."""
+        return self.stats_reads(STAT_INTERVAL)
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if not self._is_light:
+            return [ATTR_ONOFF]
+        WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
+
+    async def async_update(self):
         if self._active:
             """Get the latest data from neviweb and update the state."""
-            WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if self._is_light:
-                if safe_mode == self._id:
-                    device_data = safe_get_device_attributes(
-                        self.hass,
-                        self._client,
-                        self._id,
-                        attributes,
-                        _LOGGER,
-                        device_sku=self._sku,
-                        device_model=self._device_model,
-                        firmware=self._firmware,
-                    )
-                else:
-                    device_data = self._client.get_device_attributes(self._id, attributes)
-            else:
-                if safe_mode == self._id:
-                    device_data = safe_get_device_attributes(
-                        self.hass,
-                        self._client,
-                        self._id,
-                        ATTR_ONOFF,
-                        _LOGGER,
-                        device_sku=self._sku,
-                        device_model=self._device_model,
-                        firmware=self._firmware,
-                    )
-                else:
-                    device_data = self._client.get_device_attributes(self._id, ATTR_ONOFF)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -608,7 +541,7 @@ class Neviweb130Light(LightEntity):
                     _LOGGER.warning("Error in updating device %s: (%s)", self._name, device_data)
             else:
                 self.log_error(device_data["error"]["code"])
-            if self._is_light:
+            if self.reads_stats:
                 self.do_stat(start)
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -710,85 +643,89 @@ class Neviweb130Light(LightEntity):
     # chance that the current stored state doesn't match with real device
     # state. So we force the set_brightness each time.
 
-    def turn_on(self, **kwargs):
+    async def async_turn_on(self, **kwargs):
         """Turn the light on."""
         if not self.is_on:
             if self._brightness_pct == 0:
                 self._brightness_pct = 5
-            self._client.set_light_onoff(self._id, "on", self._brightness_pct)
+            await self._client.async_set_light_onoff(self._id, "on", self._brightness_pct)
         if ATTR_BRIGHTNESS in kwargs and self.brightness != kwargs[ATTR_BRIGHTNESS]:
             brightness_pct = brightness_to_percentage(round(kwargs[ATTR_BRIGHTNESS]))
-            self._client.set_brightness(self._id, brightness_pct)
+            await self._client.async_set_brightness(self._id, brightness_pct)
             self._brightness_pct = brightness_pct
         self._onoff = "on"
+        self.async_refresh_after_write()
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs):
         """Turn the light off."""
-        self._client.set_onoff(self._id, "off")
+        await self._client.async_set_onoff(self._id, "off")
         self._onoff = MODE_OFF
+        self.async_refresh_after_write()
 
-    def set_phase_control(self, value):
+    async def async_set_phase_control(self, value):
         """Change phase control parameter, reverse or forward."""
-        self._client.set_phase(value["id"], value["phase"])
+        await self._client.async_set_phase(value["id"], value["phase"])
         self._phase_control = value["phase"]
 
-    def set_keypad_lock(self, value):
+    async def async_set_keypad_lock(self, value):
         """Lock, unlock or partially lock device's keypad,
         lock = locked, unlock = unlocked, partiallyLocked = partial lock."""
-        self._client.set_keypad_lock(value["id"], value["lock"], False)
+        await self._client.async_set_keypad_lock(value["id"], value["lock"], False)
         self._keypad = value["lock"]
 
-    def set_timer(self, value):
+    async def async_set_timer(self, value):
         """Set device timer, 0 = off, 1 to 255 = timer length."""
-        self._client.set_timer(value["id"], value[ATTR_TIME])
+        await self._client.async_set_timer(value["id"], value[ATTR_TIME])
         self._timer = value[ATTR_TIME]
 
-    def set_led_indicator(self, value):
+    async def async_set_led_indicator(self, value):
         """Set led indicator color and intensity,
         based on RGB red, green, blue colors (0-255) and intensity from 0 to 100."""
-        self._client.set_led_indicator(value["id"], value["state"], value["red"], value["green"], value["blue"])
+        await self._client.async_set_led_indicator(
+            value["id"], value["state"], value["red"], value["green"], value["blue"]
+        )
         rgb = f"{value['red']},{value['green']},{value['blue']}"
         if value["state"] == 0:
             self._led_off = rgb
         else:
             self._led_on = rgb
 
-    def set_led_on_intensity(self, value):
+    async def async_set_led_on_intensity(self, value):
         """Set led indicator on intensity from 0 to 100."""
-        self._client.set_led_on_intensity(value["id"], value["led_on"])
+        await self._client.async_set_led_on_intensity(value["id"], value["led_on"])
         self._led_on_intensity = value["led_on"]
 
-    def set_led_off_intensity(self, value):
+    async def async_set_led_off_intensity(self, value):
         """Set led indicator off intensity from 0 to 100."""
-        self._client.set_led_off_intensity(value["id"], value["led_off"])
+        await self._client.async_set_led_off_intensity(value["id"], value["led_off"])
         self._led_off_intensity = value["led_off"]
 
-    def set_light_min_intensity(self, value):
+    async def async_set_light_min_intensity(self, value):
         """Set dimmer light minimum intensity from 1 to 3000."""
-        self._client.set_light_min_intensity(value["id"], value["intensity"])
+        await self._client.async_set_light_min_intensity(value["id"], value["intensity"])
         self._intensity_min = value["intensity"]
 
-    def set_wattage(self, value):
+    async def async_set_wattage(self, value):
         """Set light device watt load."""
-        self._client.set_wattage(value["id"], value["watt"])
+        await self._client.async_set_wattage(value["id"], value["watt"])
         self._wattage = value["watt"]
 
     def set_activation(self, value):
         """Activate or deactivate neviweb polling for a missing device."""
         self._active = value["active"]
 
-    def set_key_double_up(self, value):
+    async def async_set_key_double_up(self, value):
         """Change key double up action."""
-        self._client.set_double_up(value["id"], value["double"])
+        await self._client.async_set_double_up(value["id"], value["double"])
         self._double_up = value["double"]
 
     def do_stat(self, start):
         """Get device energy statistic."""
-        if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
+        if self.has_cycle_value(READ_HOURLY_STATS):
             today = date.today()
             current_month = today.month
             current_day = today.day
-            device_monthly_stats = self._client.get_device_monthly_stats(self._id, False)
+            device_monthly_stats = self.cycle_value(READ_MONTHLY_STATS)
             #            _LOGGER.debug("%s device_monthly_stats = %s", self._name, device_monthly_stats)
             if device_monthly_stats is not None and len(device_monthly_stats) > 1:
                 n = len(device_monthly_stats)
@@ -814,7 +751,7 @@ class Neviweb130Light(LightEntity):
                         name=self._name,
                     )
                 )
-            device_daily_stats = self._client.get_device_daily_stats(self._id, False)
+            device_daily_stats = self.cycle_value(READ_DAILY_STATS)
             #            _LOGGER.debug("%s device_daily_stats = %s", self._name, device_daily_stats)
             if device_daily_stats is not None and len(device_daily_stats) > 1:
                 n = len(device_daily_stats)
@@ -844,7 +781,7 @@ class Neviweb130Light(LightEntity):
                         name=self._name,
                     )
                 )
-            device_hourly_stats = self._client.get_device_hourly_stats(self._id, False)
+            device_hourly_stats = self.cycle_value(READ_HOURLY_STATS)
             #            _LOGGER.debug("%s device_hourly_stats = %s", self._name, device_hourly_stats)
             if device_hourly_stats is not None and len(device_hourly_stats) > 1:
                 n = len(device_hourly_stats)
@@ -915,7 +852,7 @@ class Neviweb130Light(LightEntity):
                         ),
                     )
                 )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCDAYREQMAX":
             _LOGGER.warning("Maximum daily request reached... Reduce polling frequency")
         elif error_data == "TimeoutError":
@@ -935,7 +872,7 @@ class Neviweb130Light(LightEntity):
                     "Warning: Neviweb access temporary blocked for maintenance... Retry later.",
                 ),
             )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning(
                 translated_or_default(
@@ -957,7 +894,7 @@ class Neviweb130Light(LightEntity):
                     ),
                 )
             )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "DVCATTRNSPTD":
             _LOGGER.warning(
                 "Device attribute not supported for %s (id: %s): %s... (SKU: %s)",
@@ -1071,14 +1008,15 @@ class Neviweb130Light(LightEntity):
 
     def notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
-            PN_DOMAIN,
-            "create",
-            service_data={
-                "title": title,
-                "message": msg,
-            },
-            blocking=False,
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                PN_DOMAIN,
+                "create",
+                service_data={
+                    "title": title,
+                    "message": msg,
+                },
+            )
         )
         return True
 
@@ -1086,42 +1024,26 @@ class Neviweb130Light(LightEntity):
 class Neviweb130Dimmer(Neviweb130Light):
     """Implementation of a neviweb dimmer, DM2500ZB, DM2500ZB-G2."""
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._is_dimmer
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if not self._is_dimmer:
+            return [ATTR_ONOFF]
+        WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
+        return UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
+
+    async def async_update(self):
         if self._active:
             """Get the latest data from neviweb and update the state."""
-            WATT_ATTRIBUTE = [ATTR_LIGHT_WATTAGE, ATTR_ERROR_CODE_SET1]
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if self._is_dimmer:
-                if safe_mode == self._id:
-                    device_data = safe_get_device_attributes(
-                        self.hass,
-                        self._client,
-                        self._id,
-                        attributes,
-                        _LOGGER,
-                        device_sku=self._sku,
-                        device_model=self._device_model,
-                        firmware=self._firmware,
-                    )
-                else:
-                    device_data = self._client.get_device_attributes(self._id, attributes)
-            else:
-                if safe_mode == self._id:
-                    device_data = safe_get_device_attributes(
-                        self.hass,
-                        self._client,
-                        self._id,
-                        ATTR_ONOFF,
-                        _LOGGER,
-                        device_sku=self._sku,
-                        device_model=self._device_model,
-                        firmware=self._firmware,
-                    )
-                else:
-                    device_data = self._client.get_device_attributes(self._id, ATTR_ONOFF)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1181,7 +1103,7 @@ class Neviweb130Dimmer(Neviweb130Light):
                     _LOGGER.warning("Error reading device %s: (%s)", self._name, device_data)
             else:
                 self.log_error(device_data["error"]["code"])
-            if self._is_dimmer:
+            if self.reads_stats:
                 self.do_stat(start)
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -1241,47 +1163,31 @@ class Neviweb130Dimmer(Neviweb130Light):
 class Neviweb130NewDimmer(Neviweb130Light):
     """Implementation of a neviweb new dimmer DM2550ZB, DM2550ZB-G2."""
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._is_new_dimmer
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if not self._is_new_dimmer:
+            return [ATTR_ONOFF]
+        WATT_ATTRIBUTE = [
+            ATTR_PHASE_CONTROL,
+            ATTR_KEY_DOUBLE_UP,
+            ATTR_WATTAGE_INSTANT,
+            ATTR_ERROR_CODE_SET1,
+        ]
+        return UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
+
+    async def async_update(self):
         if self._active:
             """Get the latest data from neviweb and update the state."""
-            WATT_ATTRIBUTE = [
-                ATTR_PHASE_CONTROL,
-                ATTR_KEY_DOUBLE_UP,
-                ATTR_WATTAGE_INSTANT,
-                ATTR_ERROR_CODE_SET1,
-            ]
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + WATT_ATTRIBUTE
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if self._is_new_dimmer:
-                if safe_mode == self._id:
-                    device_data = safe_get_device_attributes(
-                        self.hass,
-                        self._client,
-                        self._id,
-                        attributes,
-                        _LOGGER,
-                        device_sku=self._sku,
-                        device_model=self._device_model,
-                        firmware=self._firmware,
-                    )
-                else:
-                    device_data = self._client.get_device_attributes(self._id, attributes)
-            else:
-                if safe_mode == self._id:
-                    device_data = safe_get_device_attributes(
-                        self.hass,
-                        self._client,
-                        self._id,
-                        ATTR_ONOFF,
-                        _LOGGER,
-                        device_sku=self._sku,
-                        device_model=self._device_model,
-                        firmware=self._firmware,
-                    )
-                else:
-                    device_data = self._client.get_device_attributes(self._id, ATTR_ONOFF)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1341,7 +1247,7 @@ class Neviweb130NewDimmer(Neviweb130Light):
                     _LOGGER.warning("Error reading device %s: (%s)", self._name, device_data)
             else:
                 self.log_error(device_data["error"]["code"])
-            if self._is_new_dimmer:
+            if self.reads_stats:
                 self.do_stat(start)
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -104,13 +104,17 @@ from .const import (
     CONF_LOCATION,
     CONF_LOCATION2,
     CONF_LOCATION3,
+    CONF_LOCATIONS,
+    CONF_MAX_CONNECTIONS,
     CONF_NETWORK,
     CONF_NETWORK2,
     CONF_NETWORK3,
     CONF_NOTIFY,
     CONF_PREFIX,
+    CONF_REQUEST_TARGET,
     CONF_SAFE_MODE,
     CONF_STAT_INTERVAL,
+    CONF_WEATHER_INTERVAL,
     DOMAIN,
 )
 
@@ -122,6 +126,9 @@ STAT_INTERVAL = 1800
 IGNORE_MIWI = False
 NOTIFY = "both"
 SAFE_MODE = "-"
+MAX_CONNECTIONS = 10
+WEATHER_INTERVAL = 1800
+REQUEST_TARGET = 24000
 
 REVERSING_VALVE_POLARITY = ["cooling", "heating"]
 MIN_TIME = {120, 180, 240, 300, 600}
@@ -295,6 +302,8 @@ ACCOUNT_SCHEMA = vol.Schema(
         vol.Optional(CONF_LOCATION): cv.string,  # Preferred name (network 1)
         vol.Optional(CONF_LOCATION2): cv.string,  # Preferred name (network 2)
         vol.Optional(CONF_LOCATION3): cv.string,  # Preferred name (network 3)
+        # Any number of locations, in network order, instead of location/location2/location3
+        vol.Optional(CONF_LOCATIONS): vol.All(cv.ensure_list, [cv.string]),
         # Aliases for backward compatibility
         vol.Optional(CONF_NETWORK): cv.string,
         vol.Optional(CONF_NETWORK2): cv.string,
@@ -325,6 +334,15 @@ CONFIG_SCHEMA = vol.Schema(
                 ),
                 vol.Optional(CONF_NOTIFY, default=NOTIFY): vol.In(["both", "logging", "nothing", "notification"]),
                 vol.Optional(CONF_SAFE_MODE, default="-"): cv.string,
+                vol.Optional(CONF_MAX_CONNECTIONS, default=MAX_CONNECTIONS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=100)
+                ),
+                vol.Optional(CONF_WEATHER_INTERVAL, default=WEATHER_INTERVAL): vol.All(
+                    vol.Coerce(int), vol.Range(min=600, max=7200)
+                ),
+                vol.Optional(CONF_REQUEST_TARGET, default=REQUEST_TARGET): vol.All(
+                    vol.Coerce(int), vol.Range(min=1000, max=30000)
+                ),
             }
         )
     },
@@ -19,15 +19,16 @@ from __future__ import annotations
 import datetime
 import logging
 import time
+from functools import partial
 from threading import Lock
 from typing import cast, override
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.persistent_notification import DOMAIN as PN_DOMAIN
 from homeassistant.components.recorder.models import StatisticMeanType
-from homeassistant.components.sensor import SensorStateClass
-from homeassistant.const import ATTR_ENTITY_ID, PERCENTAGE
-from homeassistant.core import ServiceCall
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import ATTR_ENTITY_ID, PERCENTAGE, UnitOfTemperature
+from homeassistant.core import ServiceCall, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity import Entity
 
@@ -63,6 +64,13 @@ from .const import (
     ATTR_TEMP_ALERT,
     ATTR_WATER_LEAK_STATUS,
     DOMAIN,
+    IMPLEMENTED_CONNECTED_SENSOR,
+    IMPLEMENTED_GATEWAY,
+    IMPLEMENTED_LTE_TANK_MONITOR,
+    IMPLEMENTED_NEW_CONNECTED_SENSOR,
+    IMPLEMENTED_NEW_SENSOR_MODEL,
+    IMPLEMENTED_SENSOR_MODEL,
+    IMPLEMENTED_TANK_MONITOR,
     SERVICE_SET_ACTIVATION,
     SERVICE_SET_BATTERY_ALERT,
     SERVICE_SET_BATTERY_TYPE,
@@ -77,7 +85,14 @@ from .const import (
     STATE_WATER_LEAK,
     VERSION,
 )
-from .helpers import file_exists, get_daily_request_count, notify_ha, safe_get_device_attributes, translated_or_default
+from .coordinator import READ_STATUS, DeviceRead, Neviweb130CoordinatorEntity, async_track_platform_devices
+from .helpers import (
+    file_exists,
+    get_daily_request_breakdown,
+    get_daily_request_count,
+    notify_ha,
+    translated_or_default,
+)
 from .schema import (
     SET_ACTIVATION_SCHEMA,
     SET_BATTERY_ALERT_SCHEMA,
@@ -99,22 +114,6 @@ SCAN_INTERVAL = scan_interval
 
 UPDATE_ATTRIBUTES = [ATTR_BATTERY_VOLTAGE, ATTR_BATTERY_STATUS]
 
-IMPLEMENTED_GATEWAY = [130, 3156]
-IMPLEMENTED_TANK_MONITOR = [5056]
-IMPLEMENTED_LTE_TANK_MONITOR = [5055]
-IMPLEMENTED_SENSOR_MODEL = [5051, 5053]
-IMPLEMENTED_NEW_SENSOR_MODEL = [4210]
-IMPLEMENTED_NEW_CONNECTED_SENSOR = [42102]
-IMPLEMENTED_CONNECTED_SENSOR = [5050, 5052]
-IMPLEMENTED_DEVICE_MODEL = (
-    IMPLEMENTED_SENSOR_MODEL
-    + IMPLEMENTED_TANK_MONITOR
-    + IMPLEMENTED_LTE_TANK_MONITOR
-    + IMPLEMENTED_CONNECTED_SENSOR
-    + IMPLEMENTED_GATEWAY
-    + IMPLEMENTED_NEW_SENSOR_MODEL
-    + IMPLEMENTED_NEW_CONNECTED_SENSOR
-)
 
 SENSOR_TYPES: dict[
     str, tuple[str | None, str | None, BinarySensorDeviceClass | SensorStateClass, str | None, StatisticMeanType | None]
@@ -125,11 +124,10 @@ SENSOR_TYPES: dict[
 }
 
 
-async def async_setup_platform(
+async def async_setup_entry(
     hass,
-    config,
+    entry,
     async_add_entities,
-    discovery_info=None,
 ) -> None:
     """Set up the Neviweb sensor."""
     data = hass.data[DOMAIN]["data"]
@@ -137,157 +135,80 @@ async def async_setup_platform(
     # Wait for async migration to be done
     await data.migration_done.wait()
 
-    entities: list[Entity] = []
-    entities.append(NeviwebDailyRequestSensor(hass))
-
-    # Loop through all clients (supports multi-account)
-    for client in data.neviweb130_clients:
-        default_name = client.default_group_name("sensor")
-        default_name_2 = client.default_group_name("sensor", 2)
-        default_name_3 = client.default_group_name("sensor", 3)
-
-        # Process gateway_data for this client
-        for device_info in client.gateway_data:
+    def create_entities(client, devices) -> list[Entity]:
+        """Return the entities of discovered devices of an account."""
+        created: list[Entity] = []
+        for device in devices:
+            device_info = device.info
+            device_name = "{} {}".format(client.default_group_name("sensor", device.network), device_info["name"])
+            device_sku = device_info["sku"]
+            location_id = device_info["location$id"]
+            device_firmware = "{}.{}.{}".format(
+                device_info["signature"]["softVersion"]["major"],
+                device_info["signature"]["softVersion"]["middle"],
+                device_info["signature"]["softVersion"]["minor"],
+            )
             if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
+                device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL
+                or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL
             ):
-                device_name = "{} {}".format(default_name, device_info["name"])
-                device_sku = device_info["sku"]
-                location_id = device_info["location$id"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
+                device_type = "leak"
+                created.append(
+                    Neviweb130Sensor(device_info, device_name, device_type, device_sku, device_firmware, client)
                 )
-                if (
-                    device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL
-                    or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL
-                ):
-                    device_type = "leak"
-                    entities.append(
-                        Neviweb130Sensor(device_info, device_name, device_type, device_sku, device_firmware, client)
-                    )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR
-                    or device_info["signature"]["model"] in IMPLEMENTED_NEW_CONNECTED_SENSOR
-                ):
-                    device_type = "leak"
-                    entities.append(
-                        Neviweb130ConnectedSensor(
-                            device_info, device_name, device_type, device_sku, device_firmware, client
-                        )
-                    )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR
-                    or device_info["signature"]["model"] in IMPLEMENTED_LTE_TANK_MONITOR
-                ):
-                    device_type = "level"
-                    entities.append(
-                        Neviweb130TankSensor(device_info, device_name, device_type, device_sku, device_firmware, client)
-                    )
-                else:
-                    device_type = "gateway"
-                    entities.append(
-                        Neviweb130GatewaySensor(
-                            device_info, device_name, device_type, device_sku, device_firmware, location_id, client
-                        )
-                    )
-        for device_info in client.gateway_data2:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
+            elif (
+                device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR
+                or device_info["signature"]["model"] in IMPLEMENTED_NEW_CONNECTED_SENSOR
             ):
-                device_name = "{} {}".format(default_name_2, device_info["name"])
-                device_sku = device_info["sku"]
-                location_id = device_info["location$id"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if (
-                    device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL
-                    or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL
-                ):
-                    device_type = "leak"
-                    entities.append(
-                        Neviweb130Sensor(device_info, device_name, device_type, device_sku, device_firmware, client)
-                    )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR
-                    or device_info["signature"]["model"] in IMPLEMENTED_NEW_CONNECTED_SENSOR
-                ):
-                    device_type = "leak"
-                    entities.append(
-                        Neviweb130ConnectedSensor(
-                            device_info, device_name, device_type, device_sku, device_firmware, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR:
-                    device_type = "level"
-                    entities.append(
-                        Neviweb130TankSensor(device_info, device_name, device_type, device_sku, device_firmware, client)
+                device_type = "leak"
+                created.append(
+                    Neviweb130ConnectedSensor(
+                        device_info, device_name, device_type, device_sku, device_firmware, client
                     )
-                else:
-                    device_type = "gateway"
-                    entities.append(
-                        Neviweb130GatewaySensor(
-                            device_info, device_name, device_type, device_sku, device_firmware, location_id, client
-                        )
-                    )
-        for device_info in client.gateway_data3:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
+                )
+            elif (
+                device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR
+                or device_info["signature"]["model"] in IMPLEMENTED_LTE_TANK_MONITOR
             ):
-                device_name = "{} {}".format(default_name_3, device_info["name"])
-                device_sku = device_info["sku"]
-                location_id = device_info["location$id"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
+                device_type = "level"
+                created.append(
+                    Neviweb130TankSensor(device_info, device_name, device_type, device_sku, device_firmware, client)
                 )
-                if (
-                    device_info["signature"]["model"] in IMPLEMENTED_SENSOR_MODEL
-                    or device_info["signature"]["model"] in IMPLEMENTED_NEW_SENSOR_MODEL
-                ):
-                    device_type = "leak"
-                    entities.append(
-                        Neviweb130Sensor(device_info, device_name, device_type, device_sku, device_firmware, client)
-                    )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_CONNECTED_SENSOR
-                    or device_info["signature"]["model"] in IMPLEMENTED_NEW_CONNECTED_SENSOR
-                ):
-                    device_type = "leak"
-                    entities.append(
-                        Neviweb130ConnectedSensor(
-                            device_info, device_name, device_type, device_sku, device_firmware, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_TANK_MONITOR:
-                    device_type = "level"
-                    entities.append(
-                        Neviweb130TankSensor(device_info, device_name, device_type, device_sku, device_firmware, client)
-                    )
-                else:
-                    device_type = "gateway"
-                    entities.append(
-                        Neviweb130GatewaySensor(
-                            device_info, device_name, device_type, device_sku, device_firmware, location_id, client
-                        )
+            else:
+                device_type = "gateway"
+                created.append(
+                    Neviweb130GatewaySensor(
+                        device_info, device_name, device_type, device_sku, device_firmware, location_id, client
                     )
+                )
+        return created
 
-    async_add_entities(entities, True)
+    entities: list[Entity] = []
+    entities.append(NeviwebDailyRequestSensor(hass))
+
+    # Loop through all clients (supports multi-account)
+    for client in data.neviweb130_clients:
+        # One weather sensor per location, shared by all thermostats of the location
+        for index, location in client.locations:
+            name = "{} weather".format(client.default_group_name("sensor", index))
+            entities.append(Neviweb130WeatherSensor(name, location, client))
+
+        entities.extend(create_entities(client, client.devices.platform("sensor")))
+
+    async_add_entities(entities)
 
     entity_map: dict[str, Entity] | None = None
     _entity_map_lock = Lock()
 
+    def _entities_changed() -> None:
+        """Rebuild the entity lookup of services on next use."""
+        nonlocal entity_map
+        entity_map = None
+
+    async_track_platform_devices(
+        hass, entry, "sensor", entities, create_entities, async_add_entities, _entities_changed
+    )
+
     def get_sensor(service: ServiceCall) -> Neviweb130Sensor:
         entity_id = service.data.get(ATTR_ENTITY_ID)
         if entity_id is None:
@@ -342,7 +263,7 @@ async def async_setup_platform(
 
         return cast(Neviweb130Sensor, sensor)
 
-    def set_sensor_alert_service(service: ServiceCall) -> None:
+    async def set_sensor_alert_service(service: ServiceCall) -> None:
         """Set different alert and action for water leak sensor."""
         sensor = get_sensor(service)
         value = {
@@ -352,20 +273,20 @@ async def async_setup_platform(
             "batt": service.data[ATTR_BATT_ALERT],
             "close": service.data[ATTR_CONF_CLOSURE],
         }
-        sensor.set_sensor_alert(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_sensor_alert(value)
+        sensor.async_refresh_after_write()
 
-    def set_battery_type_service(service: ServiceCall) -> None:
+    async def set_battery_type_service(service: ServiceCall) -> None:
         """Set battery type for water leak sensor."""
         sensor = get_sensor(service)
         value = {
             "id": sensor.unique_id,
             "type": service.data[ATTR_BATTERY_TYPE],
         }
-        sensor.set_battery_type(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_battery_type(value)
+        sensor.async_refresh_after_write()
 
-    def set_tank_type_service(service: ServiceCall) -> None:
+    async def set_tank_type_service(service: ServiceCall) -> None:
         """Set tank type for fuel tank."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -378,10 +299,10 @@ async def async_setup_platform(
                 )
             )
         value = {"id": sensor.unique_id, "type": service.data[ATTR_TANK_TYPE]}
-        sensor.set_tank_type(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_tank_type(value)
+        sensor.async_refresh_after_write()
 
-    def set_gauge_type_service(service: ServiceCall) -> None:
+    async def set_gauge_type_service(service: ServiceCall) -> None:
         """Set gauge type for propane tank."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -396,10 +317,10 @@ async def async_setup_platform(
                 )
             )
         value = {"id": sensor.unique_id, "gauge": service.data[ATTR_GAUGE_TYPE]}
-        sensor.set_gauge_type(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_gauge_type(value)
+        sensor.async_refresh_after_write()
 
-    def set_low_fuel_alert_service(service: ServiceCall) -> None:
+    async def set_low_fuel_alert_service(service: ServiceCall) -> None:
         """Set low fuel alert on tank, propane or oil."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -417,10 +338,10 @@ async def async_setup_platform(
             "id": sensor.unique_id,
             "low": service.data[ATTR_FUEL_PERCENT_ALERT],
         }
-        sensor.set_low_fuel_alert(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_low_fuel_alert(value)
+        sensor.async_refresh_after_write()
 
-    def set_tank_height_service(service: ServiceCall) -> None:
+    async def set_tank_height_service(service: ServiceCall) -> None:
         """Set tank height for oil tank."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -438,10 +359,10 @@ async def async_setup_platform(
             "id": sensor.unique_id,
             "height": service.data[ATTR_TANK_HEIGHT],
         }
-        sensor.set_tank_height(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_tank_height(value)
+        sensor.async_refresh_after_write()
 
-    def set_fuel_alert_service(service: ServiceCall) -> None:
+    async def set_fuel_alert_service(service: ServiceCall) -> None:
         """Set fuel alert for LM4110-ZB."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -456,10 +377,10 @@ async def async_setup_platform(
                 )
             )
         value = {"id": sensor.unique_id, "fuel": service.data[ATTR_FUEL_ALERT]}
-        sensor.set_fuel_alert(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_fuel_alert(value)
+        sensor.async_refresh_after_write()
 
-    def set_refuel_alert_service(service: ServiceCall) -> None:
+    async def set_refuel_alert_service(service: ServiceCall) -> None:
         """Set refuel alert for LM4110-ZB."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -474,10 +395,10 @@ async def async_setup_platform(
                 )
             )
         value = {"id": sensor.unique_id, "refuel": service.data[ATTR_REFUEL]}
-        sensor.set_refuel_alert(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_refuel_alert(value)
+        sensor.async_refresh_after_write()
 
-    def set_battery_alert_service(service: ServiceCall) -> None:
+    async def set_battery_alert_service(service: ServiceCall) -> None:
         """Set battery alert for LM4110-ZB."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130TankSensor):
@@ -492,17 +413,17 @@ async def async_setup_platform(
                 )
             )
         value = {"id": sensor.unique_id, "batt": service.data[ATTR_BATT_ALERT]}
-        sensor.set_battery_alert(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_battery_alert(value)
+        sensor.async_refresh_after_write()
 
-    def set_activation_service(service: ServiceCall) -> None:
+    async def set_activation_service(service: ServiceCall) -> None:
         """Activate or deactivate Neviweb polling for missing device."""
         sensor = get_sensor(service)
         value = {"id": sensor.unique_id, "active": service.data[ATTR_ACTIVE]}
         sensor.set_activation(value)
-        sensor.schedule_update_ha_state(True)
+        sensor.async_refresh_after_write()
 
-    def set_neviweb_status_service(service: ServiceCall) -> None:
+    async def set_neviweb_status_service(service: ServiceCall) -> None:
         """Set Neviweb global status, home or away."""
         sensor = get_sensor(service)
         if not isinstance(sensor, Neviweb130GatewaySensor):
@@ -517,8 +438,8 @@ async def async_setup_platform(
                 )
             )
         value = {"id": sensor.unique_id, "mode": service.data[ATTR_MODE]}
-        sensor.set_neviweb_status(value)
-        sensor.schedule_update_ha_state(True)
+        await sensor.async_set_neviweb_status(value)
+        sensor.async_refresh_after_write()
 
     hass.services.async_register(
         DOMAIN,
@@ -633,7 +554,7 @@ def convert_to_percent(angle, low, high):
     return round(pct)
 
 
-class Neviweb130Sensor(Entity):
+class Neviweb130Sensor(Neviweb130CoordinatorEntity, Entity):
     """Implementation of a Neviweb sensor connected to GT130."""
 
     def __init__(self, device_info, name, device_type, sku, firmware, client):
@@ -688,46 +609,36 @@ class Neviweb130Sensor(Entity):
         self._temp_alert = None
         self._temp_status = None
 
-    def update(self):
-        if self._active:
-            if self._is_leak:
-                LEAK_ATTRIBUTE = [
-                    ATTR_WATER_LEAK_STATUS,
-                    ATTR_ROOM_TEMPERATURE,
-                    ATTR_ROOM_TEMP_ALARM,
-                    ATTR_LEAK_ALERT,
-                    ATTR_BATTERY_TYPE,
-                    ATTR_BATT_ALERT,
-                    ATTR_TEMP_ALERT,
-                    ATTR_RSSI,
-                    ATTR_BATT_PERCENT_NORMAL,
-                    ATTR_BATT_STATUS_NORMAL,
-                ]
-            else:
-                LEAK_ATTRIBUTE = []
-            if self._is_new_leak:
-                NEW_LEAK_ATTRIBUTE = [ATTR_ERROR_CODE_SET1, ATTR_SENSOR_TYPE]
-            else:
-                NEW_LEAK_ATTRIBUTE = []
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if self._is_leak:
+            LEAK_ATTRIBUTE = [
+                ATTR_WATER_LEAK_STATUS,
+                ATTR_ROOM_TEMPERATURE,
+                ATTR_ROOM_TEMP_ALARM,
+                ATTR_LEAK_ALERT,
+                ATTR_BATTERY_TYPE,
+                ATTR_BATT_ALERT,
+                ATTR_TEMP_ALERT,
+                ATTR_RSSI,
+                ATTR_BATT_PERCENT_NORMAL,
+                ATTR_BATT_STATUS_NORMAL,
+            ]
+        else:
+            LEAK_ATTRIBUTE = []
+        if self._is_new_leak:
+            NEW_LEAK_ATTRIBUTE = [ATTR_ERROR_CODE_SET1, ATTR_SENSOR_TYPE]
+        else:
+            NEW_LEAK_ATTRIBUTE = []
+        return UPDATE_ATTRIBUTES + LEAK_ATTRIBUTE + NEW_LEAK_ATTRIBUTE
 
+    async def async_update(self):
+        if self._active:
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LEAK_ATTRIBUTE + NEW_LEAK_ATTRIBUTE
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -962,17 +873,19 @@ class Neviweb130Sensor(Entity):
         """Return the state of the sensor."""
         return self._leak_status
 
-    def set_sensor_alert(self, value):
+    async def async_set_sensor_alert(self, value):
         """Set water leak sensor alert and action."""
-        self._client.set_sensor_alert(value["id"], value["leak"], value["batt"], value["temp"], value["close"])
+        await self._client.async_set_sensor_alert(
+            value["id"], value["leak"], value["batt"], value["temp"], value["close"]
+        )
         self._leak_alert = True if value["leak"] == 1 else False
         self._temp_alert = True if value["temp"] == 1 else False
         self._battery_alert = True if value["batt"] == 1 else False
         self._closure_action = value["close"]
 
-    def set_battery_type(self, value):
+    async def async_set_battery_type(self, value):
         """Set battery type, alkaline or lithium for water leak sensor."""
-        self._client.set_battery_type(value["id"], value["type"])
+        await self._client.async_set_battery_type(value["id"], value["type"])
         self._battery_type = value["type"]
 
     def set_activation(self, value):
@@ -981,14 +894,15 @@ class Neviweb130Sensor(Entity):
 
     def notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
-            PN_DOMAIN,
-            "create",
-            service_data={
-                "title": title,
-                "message": msg,
-            },
-            blocking=False,
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                PN_DOMAIN,
+                "create",
+                service_data={
+                    "title": title,
+                    "message": msg,
+                },
+            )
         )
         return True
 
@@ -1018,7 +932,7 @@ class Neviweb130Sensor(Entity):
                         ),
                     )
                 )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCDAYREQMAX":
             _LOGGER.warning(
                 translated_or_default(
@@ -1044,7 +958,7 @@ class Neviweb130Sensor(Entity):
                     "Warning: Neviweb access temporary blocked for maintenance... Retry later.",
                 )
             )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning(
                 translated_or_default(
@@ -1066,7 +980,7 @@ class Neviweb130Sensor(Entity):
                     ),
                 )
             )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "DVCATTRNSPTD":
             _LOGGER.warning(
                 "Device attribute not supported for %s (id: %s): %s... (SKU: %s)",
@@ -1183,46 +1097,36 @@ class Neviweb130Sensor(Entity):
 class Neviweb130ConnectedSensor(Neviweb130Sensor):
     """Implementation of a Neviweb sensor connected to Sedna valve."""
 
-    def update(self):
-        if self._active:
-            if self._is_connected or self._is_new_connected:
-                LEAK_ATTRIBUTE = [
-                    ATTR_WATER_LEAK_STATUS,
-                    ATTR_ROOM_TEMPERATURE,
-                    ATTR_ROOM_TEMP_ALARM,
-                    ATTR_BATTERY_TYPE,
-                    ATTR_BATT_ALERT,
-                    ATTR_TEMP_ALERT,
-                    ATTR_BATT_PERCENT_NORMAL,
-                    ATTR_BATT_STATUS_NORMAL,
-                    ATTR_CONF_CLOSURE,
-                ]
-            else:
-                LEAK_ATTRIBUTE = []
-            if self._is_new_connected:
-                NEW_LEAK_ATTRIBUTE = [ATTR_SENSOR_TYPE]
-            else:
-                NEW_LEAK_ATTRIBUTE = []
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if self._is_connected or self._is_new_connected:
+            LEAK_ATTRIBUTE = [
+                ATTR_WATER_LEAK_STATUS,
+                ATTR_ROOM_TEMPERATURE,
+                ATTR_ROOM_TEMP_ALARM,
+                ATTR_BATTERY_TYPE,
+                ATTR_BATT_ALERT,
+                ATTR_TEMP_ALERT,
+                ATTR_BATT_PERCENT_NORMAL,
+                ATTR_BATT_STATUS_NORMAL,
+                ATTR_CONF_CLOSURE,
+            ]
+        else:
+            LEAK_ATTRIBUTE = []
+        if self._is_new_connected:
+            NEW_LEAK_ATTRIBUTE = [ATTR_SENSOR_TYPE]
+        else:
+            NEW_LEAK_ATTRIBUTE = []
+        return UPDATE_ATTRIBUTES + LEAK_ATTRIBUTE + NEW_LEAK_ATTRIBUTE
 
+    async def async_update(self):
+        if self._active:
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LEAK_ATTRIBUTE + NEW_LEAK_ATTRIBUTE
-            _LOGGER.debug("Updated attributes for %s: %s", self._name, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug("Updated attributes for %s: %s", self._name, self.planned_attributes)
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1338,48 +1242,39 @@ class Neviweb130TankSensor(Neviweb130Sensor):
         super().__init__(device_info, name, device_type, sku, firmware, client)
         self._refuel = False
 
-    def update(self):
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if self._is_monitor:
+            MONITOR_ATTRIBUTE = [
+                ATTR_ANGLE,
+                ATTR_TANK_PERCENT,
+                ATTR_TANK_TYPE,
+                ATTR_GAUGE_TYPE,
+                ATTR_TANK_HEIGHT,
+                ATTR_FUEL_ALERT,
+                ATTR_REFUEL,
+                ATTR_BATT_ALERT,
+                ATTR_FUEL_PERCENT_ALERT,
+                ATTR_ERROR_CODE_SET1,
+                ATTR_RSSI,
+            ]
+        else:
+            MONITOR_ATTRIBUTE = [
+                ATTR_ANGLE,
+                ATTR_TANK_PERCENT,
+                ATTR_TANK_TYPE,
+                ATTR_GAUGE_TYPE,
+                ATTR_TANK_HEIGHT,
+            ]
+        return UPDATE_ATTRIBUTES + MONITOR_ATTRIBUTE
+
+    async def async_update(self):
         """Update device."""
         if self._active:
-            if self._is_monitor:
-                MONITOR_ATTRIBUTE = [
-                    ATTR_ANGLE,
-                    ATTR_TANK_PERCENT,
-                    ATTR_TANK_TYPE,
-                    ATTR_GAUGE_TYPE,
-                    ATTR_TANK_HEIGHT,
-                    ATTR_FUEL_ALERT,
-                    ATTR_REFUEL,
-                    ATTR_BATT_ALERT,
-                    ATTR_FUEL_PERCENT_ALERT,
-                    ATTR_ERROR_CODE_SET1,
-                    ATTR_RSSI,
-                ]
-            else:
-                MONITOR_ATTRIBUTE = [
-                    ATTR_ANGLE,
-                    ATTR_TANK_PERCENT,
-                    ATTR_TANK_TYPE,
-                    ATTR_GAUGE_TYPE,
-                    ATTR_TANK_HEIGHT,
-                ]
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + MONITOR_ATTRIBUTE
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1558,45 +1453,47 @@ class Neviweb130TankSensor(Neviweb130Sensor):
 
     #        return convert_to_percent(self._angle, 10, 80)
 
-    def set_tank_type(self, value):
+    async def async_set_tank_type(self, value):
         """Set tank type for LM4110-ZB sensor."""
-        self._client.set_tank_type(value["id"], value["type"])
+        await self._client.async_set_tank_type(value["id"], value["type"])
         self._tank_type = value["type"]
 
-    def set_gauge_type(self, value):
+    async def async_set_gauge_type(self, value):
         """Set gauge type for LM4110-ZB sensor."""
-        self._client.set_gauge_type(value["id"], str(value["gauge"]))
+        await self._client.async_set_gauge_type(value["id"], str(value["gauge"]))
         self._gauge_type = str(value["gauge"])
 
-    def set_low_fuel_alert(self, value):
+    async def async_set_low_fuel_alert(self, value):
         """Set low fuel alert limit LM4110-ZB sensor."""
-        self._client.set_low_fuel_alert(value["id"], value["low"])
+        await self._client.async_set_low_fuel_alert(value["id"], value["low"])
         self._fuel_percent_alert = value["low"]
 
-    def set_refuel_alert(self, value):
+    async def async_set_refuel_alert(self, value):
         """ "Set refuel alert for LM4110-ZB sensor True/False."""
-        self._client.set_refuel_alert(value["id"], value["refuel"])
+        await self._client.async_set_refuel_alert(value["id"], value["refuel"])
         self._refuel = value["refuel"]
 
-    def set_tank_height(self, value):
+    async def async_set_tank_height(self, value):
         """Set low fuel alert LM4110-ZB sensor."""
-        self._client.set_tank_height(value["id"], value["height"])
+        await self._client.async_set_tank_height(value["id"], value["height"])
         self._tank_height = value["height"]
 
-    def set_fuel_alert(self, value):
+    async def async_set_fuel_alert(self, value):
         """Set low fuel alert LM4110-ZB sensor."""
-        self._client.set_fuel_alert(value["id"], value["fuel"])
+        await self._client.async_set_fuel_alert(value["id"], value["fuel"])
         self._fuel_alert = value["fuel"]
 
-    def set_battery_alert(self, value):
+    async def async_set_battery_alert(self, value):
         """Set low battery alert LM4110-ZB sensor."""
-        self._client.set_battery_alert(value["id"], value["batt"])
+        await self._client.async_set_battery_alert(value["id"], value["batt"])
         self._battery_alert = value["batt"]
 
 
 class Neviweb130GatewaySensor(Neviweb130Sensor):
     """Implementation of a Neviweb gateway sensor, GT130, GT4220WF."""
 
+    uses_location_status = True
+
     def __init__(self, device_info, name, device_type, sku, firmware, location, client):
         """Initialize."""
         super().__init__(device_info, name, device_type, sku, firmware, client)
@@ -1604,12 +1501,25 @@ class Neviweb130GatewaySensor(Neviweb130Sensor):
         self._gateway_status = None
         self._occupancyMode = "home"
 
-    def update(self):
+    @override
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll, the gateway has none."""
+        return []
+
+    @override
+    def cycle_reads(self) -> dict[str, DeviceRead]:
+        """Return the gateway status read of each cycle."""
+        return {READ_STATUS: partial(self._client.async_get_device_status, self._id)}
+
+    async def async_update(self):
         """Update device."""
         if self._active:
             start = time.time()
-            device_status = self._client.get_device_status(self._id)
-            neviweb_status = self._client.get_neviweb_status(self._location)
+            # The gateway has no attributes to read, this takes its status read with the cycle
+            if await self.async_fetch_device_attributes() is None:
+                return
+            device_status = self.cycle_value(READ_STATUS)
+            neviweb_status = self.location_status()
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_status)
@@ -1637,6 +1547,7 @@ class Neviweb130GatewaySensor(Neviweb130Sensor):
                 return
 
             self._gateway_status = device_status[ATTR_STATUS]
+            self._client.set_gateway_status(self._location, self._id, self._gateway_status)
             if neviweb_status and ATTR_OCCUPANCY in neviweb_status:
                 self._occupancyMode = neviweb_status[ATTR_OCCUPANCY]
             return
@@ -1671,9 +1582,9 @@ class Neviweb130GatewaySensor(Neviweb130Sensor):
         )
         return data
 
-    def set_neviweb_status(self, value):
+    async def async_set_neviweb_status(self, value):
         """Set Neviweb global occupancy mode, away or home"""
-        self._client.post_neviweb_status(self._location, value["mode"])
+        await self._client.async_post_neviweb_status(self._location, value["mode"])
         self._occupancyMode = value["mode"]
 
 
@@ -1717,13 +1628,20 @@ class NeviwebDailyRequestSensor(Entity):
     @property
     def extra_state_attributes(self):
         data = self.hass.data[DOMAIN]["request_data"]
+        breakdown = get_daily_request_breakdown(self.hass)
         return {
             "date": data["date"],
             "safety_limit": 25000,
             "limit": 30000,
+            "per_endpoint": breakdown["endpoints"],
+            "per_account": breakdown["accounts"],
+            "projected_total": sum(
+                client.poll_scheduler.projected_daily_total or 0
+                for client in self.hass.data[DOMAIN]["data"].neviweb130_clients
+            ),
         }
 
-    def update(self):
+    async def async_update(self):
         """Send notification if we reach limit for request."""
         count = get_daily_request_count(self.hass)
 
@@ -1749,3 +1667,49 @@ class NeviwebDailyRequestSensor(Entity):
             self._notified = False
 
         return None
+
+
+class Neviweb130WeatherSensor(SensorEntity):
+    """Location sensor : outdoor temperature and weather icon reported by Neviweb."""
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    _attr_should_poll = False
+
+    def __init__(self, name, location, client):
+        """Initialize."""
+        self._client = client
+        self._location = str(location)
+        self._attr_name = name
+        self._attr_unique_id = client.scoped_unique_id(f"weather_{location}")
+        self._weather_icon = None
+
+    async def async_added_to_hass(self) -> None:
+        """Take the weather read by the location coordinator on each of its cycles."""
+        await super().async_added_to_hass()
+        coordinator = self._client.get_coordinator(self._location)
+        self.async_on_remove(coordinator.async_add_weather_user())
+        self.async_on_remove(coordinator.async_add_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Parse outdoor weather from the last coordinator cycle."""
+        weather = self._client.get_coordinator(self._location).weather
+        if weather is None:
+            return
+        if not isinstance(weather, dict) or "error" in weather:
+            _LOGGER.warning("Neviweb returned invalid weather data for location %s: %s", self._location, weather)
+            return
+        self._attr_native_value = weather.get("temperature")
+        self._weather_icon = weather.get("icon")
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {
+            "weather_icon": self._weather_icon,
+            "neviweb_location": self._location,
+        }
@@ -112,6 +112,15 @@ from .const import (
     ATTR_WIFI_WATT_NOW,
     ATTR_WIFI_WATTAGE,
     DOMAIN,
+    IMPLEMENTED_LOAD_DEVICES,
+    IMPLEMENTED_SED_DEVICE_CONTROL,
+    IMPLEMENTED_SED_LOAD_DEVICES,
+    IMPLEMENTED_SED_WALL_DEVICES,
+    IMPLEMENTED_WALL_DEVICES,
+    IMPLEMENTED_WATER_HEATER_LOAD_MODEL,
+    IMPLEMENTED_WIFI_LOAD_DEVICES,
+    IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL,
+    IMPLEMENTED_ZB_DEVICE_CONTROL,
     MODE_OFF,
     SERVICE_SET_ACTIVATION,
     SERVICE_SET_CONTROL_ONOFF,
@@ -130,7 +139,15 @@ from .const import (
     STATE_WATER_LEAK,
     VERSION,
 )
-from .helpers import safe_get_device_attributes, safe_number, translated_or_default
+from .coordinator import (
+    READ_DAILY_STATS,
+    READ_HOURLY_STATS,
+    READ_MONTHLY_STATS,
+    DeviceRead,
+    Neviweb130CoordinatorEntity,
+    async_track_platform_devices,
+)
+from .helpers import safe_number, translated_or_default
 from .schema import (
     SET_ACTIVATION_SCHEMA,
     SET_CONTROL_ONOFF_SCHEMA,
@@ -189,33 +206,11 @@ SWITCH_TYPES: dict[str, tuple[str, SwitchDeviceClass]] = {
     "control": ("mdi:alarm", SwitchDeviceClass.SWITCH),
 }
 
-IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL = [2152, 339]
-IMPLEMENTED_WATER_HEATER_LOAD_MODEL = [2151]
-IMPLEMENTED_ZB_DEVICE_CONTROL = [2180]
-IMPLEMENTED_SED_DEVICE_CONTROL = [2181]
-IMPLEMENTED_WALL_DEVICES = [2600, 2610]
-IMPLEMENTED_SED_WALL_DEVICES = [26002, 26102]
-IMPLEMENTED_LOAD_DEVICES = [2506]
-IMPLEMENTED_SED_LOAD_DEVICES = [25062]
-IMPLEMENTED_WIFI_LOAD_DEVICES = [346]
-IMPLEMENTED_DEVICE_MODEL = (
-    IMPLEMENTED_LOAD_DEVICES
-    + IMPLEMENTED_SED_LOAD_DEVICES
-    + IMPLEMENTED_WALL_DEVICES
-    + IMPLEMENTED_SED_WALL_DEVICES
-    + IMPLEMENTED_ZB_DEVICE_CONTROL
-    + IMPLEMENTED_SED_DEVICE_CONTROL
-    + IMPLEMENTED_WATER_HEATER_LOAD_MODEL
-    + IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL
-    + IMPLEMENTED_WIFI_LOAD_DEVICES
-)
-
 
-async def async_setup_platform(
+async def async_setup_entry(
     hass,
-    config,
+    entry,
     async_add_entities,
-    discovery_info=None,
 ) -> None:
     """Set up the Neviweb130 switch."""
     data = hass.data[DOMAIN]["data"]
@@ -223,198 +218,84 @@ async def async_setup_platform(
     # Wait for async migration to be done
     await data.migration_done.wait()
 
-    entities: list[Neviweb130Switch] = []
-
-    # Loop through all clients (supports multi-account)
-    for client in data.neviweb130_clients:
-        default_name = client.default_group_name("switch")
-        default_name_2 = client.default_group_name("switch", 2)
-        default_name_3 = client.default_group_name("switch", 3)
-
-        # Process gateway_data for this client
-        for device_info in client.gateway_data:
+    def create_entities(client, devices) -> list[Neviweb130Switch]:
+        """Return the entities of discovered devices of an account."""
+        created: list[Neviweb130Switch] = []
+        for device in devices:
+            device_info = device.info
+            device_name = "{} {}".format(client.default_group_name("switch", device.network), device_info["name"])
+            device_sku = device_info["sku"]
+            device_firmware = "{}.{}.{}".format(
+                device_info["signature"]["softVersion"]["major"],
+                device_info["signature"]["softVersion"]["middle"],
+                device_info["signature"]["softVersion"]["minor"],
+            )
             if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
+                device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES
+                or device_info["signature"]["model"] in IMPLEMENTED_SED_WALL_DEVICES
             ):
-                device_name = "{} {}".format(default_name, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
+                device_type = "outlet"
+                created.append(
+                    Neviweb130Switch(device_info, device_name, device_sku, device_firmware, device_type, client)
                 )
-                if (
-                    device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES
-                    or device_info["signature"]["model"] in IMPLEMENTED_SED_WALL_DEVICES
-                ):
-                    device_type = "outlet"
-                    entities.append(
-                        Neviweb130Switch(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES
-                    or device_info["signature"]["model"] in IMPLEMENTED_SED_LOAD_DEVICES
-                ):
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130PowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_LOAD_DEVICES:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130WifiPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130TankPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130WifiTankPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                else:  # IMPLEMENTED_ZB_DEVICE_CONTROL or model in IMPLEMENTED_SED_DEVICE_CONTROL
-                    device_type = "control"
-                    entities.append(
-                        Neviweb130ControlerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-        for device_info in client.gateway_data2:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
+            elif (
+                device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES
+                or device_info["signature"]["model"] in IMPLEMENTED_SED_LOAD_DEVICES
             ):
-                device_name = "{} {}".format(default_name_2, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
+                device_type = "power"
+                created.append(
+                    Neviweb130PowerSwitch(device_info, device_name, device_sku, device_firmware, device_type, client)
                 )
-                if (
-                    device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES
-                    or device_info["signature"]["model"] in IMPLEMENTED_SED_WALL_DEVICES
-                ):
-                    device_type = "outlet"
-                    entities.append(
-                        Neviweb130Switch(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES
-                    or device_info["signature"]["model"] in IMPLEMENTED_SED_LOAD_DEVICES
-                ):
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130PowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_LOAD_DEVICES:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130WifiPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
+            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_LOAD_DEVICES:
+                device_type = "power"
+                created.append(
+                    Neviweb130WifiPowerSwitch(
+                        device_info, device_name, device_sku, device_firmware, device_type, client
                     )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130TankPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130WifiTankPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                else:  # IMPLEMENTED_ZB_DEVICE_CONTROL or model in IMPLEMENTED_SED_DEVICE_CONTROL
-                    device_type = "control"
-                    entities.append(
-                        Neviweb130ControlerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-        for device_info in client.gateway_data3:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_3, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
                 )
-                if (
-                    device_info["signature"]["model"] in IMPLEMENTED_WALL_DEVICES
-                    or device_info["signature"]["model"] in IMPLEMENTED_SED_WALL_DEVICES
-                ):
-                    device_type = "outlet"
-                    entities.append(
-                        Neviweb130Switch(device_info, device_name, device_sku, device_firmware, device_type, client)
+            elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
+                device_type = "power"
+                created.append(
+                    Neviweb130TankPowerSwitch(
+                        device_info, device_name, device_sku, device_firmware, device_type, client
                     )
-                elif (
-                    device_info["signature"]["model"] in IMPLEMENTED_LOAD_DEVICES
-                    or device_info["signature"]["model"] in IMPLEMENTED_SED_LOAD_DEVICES
-                ):
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130PowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_LOAD_DEVICES:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130WifiPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WATER_HEATER_LOAD_MODEL:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130TankPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
-                    device_type = "power"
-                    entities.append(
-                        Neviweb130WifiTankPowerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
+                )
+            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_WATER_HEATER_LOAD_MODEL:
+                device_type = "power"
+                created.append(
+                    Neviweb130WifiTankPowerSwitch(
+                        device_info, device_name, device_sku, device_firmware, device_type, client
                     )
-                else:  # IMPLEMENTED_ZB_DEVICE_CONTROL or model in IMPLEMENTED_SED_DEVICE_CONTROL
-                    device_type = "control"
-                    entities.append(
-                        Neviweb130ControlerSwitch(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
+                )
+            else:  # IMPLEMENTED_ZB_DEVICE_CONTROL or model in IMPLEMENTED_SED_DEVICE_CONTROL
+                device_type = "control"
+                created.append(
+                    Neviweb130ControlerSwitch(
+                        device_info, device_name, device_sku, device_firmware, device_type, client
                     )
+                )
+        return created
 
-    async_add_entities(entities, True)
+    entities: list[Neviweb130Switch] = []
+
+    # Loop through all clients (supports multi-account)
+    for client in data.neviweb130_clients:
+        entities.extend(create_entities(client, client.devices.platform("switch")))
+
+    async_add_entities(entities)
 
     entity_map: dict[str, Neviweb130Switch] | None = None
     _entity_map_lock = Lock()
 
+    def _entities_changed() -> None:
+        """Rebuild the entity lookup of services on next use."""
+        nonlocal entity_map
+        entity_map = None
+
+    async_track_platform_devices(
+        hass, entry, "switch", entities, create_entities, async_add_entities, _entities_changed
+    )
+
     def get_switch(service: ServiceCall) -> Neviweb130Switch:
         entity_id = service.data.get(ATTR_ENTITY_ID)
         if entity_id is None:
@@ -456,35 +337,35 @@ async def async_setup_platform(
             )
         return switch
 
-    def set_switch_keypad_lock_service(service: ServiceCall) -> None:
+    async def set_switch_keypad_lock_service(service: ServiceCall) -> None:
         """Lock/unlock keypad device."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, "lock": service.data[ATTR_KEYPAD]}
-        switch.set_keypad_lock(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_keypad_lock(value)
+        switch.async_refresh_after_write()
 
-    def set_switch_timer_service(service: ServiceCall) -> None:
+    async def set_switch_timer_service(service: ServiceCall) -> None:
         """Set timer for switch device."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, ATTR_TIME: service.data[ATTR_TIMER]}
-        switch.set_timer(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_timer(value)
+        switch.async_refresh_after_write()
 
-    def set_switch_timer2_service(service: ServiceCall) -> None:
+    async def set_switch_timer2_service(service: ServiceCall) -> None:
         """Set timer for switch device."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, ATTR_TIME: service.data[ATTR_TIMER2]}
-        switch.set_timer2(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_timer2(value)
+        switch.async_refresh_after_write()
 
-    def set_switch_temp_alert_service(service: ServiceCall) -> None:
+    async def set_switch_temp_alert_service(service: ServiceCall) -> None:
         """Set low temperature alert for switch device MC3100ZB."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, "alert": service.data[ATTR_TEMP_ALERT]}
-        switch.set_temp_alert(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_temp_alert(value)
+        switch.async_refresh_after_write()
 
-    def set_load_dr_options_service(service: ServiceCall) -> None:
+    async def set_load_dr_options_service(service: ServiceCall) -> None:
         """Set dr mode options for load controller."""
         switch = get_switch(service)
         value = {
@@ -493,10 +374,10 @@ async def async_setup_platform(
             "droptout": service.data[ATTR_OPTOUT],
             "onoff": service.data[ATTR_ONOFF],
         }
-        switch.set_load_dr_options(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_load_dr_options(value)
+        switch.async_refresh_after_write()
 
-    def set_control_onoff_service(service: ServiceCall) -> None:
+    async def set_control_onoff_service(service: ServiceCall) -> None:
         """Set status of both onoff controller."""
         switch = get_switch(service)
         value = {
@@ -504,34 +385,34 @@ async def async_setup_platform(
             "onoff_num": service.data[ATTR_ONOFF_NUM],
             "status": service.data[ATTR_STATUS],
         }
-        switch.set_control_onoff(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_control_onoff(value)
+        switch.async_refresh_after_write()
 
-    def set_tank_size_service(service: ServiceCall) -> None:
+    async def set_tank_size_service(service: ServiceCall) -> None:
         """Set water tank size for RM3500ZB."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, "val": service.data[ATTR_VALUE][0]}
-        switch.set_tank_size(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_tank_size(value)
+        switch.async_refresh_after_write()
 
-    def set_controlled_device_service(service: ServiceCall) -> None:
+    async def set_controlled_device_service(service: ServiceCall) -> None:
         """Set controlled device type for RM3250ZB."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, "val": service.data[ATTR_VALUE][0]}
-        switch.set_controlled_device(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_controlled_device(value)
+        switch.async_refresh_after_write()
 
-    def set_low_temp_protection_service(service: ServiceCall) -> None:
+    async def set_low_temp_protection_service(service: ServiceCall) -> None:
         """Set water tank temperature protection for RM3500ZB."""
         switch = get_switch(service)
         value = {
             "id": switch.unique_id,
             "val": service.data[ATTR_WATER_TEMP_MIN],
         }
-        switch.set_low_temp_protection(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_low_temp_protection(value)
+        switch.async_refresh_after_write()
 
-    def set_input_output_names_service(service: ServiceCall) -> None:
+    async def set_input_output_names_service(service: ServiceCall) -> None:
         """Set names for input 1 and 2, output 1 and 2 for MC3100ZB device."""
         switch = get_switch(service)
         value = {
@@ -541,27 +422,27 @@ async def async_setup_platform(
             "output1": service.data[ATTR_OUTPUT_NAME_1],
             "output2": service.data[ATTR_OUTPUT_NAME_2],
         }
-        switch.set_input_output_names(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_input_output_names(value)
+        switch.async_refresh_after_write()
 
-    def set_activation_service(service: ServiceCall) -> None:
+    async def set_activation_service(service: ServiceCall) -> None:
         """Activate or deactivate Neviweb polling for missing device."""
         switch = get_switch(service)
         value = {"id": switch.unique_id, "active": service.data[ATTR_ACTIVE]}
         switch.set_activation(value)
-        switch.schedule_update_ha_state(True)
+        switch.async_refresh_after_write()
 
-    def set_remaining_time_service(service: ServiceCall) -> None:
+    async def set_remaining_time_service(service: ServiceCall) -> None:
         """Set coldLoadPickupRemainingTime value."""
         switch = get_switch(service)
         value = {
             "id": switch.unique_id,
             ATTR_TIME: service.data[ATTR_COLD_LOAD_PICKUP_REMAIN_TIME],
         }
-        switch.set_remaining_time(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_remaining_time(value)
+        switch.async_refresh_after_write()
 
-    def set_on_off_input_delay_service(service: ServiceCall) -> None:
+    async def set_on_off_input_delay_service(service: ServiceCall) -> None:
         """Set input 1 or 2 on/off delay for MC3100ZB device."""
         switch = get_switch(service)
         value = {
@@ -570,8 +451,8 @@ async def async_setup_platform(
             "onoff": service.data[ATTR_ONOFF],
             "delay": service.data[ATTR_DELAY][0],
         }
-        switch.set_on_off_input_delay(value)
-        switch.schedule_update_ha_state(True)
+        await switch.async_set_on_off_input_delay(value)
+        switch.async_refresh_after_write()
 
     hass.services.async_register(
         DOMAIN,
@@ -750,7 +631,7 @@ def remaining_time(time_val):
     return time_val
 
 
-class Neviweb130Switch(SwitchEntity):
+class Neviweb130Switch(Neviweb130CoordinatorEntity, SwitchEntity):
     """Implementation of a Neviweb switch, SP2600ZB and SP2610ZB."""
 
     def __init__(self, device_info, name, sku, firmware, device_type, client):
@@ -815,30 +696,30 @@ class Neviweb130Switch(SwitchEntity):
         self._total_kwh_count: float = 0.0
         self._water_temp_min = None
 
-    def update(self):
+    @property
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._is_wall
+
+    def cycle_reads(self) -> dict[str, DeviceRead]:
+        """Return the energy statistic reads due in this cycle."""
+        return self.stats_reads(STAT_INTERVAL)
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if self._is_wall:
+            LOAD_ATTRIBUTES = [ATTR_WATTAGE_INSTANT]
+        else:
+            LOAD_ATTRIBUTES = []
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            if self._is_wall:
-                LOAD_ATTRIBUTES = [ATTR_WATTAGE_INSTANT]
-            else:
-                LOAD_ATTRIBUTES = []
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -851,7 +732,7 @@ class Neviweb130Switch(SwitchEntity):
                     _LOGGER.warning("Error reading device %s: (%s)", self._name, device_data)
             else:
                 self.log_error(device_data["error"]["code"])
-            if self._is_wall:
+            if self.reads_stats:
                 self.do_stat(start)
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -904,15 +785,17 @@ class Neviweb130Switch(SwitchEntity):
         """Return current operation i.e. ON, OFF."""
         return self._onoff != MODE_OFF
 
-    def turn_on(self, **kwargs):
+    async def async_turn_on(self, **kwargs):
         """Turn the device on."""
-        self._client.set_onoff(self._id, "on")
+        await self._client.async_set_onoff(self._id, "on")
         self._onoff = "on"
+        self.async_refresh_after_write()
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs):
         """Turn the device off."""
-        self._client.set_onoff(self._id, "off")
+        await self._client.async_set_onoff(self._id, "off")
         self._onoff = MODE_OFF
+        self.async_refresh_after_write()
 
     @property
     def keypad_status(self):
@@ -971,77 +854,77 @@ class Neviweb130Switch(SwitchEntity):
         """Return true if device is in standby."""
         return self._current_power_w == 0
 
-    def set_control_onoff(self, value):
+    async def async_set_control_onoff(self, value):
         """Set onOff or onOff2 to on or off"""
-        self._client.set_control_onoff(value["id"], value["onoff_num"], value["status"])
+        await self._client.async_set_control_onoff(value["id"], value["onoff_num"], value["status"])
         if value["onoff_num"] == 1:
             self._onoff = value["status"]
         else:
             self._onoff2 = value["status"]
 
-    def set_keypad_lock(self, value):
+    async def async_set_keypad_lock(self, value):
         """Lock or unlock device's keypad, lock = locked, unlock = unlocked, partiallyLocked - partial lock."""
         if self._is_wifi_load or self._is_wifi_tank_load:
-            self._client.set_keypad_lock(value["id"], value["lock"], True)
+            await self._client.async_set_keypad_lock(value["id"], value["lock"], True)
         else:
-            self._client.set_keypad_lock(value["id"], value["lock"], False)
+            await self._client.async_set_keypad_lock(value["id"], value["lock"], False)
         self._keypad = value["lock"]
 
-    def set_timer(self, value):
+    async def async_set_timer(self, value):
         """Set device timer, 0 = off, 1 to 255 = timer length."""
-        self._client.set_timer(value["id"], value[ATTR_TIME])
+        await self._client.async_set_timer(value["id"], value[ATTR_TIME])
         self._timer = value[ATTR_TIME]
 
-    def set_timer2(self, value):
+    async def async_set_timer2(self, value):
         """Set device timer 2 for Multi controller, 0 = off, 1 to 255 = timer length."""
-        self._client.set_timer2(value["id"], value[ATTR_TIME])
+        await self._client.async_set_timer2(value["id"], value[ATTR_TIME])
         self._timer2 = value[ATTR_TIME]
 
-    def set_temp_alert(self, value):
+    async def async_set_temp_alert(self, value):
         """Set low temperature alert on/off for MC3100ZB."""
-        self._client.set_switch_temp_alert(value["id"], value["alert"])
+        await self._client.async_set_switch_temp_alert(value["id"], value["alert"])
         self._temp_alert = value["alert"]
 
-    def set_load_dr_options(self, value):
+    async def async_set_load_dr_options(self, value):
         """Set load controller Éco Sinopé attributes."""
-        self._client.set_load_dr_options(value["id"], value["onoff"], value["droptout"], value["dractive"])
+        await self._client.async_set_load_dr_options(value["id"], value["onoff"], value["droptout"], value["dractive"])
         self._drstatus_active = value["dractive"]
         self._drstatus_optout = value["droptout"]
         self._drstatus_onoff = value["onoff"]
 
-    def set_tank_size(self, value):
+    async def async_set_tank_size(self, value):
         """Set water tank size for RM3500ZB Calypso controller."""
         val = value["val"]
         size = [v for k, v in HA_TO_NEVIWEB_SIZE.items() if k == val][0]
-        self._client.set_tank_size(value["id"], size)
+        await self._client.async_set_tank_size(value["id"], size)
         self._tank_size = size
 
-    def set_controlled_device(self, value):
+    async def async_set_controlled_device(self, value):
         """Set device name controlled by RM3250ZB load controller."""
         val = value["val"]
         type_val = [v for k, v in HA_TO_NEVIWEB_CONTROLLED.items() if k == val][0]
-        self._client.set_controlled_device(value["id"], type_val)
+        await self._client.async_set_controlled_device(value["id"], type_val)
         self._controlled_device = type_val
 
-    def set_low_temp_protection(self, value):
+    async def async_set_low_temp_protection(self, value):
         """Set water temperature protection for Calypso."""
-        self._client.set_low_temp_protection(value["id"], value["val"])
+        await self._client.async_set_low_temp_protection(value["id"], value["val"])
         self._water_temp_min = value["val"]
 
     def set_activation(self, value):
         """Activate or deactivate neviweb polling for a missing device."""
         self._active = value["active"]
 
-    def set_remaining_time(self, value):
+    async def async_set_remaining_time(self, value):
         """Set coldLoadPickupRemainingTime value."""
-        self._client.set_remaining_time(value["id"], value[ATTR_TIME])
+        await self._client.async_set_remaining_time(value["id"], value[ATTR_TIME])
         self._cold_load_remaining_time = value[ATTR_TIME]
 
-    def set_on_off_input_delay(self, value):
+    async def async_set_on_off_input_delay(self, value):
         """Set input 1 or 2 on/off delay in seconds."""
         val = value["delay"]
         delay = [v for k, v in HA_TO_NEVIWEB_DELAY.items() if k == val][0]
-        self._client.set_on_off_input_delay(value["id"], delay, value["onoff"], value["input_number"])
+        await self._client.async_set_on_off_input_delay(value["id"], delay, value["onoff"], value["input_number"])
         if value["input_number"] == 1:
             match value["onoff"]:
                 case "on":
@@ -1055,7 +938,7 @@ class Neviweb130Switch(SwitchEntity):
                 case _:
                     self._input_2_off_delay = delay
 
-    def set_input_output_names(self, value):
+    async def async_set_input_output_names(self, value):
         """Set names for input 1 and 2, output 1 and 2 for MC3100ZB device."""
         if len(value["input1"]) > 0:
             in_1 = value["input1"]
@@ -1073,7 +956,7 @@ class Neviweb130Switch(SwitchEntity):
             out_2 = value["output2"]
         else:
             out_2 = ""
-        self._client.set_input_output_names(value["id"], in_1, in_2, out_1, out_2)
+        await self._client.async_set_input_output_names(value["id"], in_1, in_2, out_1, out_2)
         self._input_name_1 = in_1
         self._input_name_2 = in_2
         self._output_name_1 = out_1
@@ -1081,11 +964,11 @@ class Neviweb130Switch(SwitchEntity):
 
     def do_stat(self, start):
         """Get device energy statistic."""
-        if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
+        if self.has_cycle_value(READ_HOURLY_STATS):
             today = date.today()
             current_month = today.month
             current_day = today.day
-            device_monthly_stats = self._client.get_device_monthly_stats(self._id, False)
+            device_monthly_stats = self.cycle_value(READ_MONTHLY_STATS)
             #            _LOGGER.warning("%s device_monthly_stats = %s", self._name, device_monthly_stats)
             if device_monthly_stats is not None and len(device_monthly_stats) > 1:
                 n = len(device_monthly_stats)
@@ -1111,7 +994,7 @@ class Neviweb130Switch(SwitchEntity):
                         name=self._name,
                     )
                 )
-            device_daily_stats = self._client.get_device_daily_stats(self._id, False)
+            device_daily_stats = self.cycle_value(READ_DAILY_STATS)
             #            _LOGGER.debug("%s device_daily_stats = %s", self._name, device_daily_stats)
             if device_daily_stats is not None and len(device_daily_stats) > 1:
                 n = len(device_daily_stats)
@@ -1141,7 +1024,7 @@ class Neviweb130Switch(SwitchEntity):
                         name=self._name,
                     )
                 )
-            device_hourly_stats = self._client.get_device_hourly_stats(self._id, False)
+            device_hourly_stats = self.cycle_value(READ_HOURLY_STATS)
             #            _LOGGER.debug("%s device_hourly_stats = %s", self._name, device_hourly_stats)
             if device_hourly_stats is not None and len(device_hourly_stats) > 1:
                 n = len(device_hourly_stats)
@@ -1196,7 +1079,7 @@ class Neviweb130Switch(SwitchEntity):
                     "Warning: Got USRSESSEXP error, Neviweb session expired. "
                     "Set your scan_interval parameter to less than 10 minutes to avoid this... Reconnecting..."
                 )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCDAYREQMAX":
             _LOGGER.warning("Maximum daily request reached... Reduce polling frequency")
         elif error_data == "TimeoutError":
@@ -1204,11 +1087,11 @@ class Neviweb130Switch(SwitchEntity):
         elif error_data == "MAINTENANCE":
             _LOGGER.warning("Access blocked for maintenance... Retry later")
             self.notify_ha("Warning: Neviweb access temporary blocked for maintenance... Retry later")
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximum session number reached... Close other connections and try again")
             self.notify_ha("Warning: Maximum Neviweb session number reached... Close other connections and try again")
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "DVCATTRNSPTD":
             _LOGGER.warning(
                 "Device attribute not supported for %s (id: %s): %s... (SKU: %s)",
@@ -1322,14 +1205,15 @@ class Neviweb130Switch(SwitchEntity):
 
     def notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
-            PN_DOMAIN,
-            "create",
-            service_data={
-                "title": title,
-                "message": msg,
-            },
-            blocking=False,
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                PN_DOMAIN,
+                "create",
+                service_data={
+                    "title": title,
+                    "message": msg,
+                },
+            )
         )
         return True
 
@@ -1344,39 +1228,36 @@ class Neviweb130PowerSwitch(Neviweb130Switch):
         self._rssi = None
         self._wattage = 0
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return self._is_load
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if self._is_load:
+            LOAD_ATTRIBUTES = [
+                ATTR_WATTAGE,
+                ATTR_WATTAGE_INSTANT,
+                ATTR_TIMER,
+                ATTR_KEYPAD,
+                ATTR_DRSTATUS,
+                ATTR_RSSI,
+                ATTR_CONTROLLED_DEVICE,
+                ATTR_ERROR_CODE_SET1,
+            ]
+        else:
+            LOAD_ATTRIBUTES = []
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            if self._is_load:
-                LOAD_ATTRIBUTES = [
-                    ATTR_WATTAGE,
-                    ATTR_WATTAGE_INSTANT,
-                    ATTR_TIMER,
-                    ATTR_KEYPAD,
-                    ATTR_DRSTATUS,
-                    ATTR_RSSI,
-                    ATTR_CONTROLLED_DEVICE,
-                    ATTR_ERROR_CODE_SET1,
-                ]
-            else:
-                LOAD_ATTRIBUTES = []
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1422,7 +1303,7 @@ class Neviweb130PowerSwitch(Neviweb130Switch):
                     _LOGGER.warning("Error in reading device %s: (%s)", self._name, device_data)
             else:
                 self.log_error(device_data["error"]["code"])
-            if self._is_load:
+            if self.reads_stats:
                 self.do_stat(start)
         else:
             if time.time() - self._snooze > SNOOZE_TIME:
@@ -1491,35 +1372,32 @@ class Neviweb130WifiPowerSwitch(Neviweb130Switch):
         self._wattage = 0
         self._wifirssi = None
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return True
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_WATTAGE_INSTANT,
+            ATTR_WIFI_WATTAGE,
+            ATTR_WIFI_KEYPAD,
+            ATTR_DRSTATUS,
+            ATTR_WIFI,
+            ATTR_CONTROLLED_DEVICE,
+            ATTR_ERROR_CODE_SET1,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_WATTAGE_INSTANT,
-                ATTR_WIFI_WATTAGE,
-                ATTR_WIFI_KEYPAD,
-                ATTR_DRSTATUS,
-                ATTR_WIFI,
-                ATTR_CONTROLLED_DEVICE,
-                ATTR_ERROR_CODE_SET1,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1635,43 +1513,40 @@ class Neviweb130TankPowerSwitch(Neviweb130Switch):
         self._watt_time_on = None
         self._wattage = 0
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return True
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_WATER_LEAK_STATUS,
+            ATTR_ROOM_TEMPERATURE,
+            ATTR_ERROR_CODE_SET1,
+            ATTR_WATTAGE,
+            ATTR_WATTAGE_INSTANT,
+            ATTR_COLD_LOAD_PICKUP_STATUS,
+            ATTR_TANK_SIZE,
+            ATTR_WATER_TEMP_MIN,
+            ATTR_WATT_TIME_ON,
+            ATTR_DR_WATER_TEMP_TIME,
+            ATTR_RSSI,
+            ATTR_DRSTATUS,
+            ATTR_DR_PROTEC_STATUS,
+            ATTR_COLD_LOAD_PICKUP_REMAIN_TIME,
+            ATTR_WATER_TEMP_PROTECT,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_WATER_LEAK_STATUS,
-                ATTR_ROOM_TEMPERATURE,
-                ATTR_ERROR_CODE_SET1,
-                ATTR_WATTAGE,
-                ATTR_WATTAGE_INSTANT,
-                ATTR_COLD_LOAD_PICKUP_STATUS,
-                ATTR_TANK_SIZE,
-                ATTR_WATER_TEMP_MIN,
-                ATTR_WATT_TIME_ON,
-                ATTR_DR_WATER_TEMP_TIME,
-                ATTR_RSSI,
-                ATTR_DRSTATUS,
-                ATTR_DR_PROTEC_STATUS,
-                ATTR_COLD_LOAD_PICKUP_REMAIN_TIME,
-                ATTR_WATER_TEMP_PROTECT,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1842,48 +1717,45 @@ class Neviweb130WifiTankPowerSwitch(Neviweb130Switch):
         self._water_temp_time = None
         self._wattage = 0
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return True
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_WATER_LEAK_ALARM_STATUS,
+            ATTR_WATER_TEMPERATURE,
+            ATTR_WATER_LEAK_DISCONNECTED_STATUS,
+            ATTR_ERROR_CODE_SET1,
+            ATTR_WIFI_WATTAGE,
+            ATTR_WIFI_WATT_NOW,
+            ATTR_COLD_LOAD_PICKUP_STATUS,
+            ATTR_TANK_SIZE,
+            ATTR_MIN_WATER_TEMP,
+            ATTR_WATER_TANK_ON,
+            ATTR_WATER_TEMP_TIME,
+            ATTR_WIFI,
+            ATTR_DRSTATUS,
+            ATTR_LEG_PROTEC_STATUS,
+            ATTR_COLD_LOAD_PICKUP_REMAIN_TIME,
+            ATTR_SYSTEM_MODE,
+            ATTR_COLD_LOAD_PICKUP_TEMP,
+            ATTR_LEAK_CLOSURE_CONFIG,
+            ATTR_AWAY_ACTION,
+            ATTR_WATER_TEMP_PROTECT,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_WATER_LEAK_ALARM_STATUS,
-                ATTR_WATER_TEMPERATURE,
-                ATTR_WATER_LEAK_DISCONNECTED_STATUS,
-                ATTR_ERROR_CODE_SET1,
-                ATTR_WIFI_WATTAGE,
-                ATTR_WIFI_WATT_NOW,
-                ATTR_COLD_LOAD_PICKUP_STATUS,
-                ATTR_TANK_SIZE,
-                ATTR_MIN_WATER_TEMP,
-                ATTR_WATER_TANK_ON,
-                ATTR_WATER_TEMP_TIME,
-                ATTR_WIFI,
-                ATTR_DRSTATUS,
-                ATTR_LEG_PROTEC_STATUS,
-                ATTR_COLD_LOAD_PICKUP_REMAIN_TIME,
-                ATTR_SYSTEM_MODE,
-                ATTR_COLD_LOAD_PICKUP_TEMP,
-                ATTR_LEAK_CLOSURE_CONFIG,
-                ATTR_AWAY_ACTION,
-                ATTR_WATER_TEMP_PROTECT,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -2056,86 +1928,82 @@ class Neviweb130ControlerSwitch(Neviweb130Switch):
         self._low_temp_status = None
         self._rssi = None
 
-    def update(self):
-        if self._active:
-            if self._is_zb_control:
-                NAME_ATTRIBUTES = [
-                    ATTR_NAME_1,
-                    ATTR_NAME_2,
-                    ATTR_OUTPUT_NAME_1,
-                    ATTR_OUTPUT_NAME_2,
-                ]
-            else:
-                NAME_ATTRIBUTES = [
-                    ATTR_NAME_1,
-                    ATTR_OUTPUT_NAME_1,
-                ]
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return False
 
-            LOAD_ATTRIBUTES = []
-            if self._is_zb_control:
-                if self._firmware == "0.1.1":
-                    LOAD_ATTRIBUTES = [
-                        ATTR_ONOFF2,
-                        ATTR_BATTERY_VOLTAGE,
-                        ATTR_BATTERY_STATUS,
-                        ATTR_EXT_TEMP,
-                        ATTR_REL_HUMIDITY,
-                        ATTR_INPUT_STATUS,
-                        ATTR_INPUT2_STATUS,
-                        ATTR_ROOM_TEMPERATURE,
-                        ATTR_TIMER,
-                        ATTR_TIMER2,
-                        ATTR_RSSI,
-                        ATTR_BATT_INFO,
-                        ATTR_INPUT_1_ON_DELAY,
-                        ATTR_INPUT_2_ON_DELAY,
-                        ATTR_INPUT_1_OFF_DELAY,
-                        ATTR_INPUT_2_OFF_DELAY,
-                        ATTR_BATT_PERCENT_NORMAL,
-                        ATTR_BATT_STATUS_NORMAL,
-                        ATTR_DRSTATUS,
-                        ATTR_TEMP_ALERT,
-                        ATTR_LOW_TEMP_STATUS,
-                    ]
-                else:
-                    LOAD_ATTRIBUTES = [
-                        ATTR_ONOFF2,
-                        ATTR_BATTERY_VOLTAGE,
-                        ATTR_BATTERY_STATUS,
-                        ATTR_EXT_TEMP,
-                        ATTR_REL_HUMIDITY,
-                        ATTR_INPUT_STATUS,
-                        ATTR_INPUT2_STATUS,
-                        ATTR_ROOM_TEMPERATURE,
-                        ATTR_TIMER,
-                        ATTR_TIMER2,
-                        ATTR_RSSI,
-                    ]
-            else:
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        if self._is_zb_control:
+            NAME_ATTRIBUTES = [
+                ATTR_NAME_1,
+                ATTR_NAME_2,
+                ATTR_OUTPUT_NAME_1,
+                ATTR_OUTPUT_NAME_2,
+            ]
+        else:
+            NAME_ATTRIBUTES = [
+                ATTR_NAME_1,
+                ATTR_OUTPUT_NAME_1,
+            ]
+
+        LOAD_ATTRIBUTES = []
+        if self._is_zb_control:
+            if self._firmware == "0.1.1":
                 LOAD_ATTRIBUTES = [
-                    ATTR_INPUT_STATUS,
+                    ATTR_ONOFF2,
                     ATTR_BATTERY_VOLTAGE,
+                    ATTR_BATTERY_STATUS,
+                    ATTR_EXT_TEMP,
+                    ATTR_REL_HUMIDITY,
+                    ATTR_INPUT_STATUS,
+                    ATTR_INPUT2_STATUS,
+                    ATTR_ROOM_TEMPERATURE,
+                    ATTR_TIMER,
+                    ATTR_TIMER2,
+                    ATTR_RSSI,
                     ATTR_BATT_INFO,
+                    ATTR_INPUT_1_ON_DELAY,
+                    ATTR_INPUT_2_ON_DELAY,
+                    ATTR_INPUT_1_OFF_DELAY,
+                    ATTR_INPUT_2_OFF_DELAY,
+                    ATTR_BATT_PERCENT_NORMAL,
+                    ATTR_BATT_STATUS_NORMAL,
+                    ATTR_DRSTATUS,
+                    ATTR_TEMP_ALERT,
+                    ATTR_LOW_TEMP_STATUS,
                 ]
+            else:
+                LOAD_ATTRIBUTES = [
+                    ATTR_ONOFF2,
+                    ATTR_BATTERY_VOLTAGE,
+                    ATTR_BATTERY_STATUS,
+                    ATTR_EXT_TEMP,
+                    ATTR_REL_HUMIDITY,
+                    ATTR_INPUT_STATUS,
+                    ATTR_INPUT2_STATUS,
+                    ATTR_ROOM_TEMPERATURE,
+                    ATTR_TIMER,
+                    ATTR_TIMER2,
+                    ATTR_RSSI,
+                ]
+        else:
+            LOAD_ATTRIBUTES = [
+                ATTR_INPUT_STATUS,
+                ATTR_BATTERY_VOLTAGE,
+                ATTR_BATT_INFO,
+            ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES + NAME_ATTRIBUTES
 
+    async def async_update(self):
+        if self._active:
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES + NAME_ATTRIBUTES
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
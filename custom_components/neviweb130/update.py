@@ -15,6 +15,7 @@ from typing import Any
 import aiohttp
 from awesomeversion import AwesomeVersion
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
@@ -53,14 +54,13 @@ def filter_valid_assets(assets, expected_version):
     return valid_assets
 
 
-async def async_setup_platform(
+async def async_setup_entry(
     hass: HomeAssistant,
-    config: dict[str, Any],
+    entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
-    discovery_info: dict[str, Any] | None = None,
 ) -> None:
     """Setup update platform."""
-    _LOGGER.debug("async_setup_platform CALLED for update platform")
+    _LOGGER.debug("async_setup_entry CALLED for update platform")
 
     data = hass.data[DOMAIN]["data"]
 
@@ -89,10 +89,12 @@ async def async_setup_platform(
 
     _LOGGER.debug("Scheduler registered for Neviweb130 update")
 
-    async_track_time_interval(
-        hass,
-        scheduled_check,
-        timedelta(hours=6),
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            scheduled_check,
+            timedelta(hours=6),
+        )
     )
 
 
@@ -29,6 +29,7 @@ import logging
 import time
 from datetime import date, datetime, timezone
 from enum import StrEnum
+from functools import partial
 from threading import Lock
 from typing import cast, override
 
@@ -80,6 +81,10 @@ from .const import (
     ATTR_WATER_LEAK_STATUS,
     ATTR_WIFI,
     DOMAIN,
+    IMPLEMENTED_WIFI_MESH_VALVE_MODEL,
+    IMPLEMENTED_WIFI_VALVE_MODEL,
+    IMPLEMENTED_ZB_MESH_VALVE_MODEL,
+    IMPLEMENTED_ZB_VALVE_MODEL,
     MODE_AUTO,
     MODE_MANUAL,
     MODE_OFF,
@@ -94,7 +99,16 @@ from .const import (
     STATE_VALVE_STATUS,
     VERSION,
 )
-from .helpers import file_exists, safe_get_device_attributes, safe_number, translated_or_default
+from .coordinator import (
+    READ_ALERT,
+    READ_DAILY_STATS,
+    READ_HOURLY_STATS,
+    READ_MONTHLY_STATS,
+    DeviceRead,
+    Neviweb130CoordinatorEntity,
+    async_track_platform_devices,
+)
+from .helpers import file_exists, safe_number, translated_or_default
 from .schema import (
     SET_ACTIVATION_SCHEMA,
     SET_FLOW_ALARM_DISABLE_TIMER_SCHEMA,
@@ -148,24 +162,11 @@ SUPPORTED_WIFI_MODES = [
     MODE_OFF,
 ]
 
-IMPLEMENTED_WIFI_MESH_VALVE_MODEL = [3155]
-IMPLEMENTED_ZB_MESH_VALVE_MODEL = [3153, 31532]
-IMPLEMENTED_WIFI_VALVE_MODEL = [3150]
-IMPLEMENTED_ZB_VALVE_MODEL = [3151]
-
-IMPLEMENTED_DEVICE_MODEL = (
-    IMPLEMENTED_WIFI_VALVE_MODEL
-    + IMPLEMENTED_ZB_VALVE_MODEL
-    + IMPLEMENTED_WIFI_MESH_VALVE_MODEL
-    + IMPLEMENTED_ZB_MESH_VALVE_MODEL
-)
 
-
-async def async_setup_platform(
+async def async_setup_entry(
     hass,
-    config,
+    entry,
     async_add_entities,
-    discovery_info=None,
 ) -> None:
     """Set up the Neviweb130 valve."""
     data = hass.data[DOMAIN]["data"]
@@ -173,126 +174,58 @@ async def async_setup_platform(
     # Wait for async migration to be done
     await data.migration_done.wait()
 
+    def create_entities(client, devices) -> list[Neviweb130Valve]:
+        """Return the entities of discovered devices of an account."""
+        created: list[Neviweb130Valve] = []
+        for device in devices:
+            device_info = device.info
+            device_name = "{} {}".format(client.default_group_name("valve", device.network), device_info["name"])
+            device_sku = device_info["sku"]
+            device_firmware = "{}.{}.{}".format(
+                device_info["signature"]["softVersion"]["major"],
+                device_info["signature"]["softVersion"]["middle"],
+                device_info["signature"]["softVersion"]["minor"],
+            )
+            if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
+                device_type = "valve"
+                created.append(
+                    Neviweb130Valve(device_info, device_name, device_sku, device_firmware, device_type, client)
+                )
+            elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
+                device_type = "valve"
+                created.append(
+                    Neviweb130WifiValve(device_info, device_name, device_sku, device_firmware, device_type, client)
+                )
+            elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
+                device_type = "flow"
+                created.append(
+                    Neviweb130MeshValve(device_info, device_name, device_sku, device_firmware, device_type, client)
+                )
+            else:
+                device_type = "flow"
+                created.append(
+                    Neviweb130WifiMeshValve(device_info, device_name, device_sku, device_firmware, device_type, client)
+                )
+        return created
+
     entities: list[Neviweb130Valve] = []
 
     # Loop through all clients (supports multi-account)
     for client in data.neviweb130_clients:
-        default_name = client.default_group_name("valve")
-        default_name_2 = client.default_group_name("valve", 2)
-        default_name_3 = client.default_group_name("valve", 3)
-
-        # Process gateway_data for this client
-        for device_info in client.gateway_data:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
-                    device_type = "valve"
-                    entities.append(
-                        Neviweb130Valve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
-                    device_type = "valve"
-                    entities.append(
-                        Neviweb130WifiValve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
-                    device_type = "flow"
-                    entities.append(
-                        Neviweb130MeshValve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                else:
-                    device_type = "flow"
-                    entities.append(
-                        Neviweb130WifiMeshValve(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-        for device_info in client.gateway_data2:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_2, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
-                    device_type = "valve"
-                    entities.append(
-                        Neviweb130Valve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
-                    device_type = "valve"
-                    entities.append(
-                        Neviweb130WifiValve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
-                    device_type = "flow"
-                    entities.append(
-                        Neviweb130MeshValve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                else:
-                    device_type = "flow"
-                    entities.append(
-                        Neviweb130WifiMeshValve(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
-        for device_info in client.gateway_data3:
-            if (
-                "signature" in device_info
-                and "model" in device_info["signature"]
-                and device_info["signature"]["model"] in IMPLEMENTED_DEVICE_MODEL
-            ):
-                device_name = "{} {}".format(default_name_3, device_info["name"])
-                device_sku = device_info["sku"]
-                device_firmware = "{}.{}.{}".format(
-                    device_info["signature"]["softVersion"]["major"],
-                    device_info["signature"]["softVersion"]["middle"],
-                    device_info["signature"]["softVersion"]["minor"],
-                )
-                if device_info["signature"]["model"] in IMPLEMENTED_ZB_VALVE_MODEL:
-                    device_type = "valve"
-                    entities.append(
-                        Neviweb130Valve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_WIFI_VALVE_MODEL:
-                    device_type = "valve"
-                    entities.append(
-                        Neviweb130WifiValve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                elif device_info["signature"]["model"] in IMPLEMENTED_ZB_MESH_VALVE_MODEL:
-                    device_type = "flow"
-                    entities.append(
-                        Neviweb130MeshValve(device_info, device_name, device_sku, device_firmware, device_type, client)
-                    )
-                else:
-                    device_type = "flow"
-                    entities.append(
-                        Neviweb130WifiMeshValve(
-                            device_info, device_name, device_sku, device_firmware, device_type, client
-                        )
-                    )
+        entities.extend(create_entities(client, client.devices.platform("valve")))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
     entity_map: dict[str, Neviweb130Valve] | None = None
     _entity_map_lock = Lock()
 
+    def _entities_changed() -> None:
+        """Rebuild the entity lookup of services on next use."""
+        nonlocal entity_map
+        entity_map = None
+
+    async_track_platform_devices(hass, entry, "valve", entities, create_entities, async_add_entities, _entities_changed)
+
     def get_valve(service: ServiceCall) -> Neviweb130Valve:
         entity_id = service.data.get(ATTR_ENTITY_ID)
         if entity_id is None:
@@ -334,47 +267,47 @@ async def async_setup_platform(
             )
         return valve
 
-    def set_valve_alert_service(service: ServiceCall) -> None:
+    async def set_valve_alert_service(service: ServiceCall) -> None:
         """Set alert for water valve."""
         valve = get_valve(service)
         value = {
             "id": valve.unique_id,
             "batt": service.data[ATTR_BATT_ALERT],
         }
-        valve.set_valve_alert(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_valve_alert(value)
+        valve.async_refresh_after_write()
 
-    def set_valve_temp_alert_service(service: ServiceCall) -> None:
+    async def set_valve_temp_alert_service(service: ServiceCall) -> None:
         """Set alert for water valve temperature location."""
         valve = get_valve(service)
         value = {
             "id": valve.unique_id,
             "temp": service.data[ATTR_TEMP_ALERT],
         }
-        valve.set_valve_temp_alert(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_valve_temp_alert(value)
+        valve.async_refresh_after_write()
 
-    def set_flow_meter_model_service(service: ServiceCall) -> None:
+    async def set_flow_meter_model_service(service: ServiceCall) -> None:
         """Set the flow meter model connected to water valve."""
         valve = get_valve(service)
         value = {
             "id": valve.unique_id,
             "model": service.data[ATTR_FLOW_MODEL_CONFIG][0],
         }
-        valve.set_flow_meter_model(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_flow_meter_model(value)
+        valve.async_refresh_after_write()
 
-    def set_flow_meter_delay_service(service: ServiceCall) -> None:
+    async def set_flow_meter_delay_service(service: ServiceCall) -> None:
         """Set the flow meter delay before alert is turned on."""
         valve = get_valve(service)
         value = {
             "id": valve.unique_id,
             "delay": service.data[ATTR_FLOW_ALARM1_PERIOD][0],
         }
-        valve.set_flow_meter_delay(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_flow_meter_delay(value)
+        valve.async_refresh_after_write()
 
-    def set_flow_meter_options_service(service: ServiceCall) -> None:
+    async def set_flow_meter_options_service(service: ServiceCall) -> None:
         """Set the flow meter options when leak is detected."""
         valve = get_valve(service)
         value = {
@@ -382,20 +315,20 @@ async def async_setup_platform(
             "alarm": service.data[ATTR_TRIGGER_ALARM],
             "close": service.data[ATTR_CLOSE_VALVE],
         }
-        valve.set_flow_meter_options(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_flow_meter_options(value)
+        valve.async_refresh_after_write()
 
-    def set_power_supply_service(service: ServiceCall) -> None:
+    async def set_power_supply_service(service: ServiceCall) -> None:
         """Set power supply type for water valve."""
         valve = get_valve(service)
         value = {
             "id": valve.unique_id,
             "supply": service.data[ATTR_POWER_SUPPLY],
         }
-        valve.set_power_supply(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_power_supply(value)
+        valve.async_refresh_after_write()
 
-    def set_activation_service(service: ServiceCall) -> None:
+    async def set_activation_service(service: ServiceCall) -> None:
         """Activate or deactivate Neviweb polling for missing device."""
         valve = get_valve(service)
         value = {
@@ -403,17 +336,17 @@ async def async_setup_platform(
             "active": service.data[ATTR_ACTIVE],
         }
         valve.set_activation(value)
-        valve.schedule_update_ha_state(True)
+        valve.async_refresh_after_write()
 
-    def set_flow_alarm_disable_timer_service(service: ServiceCall) -> None:
+    async def set_flow_alarm_disable_timer_service(service: ServiceCall) -> None:
         """Set alert for water valve temperature location."""
         valve = get_valve(service)
         value = {
             "id": valve.unique_id,
             "timer": service.data[ATTR_FLOW_ALARM_TIMER],
         }
-        valve.set_flow_alarm_disable_timer(value)
-        valve.schedule_update_ha_state(True)
+        await valve.async_set_flow_alarm_disable_timer(value)
+        valve.async_refresh_after_write()
 
     hass.services.async_register(
         DOMAIN,
@@ -537,7 +470,7 @@ def model_to_HA(value):
         return "No flow meter"
 
 
-class Neviweb130Valve(ValveEntity):
+class Neviweb130Valve(Neviweb130CoordinatorEntity, ValveEntity):
     """Implementation of a Neviweb valve."""
 
     def __init__(self, device_info, name, sku, firmware, device_type, client):
@@ -588,40 +521,45 @@ class Neviweb130Valve(ValveEntity):
         self._valve_status: str | None = None
         self._water_leak_status: str | None = None
 
-    def update(self):
+    @property
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return False
+
+    def cycle_reads(self) -> dict[str, DeviceRead]:
+        """Return the energy statistic reads due in this cycle, and the alert read of zigbee valves."""
+        reads = self.stats_reads(STAT_INTERVAL) if self._flowmeter_multiplier != 0 else {}
+        if self._is_zb_valve or self._is_zb_mesh_valve:
+            reads[READ_ALERT] = partial(self._client.async_get_device_alert, self._id)
+        return reads
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_BATTERY_VOLTAGE,
+            ATTR_BATTERY_STATUS,
+            ATTR_POWER_SUPPLY,
+            ATTR_RSSI,
+            ATTR_BATT_PERCENT_NORMAL,
+            ATTR_BATT_STATUS_NORMAL,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_BATTERY_VOLTAGE,
-                ATTR_BATTERY_STATUS,
-                ATTR_POWER_SUPPLY,
-                ATTR_RSSI,
-                ATTR_BATT_PERCENT_NORMAL,
-                ATTR_BATT_STATUS_NORMAL,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            _LOGGER.debug("Updated attributes for %s (firmware %s): %s", self._name, self._firmware, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug(
+                "Updated attributes for %s (firmware %s): %s", self._name, self._firmware, self.planned_attributes
+            )
             end = time.time()
             elapsed = round(end - start, 3)
             device_alert = None
             if self._is_zb_valve or self._is_zb_mesh_valve:
-                device_alert = self._client.get_device_alert(self._id)
+                device_alert = self.cycle_value(READ_ALERT)
                 _LOGGER.debug(
                     "Updating alert for %s (%s sec): %s",
                     self._name,
@@ -764,27 +702,29 @@ class Neviweb130Valve(ValveEntity):
         level = min(batt // 20 + 1, 5)
         return f"/local/neviweb130/battery-{level}.png"
 
-    def open_valve(self, **kwargs):
+    async def async_open_valve(self, **kwargs):
         """Open the valve."""
         if self._is_wifi_valve or self._is_wifi_mesh_valve:
-            self._client.set_valve_onoff(self._id, 100)
+            await self._client.async_set_valve_onoff(self._id, 100)
             self._valve_status = "open"
         else:
-            self._client.set_onoff(self._id, "on")
+            await self._client.async_set_onoff(self._id, "on")
             if self._is_zb_valve or self._is_zb_mesh_valve:
                 self._valve_status = "open"
         self._onoff = "on"
+        self.async_refresh_after_write()
 
-    def close_valve(self, **kwargs):
+    async def async_close_valve(self, **kwargs):
         """Close the valve."""
         if self._is_wifi_valve or self._is_wifi_mesh_valve:
-            self._client.set_valve_onoff(self._id, 0)
+            await self._client.async_set_valve_onoff(self._id, 0)
             self._valve_status = "closed"
         else:
-            self._client.set_onoff(self._id, "off")
+            await self._client.async_set_onoff(self._id, "off")
             if self._is_zb_valve or self._is_zb_mesh_valve:
                 self._valve_status = "closed"
         self._onoff = MODE_OFF
+        self.async_refresh_after_write()
 
     @property
     def extra_state_attributes(self):
@@ -823,7 +763,7 @@ class Neviweb130Valve(ValveEntity):
         """Return the current battery voltage of the valve in %."""
         return voltage_to_percentage(self._battery_voltage, 2 if self._is_zb_valve or self._is_zb_mesh_valve else 4)
 
-    def set_valve_alert(self, value):
+    async def async_set_valve_alert(self, value):
         """Set valve batt alert action."""
         if self._is_zb_valve or self._is_zb_mesh_valve:
             if value["batt"] == "true":
@@ -832,32 +772,32 @@ class Neviweb130Valve(ValveEntity):
                 batt = 0
         else:
             batt = value["batt"]
-        self._client.set_valve_alert(value["id"], batt)
+        await self._client.async_set_valve_alert(value["id"], batt)
         self._battery_alert = batt
 
-    def set_valve_temp_alert(self, value):
+    async def async_set_valve_temp_alert(self, value):
         """Set valve temperature alert action."""
-        self._client.set_valve_temp_alert(value["id"], value["temp"])
+        await self._client.async_set_valve_temp_alert(value["id"], value["temp"])
         self._temp_alert = value["temp"]
 
-    def set_flow_meter_model(self, value):
+    async def async_set_flow_meter_model(self, value):
         """Set water valve flow meter model connected."""
-        self._client.set_flow_meter_model(value["id"], value["model"])
+        await self._client.async_set_flow_meter_model(value["id"], value["model"])
         self._flowmeter_model = value["model"]
 
-    def set_flow_alarm_disable_timer(self, value):
+    async def async_set_flow_alarm_disable_timer(self, value):
         """Set flowmeter alarm action disabled timer, for valves with flowmeter."""
-        self._client.set_flow_alarm_timer(value["id"], value["timer"])
+        await self._client.async_set_flow_alarm_timer(value["id"], value["timer"])
         self._flowmeter_timer = value["timer"]
 
-    def set_flow_meter_delay(self, value):
+    async def async_set_flow_meter_delay(self, value):
         """Set water valve flow meter delay before alert."""
         val = value["delay"]
         delay = [v for k, v in HA_TO_NEVIWEB_DELAY.items() if k == val][0]
-        self._client.set_flow_meter_delay(value["id"], delay)
+        await self._client.async_set_flow_meter_delay(value["id"], delay)
         self._flowmeter_alert_delay = val
 
-    def set_power_supply(self, value):
+    async def async_set_power_supply(self, value):
         """Set water valve power supply type."""
         sup = None
         match value["supply"]:
@@ -867,10 +807,10 @@ class Neviweb130Valve(ValveEntity):
                 sup = "acups-01"
             case _:
                 sup = "both"
-        self._client.set_power_supply(value["id"], sup)
+        await self._client.async_set_power_supply(value["id"], sup)
         self._power_supply = sup
 
-    def set_flow_meter_options(self, value):
+    async def async_set_flow_meter_options(self, value):
         """Set water valve flow meter options when leak detected."""
         if value["alarm"] == "on":
             alarm = True
@@ -886,7 +826,7 @@ class Neviweb130Valve(ValveEntity):
         else:
             length = 60
             threshold = 1
-        self._client.set_flow_meter_options(value["id"], alarm, action, length, threshold)
+        await self._client.async_set_flow_meter_options(value["id"], alarm, action, length, threshold)
         self._flowmeter_opt_alarm = alarm
         self._flowmeter_opt_action = action
         self._flowmeter_threshold = threshold
@@ -899,11 +839,11 @@ class Neviweb130Valve(ValveEntity):
     def do_stat(self, start):
         """Get device flow statistic."""
         if self._flowmeter_multiplier != 0:
-            if start - self._energy_stat_time > STAT_INTERVAL and self._energy_stat_time != 0:
+            if self.has_cycle_value(READ_HOURLY_STATS):
                 today = date.today()
                 current_month = today.month
                 current_day = today.day
-                device_monthly_stats = self._client.get_device_monthly_stats(self._id, False)
+                device_monthly_stats = self.cycle_value(READ_MONTHLY_STATS)
                 _LOGGER.debug("%s device_monthly_stats = %s", self._name, device_monthly_stats)
                 if device_monthly_stats is not None and len(device_monthly_stats) > 1:
                     n = len(device_monthly_stats)
@@ -929,7 +869,7 @@ class Neviweb130Valve(ValveEntity):
                             name=self._name,
                         )
                     )
-                device_daily_stats = self._client.get_device_daily_stats(self._id, False)
+                device_daily_stats = self.cycle_value(READ_DAILY_STATS)
                 _LOGGER.debug("%s device_daily_stats = %s", self._name, device_daily_stats)
                 if device_daily_stats is not None and len(device_daily_stats) > 1:
                     n = len(device_daily_stats)
@@ -959,7 +899,7 @@ class Neviweb130Valve(ValveEntity):
                             name=self._name,
                         )
                     )
-                device_hourly_stats = self._client.get_device_hourly_stats(self._id, False)
+                device_hourly_stats = self.cycle_value(READ_HOURLY_STATS)
                 _LOGGER.debug("%s device_hourly_stats = %s", self._name, device_hourly_stats)
                 if device_hourly_stats is not None and len(device_hourly_stats) > 1:
                     n = len(device_hourly_stats)
@@ -1019,7 +959,7 @@ class Neviweb130Valve(ValveEntity):
                     + "Set your scan_interval parameter to less than 10 minutes "
                     + "to avoid this... Reconnecting..."
                 )
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCDAYREQMAX":
             _LOGGER.warning("Maximum daily request reached... Reduce polling frequency")
         elif error_data == "TimeoutError":
@@ -1027,11 +967,11 @@ class Neviweb130Valve(ValveEntity):
         elif error_data == "MAINTENANCE":
             _LOGGER.warning("Access blocked for maintenance... Retry later")
             self.notify_ha("Warning: Neviweb access temporary blocked for maintenance... Retry later")
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "ACCSESSEXC":
             _LOGGER.warning("Maximum session number reached... Close other connections and try again")
             self.notify_ha("Warning: Maximum Neviweb session number reached... Close other connections and try again")
-            self._client.reconnect()
+            self.hass.async_create_task(self._client.async_reconnect())
         elif error_data == "DVCATTRNSPTD":
             _LOGGER.warning(
                 "Device attribute not supported for %s (id: %s): %s... (SKU: %s)",
@@ -1148,14 +1088,15 @@ class Neviweb130Valve(ValveEntity):
 
     def notify_ha(self, msg: str, title: str = "Neviweb130 integration " + VERSION):
         """Notify user via HA web frontend."""
-        self.hass.services.call(
-            PN_DOMAIN,
-            "create",
-            service_data={
-                "title": title,
-                "message": msg,
-            },
-            blocking=False,
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                PN_DOMAIN,
+                "create",
+                service_data={
+                    "title": title,
+                    "message": msg,
+                },
+            )
         )
         return True
 
@@ -1192,50 +1133,49 @@ class Neviweb130WifiValve(Neviweb130Valve):
         self._valve_info_status = None
         self._water_leak_status = None
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return True
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_WIFI,
+            ATTR_MOTOR_POS,
+            ATTR_MOTOR_TARGET,
+            ATTR_TEMP_ALARM,
+            ATTR_VALVE_INFO,
+            ATTR_BATTERY_VOLTAGE,
+            ATTR_BATTERY_STATUS,
+            ATTR_POWER_SUPPLY,
+            ATTR_VALVE_CLOSURE,
+            ATTR_BATT_ALERT,
+            ATTR_STM8_ERROR,
+            ATTR_FLOW_METER_CONFIG,
+            ATTR_FLOW_ALARM1,
+            ATTR_FLOW_ALARM2,
+            ATTR_TEMP_ACTION_LOW,
+            ATTR_BATT_ACTION_LOW,
+            ATTR_OCCUPANCY_SENSOR_DELAY,
+            ATTR_BATT_STATUS_NORMAL,
+            ATTR_BATT_PERCENT_NORMAL,
+            ATTR_WATER_LEAK_STATUS,
+            ATTR_AWAY_ACTION,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_WIFI,
-                ATTR_MOTOR_POS,
-                ATTR_MOTOR_TARGET,
-                ATTR_TEMP_ALARM,
-                ATTR_VALVE_INFO,
-                ATTR_BATTERY_VOLTAGE,
-                ATTR_BATTERY_STATUS,
-                ATTR_POWER_SUPPLY,
-                ATTR_VALVE_CLOSURE,
-                ATTR_BATT_ALERT,
-                ATTR_STM8_ERROR,
-                ATTR_FLOW_METER_CONFIG,
-                ATTR_FLOW_ALARM1,
-                ATTR_FLOW_ALARM2,
-                ATTR_TEMP_ACTION_LOW,
-                ATTR_BATT_ACTION_LOW,
-                ATTR_OCCUPANCY_SENSOR_DELAY,
-                ATTR_BATT_STATUS_NORMAL,
-                ATTR_BATT_PERCENT_NORMAL,
-                ATTR_WATER_LEAK_STATUS,
-                ATTR_AWAY_ACTION,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            _LOGGER.debug("Updated attributes for %s (firmware %s): %s", self._name, self._firmware, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug(
+                "Updated attributes for %s (firmware %s): %s", self._name, self._firmware, self.planned_attributes
+            )
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)
@@ -1414,50 +1354,49 @@ class Neviweb130MeshValve(Neviweb130Valve):
         self._stm8Error_motorPosition = None
         self._water_leak_status = None
 
-    def update(self):
+    @property
+    @override
+    def reads_stats(self) -> bool:
+        """Return True if energy statistics of this device are read."""
+        return True
+
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_RSSI,
+            ATTR_BATTERY_VOLTAGE,
+            ATTR_BATTERY_STATUS,
+            ATTR_POWER_SUPPLY,
+            ATTR_STM8_ERROR,
+            ATTR_WATER_LEAK_STATUS,
+            ATTR_FLOW_METER_CONFIG,
+            ATTR_FLOW_ALARM_TIMER,
+            ATTR_FLOW_THRESHOLD,
+            ATTR_FLOW_ALARM1_PERIOD,
+            ATTR_FLOW_ALARM1_LENGTH,
+            ATTR_FLOW_ALARM1_OPTION,
+            ATTR_FLOW_ENABLED,
+            ATTR_BATT_STATUS_NORMAL,
+            ATTR_BATT_PERCENT_NORMAL,
+            ATTR_ERROR_CODE_SET1,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_RSSI,
-                ATTR_BATTERY_VOLTAGE,
-                ATTR_BATTERY_STATUS,
-                ATTR_POWER_SUPPLY,
-                ATTR_STM8_ERROR,
-                ATTR_WATER_LEAK_STATUS,
-                ATTR_FLOW_METER_CONFIG,
-                ATTR_FLOW_ALARM_TIMER,
-                ATTR_FLOW_THRESHOLD,
-                ATTR_FLOW_ALARM1_PERIOD,
-                ATTR_FLOW_ALARM1_LENGTH,
-                ATTR_FLOW_ALARM1_OPTION,
-                ATTR_FLOW_ENABLED,
-                ATTR_BATT_STATUS_NORMAL,
-                ATTR_BATT_PERCENT_NORMAL,
-                ATTR_ERROR_CODE_SET1,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            _LOGGER.debug("Updated attributes for %s (firmware %s): %s", self._name, self._firmware, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug(
+                "Updated attributes for %s (firmware %s): %s", self._name, self._firmware, self.planned_attributes
+            )
             end = time.time()
             elapsed = round(end - start, 3)
             device_alert = None
             if self._is_zb_valve or self._is_zb_mesh_valve:
-                device_alert = self._client.get_device_alert(self._id)
+                device_alert = self.cycle_value(READ_ALERT)
                 _LOGGER.debug(
                     "Updating alert for %s (%s sec): %s",
                     self._name,
@@ -1635,48 +1574,41 @@ class Neviweb130WifiMeshValve(Neviweb130Valve):
         self._valve_info_status = None
         self._water_leak_status = None
 
-    def update(self):
+    def update_attributes(self) -> list[str]:
+        """Return the attributes read on each poll."""
+        LOAD_ATTRIBUTES = [
+            ATTR_MOTOR_POS,
+            ATTR_MOTOR_TARGET,
+            ATTR_TEMP_ALARM,
+            ATTR_VALVE_INFO,
+            ATTR_BATTERY_STATUS,
+            ATTR_POWER_SUPPLY,
+            ATTR_BATTERY_VOLTAGE,
+            ATTR_STM8_ERROR,
+            ATTR_FLOW_METER_CONFIG,
+            ATTR_WATER_LEAK_STATUS,
+            ATTR_FLOW_ALARM_TIMER,
+            ATTR_FLOW_THRESHOLD,
+            ATTR_FLOW_ALARM1_PERIOD,
+            ATTR_FLOW_ALARM1_LENGTH,
+            ATTR_FLOW_ALARM1_OPTION,
+            ATTR_FLOW_ALARM1,
+            ATTR_FLOW_ALARM2,
+            ATTR_TEMP_ACTION_LOW,
+            ATTR_BATT_ACTION_LOW,
+        ]
+        return UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
+
+    async def async_update(self):
         if self._active:
-            LOAD_ATTRIBUTES = [
-                ATTR_MOTOR_POS,
-                ATTR_MOTOR_TARGET,
-                ATTR_TEMP_ALARM,
-                ATTR_VALVE_INFO,
-                ATTR_BATTERY_STATUS,
-                ATTR_POWER_SUPPLY,
-                ATTR_BATTERY_VOLTAGE,
-                ATTR_STM8_ERROR,
-                ATTR_FLOW_METER_CONFIG,
-                ATTR_WATER_LEAK_STATUS,
-                ATTR_FLOW_ALARM_TIMER,
-                ATTR_FLOW_THRESHOLD,
-                ATTR_FLOW_ALARM1_PERIOD,
-                ATTR_FLOW_ALARM1_LENGTH,
-                ATTR_FLOW_ALARM1_OPTION,
-                ATTR_FLOW_ALARM1,
-                ATTR_FLOW_ALARM2,
-                ATTR_TEMP_ACTION_LOW,
-                ATTR_BATT_ACTION_LOW,
-            ]
             """Get the latest data from Neviweb and update the state."""
             start = time.time()
-            attributes = UPDATE_ATTRIBUTES + LOAD_ATTRIBUTES
-            _LOGGER.debug("Updated attributes for %s (firmware %s): %s", self._name, self._firmware, attributes)
-            safe_mode = self.hass.data[DOMAIN]["safe_mode"]
-
-            if safe_mode == self._id:
-                device_data = safe_get_device_attributes(
-                    self.hass,
-                    self._client,
-                    self._id,
-                    attributes,
-                    _LOGGER,
-                    device_sku=self._sku,
-                    device_model=self._device_model,
-                    firmware=self._firmware,
-                )
-            else:
-                device_data = self._client.get_device_attributes(self._id, attributes)
+            device_data = await self.async_fetch_device_attributes()
+            if device_data is None:
+                return
+            _LOGGER.debug(
+                "Updated attributes for %s (firmware %s): %s", self._name, self._firmware, self.planned_attributes
+            )
             end = time.time()
             elapsed = round(end - start, 3)
             _LOGGER.debug("Updating %s (%s sec): %s", self._name, elapsed, device_data)